@@ -810,17 +810,24 @@ export function WorkItemsTab() {
     }
   }, [currentNamespace]); // Only depend on currentNamespace
 
-  // Subscribe to WebSocket work item updates for real-time updates
+  // Subscribe to the WebSocket change feed for real-time updates
   useEffect(() => {
     if (!subscribeToEvents) return;
 
-    const unsubscribe = subscribeToEvents('work_item_update', (message) => {
-      console.log('Received work item update via WebSocket:', message);
-      // Refresh work items when any work item is updated
+    // One batch carries every work item written in the feed window, so a
+    // burst of writes (e.g. a progress rollup) triggers a single reload
+    const unsubscribeChanges = subscribeToEvents('work_item_changes', (message) => {
+      console.log('Received work item changes via WebSocket:', message);
+      loadWorkItems();
+    });
+    const unsubscribeResync = subscribeToEvents('resync', () => {
       loadWorkItems();
     });
 
-    return unsubscribe;
+    return () => {
+      unsubscribeChanges();
+      unsubscribeResync();
+    };
   }, [subscribeToEvents]); // Remove loadWorkItems from dependencies
 
   const handleSearch = async () => {
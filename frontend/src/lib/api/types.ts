@@ -91,7 +91,7 @@ export interface SearchWorkItemsResponse {
 }
 
 export interface WebSocketMessage {
-  type: 'work_item_update' | 'progress_update' | 'execution_update' | 'error' | 'connection_established' | 'heartbeat' | 'pong';
+  type: 'work_item_update' | 'work_item_changes' | 'resync' | 'progress_update' | 'execution_update' | 'error' | 'connection_established' | 'heartbeat' | 'pong';
   data: any;
   timestamp: string;
 }
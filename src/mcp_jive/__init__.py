@@ -8,10 +8,24 @@ __version__ = "0.1.0"
 __author__ = "MCP Jive Development Team"
 __description__ = "Autonomous AI Code Builder with MCP Protocol Support"
 
-# Core components
-from .server import MCPJiveServer
-from .config import Config
-from .lancedb_manager import LanceDBManager, DatabaseConfig
+# Core components are imported on first access: importing the server pulls in
+# the MCP SDK and every tool module, which entry points such as --help and
+# --version do not need.
+_LAZY_EXPORTS = {
+    "MCPJiveServer": ".server",
+    "Config": ".config",
+    "LanceDBManager": ".lancedb_manager",
+    "DatabaseConfig": ".lancedb_manager",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from importlib import import_module
+        value = getattr(import_module(_LAZY_EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     "MCPJiveServer",
@@ -15,15 +15,11 @@ from typing import Optional
 # Add the src directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from mcp_jive.server import MCPServer, MCPJiveServer, set_server_instance
 from mcp_jive.config import Config, ServerConfig
-from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
-from mcp_jive.health import HealthMonitor
-from mcp_jive.utils import ensure_port_available_for_server
 
-# Apply MCP serialization fixes BEFORE any MCP operations
-from mcp_jive import mcp_serialization_fix
-mcp_serialization_fix.apply_comprehensive_fixes()
+# The server, database and MCP modules are imported by the commands that use
+# them, so --help and --version answer without loading them. Importing
+# mcp_jive.server applies the MCP serialization fixes before any MCP operation.
 
 
 def setup_logging(log_level: str = "INFO", stdio_mode: bool = False) -> None:
@@ -180,6 +176,7 @@ Environment Variables:
 
 async def initialize_database(config: ServerConfig) -> bool:
     """Initialize the LanceDB database."""
+    from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
     logger = logging.getLogger(__name__)
     
     try:
@@ -212,6 +209,8 @@ async def initialize_database(config: ServerConfig) -> bool:
 
 async def perform_health_check(config: ServerConfig) -> bool:
     """Perform a comprehensive health check."""
+    from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+    from mcp_jive.health import HealthMonitor
     logger = logging.getLogger(__name__)
     
     try:
@@ -280,6 +279,8 @@ async def perform_health_check(config: ServerConfig) -> bool:
 
 async def run_server(config: ServerConfig, full_config: Config, transport_mode: str = "combined") -> None:
     """Run the MCP server."""
+    from mcp_jive.server import MCPServer, MCPJiveServer, set_server_instance
+    from mcp_jive.utils import ensure_port_available_for_server
     logger = logging.getLogger(__name__)
 
     try:
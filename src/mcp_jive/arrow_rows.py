@@ -0,0 +1,104 @@
+"""Arrow-native row decoding for LanceDB reads.
+
+Reads project away the embedding column before anything is materialized and
+decode the resulting Arrow table column-wise with ``Table.to_pylist()``, so
+rows come back as plain Python values without a pandas round trip or
+per-cell conversion. The only per-row work left is replacing null list
+columns with empty lists, which callers rely on.
+
+pyarrow is only imported under TYPE_CHECKING: every function here receives
+Arrow objects from LanceDB, so importing this module stays cheap.
+"""
+
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+# Columns never returned to callers (embeddings are only used for ranking)
+EXCLUDED_COLUMNS = ('vector',)
+
+
+def projected_columns(schema: "pa.Schema", exclude: Iterable[str] = EXCLUDED_COLUMNS) -> List[str]:
+    """Names of the schema's columns minus the excluded ones."""
+    excluded = set(exclude)
+    return [name for name in schema.names if name not in excluded]
+
+
+def resolve_columns(schema: "pa.Schema", columns: Optional[Sequence[str]] = None) -> List[str]:
+    """Resolve a caller's column projection against a table schema.
+
+    Args:
+        schema: Schema of the table being read
+        columns: Requested columns; None selects every column except the excluded ones
+
+    Returns:
+        The requested columns that exist, always including ``id``
+    """
+    if columns is None:
+        return projected_columns(schema)
+    names = set(schema.names)
+    return [name for name in dict.fromkeys(['id', *columns]) if name in names]
+
+
+def _list_columns(schema: "pa.Schema") -> List[str]:
+    import pyarrow as pa
+    return [field.name for field in schema
+            if pa.types.is_list(field.type) or pa.types.is_large_list(field.type)
+            or pa.types.is_fixed_size_list(field.type)]
+
+
+def decode_table(table: "pa.Table", exclude: Iterable[str] = EXCLUDED_COLUMNS) -> List[Dict[str, Any]]:
+    """Decode an Arrow table into row dictionaries.
+
+    Args:
+        table: Arrow table (e.g. a LanceDB ``to_arrow()`` result)
+        exclude: Columns to drop before decoding
+
+    Returns:
+        One dictionary per row; null list columns become empty lists
+    """
+    keep = projected_columns(table.schema, exclude)
+    if len(keep) != len(table.schema.names):
+        table = table.select(keep)
+    rows = table.to_pylist()
+    list_columns = _list_columns(table.schema)
+    if list_columns:
+        for row in rows:
+            for name in list_columns:
+                if row[name] is None:
+                    row[name] = []
+    return rows
+
+
+def read_rows(query, columns: Optional[Sequence[str]] = None,
+              exclude: Iterable[str] = EXCLUDED_COLUMNS) -> List[Dict[str, Any]]:
+    """Run a LanceDB query and decode its rows.
+
+    Args:
+        query: LanceDB query builder (limit, where etc. already applied)
+        columns: Columns to read; when given they are pushed down to the scan
+        exclude: Columns dropped from the result unless explicitly requested
+
+    Returns:
+        Decoded rows (search scores such as ``_distance`` are kept)
+    """
+    if columns is not None:
+        columns = list(columns)
+        query = query.select(columns)
+        exclude = [name for name in exclude if name not in columns]
+    return decode_table(query.to_arrow(), exclude)
+
+
+def normalize_row(row: Dict[str, Any], list_fields: Iterable[str] = (),
+                  exclude: Iterable[str] = EXCLUDED_COLUMNS) -> Dict[str, Any]:
+    """Drop excluded columns and fill null list fields of an already decoded row."""
+    for name in exclude:
+        row.pop(name, None)
+    for name in list_fields:
+        if name in row and row[name] is None:
+            row[name] = []
+    return row
+
+
+__all__ = ["EXCLUDED_COLUMNS", "projected_columns", "resolve_columns", "decode_table", "read_rows", "normalize_row"]
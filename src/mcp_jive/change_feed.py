@@ -0,0 +1,307 @@
+"""Batched work item change feed for MCP Jive.
+
+Registered as a LanceDBManager work item observer in every namespace, the
+feed collects writes for a short window, merges them per work item and then
+publishes a single numbered batch. A status change that rolls progress up a
+deep hierarchy therefore reaches clients as one message holding the item and
+each touched ancestor once, instead of one message per write.
+
+Recent batches are kept so that a client which reconnects with the sequence
+number of the last batch it saw receives exactly the batches it missed; if
+those are no longer retained it is told to resync (reload) instead.
+"""
+
+import asyncio
+import logging
+from collections import deque
+from datetime import date, datetime
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Merged in the window before a batch is published
+DEFAULT_WINDOW_SECONDS = 0.025
+# Batches retained for clients resuming after a reconnect
+DEFAULT_HISTORY_SIZE = 1000
+# Batches buffered per subscriber before it is told to resync
+DEFAULT_SUBSCRIBER_BUFFER = 256
+
+# Large or internal fields that clients never render
+EXCLUDED_FIELDS = frozenset({'vector'})
+
+
+def _jsonable(value: Any) -> Any:
+    """Convert values read from LanceDB/pydantic rows into JSON types."""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if hasattr(value, 'tolist'):  # numpy scalars and arrays
+        return value.tolist()
+    return value
+
+
+class ChangeSubscription:
+    """Batches published after a subscriber's position, for streaming endpoints."""
+
+    def __init__(self, feed: "ChangeFeed", max_buffered: int):
+        self._feed = feed
+        self._buffer: Deque[Dict[str, Any]] = deque()
+        self._max_buffered = max_buffered
+        self._ready = asyncio.Event()
+        # Set when batches were lost; the subscriber has to reload
+        self.resync_required = False
+
+    def _push(self, batch: Dict[str, Any]) -> None:
+        if len(self._buffer) >= self._max_buffered:
+            self._buffer.clear()
+            self.resync_required = True
+        else:
+            self._buffer.append(batch)
+        self._ready.set()
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Wait for the next batch.
+
+        Args:
+            timeout: Seconds to wait before giving up
+
+        Returns:
+            The next batch, a ``{"resync": True, "seq": n}`` marker if batches
+            were lost, or None on timeout
+        """
+        if not self._buffer and not self.resync_required:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return None
+        if self.resync_required:
+            # Everything buffered predates the reload the subscriber is about to do
+            self.resync_required = False
+            self._buffer.clear()
+            return {"resync": True, "seq": self._feed.seq}
+        return self._buffer.popleft()
+
+    def close(self) -> None:
+        """Stop receiving batches."""
+        self._feed._subscriptions.discard(self)
+
+
+class _NamespaceObserver:
+    """Forwards one namespace manager's work item writes to the feed."""
+
+    def __init__(self, feed: "ChangeFeed", namespace: str):
+        self.feed = feed
+        self.namespace = namespace
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        self.feed.record(self.namespace, row.get('id'), 'upsert', row)
+
+    def remove(self, work_item_id: str) -> None:
+        self.feed.record(self.namespace, work_item_id, 'delete')
+
+    def invalidate(self) -> None:
+        self.feed.record(self.namespace, None, 'invalidate')
+
+
+class ChangeFeed:
+    """Collects work item writes and publishes them as merged, numbered batches."""
+
+    def __init__(self,
+                 window_seconds: float = DEFAULT_WINDOW_SECONDS,
+                 history_size: int = DEFAULT_HISTORY_SIZE,
+                 subscriber_buffer: int = DEFAULT_SUBSCRIBER_BUFFER):
+        """Initialize the change feed.
+
+        Args:
+            window_seconds: How long writes are merged before a batch is published
+            history_size: Number of published batches kept for resuming clients
+            subscriber_buffer: Batches buffered per subscription before it must resync
+        """
+        self.window_seconds = window_seconds
+        self.subscriber_buffer = subscriber_buffer
+        self.seq = 0
+        self._history: Deque[Dict[str, Any]] = deque(maxlen=max(1, history_size))
+        # (namespace, id) → merged change, in first-write order
+        self._pending: Dict[Tuple[str, Optional[str]], Dict[str, Any]] = {}
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._listeners: List[Callable[[Dict[str, Any]], None]] = []
+        self._subscriptions = set()
+
+        # Exposed through get_stats()
+        self.writes = 0
+        self.merged = 0
+
+    def configure(self, window_seconds: Optional[float] = None, history_size: Optional[int] = None) -> None:
+        """Change the merge window or history size.
+
+        Args:
+            window_seconds: New merge window
+            history_size: New number of retained batches
+        """
+        if window_seconds is not None:
+            self.window_seconds = max(0.0, window_seconds)
+        if history_size is not None and history_size != self._history.maxlen:
+            self._history = deque(self._history, maxlen=max(1, history_size))
+
+    def observer(self, namespace: str) -> _NamespaceObserver:
+        """Work item observer publishing a namespace's writes to this feed.
+
+        Args:
+            namespace: Namespace of the manager the observer is added to
+
+        Returns:
+            Object for LanceDBManager.add_work_item_observer
+        """
+        return _NamespaceObserver(self, namespace)
+
+    # Collecting
+    def record(self, namespace: str, work_item_id: Optional[str], op: str,
+               fields: Optional[Dict[str, Any]] = None) -> None:
+        """Add a write to the current window.
+
+        Args:
+            namespace: Namespace the write happened in
+            work_item_id: Work item written (None for a namespace-wide invalidate)
+            op: 'upsert', 'delete' or 'invalidate'
+            fields: Written fields for upserts (may be partial)
+        """
+        self.writes += 1
+        key = (namespace, work_item_id)
+        change = self._pending.get(key)
+        if change is None:
+            change = {"namespace": namespace, "id": work_item_id, "op": op, "fields": {}}
+            self._pending[key] = change
+        else:
+            self.merged += 1
+            if op != 'upsert' or change["op"] != 'upsert':
+                # A delete supersedes earlier fields; a re-create starts over
+                change["fields"] = {}
+            change["op"] = op
+        if op == 'upsert' and fields:
+            change["fields"].update(
+                (name, value) for name, value in fields.items()
+                if name not in EXCLUDED_FIELDS and name != 'id'
+            )
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._flush_handle is not None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Written outside an event loop: published by the next flush
+            return
+        self._flush_handle = loop.call_later(self.window_seconds, self.flush)
+
+    # Publishing
+    def flush(self) -> Optional[Dict[str, Any]]:
+        """Publish the pending changes as one batch.
+
+        Returns:
+            The published batch, or None if nothing was pending
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if not self._pending:
+            return None
+
+        changes = []
+        for change in self._pending.values():
+            if change["op"] == 'upsert':
+                change["fields"] = _jsonable(change["fields"])
+            else:
+                del change["fields"]
+            changes.append(change)
+        self._pending = {}
+
+        self.seq += 1
+        batch = {"seq": self.seq, "changes": changes, "timestamp": datetime.now().isoformat()}
+        self._history.append(batch)
+
+        for listener in self._listeners:
+            try:
+                listener(batch)
+            except Exception as e:
+                logger.warning(f"Change feed listener failed: {e}")
+        for subscription in list(self._subscriptions):
+            subscription._push(batch)
+        return batch
+
+    def add_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Call a function with every published batch.
+
+        Args:
+            listener: Synchronous callable; it must not block
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[Dict[str, Any]], None]) -> None:
+        """Stop calling a listener registered with add_listener."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def since(self, seq: int) -> Optional[List[Dict[str, Any]]]:
+        """Batches published after a sequence number.
+
+        Args:
+            seq: Sequence number of the last batch the client received
+
+        Returns:
+            The missed batches in order, or None if some are no longer
+            retained (or seq is from another server run) and the client has
+            to resync
+        """
+        if seq > self.seq:
+            return None
+        if seq == self.seq:
+            return []
+        if not self._history or self._history[0]["seq"] > seq + 1:
+            return None
+        return [batch for batch in self._history if batch["seq"] > seq]
+
+    def subscribe(self, since: Optional[int] = None) -> ChangeSubscription:
+        """Subscribe to published batches.
+
+        Args:
+            since: Resume after this sequence number; missed batches are
+                queued first (or a resync if they are gone)
+
+        Returns:
+            Subscription to read batches from
+        """
+        subscription = ChangeSubscription(self, self.subscriber_buffer)
+        if since is not None:
+            missed = self.since(since)
+            if missed is None:
+                subscription.resync_required = True
+            else:
+                for batch in missed:
+                    subscription._push(batch)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get feed statistics for health reporting."""
+        return {
+            'seq': self.seq,
+            'window_seconds': self.window_seconds,
+            'retained_batches': len(self._history),
+            'pending_changes': len(self._pending),
+            'writes': self.writes,
+            'merged_writes': self.merged,
+            'subscribers': len(self._subscriptions),
+            'listeners': len(self._listeners)
+        }
+
+
+# Global instance shared by every namespace manager and streaming endpoint
+change_feed = ChangeFeed()
+
+__all__ = ["ChangeFeed", "ChangeSubscription", "change_feed"]
@@ -40,6 +40,20 @@ class DatabaseConfig:
     lancedb_namespace: Optional[str] = None  # Namespace for multi-tenant support
     lancedb_embedding_model: str = "all-MiniLM-L6-v2"
     lancedb_device: str = "cpu"
+    
+    # Per-namespace connection pool
+    lancedb_pool_max_open: int = 32
+    lancedb_pool_idle_timeout: float = 600.0
+    
+    # Content-hash embedding cache
+    lancedb_embedding_cache_max_bytes: int = 16 * 1024 * 1024
+    lancedb_embedding_cache_disk: bool = False
+    lancedb_embedding_cache_disk_max_bytes: int = 256 * 1024 * 1024
+    
+    # Background compaction and index maintenance
+    lancedb_maintenance_enabled: bool = True
+    lancedb_maintenance_interval: float = 300.0
+    lancedb_maintenance_io_budget_bytes: int = 256 * 1024 * 1024
 
 
 # AI Configuration removed - no longer needed
@@ -72,6 +86,10 @@ class PerformanceConfig:
     enable_metrics: bool = True
     enable_health_checks: bool = True
     enable_profiling: bool = False
+    # Work item writes are merged for this long into one change feed batch
+    change_feed_window_ms: float = 25.0
+    # Change feed batches kept for clients resuming after a reconnect
+    change_feed_history: int = 1000
 
 
 @dataclass
@@ -199,7 +217,15 @@ class Config:
             lancedb_data_path=os.getenv("LANCEDB_DATA_PATH", "./data/lancedb_jive"),
             lancedb_namespace=os.getenv("LANCEDB_NAMESPACE"),  # None if not set
             lancedb_embedding_model=os.getenv("LANCEDB_EMBEDDING_MODEL", "all-MiniLM-L6-v2"),
-            lancedb_device=os.getenv("LANCEDB_DEVICE", "cpu")
+            lancedb_device=os.getenv("LANCEDB_DEVICE", "cpu"),
+            lancedb_pool_max_open=int(os.getenv("LANCEDB_POOL_MAX_OPEN", "32")),
+            lancedb_pool_idle_timeout=float(os.getenv("LANCEDB_POOL_IDLE_TIMEOUT", "600")),
+            lancedb_embedding_cache_max_bytes=int(os.getenv("LANCEDB_EMBEDDING_CACHE_MAX_BYTES", str(16 * 1024 * 1024))),
+            lancedb_embedding_cache_disk=os.getenv("LANCEDB_EMBEDDING_CACHE_DISK", "false").lower() == "true",
+            lancedb_embedding_cache_disk_max_bytes=int(os.getenv("LANCEDB_EMBEDDING_CACHE_DISK_MAX_BYTES", str(256 * 1024 * 1024))),
+            lancedb_maintenance_enabled=os.getenv("LANCEDB_MAINTENANCE_ENABLED", "true").lower() == "true",
+            lancedb_maintenance_interval=float(os.getenv("LANCEDB_MAINTENANCE_INTERVAL", "300")),
+            lancedb_maintenance_io_budget_bytes=int(os.getenv("LANCEDB_MAINTENANCE_IO_BUDGET_BYTES", str(256 * 1024 * 1024)))
         )
         
         # AI configuration removed
@@ -219,7 +245,9 @@ class Config:
             connection_timeout=int(os.getenv("CONNECTION_TIMEOUT", "60")),
             enable_metrics=os.getenv("ENABLE_METRICS", "true").lower() == "true",
             enable_health_checks=os.getenv("ENABLE_HEALTH_CHECKS", "true").lower() == "true",
-            enable_profiling=os.getenv("ENABLE_PROFILING", "false").lower() == "true"
+            enable_profiling=os.getenv("ENABLE_PROFILING", "false").lower() == "true",
+            change_feed_window_ms=float(os.getenv("CHANGE_FEED_WINDOW_MS", "25")),
+            change_feed_history=int(os.getenv("CHANGE_FEED_HISTORY", "1000"))
         )
         
         self.tools = ToolsConfig(
@@ -261,6 +289,12 @@ class Config:
         if self.database.timeout <= 0:
             errors.append(f"Invalid database timeout: {self.database.timeout}")
         
+        if self.database.lancedb_pool_max_open <= 0:
+            errors.append(f"Invalid LanceDB pool size: {self.database.lancedb_pool_max_open}")
+        
+        if self.database.lancedb_maintenance_interval <= 0:
+            errors.append(f"Invalid LanceDB maintenance interval: {self.database.lancedb_maintenance_interval}")
+        
         # AI validation removed
         
         # Validate performance settings
@@ -270,6 +304,9 @@ class Config:
         if self.performance.request_timeout <= 0:
             errors.append(f"Invalid request timeout: {self.performance.request_timeout}")
         
+        if self.performance.change_feed_window_ms < 0:
+            errors.append(f"Invalid change feed window: {self.performance.change_feed_window_ms}")
+        
         # Validate tools settings
         if self.tools.max_task_depth <= 0:
             errors.append(f"Invalid max task depth: {self.tools.max_task_depth}")
@@ -0,0 +1,185 @@
+"""Batched, thread-offloaded embedding pipeline for MCP Jive.
+
+Embedding requests are queued and coalesced into batches of up to
+``batch_size`` texts. Each batch is encoded in a worker thread, so a bulk
+create no longer blocks the event loop and concurrent requests share a single
+model forward pass instead of running one pass per text.
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+EncodeFunc = Callable[[List[str]], List[List[float]]]
+
+
+class BatchingEmbedder:
+    """Coalesces concurrent embedding requests into model batches."""
+
+    def __init__(self,
+                 encode: EncodeFunc,
+                 batch_size: int = 100,
+                 max_wait: float = 0.005,
+                 max_workers: int = 1):
+        """Initialize the batching embedder.
+
+        Args:
+            encode: Blocking function that embeds a list of texts (runs in a worker thread)
+            batch_size: Maximum number of texts per model call
+            max_wait: Seconds to wait for more requests before flushing a partial batch
+            max_workers: Number of worker threads running the model
+        """
+        self.encode = encode
+        self.batch_size = max(1, batch_size)
+        self.max_wait = max_wait
+        self.max_workers = max(1, max_workers)
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Batch the worker is currently collecting or encoding
+        self._batch: List[Tuple[str, asyncio.Future]] = []
+
+        # Counters exposed through get_stats()
+        self.batches = 0
+        self.texts = 0
+        self.largest_batch = 0
+
+    def _ensure_worker(self) -> None:
+        """Start the batching worker on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and self._loop is loop and not self._worker.done():
+            return
+
+        # Requests queued on a previous (closed) loop can never complete, so start fresh
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                thread_name_prefix="jive-embed")
+        self._worker = loop.create_task(self._run())
+
+    def submit(self, text: str) -> "asyncio.Future[List[float]]":
+        """Queue a text for embedding.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Future resolving to the embedding vector
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        self._queue.put_nowait((text, future))
+        return future
+
+    async def embed(self, text: str) -> List[float]:
+        """Embed a single text.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        return await self.submit(text)
+
+    async def embed_many(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts, batching them with any other pending requests.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors in input order
+        """
+        if not texts:
+            return []
+        futures = [self.submit(text) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    async def _run(self) -> None:
+        """Worker loop: collect a batch, encode it off-loop, resolve futures."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            self._batch = batch
+            self._drain(queue, batch)
+            if len(batch) < self.batch_size and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+                self._drain(queue, batch)
+            await self._process(batch)
+            self._batch = []
+
+    def _drain(self, queue: asyncio.Queue, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Move already-queued requests into the batch up to batch_size."""
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _process(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """Encode one batch in the executor and resolve its futures."""
+        pending = [(text, future) for text, future in batch if not future.done()]
+        if not pending:
+            return
+
+        texts = [text for text, _ in pending]
+        try:
+            vectors = await self._loop.run_in_executor(self._executor, self.encode, texts)
+        except Exception as e:
+            logger.error(f"❌ Embedding batch of {len(texts)} failed: {e}")
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.texts += len(texts)
+        self.largest_batch = max(self.largest_batch, len(texts))
+        for (_, future), vector in zip(pending, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    async def close(self) -> None:
+        """Stop the worker, fail unfinished requests and release the worker threads."""
+        if self._worker is not None and not self._worker.done():
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+
+        # Nothing will encode these any more; fail them so awaiting callers return
+        pending = self._batch
+        self._batch = []
+        while self._queue is not None and not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        for _, future in pending:
+            if not future.done():
+                future.set_exception(RuntimeError("Embedding batcher is closed"))
+        self._queue = None
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics for health reporting."""
+        return {
+            'batch_size': self.batch_size,
+            'batches': self.batches,
+            'texts': self.texts,
+            'largest_batch': self.largest_batch,
+            'average_batch': self.texts / self.batches if self.batches else 0.0,
+            'pending': self._queue.qsize() if self._queue is not None else 0
+        }
+
+
+__all__ = ["BatchingEmbedder"]
@@ -0,0 +1,174 @@
+"""In-memory work item hierarchy index for MCP Jive.
+
+Keeps a parent_id → ordered child ids adjacency map (and the reverse
+id → parent_id map) for one namespace's WorkItem table. It is built once from
+a projected scan of ``id``, ``parent_id``, ``order_index`` and ``created_at``
+and then kept current by LanceDBManager on create, update and delete, so a
+subtree lookup costs O(subtree) instead of a full table scan per level.
+"""
+
+import bisect
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (order_index, created_at, id): children sort by order_index, then creation time
+SortKey = Tuple[int, str, str]
+
+# Columns needed to build the index
+INDEX_COLUMNS = ['id', 'parent_id', 'order_index', 'created_at']
+
+
+class WorkItemHierarchyIndex:
+    """Parent → children adjacency index over work item ids."""
+
+    def __init__(self):
+        self._parent: Dict[str, Optional[str]] = {}
+        self._sort_key: Dict[str, SortKey] = {}
+        self._children: Dict[Optional[str], List[SortKey]] = defaultdict(list)
+        self.built = False
+
+    @staticmethod
+    def _normalize_parent(parent_id: Any) -> Optional[str]:
+        """Treat empty and missing parents as root."""
+        if parent_id is None or parent_id == '' or parent_id != parent_id:  # NaN from pandas
+            return None
+        return str(parent_id)
+
+    @staticmethod
+    def _order(value: Any) -> int:
+        try:
+            return int(value or 0)
+        except (TypeError, ValueError):
+            return 0
+
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the index from rows holding the INDEX_COLUMNS.
+
+        Args:
+            rows: Work item rows (extra columns are ignored)
+        """
+        self._parent.clear()
+        self._sort_key.clear()
+        self._children.clear()
+        for row in rows:
+            if row.get('id'):
+                self._attach(str(row['id']),
+                             self._normalize_parent(row.get('parent_id')),
+                             self._order(row.get('order_index')),
+                             str(row.get('created_at') or ''))
+        self.built = True
+        logger.debug(f"Built work item hierarchy index with {len(self._parent)} items")
+
+    def invalidate(self) -> None:
+        """Drop the index so it is rebuilt on next use (e.g. after a restore)."""
+        self._parent.clear()
+        self._sort_key.clear()
+        self._children.clear()
+        self.built = False
+
+    def _attach(self, item_id: str, parent_id: Optional[str], order: int, created_at: str) -> None:
+        key = (order, created_at, item_id)
+        self._parent[item_id] = parent_id
+        self._sort_key[item_id] = key
+        bisect.insort(self._children[parent_id], key)
+
+    def _detach(self, item_id: str) -> None:
+        key = self._sort_key.pop(item_id)
+        parent_id = self._parent.pop(item_id)
+        siblings = self._children.get(parent_id, [])
+        position = bisect.bisect_left(siblings, key)
+        if position < len(siblings) and siblings[position] == key:
+            del siblings[position]
+        if not siblings:
+            self._children.pop(parent_id, None)
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """Add or move a work item.
+
+        Rows may be partial: fields that are absent keep their indexed value.
+
+        Args:
+            row: Work item row with at least 'id'
+        """
+        if not self.built or not row.get('id'):
+            return
+        item_id = str(row['id'])
+
+        if item_id in self._sort_key:
+            if not any(column in row for column in INDEX_COLUMNS[1:]):
+                return  # e.g. a status-only update
+            old_order, old_created_at, _ = self._sort_key[item_id]
+            parent_id = (self._normalize_parent(row['parent_id'])
+                         if 'parent_id' in row else self._parent[item_id])
+            order = self._order(row['order_index']) if 'order_index' in row else old_order
+            created_at = str(row['created_at'] or '') if 'created_at' in row else old_created_at
+            self._detach(item_id)
+        else:
+            parent_id = self._normalize_parent(row.get('parent_id'))
+            order = self._order(row.get('order_index'))
+            created_at = str(row.get('created_at') or '')
+
+        self._attach(item_id, parent_id, order, created_at)
+
+    def remove(self, item_id: str) -> None:
+        """Remove a work item (its children keep pointing at the removed id)."""
+        if self.built and item_id in self._sort_key:
+            self._detach(item_id)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._parent
+
+    def __len__(self) -> int:
+        return len(self._parent)
+
+    def parent(self, item_id: str) -> Optional[str]:
+        """Get the parent id of a work item (None for roots and unknown ids)."""
+        return self._parent.get(item_id)
+
+    def children(self, parent_id: Optional[str]) -> List[str]:
+        """Get the ordered direct children of a work item (None for roots)."""
+        return [key[-1] for key in self._children.get(self._normalize_parent(parent_id), [])]
+
+    def roots(self) -> List[str]:
+        """Get the ordered top-level work items."""
+        return self.children(None)
+
+    def descendants(self, item_id: str, max_depth: Optional[int] = None) -> List[str]:
+        """Get all descendants of a work item in depth-first pre-order.
+
+        Args:
+            item_id: Root of the subtree (not included in the result)
+            max_depth: Optional depth limit (1 = direct children only)
+
+        Returns:
+            Descendant ids; each id appears once even if the data has cycles
+        """
+        result: List[str] = []
+        visited = {item_id}
+        stack = [(child, 1) for child in reversed(self.children(item_id))]
+        while stack:
+            current, depth = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            result.append(current)
+            if max_depth is None or depth < max_depth:
+                stack.extend((child, depth + 1) for child in reversed(self.children(current)))
+        return result
+
+    def ancestors(self, item_id: str) -> List[str]:
+        """Get the parent chain of a work item, nearest first."""
+        result: List[str] = []
+        seen = {item_id}
+        current = self._parent.get(item_id)
+        while current is not None and current not in seen:
+            result.append(current)
+            seen.add(current)
+            current = self._parent.get(current)
+        return result
+
+
+__all__ = ["WorkItemHierarchyIndex", "INDEX_COLUMNS"]
@@ -0,0 +1,307 @@
+"""In-memory inverted keyword index for MCP Jive work items.
+
+Indexes title, description, acceptance_criteria and tags per field and scores
+matches with BM25, weighted by a per-field boost. Query terms also match
+indexed terms they are a prefix of ("auth" → "authentication") and, when
+nothing matches exactly, terms within a small edit distance ("authetication").
+Like the hierarchy index, it is built once per namespace from a projected
+scan and then kept current by LanceDBManager on every write, so a search
+touches only the postings of the query terms and has no item cap.
+"""
+
+import bisect
+import logging
+import math
+import re
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Field → boost applied to its BM25 score
+FIELD_BOOSTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'description': 1.0,
+    'acceptance_criteria': 0.8,
+}
+
+# Attributes kept per item so filters are applied inside the index
+FILTER_ATTRIBUTES = ('status', 'item_type', 'priority', 'assignee')
+
+# Columns needed to build the index
+KEYWORD_INDEX_COLUMNS = ['id', *FIELD_BOOSTS, *FILTER_ATTRIBUTES]
+
+# Weight of expanded terms relative to an exact term match
+PREFIX_WEIGHT = 0.7
+FUZZY_WEIGHT = 0.5
+MAX_EXPANSIONS = 50
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_TOKEN_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: Any) -> List[str]:
+    """Split text (or a list of texts) into lowercase word tokens."""
+    if text is None:
+        return []
+    if isinstance(text, (list, tuple)) or hasattr(text, 'tolist'):
+        values = text.tolist() if hasattr(text, 'tolist') else text
+        return [token for value in values for token in tokenize(value)]
+    return _TOKEN_PATTERN.findall(str(text).lower())
+
+
+def _within_distance(a: str, b: str, max_distance: int) -> bool:
+    """Bounded Levenshtein check (stops once a row exceeds max_distance)."""
+    if abs(len(a) - len(b)) > max_distance:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, start=1):
+        current = [i]
+        for j, char_b in enumerate(b, start=1):
+            current.append(min(previous[j] + 1,
+                               current[j - 1] + 1,
+                               previous[j - 1] + (char_a != char_b)))
+        if min(current) > max_distance:
+            return False
+        previous = current
+    return previous[-1] <= max_distance
+
+
+class WorkItemKeywordIndex:
+    """Per-field inverted index with BM25 scoring over work items."""
+
+    def __init__(self, field_boosts: Optional[Dict[str, float]] = None):
+        self.field_boosts = dict(field_boosts or FIELD_BOOSTS)
+        # field → term → {item_id: term frequency}
+        self._postings: Dict[str, Dict[str, Dict[str, int]]] = {field: {} for field in self.field_boosts}
+        # item_id → field → term counts (needed to undo an item's postings)
+        self._terms: Dict[str, Dict[str, Counter]] = {}
+        self._lengths: Dict[str, Dict[str, int]] = {field: {} for field in self.field_boosts}
+        self._total_length: Dict[str, int] = {field: 0 for field in self.field_boosts}
+        self._attributes: Dict[str, Dict[str, Any]] = {}
+        # term → number of (item, field) postings; drives the vocabulary
+        self._term_refs: Counter = Counter()
+        self._vocabulary: List[str] = []
+        self._vocabulary_dirty = False
+        self.built = False
+
+    # Maintenance
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the index from rows holding the KEYWORD_INDEX_COLUMNS.
+
+        Args:
+            rows: Work item rows (extra columns are ignored)
+        """
+        self._reset()
+        for row in rows:
+            if row.get('id'):
+                self._index(str(row['id']), row)
+        self.built = True
+        logger.debug(f"Built keyword index with {len(self._terms)} items, {len(self._term_refs)} terms")
+
+    def invalidate(self) -> None:
+        """Drop the index so it is rebuilt on next use (e.g. after a restore)."""
+        self._reset()
+        self.built = False
+
+    def _reset(self) -> None:
+        for field in self.field_boosts:
+            self._postings[field].clear()
+            self._lengths[field].clear()
+            self._total_length[field] = 0
+        self._terms.clear()
+        self._attributes.clear()
+        self._term_refs.clear()
+        self._vocabulary = []
+        self._vocabulary_dirty = False
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """Index a created or updated work item.
+
+        Rows may be partial: only the fields present are re-indexed.
+
+        Args:
+            row: Work item row with at least 'id'
+        """
+        if not self.built or not row.get('id'):
+            return
+        self._index(str(row['id']), row)
+
+    def remove(self, item_id: str) -> None:
+        """Remove a work item from the index."""
+        if not self.built or item_id not in self._terms:
+            return
+        for field in list(self._terms[item_id]):
+            self._unindex_field(item_id, field)
+        del self._terms[item_id]
+        self._attributes.pop(item_id, None)
+
+    def _index(self, item_id: str, row: Dict[str, Any]) -> None:
+        fields = self._terms.setdefault(item_id, {})
+        attributes = self._attributes.setdefault(item_id, {})
+        for name in FILTER_ATTRIBUTES:
+            if name in row:
+                attributes[name] = row[name]
+
+        for field in self.field_boosts:
+            if field not in row:
+                continue
+            if field in fields:
+                self._unindex_field(item_id, field)
+            counts = Counter(tokenize(row[field]))
+            if not counts:
+                continue
+            fields[field] = counts
+            postings = self._postings[field]
+            for term, frequency in counts.items():
+                postings.setdefault(term, {})[item_id] = frequency
+                self._term_refs[term] += 1
+                if self._term_refs[term] == 1:
+                    self._vocabulary_dirty = True
+            length = sum(counts.values())
+            self._lengths[field][item_id] = length
+            self._total_length[field] += length
+
+    def _unindex_field(self, item_id: str, field: str) -> None:
+        counts = self._terms[item_id].pop(field, None)
+        if not counts:
+            return
+        postings = self._postings[field]
+        for term in counts:
+            items = postings.get(term)
+            if items is not None:
+                items.pop(item_id, None)
+                if not items:
+                    del postings[term]
+            self._term_refs[term] -= 1
+            if self._term_refs[term] <= 0:
+                del self._term_refs[term]
+                self._vocabulary_dirty = True
+        self._total_length[field] -= self._lengths[field].pop(item_id, 0)
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    # Search
+    def _sorted_vocabulary(self) -> List[str]:
+        if self._vocabulary_dirty:
+            self._vocabulary = sorted(self._term_refs)
+            self._vocabulary_dirty = False
+        return self._vocabulary
+
+    def expand(self, term: str) -> List[Tuple[str, float]]:
+        """Map a query term to indexed terms with match weights.
+
+        The exact term weighs 1.0 and terms it is a prefix of weigh
+        PREFIX_WEIGHT. Only when neither exists are terms within one edit
+        (two for terms of 8+ characters) used, at FUZZY_WEIGHT.
+
+        Args:
+            term: Lowercase query token
+
+        Returns:
+            (indexed term, weight) pairs
+        """
+        vocabulary = self._sorted_vocabulary()
+        expansions: List[Tuple[str, float]] = []
+        if term in self._term_refs:
+            expansions.append((term, 1.0))
+
+        if len(term) >= 2:
+            position = bisect.bisect_right(vocabulary, term)
+            while (position < len(vocabulary) and vocabulary[position].startswith(term)
+                   and len(expansions) < MAX_EXPANSIONS):
+                expansions.append((vocabulary[position], PREFIX_WEIGHT))
+                position += 1
+
+        if not expansions and len(term) >= 4:
+            max_distance = 2 if len(term) >= 8 else 1
+            for candidate in vocabulary:
+                if _within_distance(term, candidate, max_distance):
+                    expansions.append((candidate, FUZZY_WEIGHT))
+                    if len(expansions) >= MAX_EXPANSIONS:
+                        break
+        return expansions
+
+    def _matches_filters(self, item_id: str, filters: Dict[str, Any]) -> bool:
+        attributes = self._attributes.get(item_id, {})
+        for name, expected in filters.items():
+            if expected is None or expected == [] or expected == '':
+                continue
+            allowed = expected if isinstance(expected, (list, tuple, set)) else [expected]
+            if attributes.get(name) not in allowed:
+                return False
+        return True
+
+    def search(self,
+               query: str,
+               fields: Optional[Sequence[str]] = None,
+               filters: Optional[Dict[str, Any]] = None,
+               limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Rank work items for a keyword query.
+
+        Args:
+            query: Free-text query; items matching any term are returned
+            fields: Fields to search (default: all indexed fields)
+            filters: Attribute → value or list of values (see FILTER_ATTRIBUTES)
+            limit: Maximum number of hits (None for all)
+
+        Returns:
+            Hits ordered by descending score, each with 'id', 'score' and
+            'fields' (matched field → matched terms, best field first)
+        """
+        fields = [field for field in (fields or self.field_boosts) if field in self.field_boosts]
+        item_count = len(self._terms)
+        if not fields or not item_count:
+            return []
+
+        scores: Dict[str, float] = {}
+        matched: Dict[str, Dict[str, Dict[str, float]]] = {}
+        for query_term in dict.fromkeys(tokenize(query)):
+            for term, weight in self.expand(query_term):
+                for field in fields:
+                    postings = self._postings[field].get(term)
+                    if not postings:
+                        continue
+                    boost = self.field_boosts[field]
+                    idf = math.log(1.0 + (item_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                    average_length = self._total_length[field] / max(len(self._lengths[field]), 1)
+                    lengths = self._lengths[field]
+                    for item_id, frequency in postings.items():
+                        norm = 1.0 - BM25_B + BM25_B * lengths.get(item_id, 0) / (average_length or 1.0)
+                        score = boost * weight * idf * frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * norm)
+                        scores[item_id] = scores.get(item_id, 0.0) + score
+                        field_terms = matched.setdefault(item_id, {}).setdefault(field, {})
+                        field_terms[term] = field_terms.get(term, 0.0) + score
+
+        if filters:
+            scores = {item_id: score for item_id, score in scores.items()
+                      if self._matches_filters(item_id, filters)}
+
+        ranked = sorted(scores.items(), key=lambda entry: entry[1], reverse=True)
+        if limit is not None:
+            ranked = ranked[:limit]
+
+        hits = []
+        for item_id, score in ranked:
+            by_field = sorted(matched[item_id].items(), key=lambda entry: sum(entry[1].values()), reverse=True)
+            hits.append({
+                'id': item_id,
+                'score': score,
+                'fields': {field: list(terms) for field, terms in by_field}
+            })
+        return hits
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get index statistics for health reporting."""
+        return {
+            'built': self.built,
+            'items': len(self._terms),
+            'terms': len(self._term_refs)
+        }
+
+
+__all__ = ["WorkItemKeywordIndex", "KEYWORD_INDEX_COLUMNS", "FIELD_BOOSTS", "tokenize"]
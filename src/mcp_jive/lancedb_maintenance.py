@@ -0,0 +1,256 @@
+"""Background maintenance for LanceDB tables.
+
+Every work item update is a delete plus an append, so tables accumulate
+small fragments and deletion files, and rows appended since an index was
+built are scanned rather than indexed. The scheduler periodically
+inspects every table of every open namespace and, where thresholds are
+crossed, compacts it, removes old versions and folds unindexed rows into
+its scalar and full-text indexes.
+
+Each pass is limited by an I/O budget: tasks are ordered by urgency and
+their cost is estimated from the table size, and once the budget is spent
+the remaining tasks wait for the next pass. Work runs in a worker thread so
+request handling is not blocked.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from .lancedb_pool import LanceDBManagerPool
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class MaintenanceConfig:
+    """Thresholds and budget for background table maintenance."""
+    enabled: bool = True
+    interval_seconds: float = 300.0
+    # Bytes of table data a single pass may rewrite (the first task always runs)
+    io_budget_bytes: int = 256 * 1024 * 1024
+    # Compact once a table has this many small fragments ...
+    min_small_fragments: int = 8
+    # ... or this share of its rows are deleted
+    max_deleted_ratio: float = 0.1
+    # Versions older than this are removed after compaction
+    cleanup_older_than_seconds: float = 3600.0
+    # Also clean up without compaction once this many versions were written
+    cleanup_after_versions: int = 200
+
+
+@dataclass
+class MaintenanceTask:
+    """Maintenance planned for one table."""
+    namespace: str
+    table_name: str
+    compact: bool
+    cleanup: bool
+    refresh_indexes: bool
+    estimated_bytes: int
+    urgency: float
+
+    @property
+    def key(self) -> Tuple[str, str]:
+        return self.namespace, self.table_name
+
+
+class LanceDBMaintenanceScheduler:
+    """Periodically compacts tables and refreshes their indexes."""
+
+    def __init__(self, manager_pool: LanceDBManagerPool, config: Optional[MaintenanceConfig] = None):
+        """Initialize the scheduler.
+
+        Args:
+            manager_pool: Pool whose open namespaces are maintained
+            config: Maintenance thresholds and budget
+        """
+        self.manager_pool = manager_pool
+        self.config = config or MaintenanceConfig()
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        # (namespace, table) → table version at the last version cleanup
+        self._cleaned_versions: Dict[Tuple[str, str], int] = {}
+
+        # Exposed through get_stats()
+        self.passes = 0
+        self.last_run_at: Optional[datetime] = None
+        self.last_duration_seconds = 0.0
+        self.last_report: Dict[str, Any] = {}
+        self.totals = {
+            'compactions': 0,
+            'fragments_removed': 0,
+            'version_cleanups': 0,
+            'versions_removed': 0,
+            'index_refreshes': 0,
+            'deferred': 0,
+            'errors': 0
+        }
+
+    # Lifecycle
+    def start(self) -> None:
+        """Start the background loop (no-op when disabled or already running)."""
+        if not self.config.enabled or self.is_running:
+            return
+        self._task = asyncio.create_task(self._run_loop())
+        logger.info(f"🧹 LanceDB maintenance scheduled every {self.config.interval_seconds:.0f}s")
+
+    async def stop(self) -> None:
+        """Stop the background loop, letting a running pass finish its current table."""
+        task, self._task = self._task, None
+        if task is None:
+            return
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    @property
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _run_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.config.interval_seconds)
+            try:
+                await self.run_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.totals['errors'] += 1
+                logger.error(f"❌ LanceDB maintenance pass failed: {e}")
+
+    # Planning
+    def plan(self, namespace: str, table_name: str, stats: Dict[str, Any]) -> Optional[MaintenanceTask]:
+        """Decide what a table needs from its maintenance statistics.
+
+        Args:
+            namespace: Namespace of the table
+            table_name: Name of the table
+            stats: Output of LanceDBManager.get_table_maintenance_stats
+
+        Returns:
+            The task to run, or None if the table is healthy
+        """
+        config = self.config
+        fragmented = stats['num_small_fragments'] >= config.min_small_fragments
+        deleted = stats['deleted_rows'] > 0 and stats['deleted_ratio'] >= config.max_deleted_ratio
+        compact = fragmented or deleted
+
+        cleaned = self._cleaned_versions.get((namespace, table_name), 0)
+        cleanup = compact or stats['version'] - cleaned >= config.cleanup_after_versions
+        refresh_indexes = stats['unindexed_rows'] > 0
+        if not (compact or cleanup or refresh_indexes):
+            return None
+
+        total_bytes = stats['total_bytes']
+        estimated = 0
+        if compact:
+            estimated = total_bytes
+        elif refresh_indexes and stats['num_rows']:
+            estimated = int(total_bytes * stats['unindexed_rows'] / stats['num_rows'])
+
+        # Deleted rows and fragments slow every read; unindexed rows only some
+        urgency = (stats['num_small_fragments'] / max(config.min_small_fragments, 1)
+                   + stats['deleted_ratio'] / max(config.max_deleted_ratio, 1e-9)
+                   + (0.5 if refresh_indexes else 0.0))
+        return MaintenanceTask(namespace, table_name, compact, cleanup, refresh_indexes,
+                               estimated, urgency)
+
+    # Execution
+    async def run_once(self) -> Dict[str, Any]:
+        """Run one maintenance pass over every open namespace.
+
+        Returns:
+            Per-table report of the work done or deferred
+        """
+        async with self._lock:
+            started = time.monotonic()
+            tasks: List[MaintenanceTask] = []
+            managers = {}
+            report: Dict[str, Dict[str, Any]] = {}
+
+            for namespace, manager in self.manager_pool.open_managers().items():
+                if not manager._initialized or manager.db is None:
+                    continue
+                managers[namespace] = manager
+                for table_name in manager.list_tables():
+                    try:
+                        stats = await asyncio.to_thread(manager.get_table_maintenance_stats, table_name)
+                    except Exception as e:
+                        self.totals['errors'] += 1
+                        report.setdefault(namespace, {})[table_name] = {'status': 'error', 'error': str(e)}
+                        continue
+                    task = self.plan(namespace, table_name, stats)
+                    if task is not None:
+                        tasks.append(task)
+
+            budget = self.config.io_budget_bytes
+            spent = 0
+            for task in sorted(tasks, key=lambda t: t.urgency, reverse=True):
+                table_report = report.setdefault(task.namespace, {})
+                if spent and spent + task.estimated_bytes > budget:
+                    self.totals['deferred'] += 1
+                    table_report[task.table_name] = {'status': 'deferred',
+                                                     'estimated_bytes': task.estimated_bytes}
+                    continue
+                spent += task.estimated_bytes
+                table_report[task.table_name] = await self._run_task(managers[task.namespace], task)
+
+            self.passes += 1
+            self.last_run_at = datetime.now()
+            self.last_duration_seconds = time.monotonic() - started
+            self.last_report = report
+            if tasks:
+                logger.info(f"🧹 LanceDB maintenance pass: {len(tasks)} tables needed work, "
+                            f"~{spent / (1024 * 1024):.1f} MiB budgeted in {self.last_duration_seconds:.1f}s")
+            return report
+
+    async def _run_task(self, manager, task: MaintenanceTask) -> Dict[str, Any]:
+        try:
+            result = await asyncio.to_thread(
+                manager.maintain_table,
+                task.table_name,
+                compact=task.compact,
+                cleanup_older_than=self.config.cleanup_older_than_seconds if task.cleanup else None,
+                refresh_indexes=task.refresh_indexes
+            )
+        except Exception as e:
+            self.totals['errors'] += 1
+            logger.warning(f"⚠️ Maintenance of {task.namespace}/{task.table_name} failed: {e}")
+            return {'status': 'error', 'error': str(e)}
+
+        if 'compaction' in result:
+            self.totals['compactions'] += 1
+            self.totals['fragments_removed'] += result['compaction']['fragments_removed']
+        if 'cleanup' in result:
+            self.totals['version_cleanups'] += 1
+            self.totals['versions_removed'] += result['cleanup']['old_versions']
+            try:
+                self._cleaned_versions[task.key] = manager.db.open_table(task.table_name).version
+            except Exception:
+                pass
+        if 'indexes' in result:
+            self.totals['index_refreshes'] += 1
+        return {'status': 'maintained', 'estimated_bytes': task.estimated_bytes, **result}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get scheduler statistics for health reporting."""
+        return {
+            'enabled': self.config.enabled,
+            'running': self.is_running,
+            'interval_seconds': self.config.interval_seconds,
+            'io_budget_bytes': self.config.io_budget_bytes,
+            'passes': self.passes,
+            'last_run_at': self.last_run_at.isoformat() if self.last_run_at else None,
+            'last_duration_seconds': self.last_duration_seconds,
+            'last_report': self.last_report,
+            'totals': dict(self.totals)
+        }
+
+
+__all__ = ["LanceDBMaintenanceScheduler", "MaintenanceConfig", "MaintenanceTask"]
@@ -15,12 +15,16 @@ Features:
 """
 
 import asyncio
+import hashlib
+import json
 import os
 import logging
+import threading
 import warnings
-from datetime import datetime, timezone
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Any, Optional, Set, Union, Tuple
 from dataclasses import dataclass
 from enum import Enum
 from uuid import uuid4
@@ -32,24 +36,46 @@ warnings.filterwarnings(
     category=UserWarning
 )
 
-try:
-    import lancedb
-    from lancedb.embeddings import SentenceTransformerEmbeddings
-    from lancedb.pydantic import LanceModel, Vector
-    import pandas as pd
+if TYPE_CHECKING:
+    # numpy and pyarrow are imported where used, so importing the server stays light
+    import numpy as np
     import pyarrow as pa
-except ImportError as e:
-    raise ImportError(
-        f"LanceDB dependencies not installed: {e}\n"
-        "Install with: pip install lancedb sentence-transformers pyarrow pandas"
-    )
 
-from pydantic import BaseModel, Field
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from .embedding_batcher import BatchingEmbedder
+from .hierarchy_index import WorkItemHierarchyIndex, INDEX_COLUMNS
+from .keyword_index import WorkItemKeywordIndex, KEYWORD_INDEX_COLUMNS
+from .search_fusion import reciprocal_rank_fusion
+from .arrow_rows import decode_table, read_rows, resolve_columns
+from .pagination import decode_cursor, encode_cursor, like_contains, sql_literal
 
 logger = logging.getLogger(__name__)
 
+# LanceDB (and through it lance-namespace, pandas and the embedding registry)
+# takes seconds to import, so it is loaded on first database use rather than
+# at module import; the table models live in lancedb_models for the same reason.
+_LANCEDB_MODELS = ('WorkItemModel', 'ExecutionLogModel', 'ArchitectureMemoryModel', 'TroubleshootMemoryModel')
+
+
+def _import_lancedb():
+    """Import and return the lancedb package."""
+    try:
+        import lancedb
+    except ImportError as e:
+        raise ImportError(
+            f"LanceDB dependencies not installed: {e}\n"
+            "Install with: pip install lancedb sentence-transformers pyarrow pandas"
+        )
+    return lancedb
+
+
+def __getattr__(name: str) -> Any:
+    # Table models are re-exported from lancedb_models on first access
+    if name in _LANCEDB_MODELS:
+        from . import lancedb_models
+        return getattr(lancedb_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 class SearchType(Enum):
     """Search type enumeration."""
     VECTOR = "vector"
@@ -70,92 +96,295 @@ class DatabaseConfig:
     enable_fts: bool = True  # Full-text search
     max_retries: int = 3
     retry_delay: float = 1.0
+    embedding_cache_max_bytes: int = 16 * 1024 * 1024  # In-memory LRU tier (0 disables)
+    embedding_cache_disk: bool = False  # Memory-mapped on-disk tier under the namespace path
+    embedding_cache_disk_max_bytes: int = 256 * 1024 * 1024
+    hybrid_candidate_multiplier: int = 4  # Candidates fetched per retriever = limit * multiplier
+    hybrid_rrf_k: int = 60  # Reciprocal rank fusion damping constant
 
-# Pydantic Models for LanceDB Tables (MCP Jive specific)
-
-class WorkItemModel(LanceModel):
-    """Work item data model for MCP Jive."""
-    id: str = Field(description="Unique work item identifier")
-    item_id: str = Field(description="Work item ID (may differ from primary id)")
-    title: str = Field(description="Work item title")
-    description: str = Field(description="Detailed description")
-    vector: Vector(384) = Field(description="Embedding vector")
-    item_type: str = Field(description="Type: Initiative/Epic/Feature/Story/Task")
-    status: str = Field(description="Current status")
-    priority: str = Field(description="Priority level")
-    assignee: Optional[str] = Field(description="Assigned person or AI agent", default=None)
-    tags: List[str] = Field(description="Associated tags", default_factory=list)
-    estimated_hours: Optional[float] = Field(description="Estimated effort", default=None)
-    actual_hours: Optional[float] = Field(description="Actual time spent", default=None)
-    progress: float = Field(description="Completion percentage (0-100)", default=0.0)
-    parent_id: Optional[str] = Field(description="Parent work item ID", default=None)
-    dependencies: List[str] = Field(description="Dependent work item IDs", default_factory=list)
-    
-    # Ordering and sequencing
-    sequence_number: Optional[str] = Field(description="Hierarchical sequence number (e.g., '1.1', '1.2', '2.1')", default=None)
-    order_index: int = Field(description="Numeric order within parent for sorting", default=0)
-    
-    # AI Optimization Parameters
-    context_tags: List[str] = Field(description="Technical context tags for AI categorization", default_factory=list)
-    complexity: Optional[str] = Field(description="Implementation complexity: simple, moderate, complex", default=None)
-    notes: Optional[str] = Field(description="Implementation notes, constraints, or context for AI agent", default=None)
-    acceptance_criteria: List[str] = Field(description="Clear, testable criteria for AI agents to validate completion", default_factory=list)
-    executable: bool = Field(description="Can be executed by the system", default=False)
-    execution_instructions: Optional[str] = Field(description="Instructions for execution", default=None)
-    created_at: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    updated_at: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
-
-class ExecutionLogModel(LanceModel):
-    """Execution log data model for MCP Jive."""
-    id: str = Field(description="Unique log identifier")
-    log_id: str = Field(description="Log entry ID")
-    work_item_id: Optional[str] = Field(description="Associated work item ID", default=None)
-    action: str = Field(description="Action performed")
-    status: str = Field(description="Execution status")
-    agent_id: Optional[str] = Field(description="AI agent identifier", default=None)
-    details: str = Field(description="Execution details", default="")
-    error_message: Optional[str] = Field(description="Error message if failed", default=None)
-    duration_seconds: float = Field(description="Execution duration", default=0.0)
-    timestamp: datetime = Field(description="Execution timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
-
-class ArchitectureMemoryModel(LanceModel):
-    """Architecture Memory data model for MCP Jive."""
-    id: str = Field(description="Unique identifier")
-    unique_slug: str = Field(description="Unique short slug for identification")
-    title: str = Field(description="Human-friendly short name")
-    ai_when_to_use: List[str] = Field(description="AI-friendly instructions for when to apply", default_factory=list)
-    ai_requirements: str = Field(description="AI-friendly detailed specifications (Markdown)")
-    vector: Vector(384) = Field(description="Embedding vector for semantic search")
-    keywords: List[str] = Field(description="Keywords that describe this architecture item", default_factory=list)
-    children_slugs: List[str] = Field(description="Child architecture item slugs", default_factory=list)
-    related_slugs: List[str] = Field(description="Related architecture item slugs", default_factory=list)
-    linked_epic_ids: List[str] = Field(description="Epic work item IDs that reference this", default_factory=list)
-    tags: List[str] = Field(description="Tags for categorization", default_factory=list)
-    created_on: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    last_updated_on: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+class EmbeddingCache:
+    """Content-addressed embedding cache.
+    
+    Vectors are keyed on a hash of (model name, whitespace-normalized text).
+    Lookups hit an in-memory LRU tier first and, when enabled, a memory-mapped
+    on-disk tier that survives restarts. Both tiers are bounded by bytes: the
+    memory tier evicts least recently used vectors, the disk tier is a ring of
+    fixed-size slots that overwrites the oldest entries.
+    """
+    
+    KEY_SIZE = 32  # sha256 digest
+    # Disk tier puts between checkpoints of the ring position
+    META_SYNC_INTERVAL = 256
+    
+    def __init__(self,
+                 model_name: str,
+                 dimension: int,
+                 max_bytes: int,
+                 disk_path: Optional[str] = None,
+                 disk_max_bytes: int = 0):
+        """Initialize the embedding cache.
+        
+        Args:
+            model_name: Embedding model name (part of the cache key)
+            dimension: Vector dimension
+            max_bytes: Byte budget of the in-memory tier (0 disables it)
+            disk_path: Directory of the on-disk tier (None disables it)
+            disk_max_bytes: Byte budget of the on-disk tier
+        """
+        self.model_name = model_name
+        self.dimension = dimension
+        self.max_bytes = max(0, max_bytes)
+        self.disk_path = Path(disk_path) if disk_path else None
+        self.disk_capacity = disk_max_bytes // (dimension * 4 + self.KEY_SIZE) if disk_path else 0
+        
+        self._lock = threading.Lock()
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._memory_bytes = 0
+        
+        self._disk_opened = False
+        self._disk_vectors = None
+        self._disk_keys = None
+        self._disk_index: Dict[bytes, int] = {}
+        self._disk_next = 0
+        self._disk_puts_since_sync = 0
+        
+        # Counters exposed through get_stats()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Normalize text so trivially different inputs share a cache entry."""
+        return " ".join(text.split())
+    
+    def key(self, text: str) -> bytes:
+        """Get the cache key for a text."""
+        payload = f"{self.model_name}\n{self.normalize(text)}".encode("utf-8")
+        return hashlib.sha256(payload).digest()
+    
+    def get(self, text: str) -> Optional[List[float]]:
+        """Look up the embedding of a text.
+        
+        Args:
+            text: Text to look up
+            
+        Returns:
+            Cached embedding or None on a miss
+        """
+        key = self.key(text)
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.memory_hits += 1
+                return vector.tolist()
+            
+            vector = self._disk_get(key)
+            if vector is not None:
+                self.disk_hits += 1
+                self._memory_put(key, vector)
+                return vector.tolist()
+            
+            self.misses += 1
+            return None
+    
+    def put(self, text: str, vector: List[float]) -> None:
+        """Store the embedding of a text in every enabled tier.
+        
+        Args:
+            text: Embedded text
+            vector: Its embedding
+        """
+        if len(vector) != self.dimension:
+            return
+        key = self.key(text)
+        import numpy as np
+        array = np.asarray(vector, dtype=np.float32)
+        with self._lock:
+            self._memory_put(key, array)
+            self._disk_put(key, array)
+    
+    def _memory_put(self, key: bytes, vector: "np.ndarray") -> None:
+        """Insert into the LRU tier and evict until it fits max_bytes."""
+        if self.max_bytes <= 0:
+            return
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.nbytes + len(key)
+        self._memory[key] = vector
+        self._memory_bytes += vector.nbytes + len(key)
+        while self._memory_bytes > self.max_bytes and self._memory:
+            evicted_key, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.nbytes + len(evicted_key)
+    
+    def _open_disk(self) -> bool:
+        """Open (or create) the memory-mapped disk tier on first use."""
+        if self._disk_opened:
+            return self._disk_vectors is not None
+        self._disk_opened = True
+        if self.disk_path is None or self.disk_capacity <= 0:
+            return False
+        
+        try:
+            self.disk_path.mkdir(parents=True, exist_ok=True)
+            meta_path = self.disk_path / "meta.json"
+            vectors_path = self.disk_path / "vectors.f32"
+            keys_path = self.disk_path / "keys.bin"
+            
+            meta = {}
+            if meta_path.exists():
+                try:
+                    meta = json.loads(meta_path.read_text())
+                except ValueError:
+                    meta = {}
+            expected_sizes = (self.disk_capacity * self.dimension * 4, self.disk_capacity * self.KEY_SIZE)
+            files_fit = (
+                vectors_path.exists() and keys_path.exists()
+                and (vectors_path.stat().st_size, keys_path.stat().st_size) == expected_sizes
+            )
+            # Keys hash the model name, so files of the right shape are safe to reuse
+            # even when meta.json was never written (the process did not shut down cleanly)
+            reuse = files_fit and (not meta or (
+                meta.get('model') == self.model_name
+                and meta.get('dimension') == self.dimension
+                and meta.get('capacity') == self.disk_capacity
+            ))
+            mode = 'r+' if reuse else 'w+'
+            import numpy as np
+            self._disk_vectors = np.memmap(vectors_path, dtype=np.float32, mode=mode,
+                                           shape=(self.disk_capacity, self.dimension))
+            self._disk_keys = np.memmap(keys_path, dtype=np.uint8, mode=mode,
+                                        shape=(self.disk_capacity, self.KEY_SIZE))
+            
+            if reuse:
+                occupied = np.flatnonzero(self._disk_keys.any(axis=1))
+                for slot in occupied:
+                    self._disk_index[self._disk_keys[slot].tobytes()] = int(slot)
+                if len(occupied) < self.disk_capacity:
+                    # The ring has not wrapped: continue after the last filled slot,
+                    # which may be past a checkpoint that predates a crash
+                    self._disk_next = (int(occupied[-1]) + 1) if len(occupied) else 0
+                else:
+                    self._disk_next = int(meta.get('next_slot', 0)) % self.disk_capacity
+            if not reuse or not meta:
+                self._write_meta()
+            
+            logger.info(f"💾 Embedding cache disk tier at {self.disk_path} "
+                        f"({len(self._disk_index)}/{self.disk_capacity} entries)")
+            return True
+            
+        except Exception as e:
+            logger.warning(f"⚠️ Embedding cache disk tier disabled: {e}")
+            self._disk_vectors = None
+            self._disk_keys = None
+            return False
+    
+    def _disk_get(self, key: bytes) -> Optional["np.ndarray"]:
+        import numpy as np
+        if not self._open_disk():
+            return None
+        slot = self._disk_index.get(key)
+        if slot is None:
+            return None
+        return np.array(self._disk_vectors[slot])
+    
+    def _disk_put(self, key: bytes, vector: "np.ndarray") -> None:
+        import numpy as np
+        if not self._open_disk() or key in self._disk_index:
+            return
+        slot = self._disk_next
+        old_key = self._disk_keys[slot].tobytes()
+        if self._disk_index.get(old_key) == slot:
+            del self._disk_index[old_key]
+        # Write the vector before the key so a slot is never indexed with a stale vector
+        self._disk_vectors[slot] = vector
+        self._disk_keys[slot] = np.frombuffer(key, dtype=np.uint8)
+        self._disk_index[key] = slot
+        self._disk_next = (slot + 1) % self.disk_capacity
+        
+        self._disk_puts_since_sync += 1
+        if self._disk_puts_since_sync >= self.META_SYNC_INTERVAL:
+            self._sync_disk()
+    
+    def _write_meta(self) -> None:
+        """Atomically write the disk tier's shape and ring position."""
+        meta_path = self.disk_path / "meta.json"
+        temp_path = meta_path.with_suffix(".json.tmp")
+        temp_path.write_text(json.dumps({
+            'model': self.model_name,
+            'dimension': self.dimension,
+            'capacity': self.disk_capacity,
+            'next_slot': self._disk_next
+        }))
+        os.replace(temp_path, meta_path)
+    
+    def _sync_disk(self) -> None:
+        """Flush the memmaps, then checkpoint the ring position (lock held)."""
+        try:
+            self._disk_vectors.flush()
+            self._disk_keys.flush()
+            self._write_meta()
+            self._disk_puts_since_sync = 0
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to flush embedding cache: {e}")
+    
+    def flush(self) -> None:
+        """Persist the disk tier."""
+        with self._lock:
+            if self._disk_vectors is None:
+                return
+            self._sync_disk()
+    
+    def close(self) -> None:
+        """Flush and unmap the disk tier (it reopens lazily on next use)."""
+        self.flush()
+        with self._lock:
+            self._disk_vectors = None
+            self._disk_keys = None
+            self._disk_index.clear()
+            self._disk_opened = False
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics for health reporting."""
+        hits = self.memory_hits + self.disk_hits
+        lookups = hits + self.misses
+        return {
+            'hits': hits,
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses,
+            'hit_rate': hits / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_bytes,
+            'memory_max_bytes': self.max_bytes,
+            'disk_enabled': self.disk_path is not None,
+            'disk_entries': len(self._disk_index),
+            'disk_capacity': self.disk_capacity
+        }
 
-class TroubleshootMemoryModel(LanceModel):
-    """Troubleshoot Memory data model for MCP Jive."""
-    id: str = Field(description="Unique identifier")
-    unique_slug: str = Field(description="Unique short slug for identification")
-    title: str = Field(description="Human-friendly short name")
-    ai_use_case: List[str] = Field(description="AI-friendly problem descriptions", default_factory=list)
-    ai_solutions: str = Field(description="AI-friendly solution with tips and steps (Markdown)")
-    vector: Vector(384) = Field(description="Embedding vector for semantic search")
-    keywords: List[str] = Field(description="Keywords that describe this troubleshooting item", default_factory=list)
-    tags: List[str] = Field(description="Tags for categorization", default_factory=list)
-    usage_count: int = Field(description="Number of times retrieved", default=0)
-    success_count: int = Field(description="Number of times marked as successful", default=0)
-    created_on: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    last_updated_on: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
-    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+# Scalar indexes created on each table: column -> LanceDB index type.
+# BTREE suits high-cardinality keys, BITMAP low-cardinality enums.
+SCALAR_INDEX_CONFIGS: Dict[str, Dict[str, str]] = {
+    'WorkItem': {
+        'id': 'BTREE',
+        'item_id': 'BTREE',
+        'parent_id': 'BTREE',
+        'order_index': 'BTREE',
+        'status': 'BITMAP',
+        'item_type': 'BITMAP'
+    },
+    'ExecutionLog': {'id': 'BTREE', 'action': 'BITMAP'},
+    'ArchitectureMemory': {'unique_slug': 'BTREE'},
+    'TroubleshootMemory': {'unique_slug': 'BTREE'}
+}
 
 class LanceDBManager:
     """LanceDB database manager for MCP Jive."""
     
+    # Cosine distance above which vector matches are dropped (lower is more similar)
+    VECTOR_DISTANCE_THRESHOLD = 0.8
+    
     def __init__(self, config: DatabaseConfig, namespace: Optional[str] = None):
         self.config = config
         # Override namespace if provided directly
@@ -168,17 +397,42 @@ class LanceDBManager:
         
         self.db = None
         self.embedding_func = None
+        # Batches embedding requests and runs the model off the event loop
+        self.embedder = BatchingEmbedder(self._encode_texts, batch_size=self.config.batch_size)
+        self._owns_embedder = True
+        self.embedding_cache = EmbeddingCache(
+            model_name=self.config.embedding_model,
+            dimension=self.config.vector_dimension,
+            max_bytes=self.config.embedding_cache_max_bytes,
+            disk_path=str(Path(self.db_path) / "embedding_cache") if self.config.embedding_cache_disk else None,
+            disk_max_bytes=self.config.embedding_cache_disk_max_bytes
+        )
+        # Parent → children adjacency for this namespace, built on first use
+        self.hierarchy_index = WorkItemHierarchyIndex()
+        # Inverted keyword index over the work item text fields, built on first use
+        self.keyword_index = WorkItemKeywordIndex()
+        # In-memory structures derived from the WorkItem table; each exposes
+        # upsert(row), remove(id) and invalidate() and is kept current on writes
+        self._work_item_observers: List[Any] = [self.hierarchy_index, self.keyword_index]
+        # In-memory structures derived from other tables, by table name; each
+        # exposes invalidate() and is dropped when its table is replaced wholesale
+        self._table_observers: Dict[str, List[Any]] = {}
+        
+        # Scalar index configuration and the columns known to be indexed
+        self.scalar_index_configs = {name: dict(columns) for name, columns in SCALAR_INDEX_CONFIGS.items()}
+        self._scalar_indexed: Dict[str, Set[str]] = {}
+        self._scalar_index_checked: Set[str] = set()
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        self._embedding_load_lock = threading.Lock()
         self._tables_initialized = False
         self._tables = {}
-        
-        # Table model mapping for MCP Jive
-        self.table_models = {
-            'WorkItem': WorkItemModel,
-            'ExecutionLog': ExecutionLogModel,
-            'ArchitectureMemory': ArchitectureMemoryModel,
-            'TroubleshootMemory': TroubleshootMemoryModel
-        }
+
+    @property
+    def table_models(self) -> Dict[str, Any]:
+        """Table name → LanceModel schema for MCP Jive (imports LanceDB on first use)."""
+        from .lancedb_models import TABLE_MODELS
+        return TABLE_MODELS
     
     def _get_namespace_path(self) -> str:
         """Get the namespace-specific database path."""
@@ -201,20 +455,23 @@ class LanceDBManager:
         if self._initialized:
             return
         
+        async with self._init_lock:
+            if not self._initialized:
+                await self._connect()
+    
+    async def _connect(self) -> None:
         try:
             # Create namespace-specific data directory
             os.makedirs(self.db_path, exist_ok=True)
             
+            # Importing LanceDB takes seconds; keep it off the event loop
+            lancedb = await asyncio.to_thread(_import_lancedb)
+            
             # Connect to LanceDB with namespace-specific path
             self.db = lancedb.connect(self.db_path)
             
-            # Initialize embedding function lazily (defer model loading)
-            self.embedding_func = None
-            self._embedding_config = {
-                'model_name': self.config.embedding_model,
-                'device': self.config.device,
-                'normalize': self.config.normalize_embeddings
-            }
+            # The embedding model loads lazily on the first embedding request.
+            # A pooled manager may already share a loaded model, so keep it.
             
             # Defer table initialization until first use (lazy loading)
             # This prevents blocking during MCP handshake
@@ -296,6 +553,7 @@ class LanceDBManager:
                                     'metadata': '{}'
                                 }
                             
+                            import pandas as pd
                             sample_df = pd.DataFrame([sample_data])
                             table = self.db.create_table(table_name, data=sample_df)
                             # Remove the temporary record
@@ -312,9 +570,87 @@ class LanceDBManager:
             except Exception as e:
                 logger.error(f"❌ Failed to initialize table {table_name}: {e}")
                 raise
+            
+            self._ensure_scalar_indexes(table_name)
         
         self._tables_initialized = True
     
+    def register_scalar_indexes(self, table_name: str, columns: Dict[str, str]) -> None:
+        """Register scalar indexes for a table created outside table_models.
+        
+        Args:
+            table_name: Name of the table
+            columns: Mapping of column name to index type ('BTREE' or 'BITMAP')
+        """
+        self.scalar_index_configs.setdefault(table_name, {}).update(columns)
+        self._scalar_index_checked.discard(table_name)
+        self._ensure_scalar_indexes(table_name)
+    
+    @staticmethod
+    def _list_indexed_columns(table) -> Set[str]:
+        """Get the columns that already have an index on a table."""
+        try:
+            indices = table.list_indices()
+        except Exception:
+            return set()
+        
+        columns: Set[str] = set()
+        for index in indices:
+            index_columns = getattr(index, 'columns', None)
+            if index_columns is None and isinstance(index, dict):
+                index_columns = index.get('columns')
+            columns.update(index_columns or [])
+        return columns
+    
+    def _ensure_scalar_indexes(self, table_name: str, force: bool = False) -> List[str]:
+        """Create the configured scalar indexes that are missing on a table.
+        
+        LanceDB cannot index an empty table, so a table whose indexes could
+        not all be created is retried on later writes until it has data.
+        Afterwards only ``optimize_tables`` (force=True) checks again.
+        
+        Args:
+            table_name: Name of the table
+            force: Check even if the table was already handled
+            
+        Returns:
+            Columns indexed by this call
+        """
+        wanted = self.scalar_index_configs.get(table_name)
+        if not wanted or self.db is None:
+            return []
+        if not force and table_name in self._scalar_index_checked:
+            return []
+        
+        from lancedb.index import BTree, Bitmap
+        
+        index_configs = {'BTREE': BTree, 'BITMAP': Bitmap}
+        indexed = self._scalar_indexed.setdefault(table_name, set())
+        created = []
+        try:
+            table = self.db.open_table(table_name)
+            indexed.update(self._list_indexed_columns(table))
+            
+            for column, index_type in wanted.items():
+                if column in indexed:
+                    continue
+                try:
+                    table.create_index(column, config=index_configs[index_type]())
+                    indexed.add(column)
+                    created.append(column)
+                except Exception as e:
+                    logger.debug(f"Scalar index on {table_name}.{column} not created yet: {e}")
+            
+            if all(column in indexed for column in wanted) or table.count_rows() > 0:
+                self._scalar_index_checked.add(table_name)
+            if created:
+                logger.info(f"✅ Created scalar indexes on {table_name}: {created}")
+                
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to ensure scalar indexes for {table_name}: {e}")
+        
+        return created
+    
     async def _create_fts_indexes(self) -> None:
         """Create full-text search indexes for text fields."""
         try:
@@ -354,38 +690,63 @@ class LanceDBManager:
                 except Exception:
                     # Index doesn't exist or is broken, create it
                     logger.info(f"🔍 Creating FTS index for {table_name} with {row_count} rows...")
-                    
-                    table.create_fts_index(
-                        text_fields,
-                        replace=True,  # Replace if exists
-                        use_tantivy=True,  # Use modern Tantivy implementation
-                        with_position=True,  # Enable phrase queries
-                        base_tokenizer="simple",  # Split by whitespace and punctuation
-                        language="English",
-                        lower_case=True,  # Case-insensitive search
-                        stem=True,  # Enable stemming
-                        remove_stop_words=True,  # Remove common words
-                        ascii_folding=True  # Handle accented characters
-                    )
-                    logger.info(f"✅ Created FTS index for {table_name} fields: {text_fields}")
+                    self._build_fts_index(table, table_name)
                     
         except Exception as e:
             logger.warning(f"⚠️ Failed to ensure FTS index for {table_name}: {e}")
     
+    def _build_fts_index(self, table, table_name: str) -> None:
+        """(Re)build the full-text index of a table from its current rows.
+        
+        Creates one native inverted index per field; writes are folded into
+        them incrementally by ``optimize``.
+        """
+        from lancedb.index import FTS
+        
+        config = FTS(
+            with_position=True,  # Enable phrase queries
+            base_tokenizer="simple",  # Split by whitespace and punctuation
+            language="English",
+            lower_case=True,  # Case-insensitive search
+            stem=True,  # Enable stemming
+            remove_stop_words=True,  # Remove common words
+            ascii_folding=True  # Handle accented characters
+        )
+        indexed = []
+        error = None
+        for field in self.fts_configs[table_name]:
+            try:
+                table.create_index(field, config=config, replace=True)
+                indexed.append(field)
+            except Exception as e:
+                error = e
+                logger.debug(f"FTS index on {table_name}.{field} not created: {e}")
+        if not indexed:
+            raise error
+        logger.info(f"✅ Created FTS index for {table_name} fields: {indexed}")
+    
     async def _ensure_embedding_func(self) -> None:
         """Ensure embedding function is initialized (lazy loading)."""
         if self.embedding_func is None:
-            logger.info(f"🤖 Loading embedding model: {self._embedding_config['model_name']}...")
-            try:
-                self.embedding_func = SentenceTransformerEmbeddings(
-                    model_name=self._embedding_config['model_name'],
-                    device=self._embedding_config['device'],
-                    normalize=self._embedding_config['normalize']
-                )
-                logger.info(f"✅ Embedding model loaded successfully")
-            except Exception as e:
-                logger.error(f"❌ Failed to load embedding model: {e}")
-                raise
+            await asyncio.get_running_loop().run_in_executor(None, self._load_embedding_func)
+    
+    def _load_embedding_func(self) -> None:
+        """Load the embedding model (blocking; called from a worker thread)."""
+        # Background warm-up and the first embedding request may race here
+        with self._embedding_load_lock:
+            if self.embedding_func is None:
+                logger.info(f"🤖 Loading embedding model: {self.config.embedding_model}...")
+                try:
+                    from lancedb.embeddings import SentenceTransformerEmbeddings
+                    self.embedding_func = SentenceTransformerEmbeddings(
+                        model_name=self.config.embedding_model,
+                        device=self.config.device,
+                        normalize=self.config.normalize_embeddings
+                    )
+                    logger.info(f"✅ Embedding model loaded successfully")
+                except Exception as e:
+                    logger.error(f"❌ Failed to load embedding model: {e}")
+                    raise
     
     async def _ensure_tables_initialized(self) -> None:
         """Ensure tables are initialized (lazy loading)."""
@@ -401,117 +762,95 @@ class LanceDBManager:
             await self._ensure_embedding_func()
             # Generate a test embedding to fully initialize the model
             test_text = "test embedding initialization"
-            _ = self._generate_embedding(test_text)
+            _ = await self.generate_embedding(test_text)
             logger.info("✅ Embedding model pre-warmed successfully")
         except Exception as e:
             logger.warning(f"⚠️ Failed to pre-warm embedding model: {e}")
     
-    def _generate_embedding(self, text_content: str) -> List[float]:
-        """Generate embedding for text content."""
-        try:
-            # Ensure embedding function is loaded
-            if self.embedding_func is None:
-                # Run async initialization in sync context
-                import asyncio
-                try:
-                    loop = asyncio.get_event_loop()
-                    if loop.is_running():
-                        # If we're in an async context, we need to handle this differently
-                        logger.warning("Embedding function not initialized - using zero vector")
-                        return [0.0] * self.config.vector_dimension
-                    else:
-                        loop.run_until_complete(self._ensure_embedding_func())
-                except RuntimeError:
-                    # No event loop running
-                    asyncio.run(self._ensure_embedding_func())
-            
-            if not text_content or not text_content.strip():
-                # Return zero vector for empty content
-                return [0.0] * self.config.vector_dimension
-            
-            embeddings = self.embedding_func.compute_query_embeddings([text_content])
-            embedding = embeddings[0]
-            
+    def _encode_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed a batch of texts with the model (blocking).
+        
+        Runs in the embedder's worker thread. Empty texts get a zero vector
+        without going through the model.
+        """
+        self._load_embedding_func()
+        
+        vectors: List[List[float]] = [[0.0] * self.config.vector_dimension for _ in texts]
+        indices = [i for i, text in enumerate(texts) if text and text.strip()]
+        if not indices:
+            return vectors
+        
+        embeddings = self.embedding_func.compute_source_embeddings([texts[i] for i in indices])
+        for i, embedding in zip(indices, embeddings):
             # Convert to list if needed
             if isinstance(embedding, list):
-                return embedding
+                vectors[i] = embedding
             elif hasattr(embedding, 'tolist'):
-                return embedding.tolist()
+                vectors[i] = embedding.tolist()
             else:
-                return list(embedding)
-            
+                vectors[i] = list(embedding)
+        return vectors
+    
+    def _generate_embedding(self, text_content: str) -> List[float]:
+        """Generate embedding for text content synchronously.
+        
+        Blocks the calling thread; async code should use ``generate_embedding``.
+        """
+        if not text_content or not text_content.strip():
+            return [0.0] * self.config.vector_dimension
+        cached = self.embedding_cache.get(text_content)
+        if cached is not None:
+            return cached
+        try:
+            vector = self._encode_texts([text_content])[0]
         except Exception as e:
             logger.error(f"❌ Failed to generate embedding: {e}")
             # Return zero vector as fallback
             return [0.0] * self.config.vector_dimension
+        self.embedding_cache.put(text_content, vector)
+        return vector
     
     async def generate_embedding(self, text_content: str) -> List[float]:
-        """Public method to generate embedding for text content."""
-        # Ensure embedding function is loaded
-        await self._ensure_embedding_func()
-        return self._generate_embedding(text_content)
+        """Public method to generate embedding for text content.
+        
+        Cached vectors are returned directly; otherwise the request is batched
+        with other pending requests and encoded in a worker thread.
+        """
+        return (await self.generate_embeddings([text_content]))[0]
     
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
-        """Public method to generate embeddings for multiple texts."""
-        # Ensure embedding function is loaded
-        await self._ensure_embedding_func()
-        return [self._generate_embedding(text) for text in texts]
-    
-    def _convert_numpy_to_python(self, work_item_dict: Dict[str, Any]) -> Dict[str, Any]:
-        """Convert numpy arrays and scalars to Python native types."""
-        import numpy as np
-        
-        # List fields that should be converted from numpy arrays to Python lists
-        list_fields = ['dependencies', 'tags', 'context_tags', 'acceptance_criteria']
+        """Public method to generate embeddings for multiple texts in batches."""
+        zero_vector = [0.0] * self.config.vector_dimension
+        vectors: List[Optional[List[float]]] = [None] * len(texts)
         
-        # Fields that should be excluded from serialization (like vector embeddings)
-        exclude_fields = ['vector']
-        
-        # Remove vector field to avoid serialization issues
-        for field in exclude_fields:
-            if field in work_item_dict:
-                del work_item_dict[field]
+        # Serve cache hits and embed each distinct missing text once
+        missing: Dict[str, List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                vectors[i] = zero_vector
+                continue
+            cached = self.embedding_cache.get(text)
+            if cached is not None:
+                vectors[i] = cached
+            else:
+                missing.setdefault(text, []).append(i)
         
-        # Convert all numpy types to Python types
-        converted_dict = {}
-        for key, value in work_item_dict.items():
+        if missing:
             try:
-                # Handle numpy arrays first (before checking pd.isna to avoid array ambiguity)
-                if isinstance(value, np.ndarray):
-                    if key in list_fields:
-                        converted_dict[key] = value.tolist()
-                    elif value.size == 1:
-                        converted_dict[key] = value.item()
-                    else:
-                        converted_dict[key] = value.tolist()
-                # Handle numpy scalars
-                elif hasattr(value, 'item') and hasattr(value, 'dtype'):
-                    converted_dict[key] = value.item()
-                # Handle pandas NA/NaN values (only for scalar values, not arrays)
-                elif not isinstance(value, (list, np.ndarray)) and hasattr(pd, 'isna'):
-                    try:
-                        if pd.isna(value):
-                            if key in list_fields:
-                                converted_dict[key] = []
-                            else:
-                                converted_dict[key] = None
-                        else:
-                            converted_dict[key] = value
-                    except (ValueError, TypeError):
-                        # If pd.isna fails, just use the original value
-                        converted_dict[key] = value
-                # Handle regular Python types
-                else:
-                    converted_dict[key] = value
-            except (ValueError, TypeError, AttributeError) as e:
-                # If conversion fails, try to handle gracefully
-                logger.warning(f"Failed to convert field {key} with value {value}: {e}")
-                if key in list_fields:
-                    converted_dict[key] = []
+                computed = await self.embedder.embed_many(list(missing))
+            except Exception as e:
+                logger.error(f"❌ Failed to generate embeddings: {e}")
+                # Zero vectors as fallback (not cached)
+                computed = [None] * len(missing)
+            for (text, indices), vector in zip(missing.items(), computed):
+                if vector is None:
+                    vector = list(zero_vector)
                 else:
-                    converted_dict[key] = None
+                    self.embedding_cache.put(text, vector)
+                for i in indices:
+                    vectors[i] = vector
         
-        return converted_dict
+        return vectors
     
     async def _retry_operation(self, operation, *args, **kwargs):
         """Retry database operations with exponential backoff."""
@@ -561,24 +900,13 @@ class LanceDBManager:
             text_content = f"{work_item_data.get('title', '')} {work_item_data.get('description', '')}"
             
             # Convert data for WorkItemModel compatibility
-            model_data = work_item_data.copy()
-            
-            # Ensure item_id is set
-            if 'item_id' not in model_data:
-                model_data['item_id'] = model_data.get('id', '')
-            
-            # Convert 'type' to 'item_type' if present
-            if 'type' in model_data:
-                model_data['item_type'] = model_data.pop('type')
-            
-            # Ensure acceptance_criteria is a list (WorkItemModel expects List[str])
-            if 'acceptance_criteria' in model_data and model_data['acceptance_criteria'] is None:
-                model_data['acceptance_criteria'] = []
+            model_data = self._normalize_work_item_data(work_item_data)
             
             # Create work item with embedding
+            from .lancedb_models import WorkItemModel
             work_item = WorkItemModel(
                 **model_data,
-                vector=self._generate_embedding(text_content)
+                vector=await self.generate_embedding(text_content)
             )
             
             # Insert into table
@@ -588,6 +916,8 @@ class LanceDBManager:
             logger.info(f"Work item dict keys before insertion: {list(work_item_dict.keys())}")
             logger.info(f"Work item dict has item_id: {'item_id' in work_item_dict}")
             await self._retry_operation(table.add, [work_item_dict])
+            self._notify_work_items_written([work_item_dict])
+            self._ensure_scalar_indexes("WorkItem")
             
             logger.info(f"✅ Created MCP Jive work item: {work_item.id}")
             return work_item.id
@@ -596,6 +926,25 @@ class LanceDBManager:
             logger.error(f"❌ Failed to create MCP Jive work item: {e}")
             raise
     
+    def _normalize_work_item_data(self, work_item_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert raw work item data into WorkItemModel keyword arguments."""
+        model_data = work_item_data.copy()
+        model_data.pop('vector', None)
+        
+        # Ensure item_id is set
+        if 'item_id' not in model_data:
+            model_data['item_id'] = model_data.get('id', '')
+        
+        # Convert 'type' to 'item_type' if present
+        if 'type' in model_data:
+            model_data['item_type'] = model_data.pop('type')
+        
+        # Ensure acceptance_criteria is a list (WorkItemModel expects List[str])
+        if 'acceptance_criteria' in model_data and model_data['acceptance_criteria'] is None:
+            model_data['acceptance_criteria'] = []
+        
+        return model_data
+    
     async def store_work_item(self, work_item_data: Dict[str, Any]) -> str:
         """Store a work item (compatibility method for create_work_item)."""
         try:
@@ -605,44 +954,76 @@ class LanceDBManager:
             logger.error(f"❌ Failed to store MCP Jive work item: {e}")
             raise
     
+    # Fields combined into the work item embedding text
+    WORK_ITEM_TEXT_FIELDS = ('title', 'description')
+    # List-typed work item columns (None is stored as an empty list)
+    WORK_ITEM_LIST_FIELDS = ('tags', 'dependencies', 'context_tags', 'acceptance_criteria')
+    
+    def _prepare_work_item_updates(self, updates: Dict[str, Any]) -> Dict[str, Any]:
+        """Map raw update fields onto WorkItem columns.
+        
+        Drops the primary key and unknown fields, renames 'type' to
+        'item_type' and stamps updated_at.
+        """
+        from .lancedb_models import WorkItemModel
+        columns = WorkItemModel.model_fields if hasattr(WorkItemModel, 'model_fields') else WorkItemModel.__fields__
+        values = {}
+        for key, value in updates.items():
+            if key == 'type':
+                key = 'item_type'
+            if key in ('id', 'vector', 'created_at') or key not in columns:
+                continue
+            if key in self.WORK_ITEM_LIST_FIELDS and value is None:
+                value = []
+            values[key] = value
+        values['updated_at'] = datetime.now(timezone.utc)
+        return values
+    
+    def _fetch_work_item_keys(self, table, work_item_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Resolve ids (or item_ids) to rows holding id and the embedding text fields.
+        
+        Reads only the columns needed to address the rows and rebuild their
+        embeddings, not the vectors or the rest of the row.
+        
+        Returns:
+            Mapping of each requested id that exists to its row
+        """
+        quoted = ", ".join(sql_literal(work_item_id) for work_item_id in work_item_ids)
+        rows = read_rows(
+            table.search()
+            .where(f"id IN ({quoted}) OR item_id IN ({quoted})")
+            .limit(len(work_item_ids) * 2),
+            ['id', 'item_id', *self.WORK_ITEM_TEXT_FIELDS]
+        )
+        by_id = {row['id']: row for row in rows}
+        resolved = {}
+        for work_item_id in work_item_ids:
+            # Primary id wins over item_id
+            row = by_id.get(work_item_id)
+            if row is None:
+                row = next((r for r in rows if r.get('item_id') == work_item_id), None)
+            if row is not None:
+                resolved[work_item_id] = row
+        return resolved
+    
     async def update_work_item(self, work_item_id: str, updates: Dict[str, Any]) -> bool:
-        """Update an existing work item."""
-        try:
-            table = await self.get_table("WorkItem")
-            
-            # Get existing item
-            existing = table.search().where(f"id = '{work_item_id}'").limit(1).to_pandas()
+        """Update an existing work item in place.
+        
+        Only the changed columns are written, with a LanceDB ``table.update``
+        keyed by id. The stored vector is kept unless title or description
+        changed.
+        
+        Args:
+            work_item_id: Work item id or item_id
+            updates: Fields to update
             
-            if len(existing) == 0:
-                # Try searching by item_id as fallback
-                existing = table.search().where(f"item_id = '{work_item_id}'").limit(1).to_pandas()
-                
-                if len(existing) == 0:
-                    logger.warning(f"⚠️ MCP Jive work item {work_item_id} not found")
-                    return False
-            
-            # Update fields
-            updated_data = existing.iloc[0].to_dict()
-            updated_data.update(updates)
-            updated_data['updated_at'] = datetime.now(timezone.utc)
-            
-            # Regenerate embedding if title or description changed
-            if 'title' in updates or 'description' in updates:
-                text_content = f"{updated_data.get('title', '')} {updated_data.get('description', '')}"
-                updated_data['vector'] = self._generate_embedding(text_content)
-            
-            # Delete old record and insert updated one
-            actual_id = updated_data['id']
-            table.delete(f"id = '{actual_id}'")
-            await self._retry_operation(table.add, [updated_data])
-            
-            # Add a small delay to ensure the database operation is committed
-            await asyncio.sleep(0.1)
-            
-            # Verify the update was successful by checking if the record exists
-            verification = table.search().where(f"id = '{actual_id}'").limit(1).to_pandas()
-            if len(verification) == 0:
-                logger.error(f"❌ Failed to verify update for work item {work_item_id}")
+        Returns:
+            True if the work item was updated, False if it was not found
+        """
+        try:
+            updated = await self.update_work_items([{**updates, 'id': work_item_id}])
+            if not updated:
+                logger.warning(f"⚠️ MCP Jive work item {work_item_id} not found")
                 return False
             
             logger.info(f"✅ Updated MCP Jive work item: {work_item_id}")
@@ -652,24 +1033,213 @@ class LanceDBManager:
             logger.error(f"❌ Failed to update MCP Jive work item {work_item_id}: {e}")
             raise
     
-    async def get_work_item(self, work_item_id: str) -> Optional[Dict[str, Any]]:
-        """Get a work item by ID or item_id."""
-        try:
-            table = await self.get_table("WorkItem")
-            
-            # Try by primary id first
-            result = table.search().where(f"id = '{work_item_id}'").limit(1).to_pandas()
+    async def update_work_items(self, updates: List[Dict[str, Any]]) -> int:
+        """Update several work items in place.
+        
+        Ids are resolved with a single projected read, changed embeddings are
+        computed in one batch, and items receiving identical values (e.g. a
+        bulk status change) share one ``table.update`` call. There is no
+        delete/re-insert and no sleep-and-verify round trip.
+        
+        Args:
+            updates: Dictionaries each holding an 'id' (or item_id) plus the fields to change
             
-            if len(result) == 0:
-                # Try by item_id as fallback
-                result = table.search().where(f"item_id = '{work_item_id}'").limit(1).to_pandas()
+        Returns:
+            Number of work items updated
+        """
+        updates = [update for update in updates if update.get('id')]
+        if not updates:
+            return 0
+        
+        table = await self.get_table("WorkItem")
+        rows = self._fetch_work_item_keys(table, [update['id'] for update in updates])
+        
+        # Build per-item column values and collect texts that need a new embedding
+        pending: List[Tuple[str, Dict[str, Any]]] = []
+        texts: List[str] = []
+        text_targets: List[Dict[str, Any]] = []
+        for update in updates:
+            row = rows.get(update['id'])
+            if row is None:
+                continue
+            values = self._prepare_work_item_updates(update)
+            if any(field in values for field in self.WORK_ITEM_TEXT_FIELDS):
+                text_fields = {field: values.get(field, row.get(field)) or '' for field in self.WORK_ITEM_TEXT_FIELDS}
+                texts.append(f"{text_fields['title']} {text_fields['description']}")
+                text_targets.append(values)
+            pending.append((row['id'], values))
+        
+        if texts:
+            for values, vector in zip(text_targets, await self.generate_embeddings(texts)):
+                values['vector'] = vector
+        
+        # Group items that receive identical values into a single update
+        groups: Dict[str, Tuple[Dict[str, Any], List[str]]] = {}
+        for actual_id, values in pending:
+            if 'vector' in values:
+                group_key = f"id:{actual_id}"
+            else:
+                group_key = repr(sorted((k, repr(v)) for k, v in values.items() if k != 'updated_at'))
+            groups.setdefault(group_key, (values, []))[1].append(actual_id)
+        
+        for values, ids in groups.values():
+            quoted = ", ".join(sql_literal(actual_id) for actual_id in ids)
+            await self._retry_operation(table.update, where=f"id IN ({quoted})", values=values)
+        
+        self._notify_work_items_written([{'id': actual_id, **values} for actual_id, values in pending])
+        
+        return len(pending)
+    
+    def _fetch_work_item_rows(self, table, work_item_ids: List[str], chunk_size: int = 500,
+                              columns: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """Read work item rows by primary id.
+        
+        Args:
+            table: WorkItem table
+            work_item_ids: Primary ids
+            chunk_size: Maximum number of ids per query
+            columns: Column projection (default: full rows including vectors)
+        
+        Returns:
+            Mapping of id to row for the ids that exist
+        """
+        rows = {}
+        for start in range(0, len(work_item_ids), chunk_size):
+            chunk = work_item_ids[start:start + chunk_size]
+            quoted = ", ".join(sql_literal(work_item_id) for work_item_id in chunk)
+            query = table.search().where(f"id IN ({quoted})").limit(len(chunk))
+            for row in read_rows(query, columns, exclude=() if columns is None else ('vector',)):
+                rows[row['id']] = row
+        return rows
+    
+    async def upsert_work_items(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert or update several work items with a single ``merge_insert``.
+        
+        Rows for existing ids may be partial: only the given fields change and
+        the rest of the stored row (including its vector) is kept. Rows for
+        new ids must be complete work items. Embeddings for new rows and rows
+        whose title or description changed are computed in one batch, and the
+        whole set is written as one commit. Stored rows are read right before
+        the write, so columns changed by other requests while the embeddings
+        were computed are kept.
+        
+        Args:
+            rows: Work item dictionaries keyed by 'id'
             
-            if len(result) == 0:
-                return None
+        Returns:
+            Ids of the work items written (unknown ids with incomplete data are skipped)
+        """
+        from .lancedb_models import WorkItemModel
+        
+        # Collapse repeated ids so merge_insert sees each key once
+        combined: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            if row.get('id'):
+                combined.setdefault(row['id'], {}).update(row)
+        if not combined:
+            return []
+        
+        table = await self.get_table("WorkItem")
+        # Only the text fields are needed to embed partial title/description changes
+        stored = self._fetch_work_item_rows(table, list(combined),
+                                            columns=['id', *self.WORK_ITEM_TEXT_FIELDS])
+        
+        changes: Dict[str, Dict[str, Any]] = {}
+        new_records: List[Dict[str, Any]] = []
+        texts: List[str] = []
+        text_targets: List[Dict[str, Any]] = []
+        for work_item_id, row in combined.items():
+            current = stored.get(work_item_id)
+            if current is not None:
+                values = self._prepare_work_item_updates(row)
+                if any(field in values for field in self.WORK_ITEM_TEXT_FIELDS):
+                    text_fields = {field: values.get(field, current.get(field)) or '' for field in self.WORK_ITEM_TEXT_FIELDS}
+                    texts.append(f"{text_fields['title']} {text_fields['description']}")
+                    text_targets.append(values)
+                changes[work_item_id] = values
+            else:
+                try:
+                    work_item = WorkItemModel(
+                        **self._normalize_work_item_data(row),
+                        vector=[0.0] * self.config.vector_dimension
+                    )
+                except Exception as e:
+                    logger.warning(f"⚠️ Skipping upsert of unknown work item {work_item_id}: {e}")
+                    continue
+                record = work_item.model_dump() if hasattr(work_item, 'model_dump') else work_item.dict()
+                texts.append(f"{record.get('title') or ''} {record.get('description') or ''}")
+                text_targets.append(record)
+                new_records.append(record)
+        
+        if not changes and not new_records:
+            return []
+        
+        if texts:
+            for target, vector in zip(text_targets, await self.generate_embeddings(texts)):
+                target['vector'] = vector
+        
+        import pyarrow as pa
+        
+        def write() -> List[Dict[str, Any]]:
+            # No await between this read and the merge, so no other request's
+            # write can land in between and be overwritten
+            table.checkout_latest()
+            existing = self._fetch_work_item_rows(table, list(changes))
+            records = [{**existing[work_item_id], **values}
+                       for work_item_id, values in changes.items() if work_item_id in existing]
+            records.extend(new_records)
+            if records:
+                (table.merge_insert("id")
+                 .when_matched_update_all()
+                 .when_not_matched_insert_all()
+                 .execute(pa.Table.from_pylist(records, schema=table.schema)))
+            return records
+        
+        records = await self._retry_operation(write)
+        if not records:
+            return []
+        
+        self._notify_work_items_written(records)
+        self._ensure_scalar_indexes("WorkItem")
+        
+        logger.info(f"✅ Upserted {len(records)} MCP Jive work items")
+        return [record['id'] for record in records]
+    
+    def _find_work_item_row(self, table, work_item_id: str, columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Find a work item row by id or item_id with one indexed lookup.
+        
+        Args:
+            table: WorkItem table
+            work_item_id: Primary id or item_id
+            columns: Columns to read (default: all but ``vector``)
             
-            # Convert to dict and handle numpy arrays
-            work_item_dict = result.iloc[0].to_dict()
-            return self._convert_numpy_to_python(work_item_dict)
+        Returns:
+            Matching row (a primary id match wins over an item_id match) or None
+        """
+        literal = sql_literal(work_item_id)
+        query = table.search().where(f"id = {literal} OR item_id = {literal}").limit(2)
+        read_columns = resolve_columns(table.schema, columns)
+        # item_id is needed to check the match even when it was not requested
+        drop_item_id = 'item_id' not in read_columns and 'item_id' in table.schema.names
+        rows = read_rows(query, read_columns + ['item_id'] if drop_item_id else read_columns)
+        row = next((row for row in rows if row.get('id') == work_item_id), None)
+        if row is None:
+            row = next((row for row in rows if row.get('item_id') == work_item_id), None)
+        if row is not None and drop_item_id:
+            del row['item_id']
+        return row
+    
+    async def get_work_item(self, work_item_id: str,
+                            columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Get a work item by ID or item_id.
+        
+        Args:
+            work_item_id: Primary id or item_id
+            columns: Columns to read (default: all but ``vector``)
+        """
+        try:
+            table = await self.get_table("WorkItem")
+            return self._find_work_item_row(table, work_item_id, columns)
             
         except Exception as e:
             logger.error(f"❌ Failed to get MCP Jive work item {work_item_id}: {e}")
@@ -680,23 +1250,15 @@ class LanceDBManager:
         try:
             table = await self.get_table("WorkItem")
             
-            # Check if item exists by id
-            existing = table.search().where(f"id = '{work_item_id}'").limit(1).to_pandas()
+            # Resolve the primary id (by id or item_id) with one indexed lookup
+            row = self._find_work_item_row(table, work_item_id, columns=['id', 'item_id'])
+            if row is None:
+                logger.warning(f"⚠️ MCP Jive work item {work_item_id} not found")
+                return False
             
-            if len(existing) == 0:
-                # Try by item_id
-                existing = table.search().where(f"item_id = '{work_item_id}'").limit(1).to_pandas()
-                
-                if len(existing) == 0:
-                    logger.warning(f"⚠️ MCP Jive work item {work_item_id} not found")
-                    return False
-                
-                # Use the actual id for deletion
-                actual_id = existing.iloc[0]['id']
-                table.delete(f"id = '{actual_id}'")
-            else:
-                # Delete by id
-                table.delete(f"id = '{work_item_id}'")
+            actual_id = row['id']
+            table.delete(f"id = {sql_literal(actual_id)}")
+            self._notify_work_item_removed(actual_id)
             
             logger.info(f"✅ Deleted MCP Jive work item: {work_item_id}")
             return True
@@ -705,14 +1267,58 @@ class LanceDBManager:
             logger.error(f"❌ Failed to delete MCP Jive work item {work_item_id}: {e}")
             raise
     
+    @staticmethod
+    def _build_filter_expression(filters: Optional[Dict[str, Any]]) -> Optional[str]:
+        """Build a SQL filter from equality filters (lists become IN clauses).
+        
+        Args:
+            filters: Column → value or list of values
+            
+        Returns:
+            Filter expression, or None if there is nothing to filter on
+        """
+        conditions = []
+        for key, value in (filters or {}).items():
+            if isinstance(value, (list, tuple, set)):
+                if len(value) > 0:
+                    conditions.append(f"{key} IN ({', '.join(sql_literal(v) for v in value)})")
+            elif value is not None:
+                conditions.append(f"{key} = {sql_literal(value)}")
+        return " AND ".join(conditions) if conditions else None
+    
+    def _keyword_search_query(self, table, query: str, limit: int, where: Optional[str]):
+        """Build a keyword query: full-text search, or LIKE matching without FTS."""
+        if self.config.enable_fts:
+            search_query = table.search(query, query_type="fts")
+        else:
+            # Fallback to simple text matching across multiple fields
+            like = "(" + " OR ".join(like_contains(column, query)
+                                     for column in ('title', 'description', 'status', 'priority')) + ")"
+            search_query = table.search()
+            where = f"{like} AND ({where})" if where else like
+        if where:
+            search_query = search_query.where(where, prefilter=True)
+        return search_query.limit(limit)
+    
     async def search_work_items(
         self, 
         query: str, 
         search_type: Union[SearchType, str] = SearchType.VECTOR,
         limit: int = 10,
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Search work items with various search types."""
+        """Search work items with various search types.
+        
+        Filters are applied before ranking, so every mode returns up to
+        ``limit`` matching items. Hybrid search over-fetches candidates from
+        the vector and keyword indexes and fuses them with reciprocal rank
+        fusion; its results are ordered by ``_relevance_score`` and carry the
+        component scores (``_distance``, ``_score``) and ranks
+        (``_vector_rank``, ``_keyword_rank``). ``columns`` limits the fields
+        read (default: all but ``vector``); ``order_index`` is added so
+        results can be sorted.
+        """
         try:
             # Convert string search types to enum
             if isinstance(search_type, str):
@@ -731,174 +1337,450 @@ class LanceDBManager:
                 await self._ensure_fts_index("WorkItem")
             
             table = await self.get_table("WorkItem")
+            where = self._build_filter_expression(filters)
+            columns = resolve_columns(table.schema, None if columns is None else [*columns, 'order_index'])
             
             if search_type == SearchType.VECTOR:
                 # Vector similarity search - generate embedding from query text
-                query_embedding = self._generate_embedding(query)
-                search_query = table.search(query_embedding).limit(limit)
+                query_embedding = await self.generate_embedding(query)
+                search_query = table.search(query_embedding)
+                if where:
+                    search_query = search_query.where(where, prefilter=True)
+                search_query = search_query.limit(limit)
                 
             elif search_type == SearchType.KEYWORD:
-                # Full-text search (if available)
-                if self.config.enable_fts:
-                    search_query = table.search(query, query_type="fts").limit(limit)
-                else:
-                    # Fallback to simple text matching across multiple fields
-                    search_query = table.search().where(
-                        f"title LIKE '%{query}%' OR description LIKE '%{query}%' OR status LIKE '%{query}%' OR priority LIKE '%{query}%'"
-                    ).limit(limit)
-                    
-            elif search_type == SearchType.HYBRID:
-                # Combine vector and keyword search
-                query_embedding = self._generate_embedding(query)
-                vector_results = table.search(query_embedding).limit(limit // 2).to_pandas()
-                
-                # Apply similarity threshold to vector results
-                similarity_threshold = 0.8
-                if not vector_results.empty and '_distance' in vector_results.columns:
-                    vector_results = vector_results[vector_results['_distance'] <= similarity_threshold]
-                
-                if self.config.enable_fts:
-                    keyword_results = table.search(query, query_type="fts").limit(limit // 2).to_pandas()
-                else:
-                    keyword_results = table.search().where(
-                        f"title LIKE '%{query}%' OR description LIKE '%{query}%' OR status LIKE '%{query}%' OR priority LIKE '%{query}%'"
-                    ).limit(limit // 2).to_pandas()
-                
-                # Combine and deduplicate
-                if not vector_results.empty and not keyword_results.empty:
-                    combined = pd.concat([vector_results, keyword_results]).drop_duplicates(subset=['id'])
-                elif not vector_results.empty:
-                    combined = vector_results
-                elif not keyword_results.empty:
-                    combined = keyword_results
-                else:
-                    return []  # No results from either search
+                search_query = self._keyword_search_query(table, query, limit, where)
                 
-                result_items = combined.head(limit).to_dict('records')
-                return [self._convert_numpy_to_python(item) for item in result_items]
+            elif search_type == SearchType.HYBRID:
+                return await self._hybrid_search_work_items(table, query, limit, where, columns)
             
             else:
                 raise ValueError(f"Unknown search type: {search_type}")
             
-            # Apply filters if provided
-            if filters:
-                for key, value in filters.items():
-                    if isinstance(value, str):
-                        search_query = search_query.where(f"{key} = '{value}'")
-                    else:
-                        search_query = search_query.where(f"{key} = {value}")
+            results = read_rows(search_query, columns)
             
-            results = search_query.to_pandas()
-            
-            # Filter out results with poor similarity for vector and hybrid searches
+            # Filter out results with poor similarity for vector searches
             # LanceDB uses cosine distance, where lower values mean higher similarity
             # Threshold of 0.8 means we only keep results with reasonable similarity
-            similarity_threshold = 0.8
-            if search_type in [SearchType.VECTOR, SearchType.HYBRID] and not results.empty:
-                if '_distance' in results.columns:
-                    results = results[results['_distance'] <= similarity_threshold]
-                    # If no results meet the threshold, return empty list
-                    if results.empty:
-                        return []
+            if search_type == SearchType.VECTOR:
+                results = [row for row in results
+                           if row.get('_distance') is None or row['_distance'] <= self.VECTOR_DISTANCE_THRESHOLD]
             
             # Sort by order_index to maintain sequence order
-            if hasattr(results, 'columns') and 'order_index' in results.columns.tolist():
-                results = results.sort_values(by='order_index', ascending=True)
+            results.sort(key=lambda row: row.get('order_index') or 0)
             
-            work_items = results.to_dict('records')
-            return [self._convert_numpy_to_python(item) for item in work_items]
+            return results
             
         except Exception as e:
             logger.error(f"❌ Failed to search MCP Jive work items: {e}")
             raise
     
+    async def _hybrid_search_work_items(self, table, query: str, limit: int,
+                                        where: Optional[str], columns: List[str]) -> List[Dict[str, Any]]:
+        """Run vector and keyword retrieval and fuse the rankings.
+        
+        Args:
+            table: WorkItem table
+            query: Search text
+            limit: Number of results to return
+            where: Filter applied inside both retrievals
+            columns: Columns to return
+            
+        Returns:
+            Up to ``limit`` work items ordered by fused relevance
+        """
+        candidates = max(limit * self.config.hybrid_candidate_multiplier, limit)
+        
+        query_embedding = await self.generate_embedding(query)
+        vector_query = table.search(query_embedding)
+        if where:
+            vector_query = vector_query.where(where, prefilter=True)
+        vector_results = read_rows(vector_query.limit(candidates), columns)
+        
+        try:
+            keyword_results = read_rows(self._keyword_search_query(table, query, candidates, where), columns)
+        except Exception as e:
+            # No FTS index yet (e.g. empty table): rank on vectors alone
+            logger.warning(f"⚠️ Keyword part of hybrid search failed, using vector ranking only: {e}")
+            keyword_results = []
+        
+        return reciprocal_rank_fusion(
+            {'vector': vector_results, 'keyword': keyword_results},
+            k=self.config.hybrid_rrf_k,
+            limit=limit
+        )
+    
+    @staticmethod
+    def _ordered_scan(table, where: Optional[str], projection: List[str], sort_by: str,
+                      ascending: bool, limit: Optional[int], offset: int = 0) -> "pa.Table":
+        """Read one ordered slice of a filtered, projected scan.
+        
+        Ordering (with ``id`` as tie-breaker, nulls last), offset and limit are
+        pushed into LanceDB, so only the requested rows are materialized.
+        
+        Args:
+            table: Table to scan
+            where: Filter expression
+            projection: Columns to read (must include sort_by and ``id``)
+            sort_by: Sort column
+            ascending: Sort direction
+            limit: Maximum number of rows (None for all matching rows)
+            offset: Rows to skip
+            
+        Returns:
+            Arrow table holding the slice
+        """
+        query = table.search()
+        if where:
+            query = query.where(where)
+        query = query.select(projection)
+        if limit is None:
+            limit = max(table.count_rows(where) - offset, 1)
+        
+        from lancedb.query import ColumnOrdering
+        
+        ordering = [ColumnOrdering(column_name=sort_by, ascending=ascending, nulls_first=False)]
+        if sort_by != 'id':
+            ordering.append(ColumnOrdering(column_name='id', ascending=ascending))
+        query = query.order_by(ordering)
+        if offset:
+            query = query.offset(offset)
+        return query.limit(limit).to_arrow()
+    
+    @staticmethod
+    def _sorted_projection(table, columns: Optional[List[str]], sort_by: str) -> Tuple[List[str], str, bool]:
+        """Resolve the columns and sort key of a listing.
+        
+        Returns:
+            (projection, sort column, whether the sort column was added only for ordering)
+        """
+        if sort_by not in table.schema.names:
+            sort_by = 'id'
+        projection = resolve_columns(table.schema, columns)
+        extra_sort_column = sort_by not in projection
+        if extra_sort_column:
+            projection.append(sort_by)
+        return projection, sort_by, extra_sort_column
+    
     async def list_work_items(
         self,
         filters: Optional[Dict[str, Any]] = None,
-        limit: int = 50,
+        limit: Optional[int] = 50,
         offset: int = 0,
         sort_by: str = "order_index",
-        sort_order: str = "asc"
+        sort_order: str = "asc",
+        columns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """List work items with filtering, pagination, and sorting."""
+        """List work items with filtering, pagination, and sorting.
+        
+        Filtering, ordering, offset and limit run inside LanceDB. Deep pages
+        are cheaper through list_work_items_page, whose cursors avoid skipping
+        rows; full scans without ordering through iter_work_items.
+        
+        Args:
+            filters: Field → value (or list of values) equality filters
+            limit: Page size (None for every matching item)
+            offset: Rows to skip after sorting
+            sort_by: Sort column (unknown columns sort by id)
+            sort_order: "asc" or "desc"
+            columns: Columns to return (default: all but ``vector``)
+        """
         try:
             table = await self.get_table("WorkItem")
+            where = self._build_filter_expression(filters)
+            projection, sort_by, extra_sort_column = self._sorted_projection(table, columns, sort_by)
             
-            # Handle filtering
-            if filters:
-                # Build filter conditions
-                filter_conditions = []
-                for key, value in filters.items():
-                    if isinstance(value, list):
-                        # Handle array filters (e.g., status in ['active', 'pending'])
-                        # Use len() check to avoid numpy boolean evaluation error
-                        if len(value) > 0:  # Only add if list is not empty
-                            condition_parts = [f"{key} = '{v}'" for v in value]
-                            filter_conditions.append(f"({' OR '.join(condition_parts)})")
-                    elif isinstance(value, str):
-                        filter_conditions.append(f"{key} = '{value}'")
-                    elif isinstance(value, (int, float)):
-                        filter_conditions.append(f"{key} = {value}")
-                    elif isinstance(value, bool):
-                        filter_conditions.append(f"{key} = {str(value).lower()}")
-                
-                if filter_conditions is not None and len(filter_conditions) > 0:
-                    filter_expr = " AND ".join(filter_conditions)
-                    df = table.search().where(filter_expr).to_pandas()
-                else:
-                    df = table.to_pandas()
-            else:
-                df = table.to_pandas()
-            
-            # Handle sorting
-            if hasattr(df, 'columns') and sort_by in df.columns.tolist():
-                ascending = sort_order.lower() == "asc"
-                df = df.sort_values(by=sort_by, ascending=ascending)
+            data = self._ordered_scan(table, where, projection, sort_by,
+                                      sort_order.lower() == "asc", limit, offset)
+            if extra_sort_column:
+                data = data.drop_columns([sort_by])
+            work_items = decode_table(data, exclude=())
             
-            # Handle pagination
-            total_count = len(df)
-            df = df.iloc[offset:offset + limit]
-            
-            # Convert to list of dictionaries and handle numpy types
-            work_items = df.to_dict('records')
-            
-            # Convert numpy types to native Python types for JSON serialization
-            work_items = [self._convert_numpy_to_python(item) for item in work_items]
-            
-            logger.info(f"✅ Listed {len(work_items)} work items (total: {total_count})")
+            logger.info(f"✅ Listed {len(work_items)} work items")
             return work_items
             
         except Exception as e:
             logger.error(f"Error listing work items: {e}")
             raise
     
-    async def get_work_item_children(self, work_item_id: str, recursive: bool = False) -> List[Dict[str, Any]]:
-        """Get child work items for a given parent work item."""
-        try:
-            table = await self.get_table("WorkItem")
+    async def list_work_items_page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        sort_by: str = "order_index",
+        sort_order: str = "asc",
+        columns: Optional[List[str]] = None,
+        include_total: bool = True
+    ) -> Dict[str, Any]:
+        """List one page of work items with a continuation cursor.
+        
+        Each page is a keyset query (rows after the previous page's last sort
+        value and id), so page N costs the same as page 1.
+        
+        Args:
+            filters: Field → value (or list of values) equality filters
+            limit: Page size
+            cursor: ``next_cursor`` of the previous page (None for the first page)
+            sort_by: Sort column (unknown columns sort by id)
+            sort_order: "asc" or "desc"
+            columns: Columns to return (default: all but ``vector``)
+            include_total: Count all items matching the filters
+            
+        Returns:
+            Dictionary with 'items', 'next_cursor' (None on the last page) and
+            'total' (None unless include_total)
+            
+        Raises:
+            ValueError: If limit is not positive or the cursor belongs to a
+                different filter or sort order
+        """
+        if limit < 1:
+            raise ValueError(f"Page size must be positive, got {limit}")
+        
+        table = await self.get_table("WorkItem")
+        where = self._build_filter_expression(filters)
+        ascending = sort_order.lower() == "asc"
+        projection, sort_by, extra_sort_column = self._sorted_projection(table, columns, sort_by)
+        
+        page_where = where
+        if cursor:
+            keyset = decode_cursor(cursor, sort_by, ascending, where)
+            page_where = f"({where}) AND {keyset}" if where else keyset
+        
+        # One extra row tells whether another page follows
+        data = self._ordered_scan(table, page_where, projection, sort_by, ascending, limit + 1)
+        items = decode_table(data.slice(0, limit), exclude=())
+        next_cursor = None
+        if data.num_rows > limit:
+            next_cursor = encode_cursor(sort_by, ascending, where, items[-1])
+        if extra_sort_column:
+            for item in items:
+                item.pop(sort_by, None)
+        
+        return {
+            "items": items,
+            "next_cursor": next_cursor,
+            "total": table.count_rows(where) if include_total else None
+        }
+    
+    async def count_work_items(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count work items matching equality filters without reading them.
+        
+        Args:
+            filters: Field → value (or list of values) equality filters
+            
+        Returns:
+            Number of matching work items
+        """
+        table = await self.get_table("WorkItem")
+        return table.count_rows(self._build_filter_expression(filters))
+    
+    async def iter_work_items(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every matching work item in storage order.
+        
+        Rows are decoded one Arrow record batch at a time, so memory stays
+        bounded by batch_size regardless of table size. Batches are read in a
+        worker thread so long scans (e.g. backups) do not block the event loop.
+        
+        Args:
+            filters: Field → value (or list of values) equality filters
+            columns: Columns to return (default: all but ``vector``)
+            batch_size: Rows per record batch
             
-            # Get all work items and filter by parent_id
-            df = table.to_pandas()
+        Yields:
+            Work item rows
+        """
+        table = await self.get_table("WorkItem")
+        where = self._build_filter_expression(filters)
+        query = table.search()
+        if where:
+            query = query.where(where)
+        query = query.select(resolve_columns(table.schema, columns))
+        query = query.limit(max(table.count_rows(where), 1))
+        
+        import pyarrow as pa
+        batches = iter(query.to_batches(batch_size))
+        while True:
+            batch = await asyncio.to_thread(next, batches, None)
+            if batch is None:
+                break
+            for row in decode_table(pa.Table.from_batches([batch]), exclude=()):
+                yield row
+    
+    async def scan_work_items(self, columns: List[str]) -> List[Dict[str, Any]]:
+        """Read selected columns of every work item in one projected scan.
+        
+        Args:
+            columns: Columns to read
             
-            # Filter for direct children - use safe comparison to avoid numpy boolean evaluation
-            # Convert parent_id column to string to avoid numpy array comparison issues
-            df_safe = df.copy()
-            df_safe['parent_id'] = df_safe['parent_id'].astype(str)
-            children_df = df_safe[df_safe['parent_id'] == str(work_item_id)]
+        Returns:
+            Rows holding only the requested columns
+        """
+        table = await self.get_table("WorkItem")
+        row_count = table.count_rows()
+        return read_rows(table.search().limit(max(row_count, 1)), columns)
+    
+    def add_work_item_observer(self, observer: Any) -> None:
+        """Keep an in-memory structure current with WorkItem writes.
+        
+        Args:
+            observer: Object with upsert(row), remove(work_item_id) and invalidate();
+                rows passed to upsert may be partial updates keyed by 'id'
+        """
+        if observer not in self._work_item_observers:
+            self._work_item_observers.append(observer)
+    
+    def remove_work_item_observer(self, observer: Any) -> None:
+        """Stop notifying an observer registered with add_work_item_observer."""
+        if observer in self._work_item_observers:
+            self._work_item_observers.remove(observer)
+    
+    def add_table_observer(self, table_name: str, observer: Any) -> None:
+        """Invalidate an in-memory structure when a table is replaced wholesale.
+        
+        Args:
+            table_name: Table the structure is derived from
+            observer: Object with invalidate()
+        """
+        observers = self._table_observers.setdefault(table_name, [])
+        if observer not in observers:
+            observers.append(observer)
+    
+    def remove_table_observer(self, table_name: str, observer: Any) -> None:
+        """Stop notifying an observer registered with add_table_observer."""
+        observers = self._table_observers.get(table_name, [])
+        if observer in observers:
+            observers.remove(observer)
+    
+    def invalidate_tables(self, table_names: List[str]) -> None:
+        """Drop in-memory structures derived from tables whose rows changed
+        outside this manager's write methods (e.g. a snapshot restore).
+        
+        Args:
+            table_names: Tables that changed
+        """
+        for table_name in table_names:
+            if table_name == "WorkItem":
+                self._notify_work_items_invalidated()
+            for observer in self._table_observers.get(table_name, []):
+                observer.invalidate()
+    
+    def _notify_work_items_written(self, rows: List[Dict[str, Any]]) -> None:
+        for observer in self._work_item_observers:
+            for row in rows:
+                observer.upsert(row)
+    
+    def _notify_work_item_removed(self, work_item_id: str) -> None:
+        for observer in self._work_item_observers:
+            observer.remove(work_item_id)
+    
+    def _notify_work_items_invalidated(self) -> None:
+        for observer in self._work_item_observers:
+            observer.invalidate()
+    
+    async def get_hierarchy_index(self) -> WorkItemHierarchyIndex:
+        """Get the work item hierarchy index, building it on first use.
+        
+        The build reads only the id, parent_id, order_index and created_at
+        columns; afterwards the index is maintained on every write.
+        """
+        if not self.hierarchy_index.built:
+            self.hierarchy_index.build(await self.scan_work_items(INDEX_COLUMNS))
+            logger.info(f"✅ Built hierarchy index for namespace '{self.namespace}' ({len(self.hierarchy_index)} items)")
+        return self.hierarchy_index
+    
+    async def get_keyword_index(self) -> WorkItemKeywordIndex:
+        """Get the work item keyword index, building it on first use."""
+        if not self.keyword_index.built:
+            self.keyword_index.build(await self.scan_work_items(KEYWORD_INDEX_COLUMNS))
+            logger.info(f"✅ Built keyword index for namespace '{self.namespace}' ({len(self.keyword_index)} items)")
+        return self.keyword_index
+    
+    async def keyword_search_work_items(
+        self,
+        query: str,
+        fields: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10,
+        columns: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Search work items through the in-memory keyword index.
+        
+        Args:
+            query: Free-text query (prefix and typo tolerant)
+            fields: Text fields to search (default: title, description,
+                acceptance_criteria and tags)
+            filters: status, item_type, priority or assignee → value or list of values
+            limit: Maximum number of results
+            columns: Columns to return (default: all but ``vector``)
             
-            # Convert to list of dictionaries
-            children = children_df.to_dict('records')
+        Returns:
+            Work items ordered by BM25 score, each with '_keyword_score' and
+            '_keyword_fields' (matched field → matched terms)
+        """
+        index = await self.get_keyword_index()
+        hits = index.search(query, fields=fields, filters=filters, limit=limit)
+        rows = {row['id']: row for row in await self.get_work_items_by_ids([hit['id'] for hit in hits],
+                                                                           columns=columns)}
+        
+        results = []
+        for hit in hits:
+            row = rows.get(hit['id'])
+            if row is not None:
+                row['_keyword_score'] = hit['score']
+                row['_keyword_fields'] = hit['fields']
+                results.append(row)
+        return results
+    
+    async def get_work_items_by_ids(self, work_item_ids: List[str], chunk_size: int = 500,
+                                    columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch work items by primary id, preserving the requested order.
+        
+        Args:
+            work_item_ids: Work item ids
+            chunk_size: Maximum number of ids per query
+            columns: Columns to read (default: all but ``vector``)
             
-            # Convert numpy types to native Python types for JSON serialization
-            children = [self._convert_numpy_to_python(child) for child in children]
+        Returns:
+            Work items for the ids that exist
+        """
+        if not work_item_ids:
+            return []
+        table = await self.get_table("WorkItem")
+        rows = self._fetch_work_item_rows(table, list(dict.fromkeys(work_item_ids)), chunk_size,
+                                          columns=resolve_columns(table.schema, columns))
+        return [rows[work_item_id] for work_item_id in work_item_ids if work_item_id in rows]
+    
+    async def get_work_item_children(self, work_item_id: str, recursive: bool = False,
+                                     columns: Optional[List[str]] = None,
+                                     max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get child work items for a given parent work item.
+        
+        Uses the hierarchy index to find the child ids, then fetches just
+        those rows, so the cost is proportional to the subtree size.
+        
+        Args:
+            work_item_id: Parent work item id
+            recursive: Include all descendants (depth-first pre-order)
+            columns: Columns to read (default: all but ``vector``)
+            max_depth: Depth limit for recursive reads (1 = direct children only)
             
-            # If recursive, get children of children
+        Returns:
+            Child work items ordered by order_index
+        """
+        try:
+            index = await self.get_hierarchy_index()
             if recursive:
-                all_children = children.copy()
-                for child in children:
-                    grandchildren = await self.get_work_item_children(child['id'], recursive=True)
-                    all_children.extend(grandchildren)
-                children = all_children
+                child_ids = index.descendants(str(work_item_id), max_depth=max_depth)
+            else:
+                child_ids = index.children(str(work_item_id))
+            children = await self.get_work_items_by_ids(child_ids, columns=columns)
             
             logger.info(f"✅ Found {len(children)} children for work item {work_item_id}")
             return children
@@ -915,6 +1797,7 @@ class LanceDBManager:
                 log_data['log_id'] = log_data.get('id', '')
             
             # Create execution log
+            from .lancedb_models import ExecutionLogModel
             execution_log = ExecutionLogModel(**log_data)
             
             # Insert into table
@@ -931,34 +1814,33 @@ class LanceDBManager:
     async def get_execution_logs(
         self, 
         work_item_id: Optional[str] = None,
-        limit: int = 100
+        limit: int = 100,
+        columns: Optional[List[str]] = None
     ) -> List[Dict[str, Any]]:
-        """Get execution logs, optionally filtered by work item."""
+        """Get execution logs, optionally filtered by work item.
+        
+        Args:
+            work_item_id: Only return logs of this work item
+            limit: Maximum number of logs
+            columns: Columns to read (default: all but ``vector``)
+        """
         try:
             table = await self.get_table("ExecutionLog")
+            projection = resolve_columns(table.schema, columns)
+            extra_sort_column = 'timestamp' not in projection
             
+            query = table.search()
             if work_item_id:
-                results = table.search().where(
-                    f"work_item_id = '{work_item_id}'"
-                ).limit(limit).to_pandas()
-            else:
-                results = table.search().limit(limit).to_pandas()
+                query = query.where(f"work_item_id = {sql_literal(work_item_id)}")
+            data = query.select(projection + ['timestamp'] if extra_sort_column else projection)
+            data = data.limit(limit).to_arrow()
             
             # Sort by timestamp descending
-            results = results.sort_values('timestamp', ascending=False)
-            
-            logs = results.to_dict('records')
-            # Convert numpy types for execution logs (simpler conversion since no list fields)
-            for log in logs:
-                for key, value in log.items():
-                    if hasattr(value, 'item'):  # numpy scalar
-                        try:
-                            log[key] = value.item()
-                        except (ValueError, AttributeError):
-                            pass
-                    elif pd.isna(value):
-                        log[key] = None
-            return logs
+            if data.num_rows:
+                data = data.sort_by([('timestamp', 'descending')])
+            if extra_sort_column:
+                data = data.drop_columns(['timestamp'])
+            return decode_table(data, exclude=())
             
         except Exception as e:
             logger.error(f"❌ Failed to get MCP Jive execution logs: {e}")
@@ -1036,6 +1918,9 @@ class LanceDBManager:
                 'status': 'healthy' if all_healthy else 'degraded',
                 'database_path': self.config.data_path,
                 'embedding_model': self.config.embedding_model,
+                'embedding_batching': self.embedder.get_stats(),
+                'embedding_cache': self.embedding_cache.get_stats(),
+                'keyword_index': self.keyword_index.get_stats(),
                 'tables': table_status,
                 'total_tables': len(tables),
                 'initialized': self._initialized,
@@ -1065,7 +1950,10 @@ class LanceDBManager:
             self._initialized = False
             self._tables.clear()
             self.db = None
-            self.embedding_func = None
+            if self._owns_embedder:
+                await self.embedder.close()
+                self.embedding_func = None
+            self.embedding_cache.close()
             
             logger.info("✅ MCP Jive LanceDB cleanup completed")
             
@@ -1110,25 +1998,35 @@ class LanceDBManager:
         else:
             data_list = data
 
-        # Ensure IDs exist and generate embeddings if text_field specified
+        # Ensure IDs exist and collect rows that need a vector embedding
+        to_embed = []
         for item in data_list:
             if 'id' not in item:
                 item['id'] = str(uuid4())
 
-            # Generate vector embedding if text_field specified
             if text_field and text_field in item and item[text_field]:
                 text_content = item[text_field]
                 if isinstance(text_content, str) and text_content.strip():
-                    item['vector'] = await self.generate_embedding(text_content)
+                    to_embed.append(item)
+
+        # Embed all rows in one batched call instead of one model pass per row
+        if to_embed:
+            vectors = await self.generate_embeddings([item[text_field] for item in to_embed])
+            for item, vector in zip(to_embed, vectors):
+                item['vector'] = vector
 
         # Add to table (table.add is synchronous, not async)
         table.add(data_list)
+        if table_name == "WorkItem":
+            self._notify_work_items_invalidated()
+        self._ensure_scalar_indexes(table_name)
 
         return data_list[0]['id']
 
     async def search_data(self, table_name: str, query: Optional[str] = None,
                           filters: Optional[Dict[str, Any]] = None,
-                          limit: int = 100) -> List[Dict[str, Any]]:
+                          limit: int = 100,
+                          columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Search for rows in a table with optional semantic query and filters.
 
         Args:
@@ -1136,6 +2034,7 @@ class LanceDBManager:
             query: Optional semantic search query string
             filters: Optional filters to apply (key-value pairs)
             limit: Maximum number of results
+            columns: Columns to read (default: all but ``vector``)
 
         Returns:
             List of matching rows as dictionaries
@@ -1143,19 +2042,7 @@ class LanceDBManager:
         await self._ensure_tables_initialized()
         table = await self.get_table(table_name)
 
-        # Build filter string for LanceDB
-        filter_str = None
-        if filters:
-            filter_conditions = []
-            for key, value in filters.items():
-                if isinstance(value, str):
-                    filter_conditions.append(f"{key} = '{value}'")
-                elif isinstance(value, (int, float)):
-                    filter_conditions.append(f"{key} = {value}")
-                elif isinstance(value, bool):
-                    filter_conditions.append(f"{key} = {str(value).lower()}")
-            if filter_conditions:
-                filter_str = " AND ".join(filter_conditions)
+        filter_str = self._build_filter_expression(filters)
 
         # Execute search
         if query:
@@ -1170,8 +2057,35 @@ class LanceDBManager:
         if filter_str:
             search_query = search_query.where(filter_str)
 
-        results = search_query.limit(limit).to_list()
-        return [self._convert_numpy_to_python(r) for r in results]
+        return read_rows(search_query.limit(limit), resolve_columns(table.schema, columns))
+
+    async def upsert_data(self, table_name: str, rows: List[Dict[str, Any]], key: str = 'id') -> int:
+        """Insert or replace whole rows of a table in one merge_insert commit.
+
+        Args:
+            table_name: Name of the table
+            rows: Complete rows (missing nullable columns are stored as null)
+            key: Column matching existing rows
+
+        Returns:
+            Number of rows written
+        """
+        if not rows:
+            return 0
+        await self._ensure_tables_initialized()
+        table = await self.get_table(table_name)
+        import pyarrow as pa
+        data = pa.Table.from_pylist(rows, schema=table.schema)
+        await self._retry_operation(
+            lambda: table.merge_insert(key)
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(data)
+        )
+        if table_name == "WorkItem":
+            self._notify_work_items_invalidated()
+        self._ensure_scalar_indexes(table_name)
+        return len(rows)
 
     async def delete_data(self, table_name: str, filters: Dict[str, Any]) -> int:
         """Delete rows from a table matching the filters.
@@ -1186,22 +2100,17 @@ class LanceDBManager:
         await self._ensure_tables_initialized()
         table = await self.get_table(table_name)
 
-        # Build filter string
-        filter_conditions = []
-        for key, value in filters.items():
-            if isinstance(value, str):
-                filter_conditions.append(f"{key} = '{value}'")
-            elif isinstance(value, (int, float)):
-                filter_conditions.append(f"{key} = {value}")
-            elif isinstance(value, bool):
-                filter_conditions.append(f"{key} = {str(value).lower()}")
+        filter_str = self._build_filter_expression(filters)
+        if not filter_str:
+            return 0
 
-        if filter_conditions:
-            filter_str = " AND ".join(filter_conditions)
+        # LanceDB's delete doesn't report a count, so count the matches first
+        deleted = table.count_rows(filter_str)
+        if deleted:
             table.delete(filter_str)
-            return 1  # LanceDB doesn't return count, so we return 1 on success
-
-        return 0
+            if table_name == "WorkItem":
+                self._notify_work_items_invalidated()
+        return deleted
 
     def list_tables(self) -> List[str]:
         """List all tables in the database."""
@@ -1213,8 +2122,93 @@ class LanceDBManager:
             logger.error(f"❌ Failed to list MCP Jive tables: {e}")
             return []
     
+    def get_table_maintenance_stats(self, table_name: str) -> Dict[str, Any]:
+        """Collect the storage statistics that drive background maintenance.
+        
+        Args:
+            table_name: Name of the table
+            
+        Returns:
+            Fragment counts, live and deleted rows and unindexed rows of the
+            table
+        """
+        table = self.db.open_table(table_name)
+        stats = table.stats()
+        fragment_stats = stats.get('fragment_stats', {})
+        try:
+            deleted_rows = table.to_lance().stats.dataset_stats().get('num_deleted_rows', 0)
+        except Exception:
+            deleted_rows = 0
+        
+        unindexed_rows = 0
+        for index in table.list_indices():
+            index_stats = table.index_stats(index.name)
+            if index_stats is not None:
+                unindexed_rows = max(unindexed_rows, index_stats.num_unindexed_rows)
+        
+        num_rows = stats.get('num_rows', 0)
+        return {
+            'version': table.version,
+            'total_bytes': stats.get('total_bytes', 0),
+            'num_rows': num_rows,
+            'num_fragments': fragment_stats.get('num_fragments', 0),
+            'num_small_fragments': fragment_stats.get('num_small_fragments', 0),
+            'deleted_rows': deleted_rows,
+            'deleted_ratio': deleted_rows / (num_rows + deleted_rows) if deleted_rows else 0.0,
+            'unindexed_rows': unindexed_rows
+        }
+    
+    def maintain_table(self, table_name: str, compact: bool = False,
+                       cleanup_older_than: Optional[float] = None,
+                       refresh_indexes: bool = False) -> Dict[str, Any]:
+        """Run maintenance steps on one table.
+        
+        Blocking; the maintenance scheduler runs it in a worker thread.
+        Compaction and version cleanup run as one ``optimize`` call, which
+        also folds unindexed rows into the existing (scalar and full-text)
+        indexes; ``optimize`` always compacts and, without
+        ``cleanup_older_than``, removes versions older than seven days.
+        
+        Args:
+            table_name: Name of the table
+            compact: Merge small fragments and materialize deletions
+            cleanup_older_than: Remove table versions older than this many seconds
+            refresh_indexes: Create missing scalar indexes and fold unindexed
+                rows into the existing ones
+            
+        Returns:
+            What each step did
+        """
+        table = self.db.open_table(table_name)
+        result: Dict[str, Any] = {}
+        
+        if compact or cleanup_older_than is not None:
+            fragments = table.stats().get('fragment_stats', {}).get('num_fragments', 0)
+            versions = {v['version'] for v in table.list_versions()}
+            table.optimize(cleanup_older_than=None if cleanup_older_than is None
+                           else timedelta(seconds=cleanup_older_than))
+            if compact:
+                remaining = table.stats().get('fragment_stats', {}).get('num_fragments', 0)
+                result['compaction'] = {'fragments_removed': max(fragments - remaining, 0)}
+            if cleanup_older_than is not None:
+                remaining = {v['version'] for v in table.list_versions()}
+                result['cleanup'] = {'old_versions': len(versions - remaining)}
+        
+        if refresh_indexes:
+            created = self._ensure_scalar_indexes(table_name, force=True)
+            if not result:
+                table.to_lance().optimize.optimize_indices()
+            result['indexes'] = {'created': created, 'optimized': True}
+        
+        return result
+    
     async def optimize_tables(self) -> Dict[str, Any]:
-        """Optimize database tables for better performance."""
+        """Optimize database tables for better performance.
+        
+        Compacts each table (removing versions older than seven days),
+        creates any missing scalar indexes and folds rows written since the
+        last run into the existing indexes incrementally (no full rebuild).
+        """
         try:
             optimization_results = {}
             
@@ -1222,12 +2216,16 @@ class LanceDBManager:
                 try:
                     table = await self.get_table(table_name)
                     
-                    # Compact the table (LanceDB specific optimization)
-                    table.compact_files()
+                    # Compact the table and fold new rows into its indexes
+                    table.optimize()
+                    
+                    created_indexes = self._ensure_scalar_indexes(table_name, force=True)
                     
                     optimization_results[table_name] = {
                         'status': 'optimized',
-                        'row_count': table.count_rows()
+                        'row_count': table.count_rows(),
+                        'created_indexes': created_indexes,
+                        'indexes_optimized': True
                     }
                     
                 except Exception as e:
@@ -1274,6 +2272,7 @@ __all__ = [
     'LanceDBManager',
     'WeaviateManager',  # Compatibility alias
     'DatabaseConfig',
+    'EmbeddingCache',
     'SearchType',
     'WorkItemModel',
     'ExecutionLogModel'
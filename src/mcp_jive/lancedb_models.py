@@ -0,0 +1,120 @@
+"""LanceDB table models for MCP Jive.
+
+Kept apart from lancedb_manager because defining ``LanceModel`` subclasses
+imports the whole ``lancedb`` package; the manager loads this module only
+when tables are first created or opened, so importing the server (and
+answering the MCP handshake) does not pay for it.
+"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from pydantic import Field
+
+try:
+    from lancedb.pydantic import LanceModel, Vector
+except ImportError as e:
+    raise ImportError(
+        f"LanceDB dependencies not installed: {e}\n"
+        "Install with: pip install lancedb sentence-transformers pyarrow pandas"
+    )
+
+# Pydantic Models for LanceDB Tables (MCP Jive specific)
+
+class WorkItemModel(LanceModel):
+    """Work item data model for MCP Jive."""
+    id: str = Field(description="Unique work item identifier")
+    item_id: str = Field(description="Work item ID (may differ from primary id)")
+    title: str = Field(description="Work item title")
+    description: str = Field(description="Detailed description")
+    vector: Vector(384) = Field(description="Embedding vector")
+    item_type: str = Field(description="Type: Initiative/Epic/Feature/Story/Task")
+    status: str = Field(description="Current status")
+    priority: str = Field(description="Priority level")
+    assignee: Optional[str] = Field(description="Assigned person or AI agent", default=None)
+    tags: List[str] = Field(description="Associated tags", default_factory=list)
+    estimated_hours: Optional[float] = Field(description="Estimated effort", default=None)
+    actual_hours: Optional[float] = Field(description="Actual time spent", default=None)
+    progress: float = Field(description="Completion percentage (0-100)", default=0.0)
+    parent_id: Optional[str] = Field(description="Parent work item ID", default=None)
+    dependencies: List[str] = Field(description="Dependent work item IDs", default_factory=list)
+    
+    # Ordering and sequencing
+    sequence_number: Optional[str] = Field(description="Hierarchical sequence number (e.g., '1.1', '1.2', '2.1')", default=None)
+    order_index: int = Field(description="Numeric order within parent for sorting", default=0)
+    
+    # AI Optimization Parameters
+    context_tags: List[str] = Field(description="Technical context tags for AI categorization", default_factory=list)
+    complexity: Optional[str] = Field(description="Implementation complexity: simple, moderate, complex", default=None)
+    notes: Optional[str] = Field(description="Implementation notes, constraints, or context for AI agent", default=None)
+    acceptance_criteria: List[str] = Field(description="Clear, testable criteria for AI agents to validate completion", default_factory=list)
+    executable: bool = Field(description="Can be executed by the system", default=False)
+    execution_instructions: Optional[str] = Field(description="Instructions for execution", default=None)
+    created_at: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    updated_at: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+
+class ExecutionLogModel(LanceModel):
+    """Execution log data model for MCP Jive."""
+    id: str = Field(description="Unique log identifier")
+    log_id: str = Field(description="Log entry ID")
+    work_item_id: Optional[str] = Field(description="Associated work item ID", default=None)
+    action: str = Field(description="Action performed")
+    status: str = Field(description="Execution status")
+    agent_id: Optional[str] = Field(description="AI agent identifier", default=None)
+    details: str = Field(description="Execution details", default="")
+    error_message: Optional[str] = Field(description="Error message if failed", default=None)
+    duration_seconds: float = Field(description="Execution duration", default=0.0)
+    timestamp: datetime = Field(description="Execution timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+
+class ArchitectureMemoryModel(LanceModel):
+    """Architecture Memory data model for MCP Jive."""
+    id: str = Field(description="Unique identifier")
+    unique_slug: str = Field(description="Unique short slug for identification")
+    title: str = Field(description="Human-friendly short name")
+    ai_when_to_use: List[str] = Field(description="AI-friendly instructions for when to apply", default_factory=list)
+    ai_requirements: str = Field(description="AI-friendly detailed specifications (Markdown)")
+    vector: Vector(384) = Field(description="Embedding vector for semantic search")
+    keywords: List[str] = Field(description="Keywords that describe this architecture item", default_factory=list)
+    children_slugs: List[str] = Field(description="Child architecture item slugs", default_factory=list)
+    related_slugs: List[str] = Field(description="Related architecture item slugs", default_factory=list)
+    linked_epic_ids: List[str] = Field(description="Epic work item IDs that reference this", default_factory=list)
+    tags: List[str] = Field(description="Tags for categorization", default_factory=list)
+    created_on: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    last_updated_on: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+
+class TroubleshootMemoryModel(LanceModel):
+    """Troubleshoot Memory data model for MCP Jive."""
+    id: str = Field(description="Unique identifier")
+    unique_slug: str = Field(description="Unique short slug for identification")
+    title: str = Field(description="Human-friendly short name")
+    ai_use_case: List[str] = Field(description="AI-friendly problem descriptions", default_factory=list)
+    ai_solutions: str = Field(description="AI-friendly solution with tips and steps (Markdown)")
+    vector: Vector(384) = Field(description="Embedding vector for semantic search")
+    keywords: List[str] = Field(description="Keywords that describe this troubleshooting item", default_factory=list)
+    tags: List[str] = Field(description="Tags for categorization", default_factory=list)
+    usage_count: int = Field(description="Number of times retrieved", default=0)
+    success_count: int = Field(description="Number of times marked as successful", default=0)
+    created_on: datetime = Field(description="Creation timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    last_updated_on: datetime = Field(description="Last update timestamp", default_factory=lambda: datetime.now(timezone.utc))
+    metadata: str = Field(description="Additional metadata (JSON string)", default="{}")
+
+
+# Table name -> schema model
+TABLE_MODELS = {
+    'WorkItem': WorkItemModel,
+    'ExecutionLog': ExecutionLogModel,
+    'ArchitectureMemory': ArchitectureMemoryModel,
+    'TroubleshootMemory': TroubleshootMemoryModel
+}
+
+
+__all__ = [
+    "WorkItemModel",
+    "ExecutionLogModel",
+    "ArchitectureMemoryModel",
+    "TroubleshootMemoryModel",
+    "TABLE_MODELS",
+]
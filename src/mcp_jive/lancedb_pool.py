@@ -0,0 +1,326 @@
+"""Namespace-keyed LanceDB manager pool for MCP Jive.
+
+Keeps one warm LanceDBManager per namespace so that requests carrying an
+``X-Namespace`` header reuse an already-open connection (and its cached table
+handles and FTS state) instead of building and initializing a fresh manager
+on every namespace switch.
+
+The pool is bounded by a max-open cap with LRU eviction and drops managers
+that have been idle longer than a configurable timeout. Managers leased by an
+in-flight request (``lease``) are never evicted; the pool may exceed max_open
+until they are released. Evicted managers are cleaned up (flushing their
+embedding cache) in the background. The default namespace manager is pinned
+and never evicted.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import replace
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+
+from .lancedb_manager import LanceDBManager, DatabaseConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_NAMESPACE = "default"
+
+
+class LanceDBManagerPool:
+    """LRU pool of LanceDBManager instances keyed by namespace."""
+
+    def __init__(self,
+                 default_manager: LanceDBManager,
+                 max_open: int = 32,
+                 idle_timeout: float = 600.0):
+        """Initialize the manager pool.
+
+        Args:
+            default_manager: Manager for the default namespace (pinned, never evicted)
+            max_open: Maximum number of namespace managers kept open besides the default
+            idle_timeout: Seconds after which an unused namespace manager is evicted
+        """
+        self.default_manager = default_manager
+        self.max_open = max(1, max_open)
+        self.idle_timeout = idle_timeout
+
+        # namespace -> manager, least recently used first
+        self._managers: "OrderedDict[str, LanceDBManager]" = OrderedDict()
+        # namespace -> last_used monotonic timestamp
+        self._last_used: Dict[str, float] = {}
+        # namespace -> number of in-flight requests holding its manager
+        self._leases: Dict[str, int] = {}
+        # namespace -> work item observer, added to every manager the pool opens
+        self._observer_factories: List[Callable[[str], Any]] = []
+        # Managers evicted by LRU or idle timeout, awaiting cleanup()
+        self._retired: List[LanceDBManager] = []
+        self._cleanup_task: Optional[asyncio.Task] = None
+
+        # Counters exposed through get_stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _normalize(namespace: Optional[str]) -> str:
+        """Map None/empty namespaces onto the default namespace."""
+        return namespace or DEFAULT_NAMESPACE
+
+    def _is_default(self, namespace: str) -> bool:
+        return namespace == DEFAULT_NAMESPACE or namespace == self.default_manager.get_namespace()
+
+    def _build_config(self, namespace: str) -> DatabaseConfig:
+        """Derive a namespace config from the default manager's config."""
+        return replace(self.default_manager.config, namespace=namespace)
+
+    def get(self, namespace: Optional[str]) -> LanceDBManager:
+        """Get the manager for a namespace, creating it if needed.
+
+        The returned manager may not be initialized yet; LanceDBManager
+        initializes itself lazily on first table access. Use ``acquire`` to
+        get an initialized manager.
+
+        Args:
+            namespace: Namespace name (None means the default namespace)
+
+        Returns:
+            LanceDBManager bound to the namespace
+        """
+        namespace = self._normalize(namespace)
+        if self._is_default(namespace):
+            return self.default_manager
+
+        now = time.monotonic()
+        self._evict_idle(now)
+
+        manager = self._managers.get(namespace)
+        if manager is not None:
+            self.hits += 1
+            self._managers.move_to_end(namespace)
+        else:
+            self.misses += 1
+            manager = LanceDBManager(self._build_config(namespace))
+            # Share the default manager's embedder (and its loaded model) so all
+            # namespaces batch into the same queue instead of loading one model each
+            manager.embedder = self.default_manager.embedder
+            manager._owns_embedder = False
+            if self.default_manager.embedding_func is not None:
+                manager.embedding_func = self.default_manager.embedding_func
+            for factory in self._observer_factories:
+                manager.add_work_item_observer(factory(namespace))
+            self._managers[namespace] = manager
+            logger.debug(f"Opened LanceDB manager for namespace '{namespace}' ({len(self._managers)}/{self.max_open} open)")
+            self._evict_over_capacity(keep=namespace)
+
+        self._last_used[namespace] = now
+        self._schedule_cleanup()
+        return manager
+
+    def add_work_item_observer(self, factory: Callable[[str], Any]) -> None:
+        """Observe work item writes in every namespace, including ones opened later.
+
+        Args:
+            factory: Called with a namespace name; returns the observer to add
+                to that namespace's manager (see LanceDBManager.add_work_item_observer)
+        """
+        self._observer_factories.append(factory)
+        for namespace, manager in self.open_managers().items():
+            manager.add_work_item_observer(factory(namespace))
+
+    async def acquire(self, namespace: Optional[str]) -> LanceDBManager:
+        """Get an initialized manager for a namespace.
+
+        Args:
+            namespace: Namespace name (None means the default namespace)
+
+        Returns:
+            Initialized LanceDBManager bound to the namespace
+        """
+        manager = self.get(namespace)
+        await self.cleanup_retired()
+        if not manager._initialized:
+            await manager.initialize()
+        return manager
+
+    @asynccontextmanager
+    async def lease(self, namespace: Optional[str]) -> AsyncIterator[LanceDBManager]:
+        """Hold an initialized manager for the duration of a request.
+
+        A leased manager is not evicted by LRU or idle timeout, so the request
+        never writes through a manager that the pool has already replaced.
+        Its idle time counts from the release.
+
+        Args:
+            namespace: Namespace name (None means the default namespace)
+
+        Yields:
+            Initialized LanceDBManager bound to the namespace
+        """
+        namespace = self._normalize(namespace)
+        manager = self.get(namespace)
+        leased = not self._is_default(namespace)
+        if leased:
+            # Counted before any await so concurrent lookups cannot evict it meanwhile
+            self._leases[namespace] = self._leases.get(namespace, 0) + 1
+        try:
+            await self.cleanup_retired()
+            if not manager._initialized:
+                await manager.initialize()
+            yield manager
+        finally:
+            if leased:
+                self._release(namespace, manager)
+
+    def _release(self, namespace: str, manager: LanceDBManager) -> None:
+        """End one lease and apply any eviction it was holding back."""
+        remaining = self._leases.get(namespace, 0) - 1
+        if remaining > 0:
+            self._leases[namespace] = remaining
+        else:
+            self._leases.pop(namespace, None)
+        if self._managers.get(namespace) is manager:
+            self._last_used[namespace] = time.monotonic()
+        self._evict_over_capacity()
+        self._schedule_cleanup()
+
+    def _is_leased(self, namespace: str) -> bool:
+        return self._leases.get(namespace, 0) > 0
+
+    def _drop(self, namespace: str, reason: str) -> Optional[LanceDBManager]:
+        """Remove a manager from the pool.
+
+        Callers still holding the manager for an in-flight request keep a
+        working instance: a cleaned-up manager reconnects lazily on its next
+        table access.
+
+        Returns:
+            The removed manager, or None if the namespace was not open
+        """
+        manager = self._managers.pop(namespace, None)
+        self._last_used.pop(namespace, None)
+        if manager is not None:
+            self.evictions += 1
+            logger.debug(f"Evicted LanceDB manager for namespace '{namespace}' ({reason})")
+        return manager
+
+    def _retire(self, namespace: str, reason: str) -> None:
+        """Drop a manager and queue it for cleanup."""
+        manager = self._drop(namespace, reason)
+        if manager is not None:
+            self._retired.append(manager)
+
+    def _schedule_cleanup(self) -> None:
+        """Clean up retired managers in a task if an event loop is running."""
+        if not self._retired or (self._cleanup_task is not None and not self._cleanup_task.done()):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No loop: left for the next acquire() or close_all()
+            return
+        self._cleanup_task = loop.create_task(self.cleanup_retired())
+
+    async def cleanup_retired(self) -> int:
+        """Clean up managers evicted by LRU or idle timeout.
+
+        Returns:
+            Number of managers cleaned up
+        """
+        retired, self._retired = self._retired, []
+        for manager in retired:
+            try:
+                await manager.cleanup()
+            except Exception as e:
+                logger.warning(f"Error cleaning up evicted LanceDB manager: {e}")
+        return len(retired)
+
+    def _evict_over_capacity(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used unleased managers until the pool fits max_open.
+
+        Args:
+            keep: Namespace that was just opened and must stay
+        """
+        excess = len(self._managers) - self.max_open
+        if excess <= 0:
+            return
+        candidates = [ns for ns in self._managers
+                      if ns != keep and not self._is_leased(ns)][:excess]
+        for namespace in candidates:
+            self._retire(namespace, "lru")
+        if len(candidates) < excess:
+            logger.debug(f"LanceDB manager pool over capacity ({len(self._managers)}/{self.max_open}) "
+                         "until leased managers are released")
+
+    def _evict_idle(self, now: float) -> None:
+        """Evict managers that have not been used within idle_timeout."""
+        if self.idle_timeout <= 0:
+            return
+        expired = [ns for ns, last_used in self._last_used.items()
+                   if now - last_used > self.idle_timeout and not self._is_leased(ns)]
+        for namespace in expired:
+            self._retire(namespace, "idle")
+
+    def evict_idle(self) -> int:
+        """Evict idle managers now; their cleanup runs in the background.
+
+        Returns:
+            Number of managers evicted
+        """
+        before = len(self._managers)
+        self._evict_idle(time.monotonic())
+        self._schedule_cleanup()
+        return before - len(self._managers)
+
+    async def evict(self, namespace: str) -> bool:
+        """Evict a namespace manager, e.g. after the namespace is deleted.
+
+        Args:
+            namespace: Namespace to evict
+
+        Returns:
+            True if a manager was evicted
+        """
+        manager = self._managers.get(namespace)
+        if manager is None:
+            return False
+        self._drop(namespace, "explicit")
+        await manager.cleanup()
+        return True
+
+    async def close_all(self) -> None:
+        """Clean up every pooled namespace manager (the default manager is left to its owner)."""
+        managers = list(self._managers.values()) + self._retired
+        self._managers.clear()
+        self._last_used.clear()
+        self._retired = []
+        for manager in managers:
+            try:
+                await manager.cleanup()
+            except Exception as e:
+                logger.warning(f"Error cleaning up pooled LanceDB manager: {e}")
+
+    def open_managers(self) -> Dict[str, LanceDBManager]:
+        """Managers currently open, keyed by namespace (default namespace first)."""
+        managers = {self.default_manager.get_namespace(): self.default_manager}
+        managers.update(self._managers)
+        return managers
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool statistics for health reporting."""
+        lookups = self.hits + self.misses
+        return {
+            'open_namespaces': list(self._managers.keys()),
+            'open_count': len(self._managers),
+            'leased_count': len(self._leases),
+            'max_open': self.max_open,
+            'idle_timeout_seconds': self.idle_timeout,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+
+__all__ = ["LanceDBManagerPool", "DEFAULT_NAMESPACE"]
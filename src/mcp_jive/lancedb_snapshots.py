@@ -0,0 +1,270 @@
+"""Lance-native snapshot backups for MCP Jive namespaces.
+
+Lance never modifies a data, deletion, index, transaction or version
+manifest file after writing it; every commit adds new files and a new
+manifest. A snapshot therefore only has to record the current version of
+each table and hard-link (or copy, across filesystems) the table's files
+into a per-namespace store. Files already in the store from an earlier
+snapshot are skipped, so each snapshot only transfers what was added since.
+A dropped and recreated table reuses file names such as
+``_versions/1.manifest`` for different contents, so every table lineage
+gets its own store directory.
+
+Restoring puts any files the live table lost (e.g. to version cleanup)
+back from the store and then restores the recorded version as a new
+commit; a live table of another lineage is replaced by the stored files. Rows come back exactly as stored, vectors and indexes included,
+so nothing is re-embedded. Because the store lives outside the table
+directories, background version cleanup never touches it.
+
+Layout under the store root::
+
+    <namespace>/files/<table>.lance/<lineage>/...   linked table files
+    <namespace>/snapshots/<id>.json       table versions and file lists
+"""
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Files Lance rewrites in place; everything else in a table directory is immutable
+MUTABLE_FILES = frozenset({'latest_version_hint.json', '_latest.manifest'})
+
+
+def _link_or_copy(source: str, target: str) -> None:
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copy2(source, target)
+
+
+def _same_file(path: str, other: str) -> bool:
+    """Whether two paths hold the same table file (hard links, or a copy made by copy2)."""
+    try:
+        if os.path.samefile(path, other):
+            return True
+        stat, other_stat = os.stat(path), os.stat(other)
+    except FileNotFoundError:
+        return False
+    return stat.st_size == other_stat.st_size and stat.st_mtime_ns == other_stat.st_mtime_ns
+
+
+def _conflicts(table_dir: str, other_dir: str, files: List[str]) -> bool:
+    """Whether any of the files exists in both directories as different files."""
+    return any(os.path.exists(os.path.join(other_dir, relative))
+               and not _same_file(os.path.join(table_dir, relative), os.path.join(other_dir, relative))
+               for relative in files)
+
+
+def _parse_local_time(value: str) -> datetime:
+    """Parse an ISO timestamp into naive local time, like snapshot created_at values."""
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _table_files(table_dir: str) -> List[str]:
+    """Relative paths of the immutable files of a Lance table directory."""
+    files = []
+    for root, _, names in os.walk(table_dir):
+        for name in names:
+            if name not in MUTABLE_FILES:
+                files.append(os.path.relpath(os.path.join(root, name), table_dir))
+    return sorted(files)
+
+
+class LanceSnapshotStore:
+    """Incremental, version-based snapshots of LanceDB namespaces."""
+
+    def __init__(self, root: str):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the linked files and snapshot records
+        """
+        self.root = root
+
+    def _namespace_dir(self, namespace: str) -> str:
+        return os.path.join(self.root, namespace)
+
+    def _snapshot_path(self, namespace: str, snapshot_id: str) -> str:
+        return os.path.join(self._namespace_dir(namespace), "snapshots", f"{snapshot_id}.json")
+
+    @staticmethod
+    def _table_dir(manager, table_name: str) -> str:
+        db_path = manager.get_database_path()
+        if "://" in db_path:
+            raise ValueError(f"Snapshots need a local database path, got {db_path}")
+        return os.path.join(db_path, f"{table_name}.lance")
+
+    @staticmethod
+    def _lineage_dir(files_root: str, table_name: str, table_dir: str, files: List[str]) -> str:
+        """Store directory for a table's files.
+
+        The newest lineage directory is reused while every file it shares
+        with the live table is the same file; otherwise the table was
+        recreated and starts a new one.
+        """
+        table_root = os.path.join(files_root, f"{table_name}.lance")
+        lineages = sorted(os.listdir(table_root)) if os.path.isdir(table_root) else []
+        if lineages and not _conflicts(table_dir, os.path.join(table_root, lineages[-1]), files):
+            return os.path.join(table_root, lineages[-1])
+        return os.path.join(table_root, f"{datetime.now():%Y%m%d%H%M%S%f}-{uuid.uuid4().hex[:8]}")
+
+    # Snapshots
+    def create_snapshot(self, manager, name: Optional[str] = None) -> Dict[str, Any]:
+        """Record the current version of every table and link its new files.
+
+        Blocking; run it in a worker thread.
+
+        Args:
+            manager: Initialized LanceDBManager of the namespace
+            name: Optional human-readable name
+
+        Returns:
+            The snapshot record, with the number of files and bytes added
+        """
+        namespace = manager.get_namespace()
+        files_root = os.path.join(self._namespace_dir(namespace), "files")
+        snapshot = {
+            "snapshot_id": str(uuid.uuid4()),
+            "name": name,
+            "namespace": namespace,
+            "created_at": datetime.now().isoformat(),
+            "tables": {},
+            "files_added": 0,
+            "bytes_added": 0
+        }
+
+        for table_name in manager.list_tables():
+            # Pin the version first: files written afterwards are extra, never missing
+            version = manager.db.open_table(table_name).version
+            table_dir = self._table_dir(manager, table_name)
+            table_files = _table_files(table_dir)
+            store_dir = self._lineage_dir(files_root, table_name, table_dir, table_files)
+            files = []
+            for relative in table_files:
+                target = os.path.join(store_dir, relative)
+                if not os.path.exists(target):
+                    source = os.path.join(table_dir, relative)
+                    try:
+                        _link_or_copy(source, target)
+                    except FileNotFoundError:
+                        # Removed by version cleanup meanwhile; not part of the pinned version
+                        continue
+                    snapshot["files_added"] += 1
+                    snapshot["bytes_added"] += os.path.getsize(target)
+                files.append(relative)
+            snapshot["tables"][table_name] = {"version": version, "files": files,
+                                              "store": os.path.relpath(store_dir, files_root)}
+
+        path = self._snapshot_path(namespace, snapshot["snapshot_id"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        logger.info(f"📸 Snapshot {snapshot['snapshot_id']} of namespace '{namespace}': "
+                    f"{len(snapshot['tables'])} tables, {snapshot['files_added']} new files")
+        return snapshot
+
+    def list_snapshots(self, namespace: str) -> List[Dict[str, Any]]:
+        """Snapshot records of a namespace, oldest first (without file lists)."""
+        directory = os.path.join(self._namespace_dir(namespace), "snapshots")
+        if not os.path.isdir(directory):
+            return []
+        snapshots = []
+        for entry in os.listdir(directory):
+            if not entry.endswith(".json"):
+                continue
+            with open(os.path.join(directory, entry), encoding="utf-8") as f:
+                record = json.load(f)
+            record["tables"] = {name: {"version": table["version"]}
+                                for name, table in record["tables"].items()}
+            snapshots.append(record)
+        return sorted(snapshots, key=lambda s: s["created_at"])
+
+    def find_snapshot(self, namespace: str, snapshot_id: Optional[str] = None,
+                      restore_point: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Look up a snapshot by id, or the latest one taken at or before a point in time.
+
+        Args:
+            namespace: Namespace of the snapshot
+            snapshot_id: Snapshot id (a UUID)
+            restore_point: ISO timestamp; used when no id is given
+
+        Returns:
+            The full snapshot record, or None if there is no match
+        """
+        if not snapshot_id:
+            point = _parse_local_time(restore_point) if restore_point else None
+            candidates = [s for s in self.list_snapshots(namespace)
+                          if point is None or datetime.fromisoformat(s["created_at"]) <= point]
+            if not candidates:
+                return None
+            snapshot_id = candidates[-1]["snapshot_id"]
+        try:
+            # Ids are UUIDs; anything else (e.g. '../x') never names a snapshot file
+            snapshot_id = str(uuid.UUID(str(snapshot_id)))
+        except ValueError:
+            return None
+        path = self._snapshot_path(namespace, snapshot_id)
+        if not os.path.exists(path):
+            return None
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def restore_snapshot(self, manager, snapshot: Dict[str, Any],
+                         tables: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Bring tables back to the versions recorded in a snapshot.
+
+        Blocking; run it in a worker thread. Each table gets a new version
+        equal to the recorded one, so the restore itself can be undone by
+        restoring a later snapshot. A table that was dropped and recreated
+        since has a history the snapshot's files cannot join, so its
+        directory is replaced by them. In-memory structures derived from the
+        tables are left to the caller to drop with manager.invalidate_tables.
+
+        Args:
+            manager: Initialized LanceDBManager of the snapshot's namespace
+            snapshot: Record from find_snapshot
+            tables: Restore only these tables (default: all in the snapshot)
+
+        Returns:
+            Per-table restored version and number of files put back
+        """
+        namespace = snapshot["namespace"]
+        store_dir = os.path.join(self._namespace_dir(namespace), "files")
+        restored = {}
+        for table_name, table in snapshot["tables"].items():
+            if tables is not None and table_name not in tables:
+                continue
+            table_dir = self._table_dir(manager, table_name)
+            table_store = os.path.join(store_dir, table["store"])
+            replaced = _conflicts(table_dir, table_store, table["files"])
+            if replaced:
+                shutil.rmtree(table_dir)
+            files_restored = 0
+            for relative in table["files"]:
+                target = os.path.join(table_dir, relative)
+                if not os.path.exists(target):
+                    _link_or_copy(os.path.join(table_store, relative), target)
+                    files_restored += 1
+
+            live = manager.db.open_table(table_name)
+            if live.version != table["version"]:
+                live.restore(table["version"])
+            restored[table_name] = {"version": table["version"], "files_restored": files_restored,
+                                    "replaced": replaced}
+
+        logger.info(f"⏪ Restored namespace '{namespace}' to snapshot {snapshot['snapshot_id']}")
+        return {"snapshot_id": snapshot["snapshot_id"], "created_at": snapshot["created_at"],
+                "tables": restored}
+
+
+__all__ = ["LanceSnapshotStore"]
@@ -5,5 +5,11 @@ projects to use the same MCP server instance with complete data separation.
 """
 
 from .namespace_manager import NamespaceManager
+from .context import get_current_namespace, set_current_namespace, namespace_scope
 
-__all__ = ["NamespaceManager"]
\ No newline at end of file
+__all__ = [
+    "NamespaceManager",
+    "get_current_namespace",
+    "set_current_namespace",
+    "namespace_scope",
+]
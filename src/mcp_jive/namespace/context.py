@@ -0,0 +1,57 @@
+"""Request-scoped namespace context for MCP-Jive.
+
+The active namespace is carried in a ``contextvars.ContextVar`` rather than in
+mutable attributes on the tool registry or storage. Each HTTP request, MCP
+call and asyncio task sees its own value, so concurrent requests for
+different namespaces can run side by side without a global switch.
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional
+
+_current_namespace: ContextVar[Optional[str]] = ContextVar("mcp_jive_namespace", default=None)
+
+
+def get_current_namespace() -> Optional[str]:
+    """Get the namespace of the current request context.
+
+    Returns:
+        Active namespace or None for the default namespace
+    """
+    return _current_namespace.get()
+
+
+def set_current_namespace(namespace: Optional[str]) -> None:
+    """Set the namespace for the rest of the current context.
+
+    Prefer ``namespace_scope`` so the previous value is restored.
+
+    Args:
+        namespace: Namespace to activate (None for the default namespace)
+    """
+    _current_namespace.set(namespace)
+
+
+@contextmanager
+def namespace_scope(namespace: Optional[str]) -> Iterator[Optional[str]]:
+    """Activate a namespace for the duration of a ``with`` block.
+
+    Args:
+        namespace: Namespace to activate (None for the default namespace)
+
+    Yields:
+        The activated namespace
+    """
+    token = _current_namespace.set(namespace)
+    try:
+        yield namespace
+    finally:
+        _current_namespace.reset(token)
+
+
+__all__ = [
+    "get_current_namespace",
+    "set_current_namespace",
+    "namespace_scope",
+]
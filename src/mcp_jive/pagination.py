@@ -0,0 +1,129 @@
+"""Keyset pagination helpers for LanceDB scans.
+
+Pages are ordered by a sort column with ``id`` as tie-breaker (nulls last in
+both directions), so the position after a page is fully described by the
+last row's sort value and id. Cursors carry that position plus the sort and
+filter they were issued for, base64-encoded so callers treat them as opaque.
+The next page is then a filtered scan (``sort > last OR (sort = last AND
+id > last_id) ...``) that scalar indexes can prune, rather than an offset
+that has to skip every earlier row.
+"""
+
+import base64
+import binascii
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, Dict, Optional
+
+
+def sql_literal(value: Any) -> str:
+    """Render a Python value as a LanceDB SQL literal."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, datetime):
+        return f"timestamp '{value.replace(tzinfo=None).isoformat(sep=' ')}'"
+    if isinstance(value, date):
+        return f"date '{value.isoformat()}'"
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def like_contains(column: str, text: str) -> str:
+    """LIKE condition matching rows whose column contains text literally.
+
+    ``%``, ``_`` and the escape character itself are escaped, so they match
+    only themselves.
+    """
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"{column} LIKE {sql_literal('%' + escaped + '%')} ESCAPE '\\'"
+
+
+def keyset_filter(sort_by: str, ascending: bool, last_value: Any, last_id: str) -> str:
+    """Filter selecting the rows that follow (last_value, last_id) in sort order.
+
+    Args:
+        sort_by: Sort column
+        ascending: Sort direction (``id`` breaks ties in the same direction)
+        last_value: Sort value of the last row already returned
+        last_id: Id of the last row already returned
+
+    Returns:
+        SQL filter expression
+    """
+    after = ">" if ascending else "<"
+    id_after = f"id {after} {sql_literal(last_id)}"
+    if sort_by == "id":
+        return id_after
+    if last_value is None:
+        # Already inside the trailing block of nulls
+        return f"({sort_by} IS NULL AND {id_after})"
+    value = sql_literal(last_value)
+    return (f"({sort_by} {after} {value} OR ({sort_by} = {value} AND {id_after}) "
+            f"OR {sort_by} IS NULL)")
+
+
+def _fingerprint(sort_by: str, ascending: bool, where: Optional[str]) -> str:
+    key = f"{sort_by}|{ascending}|{where or ''}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+def encode_cursor(sort_by: str, ascending: bool, where: Optional[str],
+                  last_row: Dict[str, Any]) -> str:
+    """Build the cursor for the page following last_row.
+
+    Args:
+        sort_by: Sort column of the listing
+        ascending: Sort direction
+        where: Filter expression of the listing
+        last_row: Last row of the current page (must hold ``id`` and sort_by)
+
+    Returns:
+        Opaque cursor token
+    """
+    value = last_row.get(sort_by)
+    if isinstance(value, datetime):
+        value = {"ts": value.isoformat()}
+    elif isinstance(value, date):
+        value = {"date": value.isoformat()}
+    payload = {"k": _fingerprint(sort_by, ascending, where), "v": value, "id": last_row["id"]}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort_by: str, ascending: bool, where: Optional[str]) -> str:
+    """Turn a cursor back into the keyset filter for the next page.
+
+    Args:
+        cursor: Token from encode_cursor
+        sort_by: Sort column of the listing
+        ascending: Sort direction
+        where: Filter expression of the listing
+
+    Returns:
+        Keyset filter expression
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for a different
+            sort order or filter
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+        last_id = payload["id"]
+        value = payload["v"]
+        fingerprint = payload["k"]
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise ValueError(f"Invalid pagination cursor: {e}") from e
+    if fingerprint != _fingerprint(sort_by, ascending, where):
+        raise ValueError("Pagination cursor does not match the requested filters or sort order")
+    if isinstance(value, dict):
+        if "ts" in value:
+            value = datetime.fromisoformat(value["ts"])
+        elif "date" in value:
+            value = date.fromisoformat(value["date"])
+    return keyset_filter(sort_by, ascending, value, last_id)
+
+
+__all__ = ["sql_literal", "like_contains", "keyset_filter", "encode_cursor", "decode_cursor"]
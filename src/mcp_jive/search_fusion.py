@@ -0,0 +1,76 @@
+"""Rank fusion for hybrid (vector + keyword) search in MCP Jive.
+
+Vector distances and full-text scores live on different scales, so hybrid
+search fuses the two result lists by rank instead of by raw score. Each
+candidate gets ``sum(weight / (k + rank))`` over the lists it appears in
+(reciprocal rank fusion); ``k`` damps the influence of the very top ranks.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+# Standard RRF constant from Cormack et al.
+DEFAULT_RRF_K = 60
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Dict[str, Sequence[Dict[str, Any]]],
+    k: int = DEFAULT_RRF_K,
+    weights: Optional[Dict[str, float]] = None,
+    id_field: str = 'id',
+    limit: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Fuse ranked result lists into one list ordered by RRF score.
+
+    Args:
+        ranked_lists: Result rows per component (e.g. 'vector', 'keyword'),
+            best match first
+        k: RRF damping constant
+        weights: Optional weight per component (default 1.0)
+        id_field: Field identifying a row across lists
+        limit: Maximum number of fused rows to return
+
+    Returns:
+        Rows ordered by descending ``_relevance_score``. Each row also carries
+        ``_<component>_rank`` (1-based, None when absent from that list); the
+        first list a row appears in provides its other fields, and
+        underscore-prefixed score fields of every list are kept.
+    """
+    weights = weights or {}
+    fused: Dict[Any, Dict[str, Any]] = {}
+    scores: Dict[Any, float] = {}
+
+    for component, rows in ranked_lists.items():
+        weight = weights.get(component, 1.0)
+        seen = set()
+        for rank, row in enumerate(rows, start=1):
+            row_id = row.get(id_field)
+            if row_id is None or row_id in seen:
+                continue
+            seen.add(row_id)
+            if row_id not in fused:
+                fused[row_id] = dict(row)
+                for name in ranked_lists:
+                    fused[row_id][f'_{name}_rank'] = None
+                scores[row_id] = 0.0
+            else:
+                # Keep this component's score fields (e.g. _score next to _distance)
+                for key, value in row.items():
+                    if key.startswith('_') and key not in fused[row_id]:
+                        fused[row_id][key] = value
+            fused[row_id][f'_{component}_rank'] = rank
+            scores[row_id] += weight / (k + rank)
+
+    # Ties keep first-seen order (the vector list comes first by convention)
+    ordered = sorted(fused, key=lambda row_id: scores[row_id], reverse=True)
+    if limit is not None:
+        ordered = ordered[:limit]
+
+    results = []
+    for row_id in ordered:
+        row = fused[row_id]
+        row['_relevance_score'] = scores[row_id]
+        results.append(row)
+    return results
+
+
+__all__ = ["reciprocal_rank_fusion", "DEFAULT_RRF_K"]
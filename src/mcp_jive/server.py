@@ -105,20 +105,25 @@ except ImportError as e:
 
 from .config import Config, ServerConfig
 from .lancedb_manager import LanceDBManager, DatabaseConfig
+from .lancedb_pool import LanceDBManagerPool
+from .lancedb_maintenance import LanceDBMaintenanceScheduler, MaintenanceConfig
 
 from .health import HealthMonitor
 from .tools.consolidated_registry import MCPConsolidatedToolRegistry, create_mcp_consolidated_registry
 from .websocket_manager import websocket_manager
+from .change_feed import change_feed
 
 logger = logging.getLogger(__name__)
 
 
-def create_tool_registry(config: ServerConfig, lancedb_manager: LanceDBManager):
+def create_tool_registry(config: ServerConfig, lancedb_manager: LanceDBManager,
+                         manager_pool: Optional[LanceDBManagerPool] = None):
     """Create the consolidated tool registry.
     
     Args:
         config: Server configuration
         lancedb_manager: LanceDB manager instance
+        manager_pool: Shared per-namespace LanceDB manager pool
         
     Returns:
         MCPConsolidatedToolRegistry instance
@@ -126,10 +131,98 @@ def create_tool_registry(config: ServerConfig, lancedb_manager: LanceDBManager):
     logger.info("Using MCPConsolidatedToolRegistry (consolidated tools)")
     return create_mcp_consolidated_registry(
         config=config,
-        lancedb_manager=lancedb_manager
+        lancedb_manager=lancedb_manager,
+        manager_pool=manager_pool
     )
 
 
+def create_manager_pool(config: Config, lancedb_manager: LanceDBManager) -> LanceDBManagerPool:
+    """Create the per-namespace LanceDB manager pool.
+    
+    Args:
+        config: Full server configuration
+        lancedb_manager: Manager for the default namespace
+        
+    Returns:
+        LanceDBManagerPool instance
+    """
+    pool = LanceDBManagerPool(
+        lancedb_manager,
+        max_open=getattr(config.database, 'lancedb_pool_max_open', 32),
+        idle_timeout=getattr(config.database, 'lancedb_pool_idle_timeout', 600.0)
+    )
+    
+    # Publish work item writes of every namespace through the batched change feed
+    change_feed.configure(
+        window_seconds=getattr(config.performance, 'change_feed_window_ms', 25.0) / 1000,
+        history_size=getattr(config.performance, 'change_feed_history', 1000)
+    )
+    pool.add_work_item_observer(change_feed.observer)
+    return pool
+
+
+def broadcast_change_batch(batch: Dict[str, Any]) -> None:
+    """Change feed listener forwarding each batch to the /ws clients.
+    
+    Args:
+        batch: Batch published by the change feed
+    """
+    websocket_manager.queue_broadcast("work_item_changes", batch)
+
+
+def parse_change_feed_position(value: Optional[str]) -> Optional[int]:
+    """Parse the sequence number a reconnecting client resumes from.
+    
+    Args:
+        value: ``since`` query parameter or ``Last-Event-ID`` header
+        
+    Returns:
+        Sequence number, or None if absent or malformed
+    """
+    try:
+        return int(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def create_maintenance_scheduler(config: Config, manager_pool: LanceDBManagerPool) -> LanceDBMaintenanceScheduler:
+    """Create the background LanceDB maintenance scheduler.
+    
+    Args:
+        config: Full server configuration
+        manager_pool: Pool whose open namespaces are maintained
+        
+    Returns:
+        LanceDBMaintenanceScheduler instance (not started)
+    """
+    return LanceDBMaintenanceScheduler(
+        manager_pool,
+        MaintenanceConfig(
+            enabled=getattr(config.database, 'lancedb_maintenance_enabled', True),
+            interval_seconds=getattr(config.database, 'lancedb_maintenance_interval', 300.0),
+            io_budget_bytes=getattr(config.database, 'lancedb_maintenance_io_budget_bytes', 256 * 1024 * 1024)
+        )
+    )
+
+
+async def warm_up_database(lancedb_manager: LanceDBManager) -> None:
+    """Connect to LanceDB and load the embedding model in the background.
+    
+    Importing LanceDB and loading sentence-transformers/torch take seconds;
+    both run in worker threads while the MCP handshake and tools/list are
+    answered. Requests that need the database earlier connect on demand.
+    
+    Args:
+        lancedb_manager: Manager to warm up
+    """
+    try:
+        await lancedb_manager.initialize()
+    except Exception as e:
+        logger.error(f"Failed to connect to LanceDB during warm-up: {e}")
+        return
+    await lancedb_manager.warm_up_embedding_model()
+
+
 class MCPServer:
     """Main MCP Jive Server implementation."""
     
@@ -153,7 +246,10 @@ class MCPServer:
             
         self.server = Server("mcp-jive-server")
         self.lancedb_manager = lancedb_manager
+        self.manager_pool: Optional[LanceDBManagerPool] = None
+        self.maintenance_scheduler: Optional[LanceDBMaintenanceScheduler] = None
         self.health_monitor: Optional[HealthMonitor] = None
+        self._warm_up_task: Optional[asyncio.Task] = None
         
         # Tool registry
         self.tool_registry: Optional[MCPConsolidatedToolRegistry] = None
@@ -190,6 +286,9 @@ class MCPServer:
                 overall_status = "degraded"
             
             uptime_seconds = (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+            pool_stats = self.manager_pool.get_stats() if self.manager_pool else {"status": "not_initialized"}
+            maintenance_stats = (self.maintenance_scheduler.get_stats() if self.maintenance_scheduler
+                                 else {"status": "not_initialized"})
             
             return {
                 "status": overall_status,
@@ -199,6 +298,9 @@ class MCPServer:
                 "components": {
                     "database": database_health,
                     "tools": tools_health,
+                    "namespace_pool": pool_stats,
+                    "maintenance": maintenance_stats,
+                    "change_feed": change_feed.get_stats(),
                 },
                 "config": {
                     "host": self.config.server.host,
@@ -244,10 +346,20 @@ class MCPServer:
                     data_path=getattr(self.config.database, 'lancedb_data_path', './data/lancedb_jive'),
                     namespace=getattr(self.config.database, 'lancedb_namespace', None),
                     embedding_model=getattr(self.config.database, 'lancedb_embedding_model', 'all-MiniLM-L6-v2'),
-                    device=getattr(self.config.database, 'lancedb_device', 'cpu')
+                    device=getattr(self.config.database, 'lancedb_device', 'cpu'),
+                    embedding_cache_max_bytes=getattr(self.config.database, 'lancedb_embedding_cache_max_bytes', 16 * 1024 * 1024),
+                    embedding_cache_disk=getattr(self.config.database, 'lancedb_embedding_cache_disk', False),
+                    embedding_cache_disk_max_bytes=getattr(self.config.database, 'lancedb_embedding_cache_disk_max_bytes', 256 * 1024 * 1024)
                 )
                 self.lancedb_manager = LanceDBManager(db_config)
-                await self.lancedb_manager.initialize()
+            
+            # Connect and load the embedding model without delaying the handshake
+            if self._warm_up_task is None:
+                self._warm_up_task = asyncio.create_task(warm_up_database(self.lancedb_manager))
+            
+            # Per-namespace manager pool (shared with the combined server if provided)
+            if not self.manager_pool:
+                self.manager_pool = create_manager_pool(self.config, self.lancedb_manager)
             
             # Initialize health monitor
             self.health_monitor = HealthMonitor(self.config, self.lancedb_manager)
@@ -256,7 +368,8 @@ class MCPServer:
             logger.info("Initializing tool registry")
             self.tool_registry = create_tool_registry(
                 config=self.config,
-                lancedb_manager=self.lancedb_manager
+                lancedb_manager=self.lancedb_manager,
+                manager_pool=self.manager_pool
             )
             await self.tool_registry.initialize()
             
@@ -276,54 +389,9 @@ class MCPServer:
         # List tools handler
         @server.list_tools()
         async def list_tools() -> list[Tool]:
-            """List available tools."""
+            """List available tools (compiled once by the registry)."""
             try:
-                # Get tool schemas from the registry
-                tool_schemas = {}
-                if hasattr(self.tool_registry, 'get_tool_schemas'):
-                    tool_schemas = self.tool_registry.get_tool_schemas()
-                else:
-                    # Fallback for legacy registry
-                    tool_names = await self.tool_registry.list_tools()
-                    tool_schemas = {name: {} for name in tool_names}
-                
-                # Convert internal schemas to MCP Tool objects
-                mcp_tools = []
-                for tool_name, schema in tool_schemas.items():
-                    try:
-                        # Ensure we have proper schema structure
-                        tool_schema = {
-                            "name": schema.get("name", tool_name),
-                            "description": schema.get("description", f"Tool: {tool_name}"),
-                            "inputSchema": schema.get("inputSchema", {"type": "object", "properties": {}})
-                        }
-                        
-                        # Create MCP Tool object
-                        mcp_tool = Tool(
-                            name=tool_schema["name"],
-                            description=tool_schema["description"],
-                            inputSchema=tool_schema["inputSchema"]
-                        )
-                        mcp_tools.append(mcp_tool)
-                        
-                    except Exception as e:
-                        logger.error(f"Error creating MCP tool for {tool_name}: {e}")
-                        # Create minimal tool as fallback
-                        mcp_tool = Tool(
-                            name=tool_name,
-                            description=f"Tool: {tool_name}",
-                            inputSchema={"type": "object", "properties": {}}
-                        )
-                        mcp_tools.append(mcp_tool)
-                
-                # Debug logging
-                logger.debug(f"Converted {len(mcp_tools)} tools to MCP format")
-                for i, tool in enumerate(mcp_tools):
-                    logger.debug(f"MCP Tool {i}: name={tool.name}, type={type(tool)}")
-                
-                # Return list of tools (MCP library will wrap in ListToolsResult)
-                return mcp_tools
-                
+                return await self.tool_registry.list_tools()
             except Exception as e:
                 logger.error(f"Error listing tools: {e}")
                 # Return empty tools list on error
@@ -354,6 +422,10 @@ class MCPServer:
     async def call_tool_with_namespace(self, name: str, arguments: Dict[str, Any], namespace: Optional[str] = None) -> Any:
         """Call a tool with namespace context.
         
+        The namespace is scoped to this call via a context variable, so
+        concurrent calls in different namespaces do not interfere and nothing
+        has to be cleared afterwards.
+        
         Args:
             name: Tool name to execute
             arguments: Tool arguments
@@ -363,75 +435,33 @@ class MCPServer:
             Tool execution result
         """
         try:
-            logger.info(f"🔧 NAMESPACE DEBUG: Starting tool '{name}' call with namespace '{namespace}'")
-
-            # If namespace is provided, resolve it and ensure it exists
-            if namespace:
-                resolved_namespace = self.namespace_manager.resolve_namespace(namespace)
-                logger.info(f"🔧 NAMESPACE DEBUG: Resolved namespace '{namespace}' to '{resolved_namespace}'")
-
-                # Ensure namespace exists (auto-create if enabled)
-                if not self.namespace_manager.ensure_namespace_exists(resolved_namespace):
-                    raise ValueError(f"Namespace '{resolved_namespace}' does not exist and auto-creation is disabled")
-
-                # Update the tool registry context
-                if hasattr(self.tool_registry, 'set_namespace_context'):
-                    logger.info(f"🔧 NAMESPACE DEBUG: Setting tool registry namespace context to '{resolved_namespace}'")
-                    await self.tool_registry.set_namespace_context(resolved_namespace)
-
-                    # Verify the context was set
-                    if hasattr(self.tool_registry, 'get_current_namespace'):
-                        current_ns = self.tool_registry.get_current_namespace()
-                        logger.info(f"🔧 NAMESPACE DEBUG: Tool registry current namespace is now: '{current_ns}'")
-                else:
-                    logger.warning(f"🔧 NAMESPACE DEBUG: Tool registry does not support set_namespace_context")
-            else:
-                logger.info(f"🔧 NAMESPACE DEBUG: No namespace provided, using default")
-
-            # Call the tool
-            logger.info(f"🔧 NAMESPACE DEBUG: Executing tool '{name}' with arguments: {arguments}")
-            result = await self.tool_registry.call_tool(name, arguments)
-            logger.info(f"🔧 NAMESPACE DEBUG: Tool '{name}' execution completed successfully")
-
-            # **CONDITIONAL**: Only clear namespace context if this is NOT a managed request
-            # For `/tools/execute` endpoint, namespace context is managed at request level
-            # For MCP endpoints, preserve the original behavior for now
-            caller_context = logger.name if hasattr(logger, 'name') else 'unknown'
-
-            if namespace and hasattr(self.tool_registry, 'clear_namespace_context'):
-                # Check if this is a managed request by looking at the call stack
-                import inspect
-                frame = inspect.currentframe()
-                try:
-                    # Look for execute_tool in the call stack (indicates /tools/execute endpoint)
-                    is_managed_request = False
-                    while frame:
-                        if frame.f_code.co_name == 'execute_tool':
-                            is_managed_request = True
-                            break
-                        frame = frame.f_back
-                finally:
-                    del frame
-
-                if not is_managed_request:
-                    # Original behavior for MCP endpoints
-                    logger.info(f"🔧 NAMESPACE DEBUG: Clearing namespace context for unmanaged request")
-                    await self.tool_registry.clear_namespace_context()
-                else:
-                    logger.info(f"🔧 NAMESPACE DEBUG: ✅ PRESERVING namespace context for managed request")
-
-            return result
+            resolved_namespace = self._resolve_request_namespace(namespace)
+            logger.debug(f"Calling tool '{name}' in namespace '{resolved_namespace or 'default'}'")
+            return await self.tool_registry.call_tool(name, arguments, namespace=resolved_namespace)
             
         except Exception as e:
             logger.error(f"Error calling tool '{name}' with namespace '{namespace}': {e}")
-            # Reset namespace context on error
-            if namespace and hasattr(self.tool_registry, 'clear_namespace_context'):
-                try:
-                    await self.tool_registry.clear_namespace_context()
-                except:
-                    pass
             raise
 
+    def _resolve_request_namespace(self, namespace: Optional[str]) -> Optional[str]:
+        """Resolve a request namespace and make sure it exists.
+        
+        Args:
+            namespace: Namespace requested by the client (None for default)
+            
+        Returns:
+            Resolved namespace or None for the default namespace
+            
+        Raises:
+            ValueError: If the namespace does not exist and auto-creation is disabled
+        """
+        if not namespace:
+            return None
+        resolved_namespace = self.namespace_manager.resolve_namespace(namespace)
+        if not self.namespace_manager.ensure_namespace_exists(resolved_namespace):
+            raise ValueError(f"Namespace '{resolved_namespace}' does not exist and auto-creation is disabled")
+        return resolved_namespace
+
     async def _register_prompt_handlers_for_server(self, server: Server) -> None:
         """Register MCP prompt handlers for a specific server instance."""
         if not server:
@@ -452,9 +482,14 @@ class MCPServer:
         logger.info("Stopping MCP Jive Server...")
         self.is_running = False
         
+        if self._warm_up_task and not self._warm_up_task.done():
+            self._warm_up_task.cancel()
+        
         try:
             if self.tool_registry:
                 await self.tool_registry.cleanup()
+            if self.manager_pool:
+                await self.manager_pool.close_all()
             if self.lancedb_manager:
                 await self.lancedb_manager.cleanup()
         except Exception as e:
@@ -522,16 +557,9 @@ class MCPServer:
                         elif server_task in done and not server_task.cancelled():
                             try:
                                 await server_task
-                                # MCP handshake completed successfully, pre-warm embedding model
-                                logger.info("MCP handshake completed, pre-warming embedding model...")
-                                if hasattr(self, 'lancedb_manager') and self.lancedb_manager:
-                                    asyncio.create_task(self.lancedb_manager.warm_up_embedding_model())
                             except asyncio.TimeoutError:
                                 logger.warning("MCP stdio handshake timed out after 30 seconds, but server components are ready")
                                 logger.info("Server will continue running without stdio transport completion")
-                                # Pre-warm embedding model even after timeout
-                                if hasattr(self, 'lancedb_manager') and self.lancedb_manager:
-                                    asyncio.create_task(self.lancedb_manager.warm_up_embedding_model())
                                 # Don't raise the timeout error, just log it and continue
                             except Exception as e:
                                 logger.error(f"Server task error: {e}")
@@ -587,7 +615,7 @@ class MCPServer:
             # Import required modules for HTTP transport
             try:
                 from fastapi import FastAPI, HTTPException, WebSocket, Request
-                from fastapi.responses import JSONResponse
+                from fastapi.responses import JSONResponse, Response
                 import uvicorn
                 from pydantic import BaseModel
                 from typing import Dict, Any, Optional
@@ -602,6 +630,9 @@ class MCPServer:
             # Create FastAPI app
             app = FastAPI(title="MCP Jive Server", version="1.0.0")
             
+            # Work item changes reach /ws clients as batches from the change feed
+            change_feed.add_listener(broadcast_change_batch)
+            
             # Add CORS middleware
             try:
                 from fastapi.middleware.cors import CORSMiddleware
@@ -634,25 +665,14 @@ class MCPServer:
             
             # List available tools
             @app.get("/tools")
-            async def list_tools():
+            async def list_tools(request: Request):
                 if self.tool_registry:
-                    tools = await self.tool_registry.list_tools()
-                    tool_schemas = []
-                    for tool in tools:
-                        # tool is a Tool object, extract the name
-                        tool_name = tool.name if hasattr(tool, 'name') else str(tool)
-                        tool_instance = self.tool_registry.tools.get(tool_name)
-                        if tool_instance and hasattr(tool_instance, 'get_schema'):
-                            schema = tool_instance.get_schema()
-                            tool_schemas.append(schema)
-                        else:
-                            # Fallback: use the Tool object's schema directly
-                            tool_schemas.append({
-                                "name": tool_name,
-                                "description": tool.description if hasattr(tool, 'description') else "",
-                                "inputSchema": tool.inputSchema if hasattr(tool, 'inputSchema') else {}
-                            })
-                    return {"tools": tool_schemas}
+                    # Pre-serialized listing; unchanged definitions revalidate by ETag
+                    catalog = await self.tool_registry.get_tool_catalog()
+                    headers = {"ETag": catalog.etag, "Cache-Control": "no-cache"}
+                    if request.headers.get("if-none-match") == catalog.etag:
+                        return Response(status_code=304, headers=headers)
+                    return Response(content=catalog.payload, media_type="application/json", headers=headers)
                 return {"tools": []}
             
             # Namespace management endpoints
@@ -703,6 +723,8 @@ class MCPServer:
                         cleanup_sessions_callback=self.cleanup_namespace_sessions
                     )
                     if success:
+                        if self.manager_pool:
+                            await self.manager_pool.evict(namespace_name)
                         return {"success": True, "message": f"Namespace '{namespace_name}' deleted"}
                     else:
                         raise HTTPException(status_code=400, detail="Failed to delete namespace")
@@ -724,28 +746,17 @@ class MCPServer:
                     namespace = http_request.headers.get("X-Namespace")
                     logger.info(f"🌐 HTTP REQUEST: Processing tool '{request.tool_name}' with namespace '{namespace}'")
 
-                    # Call the tool with proper namespace lifecycle management
-                    if namespace:
-                        # Set namespace context at REQUEST level (not tool level)
-                        resolved_namespace = self.namespace_manager.resolve_namespace(namespace)
-                        if not self.namespace_manager.ensure_namespace_exists(resolved_namespace):
-                            raise HTTPException(status_code=400, detail=f"Namespace '{resolved_namespace}' does not exist and auto-creation is disabled")
-
-                        logger.info(f"🌐 HTTP REQUEST: Setting namespace context to '{resolved_namespace}' for entire request")
-                        if hasattr(self.tool_registry, 'set_namespace_context'):
-                            await self.tool_registry.set_namespace_context(resolved_namespace)
-
-                        # Execute tool WITHOUT additional namespace management (context already set)
-                        result = await self.tool_registry.handle_tool_call(
-                            request.tool_name,
-                            request.parameters
-                        )
-                    else:
-                        # Fallback to default behavior for backward compatibility
-                        result = await self.tool_registry.handle_tool_call(
-                            request.tool_name,
-                            request.parameters
-                        )
+                    # Run the tool in a request-scoped namespace (no global switch to undo)
+                    try:
+                        resolved_namespace = self._resolve_request_namespace(namespace)
+                    except ValueError as e:
+                        raise HTTPException(status_code=400, detail=str(e))
+                    
+                    result = await self.tool_registry.handle_tool_call(
+                        request.tool_name,
+                        request.parameters,
+                        namespace=resolved_namespace
+                    )
                     
                     # Ensure result is in the correct format for ToolCallResponse
                     if isinstance(result, list) and len(result) > 0:
@@ -785,49 +796,51 @@ class MCPServer:
                 except Exception as e:
                     logger.error(f"🌐 HTTP REQUEST: Error executing tool {request.tool_name} in namespace '{namespace}': {e}")
                     return ToolCallResponse(success=False, error=str(e))
-
-                finally:
-                    # **CRITICAL**: Clear namespace context at END of request (not after each tool call)
-                    # This ensures proper isolation between different HTTP requests
-                    if namespace and hasattr(self.tool_registry, 'clear_namespace_context'):
-                        try:
-                            logger.info(f"🌐 HTTP REQUEST: Cleaning up namespace context '{namespace}' at end of request")
-                            await self.tool_registry.clear_namespace_context()
-                            logger.info(f"🌐 HTTP REQUEST: ✅ Namespace context cleared successfully")
-                        except Exception as cleanup_error:
-                            logger.error(f"🌐 HTTP REQUEST: Failed to clear namespace context: {cleanup_error}")
-                    else:
-                        logger.info(f"🌐 HTTP REQUEST: No namespace context to clean up")
             
             # WebSocket endpoint for real-time communication
             @app.websocket("/ws")
             async def websocket_endpoint(websocket: WebSocket):
-                """WebSocket endpoint for real-time communication with frontend."""
+                """WebSocket endpoint for real-time communication with frontend.
+                
+                Work item changes arrive as ``work_item_changes`` batches
+                numbered by ``seq``. A client reconnecting with ``?since=<seq>``
+                (or sending ``{"type": "resume", "since": <seq>}``) first
+                receives the batches it missed, or ``resync`` if they are gone.
+                """
+                async def replay(since: Optional[int]) -> None:
+                    # No await happens between registering the connection and
+                    # queueing the replay, so it precedes every live batch
+                    if since is None:
+                        return
+                    missed = change_feed.since(since)
+                    if missed is None:
+                        await websocket_manager.send_to_connection(websocket, "resync", {"seq": change_feed.seq})
+                        return
+                    for batch in missed:
+                        await websocket_manager.send_to_connection(websocket, "work_item_changes", batch)
+                
                 try:
                     await websocket.accept()
                     await websocket_manager.connect(websocket, {
                         "connected_at": datetime.now().isoformat(),
                         "user_agent": websocket.headers.get("user-agent", "unknown")
                     })
+                    await replay(parse_change_feed_position(websocket.query_params.get("since")))
                     
-                    # Keep connection alive and handle incoming messages
+                    # Outbound events are sent by the connection manager; the
+                    # receive loop only notices resume requests and disconnects
                     while True:
                         try:
-                            # Wait for messages from client
                             data = await websocket.receive_text()
-                            logger.debug(f"Received WebSocket message: {data}")
-                            
-                            # Echo back or handle specific message types if needed
-                            # For now, just acknowledge receipt
-                            await websocket.send_text(json.dumps({
-                                "type": "ack",
-                                "message": "Message received",
-                                "timestamp": datetime.now().isoformat()
-                            }))
-                            
                         except Exception as e:
-                            logger.debug(f"WebSocket message handling error: {e}")
+                            logger.debug(f"WebSocket receive ended: {e}")
                             break
+                        try:
+                            message = json.loads(data)
+                        except ValueError:
+                            continue
+                        if isinstance(message, dict) and message.get("type") == "resume":
+                            await replay(parse_change_feed_position(str(message.get("since", ""))))
                             
                 except Exception as e:
                     logger.error(f"WebSocket connection error: {e}")
@@ -945,16 +958,9 @@ class MCPServer:
                                         await websocket.send_text(json.dumps(error_response))
                                         continue
                                     
-                                    # Get available tools
-                                    tools_list = await self.list_tools()
-                                    response = {
-                                        "jsonrpc": "2.0",
-                                        "id": request_id,
-                                        "result": {
-                                            "tools": tools_list
-                                        }
-                                    }
-                                    await websocket.send_text(json.dumps(response))
+                                    # Send the pre-serialized tool listing
+                                    catalog = await self.tool_registry.get_tool_catalog()
+                                    await websocket.send_text(catalog.jsonrpc_response(request_id).decode("utf-8"))
                                     
                                 elif method == "tools/call":
                                     # Validate session
@@ -1197,32 +1203,14 @@ class MCPServer:
                     if method == "tools/list":
                         logger.info(f"Processing tools/list request (sessionless: {sessionless_mode})")
                         if self.tool_registry:
-                            tools = await self.tool_registry.list_tools()
-                            logger.info(f"Found {len(tools)} tools from registry")
-                            # tools is already a list of Tool objects, convert them to schemas
-                            tool_schemas = []
-                            for tool in tools:
-                                if hasattr(tool, 'model_dump'):
-                                    # Tool is a Pydantic model, serialize it
-                                    schema = tool.model_dump(by_alias=True, mode="json", exclude_none=True)
-                                    tool_schemas.append(schema)
-                                elif isinstance(tool, dict):
-                                    # Tool is already a dict
-                                    tool_schemas.append(tool)
-                                else:
-                                    # Fallback: convert to dict manually
-                                    schema = {
-                                        "name": getattr(tool, 'name', 'unknown'),
-                                        "description": getattr(tool, 'description', ''),
-                                        "inputSchema": getattr(tool, 'inputSchema', {})
-                                    }
-                                    tool_schemas.append(schema)
-                            response_data = {
-                                "jsonrpc": "2.0",
-                                "id": request_id,
-                                "result": {"tools": tool_schemas}
-                            }
-                            logger.info(f"Created response with {len(tool_schemas)} tool schemas")
+                            # The listing is serialized once per configuration; splice it in as is
+                            catalog = await self.tool_registry.get_tool_catalog()
+                            response = Response(content=catalog.jsonrpc_response(request_id),
+                                                media_type="application/json",
+                                                headers={"ETag": catalog.etag})
+                            if not sessionless_mode:
+                                response.headers["Mcp-Session-Id"] = session_id
+                            return response
                         else:
                             logger.warning("Tool registry not available")
                             response_data = {
@@ -1310,32 +1298,20 @@ class MCPServer:
                                 # Client is flexible, can use any namespace
                                 logger.debug(f"Using requested namespace '{request_namespace}' for flexible client {session_id}")
 
-                        # Execute tool with proper per-REQUEST namespace lifecycle management
-                        # (Same fix as applied to /tools/execute endpoint)
-                        namespace_context_set = False
+                        # Execute tool in a request-scoped namespace
                         try:
                             logger.info(f"🛠️ MCP TOOL EXECUTION: '{tool_name}' with final namespace '{final_namespace}'")
-
-                            # Set namespace context at REQUEST level (not tool level)
-                            if final_namespace:
-                                resolved_namespace = self.namespace_manager.resolve_namespace(final_namespace)
-                                if hasattr(self.tool_registry, 'set_namespace_context'):
-                                    await self.tool_registry.set_namespace_context(resolved_namespace)
-                                    namespace_context_set = True
-                                    logger.info(f"🔧 MCP NAMESPACE: Set context to '{resolved_namespace}'")
-
-                            # Execute tool WITHOUT additional namespace management
-                            result = await self.tool_registry.handle_tool_call(tool_name, tool_arguments)
+                            resolved_namespace = (
+                                self.namespace_manager.resolve_namespace(final_namespace) if final_namespace else None
+                            )
+                            result = await self.tool_registry.handle_tool_call(
+                                tool_name, tool_arguments, namespace=resolved_namespace
+                            )
                             logger.info(f"✅ MCP TOOL SUCCESS: '{tool_name}' completed")
 
                         except Exception as tool_error:
                             logger.error(f"❌ MCP TOOL ERROR: '{tool_name}' failed: {tool_error}")
                             result = {"success": False, "error": str(tool_error)}
-                        finally:
-                            # Clear namespace context at END of request (not after each tool call)
-                            if namespace_context_set and hasattr(self.tool_registry, 'clear_namespace_context'):
-                                await self.tool_registry.clear_namespace_context()
-                                logger.info(f"🧹 MCP NAMESPACE: Cleared context after request")
                         
                         # Handle TextContent result properly
                         if isinstance(result, list) and len(result) > 0 and hasattr(result[0], 'text'):
@@ -1360,7 +1336,6 @@ class MCPServer:
                         # Handle MCP initialized notification (no response required for notifications)
                         logger.info(f"MCP client initialized notification received (sessionless: {sessionless_mode})")
                         # Notifications don't require a response, return 204 No Content
-                        from fastapi import Response
                         return Response(status_code=204)
                     
                     else:
@@ -1395,14 +1370,25 @@ class MCPServer:
             
             # SSE endpoint for MCP streaming transport
             @app.get("/mcp")
-            async def mcp_sse_endpoint():
-                """SSE endpoint for MCP streaming transport."""
+            async def mcp_sse_endpoint(request: Request):
+                """SSE endpoint for MCP streaming transport.
+                
+                Streams work item change batches as
+                ``notifications/work_items/changed`` with the batch ``seq`` as
+                the SSE event id, so a reconnecting client resumes through
+                ``Last-Event-ID`` (or ``?since=``).
+                """
                 try:
                     from fastapi.responses import StreamingResponse
                     import asyncio
                     
+                    since = parse_change_feed_position(
+                        request.headers.get("last-event-id") or request.query_params.get("since")
+                    )
+                    
                     async def event_stream():
                         """Generate SSE events for MCP communication."""
+                        subscription = change_feed.subscribe(since)
                         try:
                             # Send initial connection notification (JSON-RPC 2.0)
                             connection_notification = {
@@ -1419,17 +1405,28 @@ class MCPServer:
                             }
                             yield f"data: {json.dumps(connection_notification)}\n\n"
                             
-                            # Keep connection alive with periodic heartbeat (JSON-RPC 2.0)
                             while True:
-                                await asyncio.sleep(30)  # Send heartbeat every 30 seconds
-                                heartbeat_notification = {
-                                    "jsonrpc": "2.0",
-                                    "method": "notifications/heartbeat",
-                                    "params": {
-                                        "timestamp": datetime.now().isoformat()
+                                batch = await subscription.get(timeout=30)
+                                if batch is None:
+                                    # Idle: keep proxies from closing the stream
+                                    yield ": keep-alive\n\n"
+                                    continue
+                                if batch.get("resync"):
+                                    notification = {
+                                        "jsonrpc": "2.0",
+                                        "method": "notifications/work_items/resync",
+                                        "params": {"seq": batch["seq"]}
                                     }
+                                    yield f"id: {batch['seq']}\ndata: {json.dumps(notification)}\n\n"
+                                    continue
+                                notification = {
+                                    "jsonrpc": "2.0",
+                                    "method": "notifications/work_items/changed",
+                                    "params": batch
                                 }
-                                yield f"data: {json.dumps(heartbeat_notification)}\n\n"
+                                yield f"id: {batch['seq']}\ndata: {json.dumps(notification)}\n\n"
+                        except asyncio.CancelledError:
+                            raise
                         except Exception as e:
                             logger.error(f"SSE stream error: {e}")
                             error_notification = {
@@ -1442,6 +1439,8 @@ class MCPServer:
                                 }
                             }
                             yield f"data: {json.dumps(error_notification)}\n\n"
+                        finally:
+                            subscription.close()
                     
                     return StreamingResponse(
                         event_stream(),
@@ -1592,17 +1591,9 @@ class MCPServer:
                             ),
                             timeout=30.0  # 30 second timeout for stdio handshake
                         )
-                        
-                        # MCP handshake completed successfully, pre-warm embedding model
-                        logger.info("MCP handshake completed in combined mode, pre-warming embedding model...")
-                        if hasattr(self, 'database') and self.database:
-                            asyncio.create_task(self.database.warm_up_embedding_model())
                     except asyncio.TimeoutError:
                         logger.warning("MCP stdio handshake timed out after 30 seconds in combined mode, but server components are ready")
                         logger.info("Server will continue running without stdio transport completion")
-                        # Pre-warm embedding model even after timeout
-                        if hasattr(self, 'database') and self.database:
-                            asyncio.create_task(self.database.warm_up_embedding_model())
                         # Don't raise the timeout error, just log it and continue
                     except Exception as e:
                         logger.error(f"stdio server task error in combined mode: {e}")
@@ -1773,6 +1764,8 @@ class MCPJiveServer:
         """
         self.config = config or Config()
         self.database: Optional[LanceDBManager] = None
+        self.manager_pool: Optional[LanceDBManagerPool] = None
+        self.maintenance_scheduler: Optional[LanceDBMaintenanceScheduler] = None
         self.tool_registry = None
         self.mcp_server = None
         self.stats = ServerStats(start_time=datetime.now())
@@ -1837,19 +1830,28 @@ class MCPJiveServer:
                 data_path=getattr(self.config.database, 'lancedb_data_path', './data/lancedb_jive'),
                 namespace=getattr(self.config.database, 'lancedb_namespace', None),
                 embedding_model=getattr(self.config.database, 'lancedb_embedding_model', 'all-MiniLM-L6-v2'),
-                device=getattr(self.config.database, 'lancedb_device', 'cpu')
+                device=getattr(self.config.database, 'lancedb_device', 'cpu'),
+                embedding_cache_max_bytes=getattr(self.config.database, 'lancedb_embedding_cache_max_bytes', 16 * 1024 * 1024),
+                embedding_cache_disk=getattr(self.config.database, 'lancedb_embedding_cache_disk', False),
+                embedding_cache_disk_max_bytes=getattr(self.config.database, 'lancedb_embedding_cache_disk_max_bytes', 256 * 1024 * 1024)
             )
             
+            # Connected in the background by MCPServer.start (see warm_up_database)
             self.database = LanceDBManager(db_config)
-            await self.database.initialize()
+            self.manager_pool = create_manager_pool(self.config, self.database)
             
             # Initialize tool registry
             self.tool_registry = create_tool_registry(
                 config=self.config,
-                lancedb_manager=self.database
+                lancedb_manager=self.database,
+                manager_pool=self.manager_pool
             )
             await self.tool_registry.initialize()
             
+            # Background compaction and index refresh for all open namespaces
+            self.maintenance_scheduler = create_maintenance_scheduler(self.config, self.manager_pool)
+            self.maintenance_scheduler.start()
+            
             logger.info("MCP Jive server initialized successfully")
             
         except Exception as e:
@@ -1883,9 +1885,15 @@ class MCPJiveServer:
             self._shutdown_event.set()
             
             # Shutdown components in reverse order
+            if self.maintenance_scheduler:
+                await self.maintenance_scheduler.stop()
+            
             if self.tool_registry:
                 await self.tool_registry.shutdown()
             
+            if self.manager_pool:
+                await self.manager_pool.close_all()
+            
             if self.database:
                 await self.database.shutdown()
             
@@ -1923,6 +1931,9 @@ class MCPJiveServer:
             # Get component health
             database_health = self.database.get_health_status() if self.database else {"status": "not_initialized"}
             tools_health = self.tool_registry.get_health_status() if self.tool_registry else {"status": "not_initialized"}
+            pool_stats = self.manager_pool.get_stats() if self.manager_pool else {"status": "not_initialized"}
+            maintenance_stats = (self.maintenance_scheduler.get_stats() if self.maintenance_scheduler
+                                 else {"status": "not_initialized"})
             
             # Overall health determination
             overall_status = "healthy"
@@ -1939,6 +1950,9 @@ class MCPJiveServer:
                 "components": {
                     "database": database_health,
                     "tools": tools_health,
+                    "namespace_pool": pool_stats,
+                    "maintenance": maintenance_stats,
+                    "change_feed": change_feed.get_stats(),
                 },
                 "stats": self.get_stats(),
                 "config": {
@@ -1985,8 +1999,10 @@ class MCPJiveServer:
                 lancedb_manager=self.database
             )
             
-            # Set the tool registry on the MCP server
+            # Share the tool registry and namespace pool with the MCP server
             mcp_server.tool_registry = self.tool_registry
+            mcp_server.manager_pool = self.manager_pool
+            mcp_server.maintenance_scheduler = self.maintenance_scheduler
             
             # Run the HTTP server
             await mcp_server.run_http()
@@ -0,0 +1,143 @@
+"""DAG scheduler for dependency-based work item execution.
+
+Tasks are released through an in-degree table: a task enters the ready queue
+the moment its last dependency finishes, and a pool of ``max_parallel``
+slots is refilled as soon as any running task completes. One slow task
+therefore only delays its own dependents instead of stalling a whole wave.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+RunFunc = Callable[[str], Awaitable[Any]]
+DoneCallback = Callable[[str, Optional[BaseException]], None]
+
+
+@dataclass
+class DagRunResult:
+    """Outcome of a DAG run."""
+    completed: List[str] = field(default_factory=list)
+    failed: Dict[str, BaseException] = field(default_factory=dict)
+    # Tasks stopped while running by cancellation or fail_fast
+    interrupted: List[str] = field(default_factory=list)
+    # Tasks never started: unreachable because of cycles, or left over after cancellation
+    not_started: List[str] = field(default_factory=list)
+    cancelled: bool = False
+    makespan: float = 0.0
+
+
+class DagScheduler:
+    """Runs tasks in dependency order on a bounded pool of slots."""
+
+    def __init__(self, max_parallel: int = 3):
+        """Initialize the scheduler.
+
+        Args:
+            max_parallel: Maximum number of tasks running at once
+        """
+        self.max_parallel = max(1, int(max_parallel or 1))
+
+    @staticmethod
+    def _in_degrees(dependencies: Dict[str, Iterable[str]]) -> Tuple[Dict[str, int], Dict[str, List[str]]]:
+        """Build the in-degree table and dependents adjacency.
+
+        Dependencies on ids outside the graph are ignored.
+        """
+        in_degree: Dict[str, int] = {}
+        dependents: Dict[str, List[str]] = {node: [] for node in dependencies}
+        for node, deps in dependencies.items():
+            unique = {dep for dep in (deps or ()) if dep in dependencies and dep != node}
+            in_degree[node] = len(unique)
+            for dep in unique:
+                dependents[dep].append(node)
+        return in_degree, dependents
+
+    async def run(self,
+                  dependencies: Dict[str, Iterable[str]],
+                  run: RunFunc,
+                  fail_fast: bool = False,
+                  cancel_event: Optional[asyncio.Event] = None,
+                  on_done: Optional[DoneCallback] = None) -> DagRunResult:
+        """Run every task after its dependencies.
+
+        Without fail_fast a failed task still releases its dependents, so one
+        failure does not block the rest of the graph.
+
+        Args:
+            dependencies: Task id → ids it depends on (insertion order breaks ties)
+            run: Coroutine function executing one task
+            fail_fast: Cancel running tasks and raise on the first failure
+            cancel_event: Setting it cancels running tasks and stops scheduling
+            on_done: Called with (task id, error or None) as each task finishes
+
+        Returns:
+            DagRunResult with completed, failed and not-started task ids
+
+        Raises:
+            Exception: The first task failure when fail_fast is set
+        """
+        started_at = time.perf_counter()
+        result = DagRunResult()
+        in_degree, dependents = self._in_degrees(dependencies)
+        ready: Deque[str] = deque(node for node, degree in in_degree.items() if degree == 0)
+        running: Dict[asyncio.Task, str] = {}
+        started: Set[str] = set()
+        cancel_waiter = asyncio.ensure_future(cancel_event.wait()) if cancel_event is not None else None
+
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_parallel:
+                    node = ready.popleft()
+                    started.add(node)
+                    running[asyncio.ensure_future(run(node))] = node
+
+                waiting = set(running)
+                if cancel_waiter is not None:
+                    waiting.add(cancel_waiter)
+                done, _ = await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+                if cancel_waiter is not None and cancel_waiter in done:
+                    result.cancelled = True
+                    logger.info(f"DAG run cancelled with {len(running)} tasks running")
+                    break
+
+                for task in done:
+                    node = running.pop(task)
+                    error = task.exception() if not task.cancelled() else asyncio.CancelledError()
+                    if error is None:
+                        result.completed.append(node)
+                    else:
+                        result.failed[node] = error
+                    if on_done is not None:
+                        on_done(node, error)
+                    if error is not None and fail_fast:
+                        raise error
+
+                    for dependent in dependents[node]:
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            ready.append(dependent)
+        finally:
+            # Cancellation, fail_fast and outer cancellation all stop running tasks at once
+            for task in running:
+                task.cancel()
+            result.interrupted = list(running.values())
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            if cancel_waiter is not None:
+                cancel_waiter.cancel()
+            result.not_started = [node for node in dependencies if node not in started]
+            result.makespan = time.perf_counter() - started_at
+
+        if result.not_started and not result.cancelled:
+            logger.warning(f"{len(result.not_started)} tasks never became ready (dependency cycle)")
+        return result
+
+
+__all__ = ["DagScheduler", "DagRunResult"]
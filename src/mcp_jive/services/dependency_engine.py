@@ -1,15 +1,16 @@
 """Dependency Engine Service.
 
 Handles dependency analysis, validation, and graph operations for work items.
-Uses NetworkX for dependency graph analysis and cycle detection.
+Dependencies are served from an in-memory graph per namespace that is loaded
+once from the dependency table and updated on add/remove; NetworkX is only
+used for cycle enumeration during validation.
 """
 
 import logging
+import weakref
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
 
-import networkx as nx
-
 from ..models.workflow import (
     WorkItem,
     WorkItemDependency,
@@ -19,6 +20,8 @@ from ..models.workflow import (
 )
 from ..lancedb_manager import LanceDBManager
 from ..config import ServerConfig
+from ..arrow_rows import read_rows
+from .dependency_graph import DependencyGraphIndex, DEPENDENCY_COLUMNS
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +34,9 @@ class DependencyEngine:
         self.lancedb_manager = lancedb_manager
         self.logger = logging.getLogger(__name__)
         self.dependency_collection = "WorkItemDependency"
+        # One graph per LanceDBManager (i.e. per namespace)
+        self._graphs: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._hierarchy_manager = None
         
     async def initialize(self) -> None:
         """Initialize the dependency engine."""
@@ -67,11 +73,56 @@ class DependencyEngine:
                 self.logger.info(f"Created {self.dependency_collection} collection")
             else:
                 self.logger.info(f"{self.dependency_collection} collection already exists")
+            
+            # Index the lookup columns used by get_dependencies/get_blocking_dependencies
+            self.lancedb_manager.register_scalar_indexes(self.dependency_collection, {
+                "source_id": "BTREE",
+                "target_id": "BTREE",
+                "dependency_type": "BITMAP"
+            })
                 
         except Exception as e:
             self.logger.error(f"Failed to ensure dependency collection exists: {e}")
             raise
     
+    async def _get_graph(self, reload: bool = False) -> DependencyGraphIndex:
+        """Get the dependency graph of the manager's namespace, loading it if needed.
+        
+        Args:
+            reload: Reload the graph from the table even if it is already built
+            
+        Returns:
+            DependencyGraphIndex kept current by add_dependency/remove_dependency
+        """
+        manager = self.lancedb_manager
+        graph = self._graphs.get(manager)
+        if graph is None:
+            graph = DependencyGraphIndex()
+            self._graphs[manager] = graph
+            # Rebuilt from the table after a snapshot restore
+            manager.add_table_observer(self.dependency_collection, graph)
+        if reload or not graph.built:
+            table = manager.db.open_table(self.dependency_collection)
+            row_count = table.count_rows()
+            graph.build(read_rows(table.search().limit(max(row_count, 1)), DEPENDENCY_COLUMNS))
+            self.logger.info(f"Loaded dependency graph ({len(graph.dependencies)} dependencies)")
+        return graph
+    
+    @staticmethod
+    def _to_dependency(record: Dict) -> WorkItemDependency:
+        """Map a dependency row onto the WorkItemDependency model."""
+        fields = {
+            "id": record["id"],
+            "source_id": record["source_id"],
+            "target_id": record["target_id"],
+            "dependency_type": DependencyType(record["dependency_type"]),
+            "description": record.get("description"),
+            "created_by": record.get("created_by") or "system"
+        }
+        if record.get("created_at"):
+            fields["created_at"] = record["created_at"]
+        return WorkItemDependency(**fields)
+    
     async def get_dependencies(self, work_item_id: str) -> List[WorkItemDependency]:
         """Get all dependencies for a work item (both incoming and outgoing).
         
@@ -82,45 +133,8 @@ class DependencyEngine:
             List of dependencies involving this work item
         """
         try:
-            table = self.lancedb_manager.db.open_table(self.dependency_collection)
-            
-            # Query for dependencies where this work item is either source or target
-            try:
-                result = table.search().where(
-                    f"source_id = '{work_item_id}' OR target_id = '{work_item_id}'"
-                ).limit(1000).to_arrow()
-                
-                # Convert to list of dictionaries safely
-                records = []
-                for i in range(len(result)):
-                    record = {}
-                    for field in result.schema:
-                        try:
-                            value = result[field.name][i].as_py()
-                            record[field.name] = value
-                        except Exception:
-                            record[field.name] = None
-                    records.append(record)
-                    
-            except Exception as e:
-                self.logger.warning(f"Arrow conversion failed, using fallback: {e}")
-                records = []
-            
-            dependencies = []
-            
-            # Convert results to WorkItemDependency objects
-            for record in records:
-                dep = WorkItemDependency(
-                    source_id=record['source_id'],
-                    target_id=record['target_id'],
-                    dependency_type=DependencyType(record['dependency_type']),
-                    description=record.get('description', ''),
-                    created_at=record.get('created_at', ''),
-                    created_by=record.get('created_by', '')
-                )
-                dependencies.append(dep)
-            
-            return dependencies
+            graph = await self._get_graph()
+            return [self._to_dependency(record) for record in graph.dependencies_of(work_item_id)]
             
         except Exception as e:
             self.logger.error(f"Failed to get dependencies for {work_item_id}: {e}")
@@ -136,43 +150,8 @@ class DependencyEngine:
             List of blocking dependencies
         """
         try:
-            table = self.lancedb_manager.db.open_table(self.dependency_collection)
-            
-            # Query for blocking dependencies where this item is the target
-            try:
-                result = table.search().where(
-                    f"target_id = '{work_item_id}' AND dependency_type = '{DependencyType.BLOCKS.value}'"
-                ).limit(1000).to_arrow()
-                
-                # Convert to list of dictionaries safely
-                records = []
-                for i in range(len(result)):
-                    record = {}
-                    for field in result.schema:
-                        try:
-                            value = result[field.name][i].as_py()
-                            record[field.name] = value
-                        except Exception:
-                            record[field.name] = None
-                    records.append(record)
-                    
-            except Exception as e:
-                self.logger.warning(f"Arrow conversion failed, using fallback: {e}")
-                records = []
-            
-            dependencies = []
-            for record in records:
-                dep = WorkItemDependency(
-                    source_id=record['source_id'],
-                    target_id=record['target_id'],
-                    dependency_type=DependencyType(record['dependency_type']),
-                    description=record.get('description', ''),
-                    created_at=record.get('created_at', ''),
-                    created_by=record.get('created_by', '')
-                )
-                dependencies.append(dep)
-            
-            return dependencies
+            graph = await self._get_graph()
+            return [self._to_dependency(record) for record in graph.blocking(work_item_id)]
             
         except Exception as e:
             self.logger.error(f"Failed to get blocking dependencies for {work_item_id}: {e}")
@@ -211,21 +190,18 @@ class DependencyEngine:
             # Build dependency graph for analysis
             dependency_graph = await self._build_dependency_graph(work_item_ids)
             
-            # Create NetworkX directed graph for cycle detection
+            # Create NetworkX directed graph for cycle detection (imported
+            # here: validation is rare and networkx is slow to import)
+            import networkx as nx
             nx_graph = nx.DiGraph()
             
             # Add nodes (work items)
             for work_item_id in work_item_ids:
                 nx_graph.add_node(work_item_id)
             
-            # Add edges (dependencies)
-            for dep in dependency_graph.dependencies:
-                if dep.dependency_type == DependencyType.BLOCKS:
-                    # Source blocks target, so target depends on source
-                    nx_graph.add_edge(dep.target_id, dep.source_id)
-                elif dep.dependency_type == DependencyType.DEPENDS_ON:
-                    # Source depends on target
-                    nx_graph.add_edge(dep.source_id, dep.target_id)
+            # Add ordering edges (prerequisite -> dependent) from the cached graph
+            graph = await self._get_graph()
+            nx_graph.add_edges_from(graph.ordering_edges(work_item_ids))
             
             # Check for circular dependencies
             if check_circular:
@@ -356,33 +332,13 @@ class DependencyEngine:
             List of work item IDs in execution order
         """
         try:
-            # Build dependency graph
-            dependency_graph = await self._build_dependency_graph(work_item_ids)
-            
-            # Create NetworkX directed graph
-            nx_graph = nx.DiGraph()
-            
-            # Add nodes
-            for work_item_id in work_item_ids:
-                nx_graph.add_node(work_item_id)
-            
-            # Add edges based on blocking dependencies
-            for dep in dependency_graph.dependencies:
-                if dep.dependency_type == DependencyType.BLOCKS:
-                    # Source blocks target, so target must wait for source
-                    nx_graph.add_edge(dep.source_id, dep.target_id)
-                elif dep.dependency_type == DependencyType.DEPENDS_ON:
-                    # Source depends on target, so source must wait for target
-                    nx_graph.add_edge(dep.target_id, dep.source_id)
-            
-            # Perform topological sort
-            try:
-                execution_order = list(nx.topological_sort(nx_graph))
-                return execution_order
-            except nx.NetworkXError as e:
+            graph = await self._get_graph()
+            execution_order = graph.execution_order(work_item_ids)
+            if execution_order is None:
                 # Graph has cycles, cannot determine order
-                self.logger.warning(f"Cannot determine execution order due to cycles: {e}")
+                self.logger.warning("Cannot determine execution order due to dependency cycles")
                 return work_item_ids  # Return original order as fallback
+            return execution_order
             
         except Exception as e:
             self.logger.error(f"Failed to get execution order: {e}")
@@ -390,35 +346,23 @@ class DependencyEngine:
     
     async def _build_dependency_graph(self, work_item_ids: List[str]) -> DependencyGraph:
         """Build a dependency graph for the given work items."""
-        work_items = {}
-        all_dependencies = []
-        
-        # Get work items (this would typically come from hierarchy manager)
-        # For now, we'll create a simplified version
-        from .hierarchy_manager import HierarchyManager
-        hierarchy_manager = HierarchyManager(self.config, self.lancedb_manager)
+        if self._hierarchy_manager is None:
+            from .hierarchy_manager import HierarchyManager
+            self._hierarchy_manager = HierarchyManager(self.config, self.lancedb_manager)
         
-        for work_item_id in work_item_ids:
-            work_item = await hierarchy_manager.get_work_item(work_item_id)
-            if work_item:
-                work_items[work_item_id] = work_item
+        # One batched read for all items instead of a lookup per item
+        rows = await self.lancedb_manager.get_work_items_by_ids(work_item_ids)
+        work_items = {row["id"]: self._hierarchy_manager._to_work_item(row) for row in rows}
         
-        # Get all dependencies for these work items
+        graph = await self._get_graph()
+        records = {}
         for work_item_id in work_item_ids:
-            dependencies = await self.get_dependencies(work_item_id)
-            all_dependencies.extend(dependencies)
-        
-        # Remove duplicates
-        unique_dependencies = []
-        seen_ids = set()
-        for dep in all_dependencies:
-            if dep.id not in seen_ids:
-                unique_dependencies.append(dep)
-                seen_ids.add(dep.id)
+            for record in graph.dependencies_of(work_item_id):
+                records[record["id"]] = record
         
         return DependencyGraph(
             work_items=work_items,
-            dependencies=unique_dependencies
+            dependencies=[self._to_dependency(record) for record in records.values()]
         )
     
     async def add_dependency(
@@ -440,11 +384,11 @@ class DependencyEngine:
             
         Returns:
             Created dependency
+            
+        Raises:
+            DependencyCycleError: If the dependency would create a cycle
         """
         try:
-            # Validate that this dependency won't create a cycle
-            validation = await self.validate_dependencies([source_id, target_id])
-            
             dependency = WorkItemDependency(
                 source_id=source_id,
                 target_id=target_id,
@@ -452,12 +396,25 @@ class DependencyEngine:
                 description=description,
                 created_by=created_by
             )
+            record = {
+                "id": dependency.id,
+                "source_id": source_id,
+                "target_id": target_id,
+                "dependency_type": dependency.dependency_type.value,
+                "description": description or "",
+                "created_at": dependency.created_at.isoformat(),
+                "created_by": created_by
+            }
             
-            # Store in LanceDB
-            dependency_data = dependency.dict()
-            result = await self.lancedb_manager.create_work_item(dependency_data)
+            # Incremental cycle check; the edge is only accepted if it keeps the graph acyclic
+            graph = await self._get_graph()
+            graph.add(record)
+            try:
+                await self.lancedb_manager.add_data(self.dependency_collection, {**record, "vector": None})
+            except Exception:
+                graph.remove(dependency.id)
+                raise
             
-            dependency.id = str(result)
             self.logger.info(f"Created dependency {dependency.id}: {source_id} -> {target_id}")
             
             return dependency
@@ -473,11 +430,14 @@ class DependencyEngine:
             dependency_id: ID of the dependency to remove
             
         Returns:
-            True if removed successfully
+            True if removed, False if it did not exist or removal failed
         """
         try:
-            # Use LanceDB to remove the dependency
-            result = await self.lancedb_manager.delete_work_item(dependency_id)
+            await self.lancedb_manager.delete_data(self.dependency_collection, {"id": dependency_id})
+            graph = await self._get_graph()
+            if graph.remove(dependency_id) is None:
+                self.logger.warning(f"Dependency {dependency_id} not found")
+                return False
             
             self.logger.info(f"Removed dependency {dependency_id}")
             return True
@@ -0,0 +1,304 @@
+"""In-memory dependency graph for work item ordering.
+
+The graph is loaded once from the dependency table and then kept current by
+DependencyEngine on every add/remove. Ordering edges point from the item that
+must finish first to the item that waits for it (``blocks``: source → target,
+``depends_on``: target → source; ``relates_to`` adds no edge).
+
+A topological order is maintained incrementally with the Pearce–Kelly
+algorithm: inserting an edge that already agrees with the order costs O(1),
+otherwise only the nodes between the two endpoints in the order are searched
+and reordered, which also detects a cycle before the edge is accepted.
+"""
+
+import logging
+from collections import deque
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEPENDENCY_COLUMNS = ["id", "source_id", "target_id", "dependency_type",
+                      "description", "created_at", "created_by"]
+
+
+def ordering_edge(row: Dict[str, Any]) -> Optional[Tuple[str, str]]:
+    """Map a dependency row to its (before, after) ordering edge, if any."""
+    dependency_type = getattr(row.get("dependency_type"), "value", row.get("dependency_type"))
+    if dependency_type == "blocks":
+        return row["source_id"], row["target_id"]
+    if dependency_type == "depends_on":
+        return row["target_id"], row["source_id"]
+    return None
+
+
+class DependencyCycleError(ValueError):
+    """Raised when a dependency would close a cycle."""
+
+    def __init__(self, cycle: List[str]):
+        self.cycle = cycle
+        super().__init__(f"Dependency would create a cycle: {' -> '.join(cycle + cycle[:1])}")
+
+
+class DependencyGraphIndex:
+    """Dependency rows plus an incrementally ordered ordering graph."""
+
+    def __init__(self):
+        self.dependencies: Dict[str, Dict[str, Any]] = {}
+        # item id → ids of dependencies it takes part in (either side)
+        self._by_item: Dict[str, Set[str]] = {}
+        # Edge multiplicities, since several dependencies can imply the same edge
+        self._successors: Dict[str, Dict[str, int]] = {}
+        self._predecessors: Dict[str, Dict[str, int]] = {}
+        # Topological position of each node; only meaningful while _ordered
+        self._position: Dict[str, int] = {}
+        self._next_position = 0
+        self._ordered = True
+        self.built = False
+
+    # Maintenance
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the graph from dependency rows.
+
+        Rows closing a cycle are kept (they exist in storage) but leave the
+        graph unordered until enough of them are removed.
+
+        Args:
+            rows: Dependency table rows (see DEPENDENCY_COLUMNS)
+        """
+        self.invalidate()
+        for row in rows:
+            self._add_row(row)
+        self._ordered = self._reorder()
+        self.built = True
+        if not self._ordered:
+            logger.warning("Dependency graph contains cycles; ordering queries fall back to per-query sorts")
+        logger.debug(f"Built dependency graph with {len(self.dependencies)} dependencies, "
+                     f"{len(self._successors)} items")
+
+    def invalidate(self) -> None:
+        """Drop the graph so it is rebuilt on next use."""
+        self.dependencies.clear()
+        self._by_item.clear()
+        self._successors.clear()
+        self._predecessors.clear()
+        self._position.clear()
+        self._next_position = 0
+        self._ordered = True
+        self.built = False
+
+    def add(self, row: Dict[str, Any]) -> None:
+        """Add a dependency, rejecting it if its ordering edge closes a cycle.
+
+        Args:
+            row: Dependency row with id, source_id, target_id and dependency_type
+
+        Raises:
+            DependencyCycleError: If the dependency would create a cycle
+        """
+        edge = ordering_edge(row)
+        if edge is not None:
+            before, after = edge
+            cycle = self._insert_edge_ordered(before, after) if self._ordered else self._path(after, before)
+            if cycle is not None:
+                raise DependencyCycleError(cycle)
+        self._add_row(row)
+
+    def remove(self, dependency_id: str) -> Optional[Dict[str, Any]]:
+        """Remove a dependency.
+
+        Returns:
+            The removed row, or None if it was not in the graph
+        """
+        row = self.dependencies.pop(dependency_id, None)
+        if row is None:
+            return None
+        for item_id in (row["source_id"], row["target_id"]):
+            ids = self._by_item.get(item_id)
+            if ids is not None:
+                ids.discard(dependency_id)
+        edge = ordering_edge(row)
+        if edge is not None:
+            before, after = edge
+            self._decrement(self._successors[before], after)
+            self._decrement(self._predecessors[after], before)
+            if not self._ordered:
+                # Removing edges can only break cycles, never an order
+                self._ordered = self._reorder()
+        return row
+
+    @staticmethod
+    def _decrement(edges: Dict[str, int], node: str) -> None:
+        edges[node] -= 1
+        if edges[node] <= 0:
+            del edges[node]
+
+    def _add_node(self, node: str) -> None:
+        if node not in self._successors:
+            self._successors[node] = {}
+            self._predecessors[node] = {}
+            self._position[node] = self._next_position
+            self._next_position += 1
+
+    def _add_row(self, row: Dict[str, Any]) -> None:
+        row = dict(row)
+        self.dependencies[row["id"]] = row
+        for item_id in (row["source_id"], row["target_id"]):
+            self._add_node(item_id)
+            self._by_item.setdefault(item_id, set()).add(row["id"])
+        edge = ordering_edge(row)
+        if edge is not None:
+            before, after = edge
+            self._successors[before][after] = self._successors[before].get(after, 0) + 1
+            self._predecessors[after][before] = self._predecessors[after].get(before, 0) + 1
+
+    # Ordering
+    def _insert_edge_ordered(self, before: str, after: str) -> Optional[List[str]]:
+        """Pearce–Kelly: make the order admit before → after, or report a cycle."""
+        if before == after:
+            return [before]
+        self._add_node(before)
+        self._add_node(after)
+        lower, upper = self._position[after], self._position[before]
+        if lower > upper:
+            return None
+
+        # Nodes reachable from `after` that sit at or before `before` in the order
+        forward: List[str] = []
+        parents: Dict[str, Optional[str]] = {after: None}
+        stack = [after]
+        while stack:
+            node = stack.pop()
+            forward.append(node)
+            for successor in self._successors[node]:
+                if successor == before:
+                    cycle = [before, node]
+                    while parents[cycle[-1]] is not None:
+                        cycle.append(parents[cycle[-1]])
+                    return [cycle[0]] + cycle[:0:-1]
+                if successor not in parents and self._position[successor] < upper:
+                    parents[successor] = node
+                    stack.append(successor)
+
+        # Nodes reaching `before` that sit after `after` in the order
+        backward: List[str] = []
+        seen = {before}
+        stack = [before]
+        while stack:
+            node = stack.pop()
+            backward.append(node)
+            for predecessor in self._predecessors[node]:
+                if predecessor not in seen and self._position[predecessor] > lower:
+                    seen.add(predecessor)
+                    stack.append(predecessor)
+
+        # Reassign the affected positions: everything reaching `before` first
+        by_position = self._position.__getitem__
+        backward.sort(key=by_position)
+        forward.sort(key=by_position)
+        slots = sorted(self._position[node] for node in backward + forward)
+        for node, slot in zip(backward + forward, slots):
+            self._position[node] = slot
+        return None
+
+    def _reorder(self) -> bool:
+        """Recompute positions with Kahn's algorithm; False if the graph has a cycle."""
+        order = self._kahn(list(self._successors))
+        if order is None:
+            return False
+        self._position = {node: index for index, node in enumerate(order)}
+        self._next_position = len(order)
+        return True
+
+    def _kahn(self, nodes: List[str]) -> Optional[List[str]]:
+        """Topological order of the subgraph induced by nodes (input order breaks ties)."""
+        members = set(nodes)
+        in_degree = {node: sum(1 for p in self._predecessors.get(node, ()) if p in members)
+                     for node in nodes}
+        ready = deque(node for node in nodes if in_degree[node] == 0)
+        order = []
+        while ready:
+            node = ready.popleft()
+            order.append(node)
+            for successor in self._successors.get(node, ()):
+                if successor in members:
+                    in_degree[successor] -= 1
+                    if in_degree[successor] == 0:
+                        ready.append(successor)
+        return order if len(order) == len(nodes) else None
+
+    def _path(self, start: str, goal: str) -> Optional[List[str]]:
+        """A path start → … → goal as the cycle it would close, or None."""
+        if start == goal:
+            return [start]
+        parents: Dict[str, Optional[str]] = {start: None}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for successor in self._successors.get(node, ()):
+                if successor in parents:
+                    continue
+                parents[successor] = node
+                if successor == goal:
+                    path = [goal]
+                    while parents[path[-1]] is not None:
+                        path.append(parents[path[-1]])
+                    return [goal] + path[:0:-1]
+                stack.append(successor)
+        return None
+
+    # Queries
+    def execution_order(self, item_ids: List[str]) -> Optional[List[str]]:
+        """Order items so each comes after everything it (transitively) waits for.
+
+        Args:
+            item_ids: Items to order
+
+        Returns:
+            Ordered ids, or None if the items are part of a cycle
+        """
+        item_ids = list(dict.fromkeys(item_ids))
+        if self._ordered:
+            unknown = self._next_position
+            return sorted(item_ids, key=lambda node: self._position.get(node, unknown))
+        return self._kahn(item_ids)
+
+    def dependencies_of(self, item_id: str) -> List[Dict[str, Any]]:
+        """Dependency rows where the item is source or target."""
+        return [self.dependencies[dependency_id] for dependency_id in self._by_item.get(item_id, ())]
+
+    def blocking(self, item_id: str) -> List[Dict[str, Any]]:
+        """Rows of ``blocks`` dependencies targeting the item."""
+        return [row for row in self.dependencies_of(item_id)
+                if row["target_id"] == item_id
+                and getattr(row["dependency_type"], "value", row["dependency_type"]) == "blocks"]
+
+    def prerequisites(self, item_id: str) -> List[str]:
+        """Items that must finish before this one (direct ordering edges)."""
+        return list(self._predecessors.get(item_id, ()))
+
+    def ordering_edges(self, item_ids: Iterable[str]) -> List[Tuple[str, str]]:
+        """Ordering edges touching any of the items."""
+        edges = set()
+        for item_id in item_ids:
+            for successor in self._successors.get(item_id, ()):
+                edges.add((item_id, successor))
+            for predecessor in self._predecessors.get(item_id, ()):
+                edges.add((predecessor, item_id))
+        return sorted(edges)
+
+    @property
+    def is_acyclic(self) -> bool:
+        return self._ordered
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get graph statistics for health reporting."""
+        return {
+            "built": self.built,
+            "dependencies": len(self.dependencies),
+            "items": len(self._successors),
+            "edges": sum(len(edges) for edges in self._successors.values()),
+            "acyclic": self._ordered
+        }
+
+
+__all__ = ["DependencyGraphIndex", "DependencyCycleError", "DEPENDENCY_COLUMNS", "ordering_edge"]
@@ -0,0 +1,299 @@
+"""Bounded, persistent store for execution sessions.
+
+Sessions live in an in-memory LRU tier and are written behind to the
+``ExecutionLog`` LanceDB table of the namespace they were created in (one row
+per session, ``action = 'execution_session'``, session JSON in ``details``).
+Finished sessions are evicted after a TTL, the hot tier never holds more than
+``max_sessions`` finished sessions, and log lists are capped, so memory stays
+flat on a long-running server. Sessions not in memory are loaded lazily, which
+lets status survive a restart.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+from ..namespace.context import get_current_namespace, namespace_scope
+from ..pagination import sql_literal
+
+logger = logging.getLogger(__name__)
+
+SESSION_ACTION = "execution_session"
+FINISHED_STATUSES = frozenset({
+    "completed", "failed", "cancelled", "dry_run_completed", "validation_completed"
+})
+# Session lists that grow with activity and are trimmed to their newest entries
+CAPPED_LISTS = ("logs", "progress_updates", "steps")
+
+
+class ExecutionSessionStore:
+    """Dict-like execution session store with LRU, TTL and write-behind."""
+
+    def __init__(self,
+                 storage=None,
+                 max_sessions: int = 256,
+                 ttl_seconds: float = 3600.0,
+                 max_log_entries: int = 200,
+                 flush_interval: float = 2.0,
+                 max_flush_failures: int = 3):
+        """Initialize the session store.
+
+        Args:
+            storage: WorkItemStorage whose ``lancedb_manager`` persists sessions
+                (None keeps sessions in memory only)
+            max_sessions: Finished sessions kept in memory (running ones are never evicted)
+            ttl_seconds: Seconds a finished session stays in memory
+            max_log_entries: Maximum entries kept per session list
+            flush_interval: Seconds between write-behind flushes
+            max_flush_failures: Failed writes after which a finished session
+                is evicted even though it was never written
+        """
+        self.storage = storage
+        self.max_sessions = max(1, max_sessions)
+        self.ttl_seconds = ttl_seconds
+        self.max_log_entries = max(1, max_log_entries)
+        self.flush_interval = flush_interval
+        self.max_flush_failures = max(1, max_flush_failures)
+
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._namespaces: Dict[str, Optional[str]] = {}
+        self._finished_at: Dict[str, float] = {}
+        # Serialized form of each session as last written, to skip clean sessions
+        self._flushed: Dict[str, str] = {}
+        # Consecutive failed writes of each dirty session
+        self._flush_failures: Dict[str, int] = {}
+        self._flusher: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+
+        self.loads = 0
+        self.evictions = 0
+        self.dropped_unwritten = 0
+
+    # Mapping interface over the hot tier
+    def __setitem__(self, execution_id: str, session: Dict[str, Any]) -> None:
+        self._hot[execution_id] = session
+        self._hot.move_to_end(execution_id)
+        self._namespaces[execution_id] = get_current_namespace()
+        self._ensure_flusher()
+
+    def __getitem__(self, execution_id: str) -> Dict[str, Any]:
+        session = self._hot[execution_id]
+        self._hot.move_to_end(execution_id)
+        return session
+
+    def __contains__(self, execution_id: object) -> bool:
+        return execution_id in self._hot
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._hot))
+
+    def __len__(self) -> int:
+        return len(self._hot)
+
+    def keys(self) -> List[str]:
+        return list(self._hot)
+
+    def get(self, execution_id: str, default: Any = None) -> Any:
+        return self[execution_id] if execution_id in self._hot else default
+
+    # Lazy loading and bounds
+    async def load(self, execution_id: str) -> Optional[Dict[str, Any]]:
+        """Get a session from memory, or from the ExecutionLog table.
+
+        Args:
+            execution_id: Execution session id
+
+        Returns:
+            The session, or None if it does not exist
+        """
+        if execution_id in self._hot:
+            return self[execution_id]
+
+        manager = self._manager()
+        if manager is None:
+            return None
+        try:
+            table = await manager.get_table("ExecutionLog")
+            rows = (table.search()
+                    .where(f"id = {sql_literal(str(execution_id))} AND action = {sql_literal(SESSION_ACTION)}")
+                    .select(["details"])
+                    .limit(1)
+                    .to_list())
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load execution session {execution_id}: {e}")
+            return None
+        if not rows:
+            return None
+
+        session = json.loads(rows[0]["details"])
+        self._hot[execution_id] = session
+        self._namespaces[execution_id] = get_current_namespace()
+        self._flushed[execution_id] = rows[0]["details"]
+        if session.get("status") in FINISHED_STATUSES:
+            self._finished_at[execution_id] = time.monotonic()
+        self.loads += 1
+        return session
+
+    def trim(self, session: Dict[str, Any]) -> None:
+        """Cap a session's log lists to their newest max_log_entries entries."""
+        for name in CAPPED_LISTS:
+            entries = session.get(name)
+            if isinstance(entries, list) and len(entries) > self.max_log_entries:
+                del entries[:len(entries) - self.max_log_entries]
+
+    def _evictable(self) -> List[str]:
+        """Finished sessions, least recently used first."""
+        now = time.monotonic()
+        finished = []
+        for execution_id, session in self._hot.items():
+            if session.get("status") in FINISHED_STATUSES:
+                finished.append(execution_id)
+                self._finished_at.setdefault(execution_id, now)
+            else:
+                self._finished_at.pop(execution_id, None)
+        return finished
+
+    def _evict(self) -> None:
+        """Drop expired and surplus finished sessions that are already written."""
+        finished = self._evictable()
+        now = time.monotonic()
+        surplus = len(finished) - self.max_sessions
+        for execution_id in finished:
+            expired = now - self._finished_at[execution_id] >= self.ttl_seconds
+            if not expired and surplus <= 0:
+                continue
+            if self._is_dirty(execution_id) and self._manager_available():
+                if self._flush_failures.get(execution_id, 0) < self.max_flush_failures:
+                    continue  # Keep it until the next flush has written it
+                # Writes keep failing; stop holding it so memory stays bounded
+                logger.warning(f"⚠️ Dropping execution session {execution_id} after "
+                               f"{self._flush_failures[execution_id]} failed writes")
+                self.dropped_unwritten += 1
+            self._drop(execution_id)
+            surplus -= 1
+            self.evictions += 1
+
+    def _drop(self, execution_id: str) -> None:
+        self._hot.pop(execution_id, None)
+        self._namespaces.pop(execution_id, None)
+        self._finished_at.pop(execution_id, None)
+        self._flushed.pop(execution_id, None)
+        self._flush_failures.pop(execution_id, None)
+
+    # Write-behind
+    def _manager(self):
+        try:
+            return self.storage.lancedb_manager if self.storage is not None else None
+        except Exception:
+            return None
+
+    def _manager_available(self) -> bool:
+        return self._manager() is not None
+
+    def _serialize(self, execution_id: str) -> str:
+        session = self._hot[execution_id]
+        self.trim(session)
+        return json.dumps(session, default=str, sort_keys=True)
+
+    def _is_dirty(self, execution_id: str) -> bool:
+        return self._flushed.get(execution_id) != self._serialize(execution_id)
+
+    def _ensure_flusher(self) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._flusher is None or self._flusher.done():
+            self._flusher = loop.create_task(self._run_flusher())
+
+    async def _run_flusher(self) -> None:
+        while self._hot:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """Write changed sessions to ExecutionLog, then apply eviction.
+
+        Returns:
+            Number of sessions written
+        """
+        async with self._lock:
+            by_namespace: Dict[Optional[str], List[Dict[str, Any]]] = {}
+            serialized: Dict[str, str] = {}
+            for execution_id in list(self._hot):
+                details = self._serialize(execution_id)
+                if self._flushed.get(execution_id) == details:
+                    continue
+                serialized[execution_id] = details
+                by_namespace.setdefault(self._namespaces.get(execution_id), []).append(
+                    self._to_row(execution_id, details)
+                )
+
+            written = 0
+            for namespace, rows in by_namespace.items():
+                with namespace_scope(namespace):
+                    manager = self._manager()
+                    if manager is None:
+                        continue
+                    try:
+                        await manager.upsert_data("ExecutionLog", rows)
+                    except Exception as e:
+                        # Sessions stay dirty and in memory until a flush succeeds
+                        logger.warning(f"⚠️ Failed to persist {len(rows)} execution sessions: {e}")
+                        for row in rows:
+                            self._flush_failures[row["id"]] = self._flush_failures.get(row["id"], 0) + 1
+                        continue
+                for row in rows:
+                    self._flushed[row["id"]] = serialized[row["id"]]
+                    self._flush_failures.pop(row["id"], None)
+                written += len(rows)
+
+            self._evict()
+            if written:
+                logger.debug(f"Flushed {written} execution sessions")
+            return written
+
+    def _to_row(self, execution_id: str, details: str) -> Dict[str, Any]:
+        session = self._hot[execution_id]
+        return {
+            "id": execution_id,
+            "log_id": execution_id,
+            "work_item_id": session.get("root_work_item_id") or session.get("work_item_id"),
+            "action": SESSION_ACTION,
+            "status": str(session.get("status", "unknown")),
+            "agent_id": None,
+            "details": details,
+            "error_message": session.get("error"),
+            "duration_seconds": 0.0,
+            "timestamp": datetime.now(timezone.utc),
+            "metadata": "{}",
+        }
+
+    async def close(self) -> None:
+        """Stop the flusher and write pending sessions."""
+        if self._flusher is not None and not self._flusher.done():
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+        self._flusher = None
+        await self.flush()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics for health reporting."""
+        return {
+            "in_memory": len(self._hot),
+            "finished_in_memory": len(self._finished_at),
+            "max_sessions": self.max_sessions,
+            "loads": self.loads,
+            "evictions": self.evictions,
+            "dropped_unwritten": self.dropped_unwritten
+        }
+
+
+__all__ = ["ExecutionSessionStore", "FINISHED_STATUSES"]
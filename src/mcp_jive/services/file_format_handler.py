@@ -61,6 +61,18 @@ class FileFormatHandler:
     async def parse_file_content(self, content: str, file_path: str) -> Optional[WorkItemSchema]:
         """Parse file content based on file extension.
         
+        Args:
+            content: Raw file content
+            file_path: Path to the file (used to determine format)
+            
+        Returns:
+            Parsed WorkItemSchema or None if parsing fails
+        """
+        return self.parse_content(content, file_path)
+        
+    def parse_content(self, content: str, file_path: str) -> Optional[WorkItemSchema]:
+        """Parse file content synchronously; safe to call from worker threads.
+        
         Args:
             content: Raw file content
             file_path: Path to the file (used to determine format)
@@ -72,11 +84,11 @@ class FileFormatHandler:
             file_ext = Path(file_path).suffix.lower()
             
             if file_ext == '.json':
-                return await self._parse_json(content)
+                return self._parse_json(content)
             elif file_ext in ['.yaml', '.yml']:
-                return await self._parse_yaml(content)
+                return self._parse_yaml(content)
             elif file_ext == '.md':
-                return await self._parse_markdown(content)
+                return self._parse_markdown(content)
             else:
                 self.logger.warning(f"Unsupported file format: {file_ext}")
                 return None
@@ -125,7 +137,7 @@ class FileFormatHandler:
             self.logger.warning(f"Work item validation failed: {e}")
             return False
             
-    async def _parse_json(self, content: str) -> Optional[WorkItemSchema]:
+    def _parse_json(self, content: str) -> Optional[WorkItemSchema]:
         """Parse JSON content."""
         try:
             data = json.loads(content)
@@ -134,7 +146,7 @@ class FileFormatHandler:
             self.logger.error(f"JSON parsing error: {e}")
             return None
             
-    async def _parse_yaml(self, content: str) -> Optional[WorkItemSchema]:
+    def _parse_yaml(self, content: str) -> Optional[WorkItemSchema]:
         """Parse YAML content."""
         try:
             data = yaml.safe_load(content)
@@ -143,7 +155,7 @@ class FileFormatHandler:
             self.logger.error(f"YAML parsing error: {e}")
             return None
             
-    async def _parse_markdown(self, content: str) -> Optional[WorkItemSchema]:
+    def _parse_markdown(self, content: str) -> Optional[WorkItemSchema]:
         """Parse Markdown content with YAML frontmatter."""
         try:
             # Split frontmatter and content
@@ -60,6 +60,51 @@ class HierarchyManager:
             self.logger.error(f"Failed to ensure table exists: {e}")
             raise
 
+    def _to_work_item(self, result: Dict) -> WorkItem:
+        """Map a LanceDB work item row onto the WorkItem model."""
+        from ..models.workflow import WorkItemType, WorkItemStatus, Priority
+        
+        # Convert string values to enums
+        item_type_str = result.get("item_type", "task")
+        try:
+            work_item_type = WorkItemType(item_type_str)
+        except ValueError:
+            work_item_type = WorkItemType.TASK
+        
+        status_str = result.get("status", "backlog")
+        try:
+            work_item_status = WorkItemStatus(status_str)
+        except ValueError:
+            work_item_status = WorkItemStatus.BACKLOG
+        
+        priority_str = result.get("priority", "medium")
+        try:
+            work_item_priority = Priority(priority_str)
+        except ValueError:
+            work_item_priority = Priority.MEDIUM
+        
+        return WorkItem(
+            id=result.get("id", ""),
+            title=result.get("title", ""),
+            description=result.get("description", ""),
+            type=work_item_type,  # Correct field name
+            status=work_item_status,
+            priority=work_item_priority,
+            parent_id=result.get("parent_id"),
+            project_id=result.get("project_id", "default-project"),  # Required field with default
+            assignee=result.get("assignee"),  # Correct field name
+            reporter=result.get("assignee", "system"),  # Required field, use assignee or default
+            created_at=result.get("created_at"),
+            updated_at=result.get("updated_at"),
+            estimated_hours=result.get("estimated_hours"),
+            actual_hours=result.get("actual_hours"),
+            progress_percentage=result.get("progress", 0.0),  # Correct field name
+            tags=result.get("tags", []),
+            dependencies=result.get("dependencies", []),
+            autonomous_executable=result.get("autonomous_executable", False),
+            execution_instructions=result.get("execution_instructions")
+        )
+
     async def get_children(self, parent_id: str, include_nested: bool = False) -> List[WorkItem]:
         """Get direct children of a work item.
         
@@ -71,69 +116,11 @@ class HierarchyManager:
             List of child work items
         """
         try:
-            # Query LanceDB for work items with the specified parent_id
-            results = await self.lancedb_manager.search_work_items(
-                query_text="",
-                filters={"parent_id": parent_id},
-                limit=1000
+            # The hierarchy index resolves the (sub)tree without scanning the table
+            results = await self.lancedb_manager.get_work_item_children(
+                parent_id, recursive=include_nested
             )
-            
-            children = []
-            for result in results:
-                # Convert result to WorkItem with proper field mapping
-                from ..models.workflow import WorkItemType, WorkItemStatus, Priority
-                
-                # Convert string values to enums
-                item_type_str = result.get("item_type", "task")
-                try:
-                    work_item_type = WorkItemType(item_type_str)
-                except ValueError:
-                    work_item_type = WorkItemType.TASK
-                
-                status_str = result.get("status", "backlog")
-                try:
-                    work_item_status = WorkItemStatus(status_str)
-                except ValueError:
-                    work_item_status = WorkItemStatus.BACKLOG
-                
-                priority_str = result.get("priority", "medium")
-                try:
-                    work_item_priority = Priority(priority_str)
-                except ValueError:
-                    work_item_priority = Priority.MEDIUM
-                
-                work_item = WorkItem(
-                    id=result.get("id", ""),
-                    title=result.get("title", ""),
-                    description=result.get("description", ""),
-                    type=work_item_type,  # Correct field name
-                    status=work_item_status,
-                    priority=work_item_priority,
-                    parent_id=result.get("parent_id"),
-                    project_id=result.get("project_id", "default-project"),  # Required field with default
-                    assignee=result.get("assignee"),  # Correct field name
-                    reporter=result.get("assignee", "system"),  # Required field, use assignee or default
-                    created_at=result.get("created_at"),
-                    updated_at=result.get("updated_at"),
-                    estimated_hours=result.get("estimated_hours"),
-                    actual_hours=result.get("actual_hours"),
-                    progress_percentage=result.get("progress", 0.0),  # Correct field name
-                    tags=result.get("tags", []),
-                    dependencies=result.get("dependencies", []),
-                    autonomous_executable=result.get("autonomous_executable", False),
-                    execution_instructions=result.get("execution_instructions")
-                )
-                children.append(work_item)
-            
-            if include_nested:
-                # Recursively get nested children
-                all_children = children.copy()
-                for child in children:
-                    nested = await self.get_children(child.id, include_nested=True)
-                    all_children.extend(nested)
-                return all_children
-            
-            return children
+            return [self._to_work_item(result) for result in results]
             
         except Exception as e:
             self.logger.error(f"Failed to get children for {parent_id}: {e}")
@@ -203,49 +190,7 @@ class HierarchyManager:
             result = await self.lancedb_manager.get_work_item(work_item_id)
             
             if result:
-                # Map LanceDB fields to WorkItem model fields
-                from ..models.workflow import WorkItemType, WorkItemStatus, Priority
-                
-                # Convert string values to enums
-                item_type_str = result.get("item_type", "task")
-                try:
-                    work_item_type = WorkItemType(item_type_str)
-                except ValueError:
-                    work_item_type = WorkItemType.TASK
-                
-                status_str = result.get("status", "backlog")
-                try:
-                    work_item_status = WorkItemStatus(status_str)
-                except ValueError:
-                    work_item_status = WorkItemStatus.BACKLOG
-                
-                priority_str = result.get("priority", "medium")
-                try:
-                    work_item_priority = Priority(priority_str)
-                except ValueError:
-                    work_item_priority = Priority.MEDIUM
-                
-                return WorkItem(
-                    id=result.get("id", ""),
-                    title=result.get("title", ""),
-                    description=result.get("description", ""),
-                    type=work_item_type,  # Correct field name
-                    status=work_item_status,
-                    priority=work_item_priority,
-                    parent_id=result.get("parent_id"),
-                    project_id=result.get("project_id", "default-project"),  # Required field with default
-                    assignee=result.get("assignee"),  # Correct field name
-                    reporter=result.get("assignee", "system"),  # Required field, use assignee or default
-                    created_at=result.get("created_at"),
-                    updated_at=result.get("updated_at"),
-                    estimated_hours=result.get("estimated_hours"),
-                    actual_hours=result.get("actual_hours"),
-                    progress_percentage=result.get("progress", 0.0),  # Correct field name
-                    tags=result.get("tags", []),
-                    dependencies=result.get("dependencies", []),
-                    autonomous_executable=result.get("autonomous_executable", False),
-                    execution_instructions=result.get("execution_instructions")
-                )
+                return self._to_work_item(result)
             
             return None
             
@@ -5,15 +5,11 @@ across the entire work item hierarchy.
 """
 
 import logging
-from typing import Dict, List, Optional, Set, Tuple
+import weakref
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from ..models.workflow import (
-    WorkItem,
-    WorkItemType,
-    WorkItemStatus,
-    ProgressCalculation,
-)
+from .progress_rollup import ProgressRollup, ROLLUP_COLUMNS, STATUS_PROGRESS
 # Removed direct import to avoid circular dependency
 # WorkItemStorage will be injected as dependency
 
@@ -31,6 +27,41 @@ class ProgressCalculator:
         """
         self.storage = storage
         self.logger = logging.getLogger(__name__)
+        # One rollup tree per namespace manager; dropped when the manager is evicted
+        self._rollups: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        
+    async def _get_rollup(self, reload: bool = False) -> ProgressRollup:
+        """Get the rollup tree of the active namespace, building it if needed.
+        
+        Args:
+            reload: Rebuild the tree from the table even if it is already built
+            
+        Returns:
+            ProgressRollup kept current with the namespace's work item writes
+        """
+        manager = self.storage.lancedb_manager
+        rollup = self._rollups.get(manager)
+        if rollup is None:
+            rollup = ProgressRollup()
+            self._rollups[manager] = rollup
+            manager.add_work_item_observer(rollup)
+        if reload or not rollup.built:
+            rollup.build(await manager.scan_work_items(ROLLUP_COLUMNS))
+            self.logger.info(f"Built progress rollup tree ({len(rollup.nodes)} items)")
+        return rollup
+        
+    async def _persist(self, rollup: ProgressRollup, updates: Dict[str, Dict]) -> None:
+        """Write rollup updates in one batch, dropping the tree if the write fails."""
+        if not updates:
+            return
+        try:
+            await self.storage.upsert_work_items(
+                [{"id": item_id, **data} for item_id, data in updates.items()]
+            )
+        except Exception:
+            # The tree already holds the new values; rebuild it from the table next time
+            rollup.invalidate()
+            raise
         
     async def calculate_work_item_progress(self, work_item_id: str) -> float:
         """Calculate progress for a single work item.
@@ -42,20 +73,18 @@ class ProgressCalculator:
             Progress percentage (0-100)
         """
         try:
-            work_item = await self.storage.get_work_item(work_item_id)
-            if not work_item:
-                self.logger.warning(f"Work item not found: {work_item_id}")
-                return 0.0
-                
-            # Get children to determine if this is a leaf node
-            children = await self._get_children(work_item_id)
-            
-            if not children:
-                # Leaf node - always calculate from status to ensure consistency
-                return self._calculate_leaf_progress(work_item)
-            else:
-                # Parent node - always calculate based on children, ignore explicit progress
-                return await self._calculate_parent_progress(children)
+            rollup = await self._get_rollup()
+            if work_item_id not in rollup.nodes:
+                work_item = await self.storage.get_work_item(work_item_id)
+                if not work_item:
+                    self.logger.warning(f"Work item not found: {work_item_id}")
+                    return 0.0
+                work_item_id = work_item["id"]
+                if work_item_id not in rollup.nodes:
+                    rollup = await self._get_rollup(reload=True)
+                    
+            # Leaves follow their status, parents the average of their children
+            return rollup.effective_progress(work_item_id)
                 
         except Exception as e:
             self.logger.error(f"Failed to calculate progress for {work_item_id}: {e}")
@@ -70,56 +99,8 @@ class ProgressCalculator:
         Returns:
             Progress percentage (0-100)
         """
-        status = work_item.get("status", "not_started")
-        
-        # Unified status-to-progress mapping
-        status_progress_map = {
-            "completed": 100.0,
-            "done": 100.0,  # Backend uses 'done'
-            "in_progress": 50.0,  # More conservative than frontend's 60%
-            "blocked": 25.0,  # Slightly less than frontend's 30%
-            "not_started": 0.0,
-            "backlog": 0.0,  # Backend uses 'backlog'
-            "cancelled": 0.0,
-        }
-        
-        return status_progress_map.get(status.lower(), 0.0)
-        
-    async def _calculate_parent_progress(self, children: List[Dict]) -> float:
-        """Calculate progress for a parent work item based on its children.
-        
-        Args:
-            children: List of child work items
-            
-        Returns:
-            Progress percentage (0-100)
-        """
-        if not children:
-            return 0.0
-            
-        total_progress = 0.0
-        total_children = len(children)
-        
-        for child in children:
-            # For leaf nodes (children with no children), always calculate from status
-            # to ensure consistency between status and progress
-            child_children = await self._get_children(child["id"])
-            
-            if not child_children:
-                # Leaf node - calculate from status to ensure consistency
-                child_progress = self._calculate_leaf_progress(child)
-            else:
-                # Parent node - use stored progress or calculate recursively
-                child_progress = child.get("progress")
-                if child_progress is not None:
-                    child_progress = float(child_progress)
-                else:
-                    # Recursively calculate for parent children
-                    child_progress = await self._calculate_parent_progress(child_children)
-            
-            total_progress += child_progress
-            
-        return total_progress / total_children if total_children > 0 else 0.0
+        status = work_item.get("status") or "not_started"
+        return STATUS_PROGRESS.get(status.lower(), 0.0)
         
     async def update_work_item_progress(self, work_item_id: str, 
                                       progress: Optional[float] = None,
@@ -177,15 +158,24 @@ class ProgressCalculator:
                     else:
                         update_data["status"] = "not_started"
                         
-            # Update the work item
+            # Apply the change to the rollup tree, then write the item and
+            # every touched ancestor in one commit
+            work_item_id = work_item["id"]
+            rollup = await self._get_rollup()
+            if work_item_id not in rollup.nodes:
+                rollup = await self._get_rollup(reload=True)
+            rollup.upsert({"id": work_item_id, **update_data})
+            
+            pending: Dict[str, Dict] = {}
+            if propagate:
+                pending = rollup.flush()
+                affected_items.extend(item_id for item_id in pending if item_id != work_item_id)
             if update_data:
-                await self.storage.update_work_item(work_item_id, update_data)
-                self.logger.info(f"Updated progress for {work_item_id}: {update_data}")
+                pending.setdefault(work_item_id, {}).update(update_data)
                 
-            # Propagate changes to parent hierarchy
-            if propagate:
-                parent_updates = await self._propagate_progress_to_parents(work_item_id)
-                affected_items.extend(parent_updates)
+            if pending:
+                await self._persist(rollup, pending)
+                self.logger.info(f"Updated progress for {work_item_id}: {update_data}")
                 
             return {
                 "success": True,
@@ -202,98 +192,25 @@ class ProgressCalculator:
                 "error": str(e)
             }
             
-    async def _propagate_progress_to_parents(self, work_item_id: str) -> List[str]:
-        """Propagate progress changes up the hierarchy.
+    async def propagate_from(self, work_item_id: str) -> List[str]:
+        """Roll a work item's stored state up to its ancestors.
         
-        Args:
-            work_item_id: ID of the work item that was updated
-            
-        Returns:
-            List of parent work item IDs that were updated
-        """
-        updated_parents = []
-        
-        try:
-            # Get the work item to find its parent
-            work_item = await self.storage.get_work_item(work_item_id)
-            if not work_item or not work_item.get("parent_id"):
-                return updated_parents
-                
-            parent_id = work_item["parent_id"]
-            
-            # Calculate new progress for the parent
-            children = await self._get_children(parent_id)
-            if children:
-                new_progress = await self._calculate_parent_progress(children)
-                
-                # Determine if parent status should be updated based on children
-                update_data = {
-                    "progress": new_progress,
-                    "updated_at": datetime.now().isoformat()
-                }
-                
-                # Check if all children are completed to update parent status
-                all_completed = all(
-                    child.get("status", "").lower() in ["completed", "done"] 
-                    for child in children
-                )
-                
-                # Check if any children are in progress or completed
-                any_in_progress_or_completed = any(
-                    child.get("status", "").lower() in ["in_progress", "completed", "done"] 
-                    for child in children
-                )
-                
-                # Get current parent status to avoid unnecessary updates
-                parent_item = await self.storage.get_work_item(parent_id)
-                current_parent_status = parent_item.get("status", "not_started").lower() if parent_item else "not_started"
-                
-                # Update parent status based on children's status
-                if all_completed and new_progress >= 100.0:
-                    if current_parent_status != "completed":
-                        update_data["status"] = "completed"
-                        update_data["completed_at"] = datetime.now().isoformat()
-                elif any_in_progress_or_completed and new_progress > 0.0:
-                    # Only update to in_progress if not already completed
-                    if current_parent_status not in ["completed", "done"]:
-                        update_data["status"] = "in_progress"
-                elif new_progress == 0.0:
-                    # If no progress and not completed, should be not_started
-                    if current_parent_status not in ["completed", "done"]:
-                        update_data["status"] = "not_started"
-                
-                # Update parent progress and status
-                await self.storage.update_work_item(parent_id, update_data)
-                
-                updated_parents.append(parent_id)
-                self.logger.info(f"Updated parent {parent_id} progress to {new_progress}%")
-                
-                # Recursively propagate to grandparents
-                grandparent_updates = await self._propagate_progress_to_parents(parent_id)
-                updated_parents.extend(grandparent_updates)
-                
-        except Exception as e:
-            self.logger.error(f"Failed to propagate progress from {work_item_id}: {e}")
-            
-        return updated_parents
-        
-    async def _get_children(self, parent_id: str) -> List[Dict]:
-        """Get direct children of a work item.
+        The item itself is left as written; only ancestors whose progress or
+        status changes are persisted, in one batch.
         
         Args:
-            parent_id: ID of the parent work item
+            work_item_id: Primary ID of a work item that was just written
             
         Returns:
-            List of child work items
+            IDs of the ancestors that were updated
         """
-        try:
-            # Get all work items and filter by parent_id
-            all_items = await self.storage.list_work_items(limit=10000)
-            children = [item for item in all_items if item.get("parent_id") == parent_id]
-            return children
-        except Exception as e:
-            self.logger.error(f"Failed to get children for {parent_id}: {e}")
-            return []
+        rollup = await self._get_rollup()
+        if work_item_id not in rollup.nodes:
+            rollup = await self._get_rollup(reload=True)
+        rollup.touch(work_item_id)
+        updates = rollup.flush()
+        await self._persist(rollup, updates)
+        return list(updates)
             
     async def recalculate_hierarchy_progress(self, root_id: Optional[str] = None) -> Dict[str, any]:
         """Recalculate progress for an entire hierarchy.
@@ -305,19 +222,22 @@ class ProgressCalculator:
             Dict with recalculation results
         """
         try:
-            updated_items = []
-            
-            if root_id:
-                # Recalculate specific hierarchy
-                updated_items = await self._recalculate_subtree(root_id)
-            else:
-                # Recalculate all hierarchies (find root items)
-                all_items = await self.storage.list_work_items(limit=10000)
-                root_items = [item for item in all_items if not item.get("parent_id")]
-                
-                for root_item in root_items:
-                    subtree_updates = await self._recalculate_subtree(root_item["id"])
-                    updated_items.extend(subtree_updates)
+            # One projected scan, then a single post-order pass in memory
+            rollup = await self._get_rollup(reload=True)
+            if root_id and root_id not in rollup.nodes:
+                work_item = await self.storage.get_work_item(root_id)
+                if not work_item:
+                    return {
+                        "success": False,
+                        "error": f"Work item not found: {root_id}"
+                    }
+                root_id = work_item["id"]
+                
+            updates = rollup.recalculate(root_id)
+            await self._persist(rollup, updates)
+            updated_items = list(updates)
+            for item_id, data in updates.items():
+                self.logger.info(f"Recalculated {item_id}: {data}")
                     
             return {
                 "success": True,
@@ -332,88 +252,3 @@ class ProgressCalculator:
                 "success": False,
                 "error": str(e)
             }
-            
-    async def _recalculate_subtree(self, work_item_id: str) -> List[str]:
-        """Recalculate progress for a work item and all its descendants.
-        
-        Args:
-            work_item_id: Root of the subtree to recalculate
-            
-        Returns:
-            List of updated work item IDs
-        """
-        updated_items = []
-        
-        try:
-            # Get children first
-            children = await self._get_children(work_item_id)
-            
-            # Recursively recalculate children first (bottom-up)
-            for child in children:
-                child_updates = await self._recalculate_subtree(child["id"])
-                updated_items.extend(child_updates)
-                
-            # Now recalculate this item's progress
-            new_progress = await self.calculate_work_item_progress(work_item_id)
-            
-            # Update if progress changed or status needs updating
-            work_item = await self.storage.get_work_item(work_item_id)
-            current_progress = work_item.get("progress", 0)
-            current_status = work_item.get("status", "not_started")
-            
-            # Determine if status should be updated based on children and progress
-            update_data = {}
-            
-            # Always update progress if it changed significantly
-            if abs(new_progress - current_progress) > 0.01:
-                update_data["progress"] = new_progress
-                
-            # Update status based on children's completion and progress
-            if children:  # Parent node - update status based on children
-                # Check if all children are completed
-                all_completed = all(
-                    child.get("status", "").lower() in ["completed", "done"] 
-                    for child in children
-                )
-                
-                # Check if any children are in progress or completed
-                any_in_progress_or_completed = any(
-                    child.get("status", "").lower() in ["in_progress", "completed", "done"] 
-                    for child in children
-                )
-                
-                # Update parent status based on children's status
-                if all_completed and new_progress >= 100.0:
-                    if current_status.lower() != "completed":
-                        update_data["status"] = "completed"
-                        update_data["completed_at"] = datetime.now().isoformat()
-                elif any_in_progress_or_completed and new_progress > 0.0:
-                    # Only update to in_progress if not already completed
-                    if current_status.lower() not in ["completed", "done"]:
-                        update_data["status"] = "in_progress"
-                elif new_progress == 0.0:
-                    # If no progress and not completed, should be not_started
-                    if current_status.lower() not in ["completed", "done"]:
-                        update_data["status"] = "not_started"
-            else:  # Leaf node - status should match progress
-                if new_progress >= 100.0 and current_status.lower() not in ["completed", "done"]:
-                    update_data["status"] = "completed"
-                    update_data["completed_at"] = datetime.now().isoformat()
-                elif new_progress > 0.0 and new_progress < 100.0 and current_status.lower() != "in_progress":
-                    update_data["status"] = "in_progress"
-                elif new_progress == 0.0 and current_status.lower() not in ["completed", "done"]:
-                    update_data["status"] = "not_started"
-                    
-            # Apply updates if any changes are needed
-            if update_data:
-                update_data["updated_at"] = datetime.now().isoformat()
-                await self.storage.update_work_item(work_item_id, update_data)
-                updated_items.append(work_item_id)
-                
-                status_change = f" status: {current_status} -> {update_data.get('status', current_status)}" if "status" in update_data else ""
-                self.logger.info(f"Recalculated {work_item_id} progress: {current_progress}% -> {new_progress}%{status_change}")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to recalculate subtree for {work_item_id}: {e}")
-            
-        return updated_items
\ No newline at end of file
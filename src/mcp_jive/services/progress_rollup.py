@@ -0,0 +1,405 @@
+"""Incremental progress rollup engine for MCP Jive.
+
+Keeps the work item tree of one namespace in memory together with per-node
+aggregates over the direct children (child count, completed count, active
+count and progress sum, each child weighted equally). A leaf change applies
+its delta on the way up to the root and stops as soon as an ancestor's
+contribution no longer changes, so propagation costs O(depth) instead of a
+table scan per level. The engine is registered as a LanceDBManager work item
+observer, which keeps it current with writes made through the manager.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Unified status-to-progress mapping for leaf work items
+STATUS_PROGRESS = {
+    "completed": 100.0,
+    "done": 100.0,  # Backend uses 'done'
+    "in_progress": 50.0,  # More conservative than frontend's 60%
+    "blocked": 25.0,  # Slightly less than frontend's 30%
+    "not_started": 0.0,
+    "backlog": 0.0,  # Backend uses 'backlog'
+    "cancelled": 0.0,
+}
+
+COMPLETED_STATUSES = frozenset({"completed", "done"})
+ACTIVE_STATUSES = frozenset({"in_progress", "completed", "done"})
+
+# Columns needed to build the rollup tree
+ROLLUP_COLUMNS = ['id', 'parent_id', 'status', 'progress']
+
+# (effective progress, is completed, is active) a node adds to its parent
+Contribution = Tuple[float, bool, bool]
+
+
+def _normalize_parent(parent_id: Any) -> Optional[str]:
+    """Treat empty and missing parents as root."""
+    if parent_id is None or parent_id == '' or parent_id != parent_id:  # NaN from pandas
+        return None
+    return str(parent_id)
+
+
+def _normalize_status(status: Any) -> str:
+    return str(status or "not_started").lower()
+
+
+def _to_progress(value: Any) -> float:
+    try:
+        progress = float(value or 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+    return 0.0 if progress != progress else progress
+
+
+class RollupNode:
+    """A work item with the aggregates of its direct children."""
+
+    __slots__ = ('id', 'parent_id', 'status', 'progress', 'child_count',
+                 'completed_count', 'active_count', 'progress_sum', 'contributed')
+
+    def __init__(self, item_id: str, parent_id: Optional[str], status: str, progress: float):
+        self.id = item_id
+        self.parent_id = parent_id
+        self.status = status
+        self.progress = progress
+        self.child_count = 0
+        self.completed_count = 0
+        self.active_count = 0
+        self.progress_sum = 0.0
+        # What this node currently adds to its parent's aggregates (None: nothing)
+        self.contributed: Optional[Contribution] = None
+
+
+class ProgressRollup:
+    """In-memory progress rollup over one namespace's work item tree."""
+
+    def __init__(self):
+        self.nodes: Dict[str, RollupNode] = {}
+        self._children: Dict[str, Set[str]] = {}
+        # Nodes whose contribution to their parent may have changed
+        self._stale: Set[str] = set()
+        # Nodes whose aggregates changed and whose own values must be re-derived
+        self._unsettled: Set[str] = set()
+        self.built = False
+
+    # Tree maintenance (work item observer interface)
+    def build(self, rows: Iterable[Dict[str, Any]]) -> None:
+        """Rebuild the tree from rows holding the ROLLUP_COLUMNS.
+
+        Aggregates are computed from the stored statuses as they are; no
+        values are re-derived, so a freshly built tree mirrors the table.
+
+        Args:
+            rows: Work item rows (extra columns are ignored)
+        """
+        self.nodes.clear()
+        self._children.clear()
+        self._stale.clear()
+        self._unsettled.clear()
+        for row in rows:
+            if row.get('id'):
+                self._add_node(row)
+
+        for node in self._post_order(self._roots()):
+            self._push(node)
+
+        self.built = True
+        logger.debug(f"Built progress rollup tree with {len(self.nodes)} items")
+
+    def invalidate(self) -> None:
+        """Drop the tree so it is rebuilt on next use (e.g. after a restore)."""
+        self.nodes.clear()
+        self._children.clear()
+        self._stale.clear()
+        self._unsettled.clear()
+        self.built = False
+
+    def upsert(self, row: Dict[str, Any]) -> None:
+        """Record a created or updated work item.
+
+        Rows may be partial: fields that are absent keep their current value.
+        Only changes that affect the rollup (a new item, a move or a status
+        change) queue work for the next ``flush``.
+
+        Args:
+            row: Work item row with at least 'id'
+        """
+        if not self.built or not row.get('id'):
+            return
+        item_id = str(row['id'])
+        node = self.nodes.get(item_id)
+
+        if node is None:
+            node = self._add_node(row)
+            self._stale.add(item_id)
+            # Items already pointing at this id now have a parent to report to
+            self._stale.update(self._children.get(item_id, ()))
+            return
+
+        if 'parent_id' in row:
+            parent_id = _normalize_parent(row['parent_id'])
+            if parent_id != node.parent_id:
+                self._detach(node)
+                node.parent_id = parent_id
+                if parent_id:
+                    self._children.setdefault(parent_id, set()).add(item_id)
+                self._stale.add(item_id)
+        if 'status' in row:
+            status = _normalize_status(row['status'])
+            if status != node.status:
+                node.status = status
+                self._stale.add(item_id)
+        if 'progress' in row:
+            node.progress = _to_progress(row['progress'])
+
+    def remove(self, item_id: str) -> None:
+        """Remove a work item (its children keep pointing at the removed id)."""
+        node = self.nodes.get(item_id) if self.built else None
+        if node is None:
+            return
+        self._detach(node)
+        del self.nodes[item_id]
+        self._stale.discard(item_id)
+        self._unsettled.discard(item_id)
+        for child_id in self._children.get(item_id, ()):
+            child = self.nodes.get(child_id)
+            if child is not None:
+                child.contributed = None
+
+    def touch(self, item_id: str) -> None:
+        """Queue the ancestors of a work item for re-derivation on next ``flush``.
+
+        The item itself keeps its values; use this after a write whose
+        effect on the tree may not have been observed (e.g. one made before
+        the tree was built).
+        """
+        node = self.nodes.get(item_id) if self.built else None
+        if node is not None and node.parent_id in self.nodes:
+            self._unsettled.add(node.parent_id)
+
+    def _add_node(self, row: Dict[str, Any]) -> RollupNode:
+        item_id = str(row['id'])
+        node = RollupNode(item_id,
+                          _normalize_parent(row.get('parent_id')),
+                          _normalize_status(row.get('status')),
+                          _to_progress(row.get('progress')))
+        self.nodes[item_id] = node
+        if node.parent_id:
+            self._children.setdefault(node.parent_id, set()).add(item_id)
+        return node
+
+    def _detach(self, node: RollupNode) -> None:
+        """Take a node's contribution out of its current parent."""
+        if node.parent_id:
+            siblings = self._children.get(node.parent_id)
+            if siblings is not None:
+                siblings.discard(node.id)
+                if not siblings:
+                    del self._children[node.parent_id]
+            parent = self.nodes.get(node.parent_id)
+            if parent is not None and node.contributed is not None:
+                self._apply(parent, node.contributed, None)
+                self._unsettled.add(parent.id)
+        node.contributed = None
+
+    # Aggregates
+    def children(self, item_id: str) -> List[str]:
+        """Get the ids of the direct children present in the tree."""
+        return [child_id for child_id in self._children.get(item_id, ()) if child_id in self.nodes]
+
+    def effective_progress(self, item_id: str) -> float:
+        """Get the rolled-up progress of a work item.
+
+        Leaves derive their progress from their status; parents average the
+        effective progress of their children.
+
+        Args:
+            item_id: Work item id
+
+        Returns:
+            Progress percentage (0-100), 0.0 for unknown ids
+        """
+        node = self.nodes.get(item_id)
+        return self._effective_progress(node) if node is not None else 0.0
+
+    @staticmethod
+    def _effective_progress(node: RollupNode) -> float:
+        if node.child_count:
+            return round(node.progress_sum / node.child_count, 4)
+        return STATUS_PROGRESS.get(node.status, 0.0)
+
+    def _contribution(self, node: RollupNode) -> Contribution:
+        return (self._effective_progress(node),
+                node.status in COMPLETED_STATUSES,
+                node.status in ACTIVE_STATUSES)
+
+    @staticmethod
+    def _apply(parent: RollupNode, old: Optional[Contribution], new: Optional[Contribution]) -> None:
+        """Replace one child's contribution in the parent's aggregates."""
+        if old is not None:
+            parent.child_count -= 1
+            parent.progress_sum -= old[0]
+            parent.completed_count -= old[1]
+            parent.active_count -= old[2]
+        if new is not None:
+            parent.child_count += 1
+            parent.progress_sum += new[0]
+            parent.completed_count += new[1]
+            parent.active_count += new[2]
+
+    def _push(self, node: RollupNode) -> Optional[RollupNode]:
+        """Bring the parent's aggregates up to date with this node.
+
+        Returns:
+            The parent if its aggregates changed, otherwise None
+        """
+        parent = self.nodes.get(node.parent_id) if node.parent_id else None
+        if parent is None:
+            node.contributed = None
+            return None
+        contribution = self._contribution(node)
+        if contribution == node.contributed:
+            return None
+        self._apply(parent, node.contributed, contribution)
+        node.contributed = contribution
+        return parent
+
+    def _settle(self, node: RollupNode, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Re-derive a node's stored progress and status from its aggregates.
+
+        Parents take the average progress of their children and follow the
+        children's statuses; a completed parent is never reopened. Leaves only
+        have their stored progress synced to their status.
+        """
+        now = datetime.now().isoformat()
+        progress = self._effective_progress(node)
+        changes: Dict[str, Any] = {}
+
+        if abs(progress - node.progress) > 0.01:
+            changes["progress"] = progress
+
+        if node.child_count:
+            status = node.status
+            if node.completed_count == node.child_count and progress >= 100.0:
+                if status != "completed":
+                    changes["status"] = "completed"
+                    changes["completed_at"] = now
+            elif node.active_count and progress > 0.0:
+                if status not in COMPLETED_STATUSES:
+                    changes["status"] = "in_progress"
+            elif progress == 0.0:
+                if status not in COMPLETED_STATUSES:
+                    changes["status"] = "not_started"
+            if changes.get("status") == status:
+                del changes["status"]
+
+        if changes:
+            node.progress = changes.get("progress", node.progress)
+            node.status = changes.get("status", node.status)
+            changes["updated_at"] = now
+            updates.setdefault(node.id, {}).update(changes)
+
+    # Rollup
+    def _walk_up(self, node: RollupNode, updates: Dict[str, Dict[str, Any]]) -> None:
+        """Apply a node's delta to its ancestors until nothing changes."""
+        visited = {node.id}
+        parent = self._push(node)
+        while parent is not None and parent.id not in visited:
+            visited.add(parent.id)
+            self._unsettled.discard(parent.id)
+            self._settle(parent, updates)
+            parent = self._push(parent)
+
+    def flush(self) -> Dict[str, Dict[str, Any]]:
+        """Propagate all pending changes to the root.
+
+        Returns:
+            Updates to persist, keyed by work item id
+        """
+        updates: Dict[str, Dict[str, Any]] = {}
+        while self._unsettled or self._stale:
+            if self._unsettled:
+                node = self.nodes.get(self._unsettled.pop())
+                if node is not None:
+                    self._settle(node, updates)
+                    self._walk_up(node, updates)
+            else:
+                node = self.nodes.get(self._stale.pop())
+                if node is not None:
+                    self._walk_up(node, updates)
+        return updates
+
+    def recalculate(self, root_id: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+        """Re-derive progress and status in one post-order pass.
+
+        Args:
+            root_id: Root of the subtree to recalculate (None for all items);
+                the subtree root's ancestors are updated by a delta walk
+
+        Returns:
+            Updates to persist, keyed by work item id
+        """
+        updates = self.flush()
+        if root_id is None:
+            roots = self._roots()
+        elif root_id in self.nodes:
+            roots = [self.nodes[root_id]]
+        else:
+            return updates
+
+        for node in self._post_order(roots):
+            self._settle(node, updates)
+            if node.id != root_id:
+                self._push(node)
+
+        if root_id is not None:
+            self._walk_up(self.nodes[root_id], updates)
+        return updates
+
+    def _roots(self) -> List[RollupNode]:
+        """Nodes without a parent in the tree, plus one entry per parent cycle."""
+        roots = [node for node in self.nodes.values()
+                 if node.parent_id is None or node.parent_id not in self.nodes]
+        reachable = {node.id for node in self._post_order(roots)}
+        for node in self.nodes.values():
+            if node.id not in reachable:
+                # Only cycles are left; start from any member
+                roots.append(node)
+                reachable.update(n.id for n in self._post_order([node], reachable))
+        return roots
+
+    def _post_order(self, roots: List[RollupNode], seen: Optional[Set[str]] = None) -> List[RollupNode]:
+        """List the subtrees under the given roots children-first."""
+        seen = set(seen) if seen else set()
+        order: List[RollupNode] = []
+        for root in roots:
+            if root.id in seen:
+                continue
+            seen.add(root.id)
+            stack = [(root, False)]
+            while stack:
+                node, expanded = stack.pop()
+                if expanded:
+                    order.append(node)
+                    continue
+                stack.append((node, True))
+                for child_id in self.children(node.id):
+                    if child_id not in seen:
+                        seen.add(child_id)
+                        stack.append((self.nodes[child_id], False))
+        return order
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tree statistics for health reporting."""
+        return {
+            'built': self.built,
+            'items': len(self.nodes),
+            'pending': len(self._stale) + len(self._unsettled)
+        }
+
+
+__all__ = ["ProgressRollup", "RollupNode", "STATUS_PROGRESS", "ROLLUP_COLUMNS"]
@@ -4,9 +4,13 @@ Handles bidirectional synchronization between local file system and LanceDB data
 Manages conflict resolution, change detection, and sync state tracking.
 """
 
+import asyncio
 import json
 import hashlib
 import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List, Tuple, Union
 from datetime import datetime, timezone
 from enum import Enum
@@ -15,6 +19,7 @@ from pathlib import Path
 from ..lancedb_manager import LanceDBManager
 from ..config import ServerConfig
 from .file_format_handler import FileFormatHandler, WorkItemSchema
+from .sync_state import SyncStateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -73,14 +78,29 @@ class SyncResult:
 class SyncEngine:
     """Core synchronization engine."""
     
-    def __init__(self, config: ServerConfig, lancedb_manager: LanceDBManager):
+    # Work item fields never compared or copied from a file onto the stored row
+    DB_MANAGED_FIELDS = ('id', 'item_id', 'vector', 'created_at', 'updated_at')
+    
+    def __init__(self, config: ServerConfig, lancedb_manager: LanceDBManager,
+                 state_path: Optional[str] = None):
+        """Initialize the sync engine.
+        
+        Args:
+            config: Server configuration
+            lancedb_manager: Manager of the namespace files are synced into
+            state_path: File the sync state is persisted to (default:
+                sync_state.json in the namespace database directory)
+        """
         self.config = config
         self.lancedb_manager = lancedb_manager
         self.file_handler = FileFormatHandler()
         self.logger = logging.getLogger(__name__)
         
-        # Sync state tracking
-        self.sync_state: Dict[str, Dict[str, Any]] = {}
+        # Sync state tracking: file path → work item id, checksum and stat
+        if state_path is None and lancedb_manager is not None:
+            state_path = os.path.join(lancedb_manager.get_database_path(), "sync_state.json")
+        self.sync_state = SyncStateIndex(state_path)
+        self._sync_state_lock = asyncio.Lock()
         self.active_syncs: Dict[str, Dict[str, Any]] = {}
         
     async def initialize(self) -> None:
@@ -140,6 +160,7 @@ class SyncEngine:
             
             # Update sync state
             await self._update_sync_state(file_path, work_item.id, file_content)
+            await self._save_sync_state()
             
             return SyncResult(
                 status=SyncStatus.SUCCESS,
@@ -223,6 +244,147 @@ class SyncEngine:
                 work_item_id=work_item_id
             )
             
+    async def sync_directory(self,
+                             directory: str,
+                             conflict_resolution: ConflictResolution = ConflictResolution.AUTO_MERGE,
+                             recursive: bool = True,
+                             force: bool = False,
+                             max_workers: Optional[int] = None) -> SyncResult:
+        """Sync every work item file under a directory to the database.
+        
+        Files are stat'ed first; those whose mtime and size match the sync
+        state are skipped without being read. The rest are read, hashed and
+        parsed concurrently in a thread pool, where a file whose content hash
+        is unchanged (e.g. only touched) just has its stat refreshed. Changed
+        work items are compared with the stored rows fetched in one query and
+        written with a single bulk upsert, containing only the fields that
+        differ, and the sync state is saved once at the end.
+        
+        Args:
+            directory: Directory holding work item files
+            conflict_resolution: Strategy for handling conflicts
+            recursive: Include subdirectories
+            force: Re-read and re-apply every file regardless of the sync state
+            max_workers: Size of the parsing thread pool (default: ThreadPoolExecutor's)
+            
+        Returns:
+            SyncResult with per-directory counts, conflicts and errors
+        """
+        started = time.perf_counter()
+        directory = os.path.abspath(directory)
+        try:
+            self.logger.info(f"Syncing directory to database: {directory}")
+            files = await asyncio.to_thread(self._scan_directory, directory, recursive)
+            
+            candidates: List[Tuple[str, Optional[str]]] = []
+            unchanged = 0
+            for path, (mtime_ns, size) in files.items():
+                entry = self.sync_state.get(path)
+                if entry is not None and not force and entry.matches_stat(mtime_ns, size):
+                    unchanged += 1
+                else:
+                    candidates.append((path, entry.checksum if entry is not None and not force else None))
+                    
+            # Deleted files are forgotten; their work items stay in the database
+            removed = [path for path in self.sync_state.under(directory) if path not in files]
+            for path in removed:
+                self.sync_state.remove(path)
+                
+            outcomes: List[Any] = []
+            if candidates:
+                loop = asyncio.get_running_loop()
+                with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="jive-sync") as executor:
+                    outcomes = await asyncio.gather(*(
+                        loop.run_in_executor(executor, self._read_and_parse, path, checksum)
+                        for path, checksum in candidates
+                    ), return_exceptions=True)
+                    
+            touched = 0
+            parsed: List[Tuple[str, str, WorkItemSchema]] = []
+            errors: List[Dict[str, str]] = []
+            for (path, _), outcome in zip(candidates, outcomes):
+                if isinstance(outcome, Exception):
+                    errors.append({"file_path": path, "error": str(outcome)})
+                    continue
+                checksum, content_changed, work_item = outcome
+                if not content_changed:
+                    self.sync_state.touch(path, *files[path])
+                    touched += 1
+                elif work_item is None:
+                    errors.append({"file_path": path, "error": "Failed to parse file content"})
+                else:
+                    parsed.append((path, checksum, work_item))
+                    
+            rows: List[Dict[str, Any]] = []
+            applied: List[Tuple[str, str, str]] = []
+            conflicts: List[Dict[str, Any]] = []
+            if parsed:
+                existing = {
+                    row['id']: self._normalize_db_row(row)
+                    for row in await self.lancedb_manager.get_work_items_by_ids(
+                        [work_item.id for _, _, work_item in parsed]
+                    )
+                }
+                for path, checksum, work_item in parsed:
+                    current = existing.get(work_item.id)
+                    data = work_item.model_dump()
+                    if current is None:
+                        rows.append(self._to_db_row(data))
+                    else:
+                        conflict_result = await self._handle_conflict(
+                            work_item, current, conflict_resolution, SyncDirection.FILE_TO_DB
+                        )
+                        if conflict_result.status == SyncStatus.CONFLICT:
+                            conflict_result.file_path = path
+                            conflict_result.work_item_id = work_item.id
+                            conflicts.append(conflict_result.to_dict())
+                            continue
+                        resolved = conflict_result.metadata.get("resolved_item", data)
+                        changes = self._changed_fields(self._to_db_row(resolved), current)
+                        if changes:
+                            rows.append({'id': work_item.id, **changes})
+                    applied.append((path, work_item.id, checksum))
+                    
+                if rows:
+                    await self.lancedb_manager.upsert_work_items(rows)
+                    
+            for path, work_item_id, checksum in applied:
+                self.sync_state.record(path, work_item_id, checksum, *files[path])
+            await self._save_sync_state()
+            
+            if conflicts:
+                status = SyncStatus.CONFLICT
+            elif errors:
+                status = SyncStatus.ERROR
+            else:
+                status = SyncStatus.SUCCESS
+            return SyncResult(
+                status=status,
+                message=(f"Synced {len(applied)} of {len(files)} files from {directory} "
+                         f"({unchanged + touched} unchanged, {len(conflicts)} conflicts, {len(errors)} errors)"),
+                file_path=directory,
+                conflicts=[c["message"] for c in conflicts],
+                metadata={
+                    "scanned": len(files),
+                    "unchanged": unchanged,
+                    "touched": touched,
+                    "synced": len(applied),
+                    "written": len(rows),
+                    "removed": removed,
+                    "conflict_details": conflicts,
+                    "errors": errors,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+                }
+            )
+            
+        except Exception as e:
+            self.logger.error(f"Error syncing directory to database: {e}")
+            return SyncResult(
+                status=SyncStatus.ERROR,
+                message=f"Error syncing directory to database: {str(e)}",
+                file_path=directory
+            )
+            
     async def get_sync_status(self, identifier: str) -> Dict[str, Any]:
         """Get sync status for a file path or work item ID.
         
@@ -234,17 +396,9 @@ class SyncEngine:
         """
         try:
             # Check if identifier is in sync state
-            if identifier in self.sync_state:
-                state = self.sync_state[identifier]
-                return {
-                    "identifier": identifier,
-                    "last_sync": state.get("last_sync"),
-                    "checksum": state.get("checksum"),
-                    "work_item_id": state.get("work_item_id"),
-                    "file_path": state.get("file_path"),
-                    "sync_direction": state.get("sync_direction"),
-                    "status": "synced"
-                }
+            entry = self.sync_state.lookup(identifier)
+            if entry is not None:
+                return {"identifier": identifier, **entry.to_dict(), "status": "synced"}
                 
             # Check active syncs
             if identifier in self.active_syncs:
@@ -286,7 +440,7 @@ class SyncEngine:
                               direction: SyncDirection) -> SyncResult:
         """Handle conflicts between file and database versions."""
         try:
-            new_data = new_item.dict() if isinstance(new_item, WorkItemSchema) else new_item
+            new_data = new_item.model_dump() if isinstance(new_item, WorkItemSchema) else new_item
             
             # Detect conflicts
             conflicts = await self._detect_conflicts(new_data, existing_item)
@@ -397,23 +551,22 @@ class SyncEngine:
     async def _update_sync_state(self, file_path: str, work_item_id: str, content: str) -> None:
         """Update sync state tracking."""
         checksum = await self._calculate_checksum(content)
-        
-        self.sync_state[file_path] = {
-            "work_item_id": work_item_id,
-            "file_path": file_path,
-            "checksum": checksum,
-            "last_sync": datetime.now(timezone.utc).isoformat(),
-            "sync_direction": "bidirectional"
-        }
-        
-        # Also track by work item ID
-        self.sync_state[work_item_id] = self.sync_state[file_path].copy()
+        self.sync_state.record(file_path, work_item_id, checksum)
         
     async def _load_sync_state(self) -> None:
         """Load sync state from storage."""
-        # In a real implementation, this would load from a persistent store
-        # For now, initialize empty state
-        self.sync_state = {}
+        await asyncio.to_thread(self.sync_state.load)
+        self.logger.info(f"Loaded sync state for {len(self.sync_state)} files")
+        
+    async def _save_sync_state(self) -> None:
+        """Persist sync state if it changed."""
+        async with self._sync_state_lock:
+            if not self.sync_state.dirty:
+                return
+            changes = self.sync_state.changes
+            await asyncio.to_thread(self.sync_state.write, self.sync_state.snapshot())
+            # Only now is the snapshot on disk; a failed write leaves the index dirty
+            self.sync_state.mark_saved(changes)
         
     async def _get_work_item_from_db(self, work_item_id: str) -> Optional[Dict[str, Any]]:
         """Get work item from LanceDB database."""
@@ -436,16 +589,78 @@ class SyncEngine:
             data['updated_at'] = datetime.now(timezone.utc).isoformat()
             
             # Use LanceDB manager to update
-            await self.lancedb_manager.upsert_object(
-                class_name="Task",
-                object_id=work_item.id,
-                properties=data
-            )
+            await self.lancedb_manager.upsert_work_items([self._to_db_row(data)])
             
         except Exception as e:
             self.logger.error(f"Error updating work item in database: {e}")
             raise
             
+    def _scan_directory(self, directory: str, recursive: bool) -> Dict[str, Tuple[int, int]]:
+        """Map each supported file under a directory to its (mtime_ns, size) (blocking)."""
+        found: Dict[str, Tuple[int, int]] = {}
+        pending = [directory]
+        while pending:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        if recursive:
+                            pending.append(entry.path)
+                    elif entry.is_file() and self.file_handler.is_supported_format(entry.name):
+                        stat = entry.stat()
+                        found[entry.path] = (stat.st_mtime_ns, stat.st_size)
+        return found
+        
+    def _read_and_parse(self, file_path: str,
+                        previous_checksum: Optional[str]) -> Tuple[str, bool, Optional[WorkItemSchema]]:
+        """Read, hash and (if the content changed) parse a file (blocking).
+        
+        Returns:
+            The content checksum, whether it differs from previous_checksum,
+            and the parsed work item (None if unchanged or unparseable)
+        """
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        checksum = hashlib.sha256(data).hexdigest()
+        if checksum == previous_checksum:
+            return checksum, False, None
+        return checksum, True, self.file_handler.parse_content(data.decode('utf-8'), file_path)
+        
+    @staticmethod
+    def _normalize_db_row(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Stored row with timestamps as ISO strings, comparable with file data."""
+        return {key: value.isoformat() if isinstance(value, datetime) else value
+                for key, value in row.items()}
+        
+    @staticmethod
+    def _to_db_row(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map work item file data onto WorkItem columns."""
+        row = dict(data)
+        if 'type' in row:
+            row['item_type'] = row.pop('type')
+        if isinstance(row.get('metadata'), dict):
+            row['metadata'] = json.dumps(row['metadata'])
+        return row
+        
+    def _changed_fields(self, row: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Fields of row that differ from the stored row (unchanged text keeps its vector)."""
+        def parse_metadata(value):
+            try:
+                return json.loads(value) if isinstance(value, str) else value
+            except ValueError:
+                return value
+                
+        changes = {}
+        for key, value in row.items():
+            if key in self.DB_MANAGED_FIELDS or key not in current:
+                continue
+            stored = current[key]
+            if key == 'metadata':
+                if parse_metadata(value) != parse_metadata(stored):
+                    changes[key] = value
+            elif value != stored:
+                changes[key] = value
+        return changes
+        
     async def _generate_file_path(self, work_item: WorkItemSchema, format_ext: str) -> str:
         """Generate file path for work item."""
         # Create path based on work item type and ID
@@ -469,8 +684,8 @@ class SyncEngine:
             # Clear active syncs
             self.active_syncs.clear()
             
-            # Save sync state if needed
-            # In a real implementation, this would persist the state
+            # Save sync state
+            await self._save_sync_state()
             
             self.logger.info("Sync Engine cleanup completed")
             
@@ -0,0 +1,198 @@
+"""Persistent sync state index for the Sync Engine.
+
+Maps each synced file path to its work item id, the SHA-256 of its content
+and the mtime/size it had when it was last synced. The index is kept in
+memory and written as one compact JSON document (a field list plus one
+array per file), replaced atomically so a crash never leaves a partial
+file. With it, a restarted engine can tell unchanged files from a stat
+call alone instead of re-reading and re-parsing them.
+"""
+
+import json
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+STATE_VERSION = 1
+STATE_FIELDS = ["file_path", "work_item_id", "checksum", "mtime_ns", "size", "last_sync"]
+
+
+@dataclass
+class SyncStateEntry:
+    """Sync state of one file."""
+    file_path: str
+    work_item_id: str
+    checksum: str
+    mtime_ns: Optional[int] = None  # None when the content did not come from a local file
+    size: Optional[int] = None
+    last_sync: str = ""
+
+    def matches_stat(self, mtime_ns: int, size: int) -> bool:
+        """Whether a file's stat says it is unchanged since the last sync."""
+        return self.mtime_ns == mtime_ns and self.size == size
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to the dictionary shape reported by get_sync_status."""
+        return {
+            "work_item_id": self.work_item_id,
+            "file_path": self.file_path,
+            "checksum": self.checksum,
+            "mtime_ns": self.mtime_ns,
+            "size": self.size,
+            "last_sync": self.last_sync,
+            "sync_direction": "bidirectional"
+        }
+
+
+class SyncStateIndex:
+    """File path → sync state, with a reverse work item id lookup."""
+
+    def __init__(self, path: Optional[str] = None):
+        """Initialize the index.
+
+        Args:
+            path: JSON file the index is persisted to (None keeps it in memory only)
+        """
+        self.path = path
+        self._entries: Dict[str, SyncStateEntry] = {}
+        self._by_work_item: Dict[str, str] = {}
+        # Mutation counter, and its value when the file was last written
+        self.changes = 0
+        self._saved_changes = 0
+
+    @property
+    def dirty(self) -> bool:
+        """Whether the index changed since it was last written."""
+        return self.changes != self._saved_changes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[SyncStateEntry]:
+        return iter(list(self._entries.values()))
+
+    def get(self, file_path: str) -> Optional[SyncStateEntry]:
+        """Sync state of a file path."""
+        return self._entries.get(file_path)
+
+    def lookup(self, identifier: str) -> Optional[SyncStateEntry]:
+        """Sync state by file path or work item id."""
+        entry = self._entries.get(identifier)
+        if entry is None and identifier in self._by_work_item:
+            entry = self._entries.get(self._by_work_item[identifier])
+        return entry
+
+    def record(self, file_path: str, work_item_id: str, checksum: str,
+               mtime_ns: Optional[int] = None, size: Optional[int] = None) -> SyncStateEntry:
+        """Record a completed sync of a file.
+
+        Args:
+            file_path: Synced file
+            work_item_id: Work item the file holds
+            checksum: SHA-256 of the synced content
+            mtime_ns: File modification time, if read from disk
+            size: File size in bytes, if read from disk
+
+        Returns:
+            The new entry
+        """
+        previous = self._entries.get(file_path)
+        if previous is not None and self._by_work_item.get(previous.work_item_id) == file_path:
+            del self._by_work_item[previous.work_item_id]
+        entry = SyncStateEntry(file_path, work_item_id, checksum, mtime_ns, size,
+                               datetime.now(timezone.utc).isoformat())
+        self._entries[file_path] = entry
+        self._by_work_item[work_item_id] = file_path
+        self.changes += 1
+        return entry
+
+    def touch(self, file_path: str, mtime_ns: int, size: int) -> None:
+        """Update the stat of a file whose content is unchanged."""
+        entry = self._entries[file_path]
+        entry.mtime_ns = mtime_ns
+        entry.size = size
+        self.changes += 1
+
+    def remove(self, file_path: str) -> None:
+        """Forget a file."""
+        entry = self._entries.pop(file_path, None)
+        if entry is not None:
+            if self._by_work_item.get(entry.work_item_id) == file_path:
+                del self._by_work_item[entry.work_item_id]
+            self.changes += 1
+
+    def under(self, directory: str) -> List[str]:
+        """Tracked file paths inside a directory."""
+        prefix = os.path.join(directory, "")
+        return [path for path in self._entries if path.startswith(prefix)]
+
+    # Persistence
+    def load(self) -> None:
+        """Read the index from its file; a missing or unreadable file gives an empty index."""
+        self._entries = {}
+        self._by_work_item = {}
+        self.changes = self._saved_changes = 0
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                document = json.load(f)
+            if document.get("version") != STATE_VERSION:
+                raise ValueError(f"unsupported version {document.get('version')}")
+            fields = document["fields"]
+            for values in document["entries"]:
+                entry = SyncStateEntry(**dict(zip(fields, values)))
+                self._entries[entry.file_path] = entry
+                self._by_work_item[entry.work_item_id] = entry.file_path
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable sync state {self.path}: {e}")
+            self._entries = {}
+            self._by_work_item = {}
+
+    def snapshot(self) -> bytes:
+        """Serialize the index (call on the thread that mutates it).
+
+        The index stays dirty until mark_saved confirms the data was written.
+        """
+        document = {
+            "version": STATE_VERSION,
+            "fields": STATE_FIELDS,
+            "entries": [[getattr(entry, field) for field in STATE_FIELDS]
+                        for entry in self._entries.values()]
+        }
+        return json.dumps(document, separators=(",", ":")).encode("utf-8")
+
+    def write(self, data: bytes) -> None:
+        """Atomically replace the index file with serialized data (blocking)."""
+        if not self.path:
+            return
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # A unique temp file per write, so concurrent saves never share one
+        fd, temp_path = tempfile.mkstemp(prefix=".sync_state.", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(temp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def mark_saved(self, changes: int) -> None:
+        """Record a successful write of the snapshot taken at a change count.
+
+        Args:
+            changes: Value of ``changes`` when the written snapshot was taken
+        """
+        self._saved_changes = max(self._saved_changes, changes)
+
+
+__all__ = ["SyncStateEntry", "SyncStateIndex"]
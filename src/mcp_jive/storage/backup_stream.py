@@ -0,0 +1,262 @@
+"""Streaming backup files for MCP Jive work items.
+
+A backup is newline-delimited JSON, gzip-compressed by default: a header
+line, one line per work item and a trailer line holding the item count. It
+is written in a single pass from an async row iterator: rows are encoded in
+chunks on the event loop while compression, file writes and the MD5
+checksum of the bytes on disk run in a worker thread. Reading is likewise
+streamed in batches, so both directions use memory bounded by the chunk and
+batch sizes rather than the number of work items.
+
+Backups written before this format (a single JSON document with a
+``work_items`` list) can still be read.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+
+BACKUP_FORMAT = "ndjson"
+BACKUP_VERSION = "2.0"
+
+# Encoded bytes handed to the writer thread at a time
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+# Work items parsed per restore batch
+DEFAULT_RESTORE_BATCH_SIZE = 500
+
+
+class BackupIntegrityError(ValueError):
+    """Raised when a backup file is truncated or malformed."""
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if hasattr(value, 'tolist'):  # numpy scalars and arrays
+        return value.tolist()
+    return str(value)
+
+
+def _encode_line(record: Dict[str, Any]) -> bytes:
+    return (json.dumps(record, ensure_ascii=False, default=_json_default) + "\n").encode("utf-8")
+
+
+class _ChecksumFile:
+    """File wrapper hashing every byte written to disk."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "wb")
+        self.md5 = hashlib.md5()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.md5.update(data)
+        self.size += len(data)
+        return self._file.write(data)
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class BackupWriter:
+    """Synchronous NDJSON writer with optional gzip; call it from a worker thread."""
+
+    def __init__(self, path: str, compress: bool = True, compression_level: int = 6):
+        self.path = path
+        self._raw = _ChecksumFile(path)
+        self._out = (gzip.GzipFile(fileobj=self._raw, mode="wb", compresslevel=compression_level)
+                     if compress else self._raw)
+
+    def write(self, data: bytes) -> None:
+        self._out.write(data)
+
+    def close(self) -> Dict[str, Any]:
+        """Finish the file.
+
+        Returns:
+            Size in bytes and MD5 checksum of the file on disk
+        """
+        if self._out is not self._raw:
+            self._out.close()
+        self._raw.close()
+        return {"size": self._raw.size, "checksum": self._raw.md5.hexdigest()}
+
+
+async def write_backup(rows: AsyncIterator[Dict[str, Any]], path: str, header: Dict[str, Any],
+                       compress: bool = True, compression_level: int = 6,
+                       chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Dict[str, Any]:
+    """Stream work item rows into a backup file.
+
+    Args:
+        rows: Async iterator of work item rows
+        path: File to write
+        header: Backup metadata stored in the first line
+        compress: Gzip the file
+        compression_level: Gzip compression level (0-9)
+        chunk_bytes: Encoded bytes buffered before each hand-off to the writer thread
+
+    Returns:
+        Number of items written, file size and MD5 checksum
+    """
+    writer = await asyncio.to_thread(BackupWriter, path, compress, compression_level)
+    try:
+        chunk: List[bytes] = [_encode_line({"_header": {**header, "format": BACKUP_FORMAT,
+                                                        "version": BACKUP_VERSION}})]
+        buffered = len(chunk[0])
+        total = 0
+        async for row in rows:
+            line = _encode_line(row)
+            chunk.append(line)
+            buffered += len(line)
+            total += 1
+            if buffered >= chunk_bytes:
+                await asyncio.to_thread(writer.write, b"".join(chunk))
+                chunk, buffered = [], 0
+        chunk.append(_encode_line({"_trailer": {"total_items": total}}))
+        await asyncio.to_thread(writer.write, b"".join(chunk))
+    finally:
+        result = await asyncio.to_thread(writer.close)
+    return {"total_items": total, **result}
+
+
+class BackupReader:
+    """Synchronous batch reader for backup files; call it from a worker thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = gzip.open(path, "rb") if path.endswith(".gz") else open(path, "rb")
+        self.header: Dict[str, Any] = {}
+        self.total_items: Optional[int] = None
+        self._legacy_items: Optional[Iterator[Dict[str, Any]]] = None
+        self._read = 0
+
+        try:
+            first = self._file.readline()
+            try:
+                record = json.loads(first)
+            except ValueError:
+                # An indented legacy document does not parse line by line
+                record = None
+            if isinstance(record, dict) and "_header" in record:
+                self.header = record["_header"]
+                return
+            # Legacy single-document backup: the whole file is one JSON value
+            rest = self._file.read()
+            document = json.loads(first + rest)
+        except (OSError, EOFError, ValueError) as e:
+            self.close()
+            raise BackupIntegrityError(f"Unreadable backup file: {e}") from e
+        if not isinstance(document, dict) or not isinstance(document.get("work_items"), list):
+            self.close()
+            raise BackupIntegrityError("Backup file has no work items")
+        self.header = {k: v for k, v in document.items() if k != "work_items"}
+        self.total_items = len(document["work_items"])
+        self._legacy_items = iter(document["work_items"])
+
+    def read_batch(self, batch_size: int) -> List[Dict[str, Any]]:
+        """Read up to batch_size work items; an empty list means the end.
+
+        Raises:
+            BackupIntegrityError: If the file is truncated, corrupt or its
+                item count does not match the trailer
+        """
+        batch: List[Dict[str, Any]] = []
+        if self._legacy_items is not None:
+            for item in self._legacy_items:
+                batch.append(item)
+                if len(batch) >= batch_size:
+                    break
+            return batch
+
+        while len(batch) < batch_size and self.total_items is None:
+            try:
+                line = self._file.readline()
+                record = json.loads(line) if line else None
+            except (OSError, EOFError, ValueError) as e:
+                raise BackupIntegrityError(f"Corrupt backup file: {e}") from e
+            if record is None:
+                raise BackupIntegrityError("Backup file is truncated (no trailer)")
+            if "_trailer" in record:
+                self.total_items = record["_trailer"].get("total_items")
+                if self.total_items != self._read + len(batch):
+                    raise BackupIntegrityError(
+                        f"Backup holds {self._read + len(batch)} items, trailer says {self.total_items}"
+                    )
+                break
+            batch.append(record)
+        self._read += len(batch)
+        return batch
+
+    def close(self) -> None:
+        self._file.close()
+
+
+async def iter_backup_batches(path: str, batch_size: int = DEFAULT_RESTORE_BATCH_SIZE,
+                              header: Optional[Dict[str, Any]] = None
+                              ) -> AsyncIterator[List[Dict[str, Any]]]:
+    """Stream the work items of a backup file in batches.
+
+    Integrity is checked as the file is read: a truncated or corrupt file
+    raises BackupIntegrityError once the damaged part is reached.
+
+    Args:
+        path: Backup file
+        batch_size: Work items per batch
+        header: Dictionary filled with the backup header once the file is opened
+
+    Yields:
+        Lists of work item dictionaries
+    """
+    reader = await asyncio.to_thread(BackupReader, path)
+    if header is not None:
+        header.update(reader.header)
+    try:
+        while True:
+            batch = await asyncio.to_thread(reader.read_batch, batch_size)
+            if not batch:
+                return
+            yield batch
+    finally:
+        await asyncio.to_thread(reader.close)
+
+
+async def verify_backup(path: str, batch_size: int = DEFAULT_RESTORE_BATCH_SIZE) -> Dict[str, Any]:
+    """Read a backup file end to end without keeping its items.
+
+    Args:
+        path: Backup file
+        batch_size: Work items parsed at a time
+
+    Returns:
+        The backup header and its number of work items
+
+    Raises:
+        BackupIntegrityError: If the file is truncated or malformed
+    """
+    reader = await asyncio.to_thread(BackupReader, path)
+    try:
+        total = 0
+        while True:
+            batch = await asyncio.to_thread(reader.read_batch, batch_size)
+            if not batch:
+                break
+            total += len(batch)
+        return {"header": reader.header, "total_items": total}
+    finally:
+        await asyncio.to_thread(reader.close)
+
+
+__all__ = [
+    "BackupIntegrityError",
+    "BackupReader",
+    "BackupWriter",
+    "iter_backup_batches",
+    "verify_backup",
+    "write_backup",
+]
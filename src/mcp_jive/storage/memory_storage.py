@@ -17,20 +17,43 @@ from ..models.memory import (
     TroubleshootItemMatch
 )
 from ..lancedb_manager import LanceDBManager
+from ..namespace.context import get_current_namespace
 
 logger = logging.getLogger(__name__)
 
 
-class ArchitectureMemoryStorage:
+class _NamespaceRoutedStorage:
+    """Resolves the LanceDB manager from the current request's namespace."""
+
+    def __init__(self, db_manager: LanceDBManager, manager_pool=None):
+        self._db_manager = db_manager
+        self.manager_pool = manager_pool
+
+    @property
+    def db_manager(self) -> LanceDBManager:
+        """LanceDB manager for the namespace of the current request context."""
+        namespace = get_current_namespace()
+        if namespace and self.manager_pool:
+            return self.manager_pool.get(namespace)
+        return self._db_manager
+
+    @db_manager.setter
+    def db_manager(self, db_manager: LanceDBManager) -> None:
+        """Set the default-namespace LanceDB manager."""
+        self._db_manager = db_manager
+
+
+class ArchitectureMemoryStorage(_NamespaceRoutedStorage):
     """Storage layer for Architecture Memory items."""
 
-    def __init__(self, db_manager: LanceDBManager):
+    def __init__(self, db_manager: LanceDBManager, manager_pool=None):
         """Initialize Architecture Memory storage.
 
         Args:
-            db_manager: LanceDB manager instance
+            db_manager: LanceDB manager instance (default namespace)
+            manager_pool: Optional per-namespace manager pool for request-scoped namespaces
         """
-        self.db_manager = db_manager
+        super().__init__(db_manager, manager_pool)
         self.table_name = "ArchitectureMemory"
 
     async def create(self, item: ArchitectureItem) -> ArchitectureItem:
@@ -316,16 +339,17 @@ class ArchitectureMemoryStorage:
         )
 
 
-class TroubleshootMemoryStorage:
+class TroubleshootMemoryStorage(_NamespaceRoutedStorage):
     """Storage layer for Troubleshoot Memory items."""
 
-    def __init__(self, db_manager: LanceDBManager):
+    def __init__(self, db_manager: LanceDBManager, manager_pool=None):
         """Initialize Troubleshoot Memory storage.
 
         Args:
-            db_manager: LanceDB manager instance
+            db_manager: LanceDB manager instance (default namespace)
+            manager_pool: Optional per-namespace manager pool for request-scoped namespaces
         """
-        self.db_manager = db_manager
+        super().__init__(db_manager, manager_pool)
         self.table_name = "TroubleshootMemory"
 
     async def create(self, item: TroubleshootItem) -> TroubleshootItem:
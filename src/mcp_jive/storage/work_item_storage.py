@@ -6,11 +6,14 @@ the consolidated tools to interact with work item data.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import AsyncIterator, Dict, Any, List, Optional, Union
 from datetime import datetime
 from uuid import uuid4
 
 from ..lancedb_manager import LanceDBManager
+from ..lancedb_pool import LanceDBManagerPool
+from ..pagination import sql_literal
+from ..namespace.context import get_current_namespace, set_current_namespace
 from ..models.workflow import WorkItem, WorkItemType, WorkItemStatus, Priority
 # Removed circular import - ProgressCalculator will be injected
 
@@ -20,27 +23,47 @@ logger = logging.getLogger(__name__)
 class WorkItemStorage:
     """Storage layer for work items using LanceDB backend."""
     
-    def __init__(self, lancedb_manager: Optional[LanceDBManager] = None, progress_calculator=None):
+    def __init__(self, lancedb_manager: Optional[LanceDBManager] = None, progress_calculator=None,
+                 manager_pool: Optional[LanceDBManagerPool] = None):
         """Initialize the work item storage.
         
         Args:
             lancedb_manager: LanceDB manager instance
             progress_calculator: Progress calculator instance (injected dependency)
+            manager_pool: Shared per-namespace manager pool (created from lancedb_manager if omitted)
         """
         self.lancedb_manager = lancedb_manager
         self.progress_calculator = progress_calculator
+        if manager_pool is None and lancedb_manager is not None:
+            manager_pool = LanceDBManagerPool(lancedb_manager)
+        self.manager_pool = manager_pool
         self.is_initialized = False
         
-        # Namespace context
-        self.current_namespace: Optional[str] = None
+    @property
+    def lancedb_manager(self) -> Optional[LanceDBManager]:
+        """LanceDB manager for the namespace of the current request context."""
+        namespace = get_current_namespace()
+        if namespace and self.manager_pool:
+            return self.manager_pool.get(namespace)
+        return self._lancedb_manager
+    
+    @lancedb_manager.setter
+    def lancedb_manager(self, manager: Optional[LanceDBManager]) -> None:
+        """Set the default-namespace LanceDB manager."""
+        self._lancedb_manager = manager
+    
+    @property
+    def current_namespace(self) -> Optional[str]:
+        """Namespace of the current request context."""
+        return get_current_namespace()
         
     async def initialize(self) -> None:
         """Initialize the storage backend."""
         if self.is_initialized:
             return
             
-        if self.lancedb_manager and not self.lancedb_manager._initialized:
-            await self.lancedb_manager.initialize()
+        # The LanceDB manager connects on first use, so registering tools
+        # does not wait for LanceDB to be imported
             
         # Progress calculator should be injected via dependency injection
         # self.progress_calculator is set in __init__ or can be set later
@@ -50,6 +73,9 @@ class WorkItemStorage:
         
     async def cleanup(self) -> None:
         """Cleanup storage resources."""
+        if self.manager_pool:
+            await self.manager_pool.close_all()
+            self.lancedb_manager = self.manager_pool.default_manager
         if self.lancedb_manager:
             await self.lancedb_manager.cleanup()
         self.is_initialized = False
@@ -63,7 +89,8 @@ class WorkItemStorage:
         Returns:
             Created work item data
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         # Convert WorkItem model to dict if needed
@@ -110,40 +137,34 @@ class WorkItemStorage:
             
         # DEBUG: Log current namespace and database path
         current_namespace = self.get_current_namespace()
-        db_path = self.lancedb_manager.db_path if self.lancedb_manager else "unknown"
+        db_path = manager.db_path if manager else "unknown"
         logger.info(f"🏪 STORAGE DEBUG: Creating work item in namespace '{current_namespace}' at path '{db_path}'")
         logger.info(f"🏪 STORAGE DEBUG: Work item title: '{data.get('title', 'NO_TITLE')}'")
 
         # Store in LanceDB
-        await self.lancedb_manager.create_work_item(data)
+        await manager.create_work_item(data)
 
         logger.info(f"🏪 STORAGE DEBUG: Work item created with ID '{data['id']}' in namespace '{current_namespace}'")
         return data
         
-    async def get_work_item(self, work_item_id: str) -> Optional[Dict[str, Any]]:
-        """Get a work item by ID.
+    async def get_work_item(self, work_item_id: str,
+                            columns: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """Get a work item by ID or item_id.
         
         Args:
-            work_item_id: Work item ID
+            work_item_id: Primary id or item_id
+            columns: Columns to read (default: all but the embedding vector)
             
         Returns:
             Work item data or None if not found
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
-            # Search by ID in LanceDB
-            table = await self.lancedb_manager.get_table("WorkItem")
-            results = table.search().where(f"id = '{work_item_id}'").limit(1).to_pandas()
-            
-            if len(results) > 0:
-                # Convert pandas row to dict
-                work_item = results.iloc[0].to_dict()
-                # Use LanceDBManager's comprehensive numpy conversion
-                work_item = self.lancedb_manager._convert_numpy_to_python(work_item)
-                return work_item
-            return None
+            # Resolve ids exactly as the manager does
+            return await manager.get_work_item(work_item_id, columns)
             
         except Exception as e:
             logger.error(f"Error getting work item {work_item_id}: {e}")
@@ -159,7 +180,8 @@ class WorkItemStorage:
         Returns:
             Updated work item data
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         # Get existing work item
@@ -168,6 +190,7 @@ class WorkItemStorage:
             raise ValueError(f"Work item {work_item_id} not found")
             
         # Merge updates
+        changes = dict(updates)
         updated_data = existing.copy()
         updated_data.update(updates)
         updated_data['updated_at'] = datetime.utcnow().isoformat()
@@ -181,25 +204,19 @@ class WorkItemStorage:
             sequence_number, order_index = await self._generate_sequence_number(new_parent_id)
             updated_data['sequence_number'] = sequence_number
             updated_data['order_index'] = order_index
+            changes['sequence_number'] = sequence_number
+            changes['order_index'] = order_index
             logger.info(f"Regenerated sequence number for work item {work_item_id}: {sequence_number}")
         
-        # Delete old record and create new one (LanceDB update pattern)
-        table = await self.lancedb_manager.get_table("WorkItem")
-        table.delete(f"id = '{work_item_id}'")
+        # Write only the changed columns in place
+        await manager.update_work_item(work_item_id, changes)
         
-        # Create updated record
-        await self.lancedb_manager.create_work_item(updated_data)
-        
-        # Trigger progress propagation if progress or status changed
+        # Roll progress or status changes up to the ancestors; the item keeps
+        # exactly what was written
         if self.progress_calculator and ('progress' in updates or 'status' in updates):
             try:
-                await self.progress_calculator.update_work_item_progress(
-                    work_item_id, 
-                    progress=updates.get('progress'),
-                    status=updates.get('status'),
-                    propagate_to_parents=True
-                )
-                logger.info(f"Progress propagation triggered for work item: {work_item_id}")
+                updated_ancestors = await self.progress_calculator.propagate_from(existing['id'])
+                logger.info(f"Progress propagated from {work_item_id} to {len(updated_ancestors)} ancestors")
             except Exception as e:
                 logger.error(f"Error during progress propagation for {work_item_id}: {e}")
         
@@ -215,24 +232,44 @@ class WorkItemStorage:
         Returns:
             True if deleted, False if not found
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
-            table = await self.lancedb_manager.get_table("WorkItem")
-            table.delete(f"id = '{work_item_id}'")
-            logger.info(f"Deleted work item: {work_item_id}")
-            return True
+            deleted = await manager.delete_work_item(work_item_id)
+            if deleted:
+                logger.info(f"Deleted work item: {work_item_id}")
+            return deleted
             
         except Exception as e:
             logger.error(f"Error deleting work item {work_item_id}: {e}")
             return False
     
+    async def upsert_work_items(self, rows: List[Dict[str, Any]]) -> List[str]:
+        """Insert or update several work items in one commit.
+        
+        Args:
+            rows: Work item dictionaries keyed by 'id' (partial for existing items)
+            
+        Returns:
+            Ids of the work items written
+        """
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+        
+        return await manager.upsert_work_items(rows)
+        
     async def batch_update_order_indices(self, updates: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Batch update order indices for multiple work items.
         
+        All updates are written with a single upsert, so reordering N items is
+        one commit instead of N read/delete/insert cycles.
+        
         Args:
-            updates: List of dicts with 'id', 'order_index', and 'sequence_number'
+            updates: List of dicts with 'id', 'order_index', 'sequence_number'
+                and optionally 'parent_id'
             
         Returns:
             Dict with success status and results
@@ -248,39 +285,28 @@ class WorkItemStorage:
         }
         
         try:
+            rows = []
             for update in updates:
                 work_item_id = update.get('id')
                 if not work_item_id:
                     results["errors"].append("Missing work item ID in update")
                     continue
-                    
-                try:
-                    # Get existing work item
-                    existing = await self.get_work_item(work_item_id)
-                    if not existing:
-                        results["failed_updates"].append({
-                            "id": work_item_id,
-                            "error": "Work item not found"
-                        })
-                        continue
-                    
-                    # Update order_index and sequence_number
-                    update_data = {
-                        "order_index": update.get('order_index', existing.get('order_index', 0)),
-                        "sequence_number": update.get('sequence_number', existing.get('sequence_number')),
-                        "updated_at": datetime.utcnow().isoformat()
-                    }
-                    
-                    # Update in database
-                    await self.update_work_item(work_item_id, update_data)
-                    results["updated_count"] += 1
-                    
-                except Exception as e:
+                
+                row = {"id": work_item_id}
+                for field in ("order_index", "sequence_number", "parent_id"):
+                    if field in update:
+                        row[field] = update[field]
+                rows.append(row)
+            
+            written = set(await self.upsert_work_items(rows)) if rows else set()
+            results["updated_count"] = len(written)
+            
+            for row in rows:
+                if row["id"] not in written:
                     results["failed_updates"].append({
-                        "id": work_item_id,
-                        "error": str(e)
+                        "id": row["id"],
+                        "error": "Work item not found"
                     })
-                    results["errors"].append(f"Failed to update {work_item_id}: {e}")
                     
             if results["failed_updates"] or results["errors"]:
                 results["success"] = False
@@ -297,31 +323,28 @@ class WorkItemStorage:
                 "errors": [str(e)]
             }
             
-    async def get_all_work_items(self) -> List[Dict[str, Any]]:
+    async def get_all_work_items(self, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get all work items without any limit.
         
+        Args:
+            columns: Columns to read (default: all but the embedding vector)
+            
         Returns:
             List of all work item data
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
-            # Get all work items by using a very high limit
-            work_items = await self.lancedb_manager.list_work_items(
+            # limit=None reads every item (ordered by order_index) with no cap
+            return await manager.list_work_items(
                 filters=None,
-                limit=10000,  # High limit to get all items
-                offset=0
+                limit=None,
+                offset=0,
+                columns=columns
             )
             
-            # Apply comprehensive numpy conversion to all items
-            converted_items = []
-            for item in work_items:
-                converted_item = self.lancedb_manager._convert_numpy_to_python(item)
-                converted_items.append(converted_item)
-                    
-            return converted_items
-            
         except Exception as e:
             logger.error(f"Error getting all work items: {e}")
             return []
@@ -329,77 +352,146 @@ class WorkItemStorage:
     async def list_work_items(self, 
                              limit: int = 100, 
                              offset: int = 0,
-                             filters: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+                             filters: Optional[Dict[str, Any]] = None,
+                             columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """List work items with optional filtering.
         
         Args:
             limit: Maximum number of items to return
             offset: Number of items to skip
             filters: Optional filters to apply
+            columns: Columns to read (default: all but the embedding vector)
             
         Returns:
             List of work item data
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
             # Use the LanceDB manager's list_work_items method which properly handles getting all items
-            work_items = await self.lancedb_manager.list_work_items(
+            return await manager.list_work_items(
                 filters=filters,
                 limit=limit,
-                offset=offset
+                offset=offset,
+                columns=columns
             )
             
-            # Apply comprehensive numpy conversion to all items
-            converted_items = []
-            for item in work_items:
-                converted_item = self.lancedb_manager._convert_numpy_to_python(item)
-                converted_items.append(converted_item)
-                    
-            return converted_items
-            
         except Exception as e:
             logger.error(f"Error listing work items: {e}")
             return []
             
+    async def list_work_items_page(self,
+                                   limit: int = 50,
+                                   cursor: Optional[str] = None,
+                                   filters: Optional[Dict[str, Any]] = None,
+                                   sort_by: str = "order_index",
+                                   sort_order: str = "asc",
+                                   columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """List one page of work items with an opaque continuation cursor.
+        
+        Args:
+            limit: Page size
+            cursor: next_cursor of the previous page (None for the first page)
+            filters: Optional filters to apply
+            sort_by: Sort column
+            sort_order: "asc" or "desc"
+            columns: Columns to read (default: all but the embedding vector)
+            
+        Returns:
+            Dictionary with 'items', 'next_cursor' and 'total'
+            
+        Raises:
+            ValueError: If the cursor belongs to a different listing
+        """
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+            
+        return await manager.list_work_items_page(
+            filters=filters, limit=limit, cursor=cursor,
+            sort_by=sort_by, sort_order=sort_order, columns=columns
+        )
+        
+    async def count_work_items(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """Count work items matching the filters without reading them.
+        
+        Args:
+            filters: Optional filters to apply
+            
+        Returns:
+            Number of matching work items
+        """
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+            
+        return await manager.count_work_items(filters)
+        
+    async def iter_work_items(self,
+                              filters: Optional[Dict[str, Any]] = None,
+                              columns: Optional[List[str]] = None,
+                              batch_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        """Stream all matching work items without loading them at once.
+        
+        Args:
+            filters: Optional filters to apply
+            columns: Columns to read (default: all but the embedding vector)
+            batch_size: Rows decoded per batch
+            
+        Yields:
+            Work item data
+        """
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+            
+        async for item in manager.iter_work_items(filters, columns, batch_size):
+            yield item
+            
     async def search_work_items(self, 
                                query: str, 
                                limit: int = 10,
-                               search_type: str = "vector") -> List[Dict[str, Any]]:
+                               search_type: str = "vector",
+                               columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Search work items using vector similarity or text search.
         
         Args:
             query: Search query
             limit: Maximum number of results
-            search_type: Type of search ("vector" or "text")
+            search_type: Type of search ("vector", "hybrid" or "text")
+            columns: Columns to read (default: all but the embedding vector)
             
         Returns:
             List of matching work items with scores
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
             # DEBUG: Log current namespace and database path
             current_namespace = self.get_current_namespace()
-            db_path = self.lancedb_manager.db_path if self.lancedb_manager else "unknown"
+            db_path = manager.db_path if manager else "unknown"
             logger.info(f"🔍 SEARCH DEBUG: Searching in namespace '{current_namespace}' at path '{db_path}'")
             logger.info(f"🔍 SEARCH DEBUG: Query: '{query}', Type: '{search_type}', Limit: {limit}")
 
-            if search_type == "vector":
-                # Use LanceDB vector search
-                results = await self.lancedb_manager.search_work_items(
+            if search_type in ("vector", "hybrid"):
+                # Use LanceDB vector search, or vector + keyword rank fusion
+                results = await manager.search_work_items(
                     query=query,
-                    search_type="vector",
-                    limit=limit
+                    search_type=search_type,
+                    limit=limit,
+                    columns=columns
                 )
             else:
                 # Use text-based search
-                results = await self.lancedb_manager.search_work_items(
+                results = await manager.search_work_items(
                     query=query,
                     search_type="keyword",
-                    limit=limit
+                    limit=limit,
+                    columns=columns
                 )
 
             logger.info(f"🔍 SEARCH DEBUG: Found {len(results)} results in namespace '{current_namespace}'")
@@ -410,50 +502,94 @@ class WorkItemStorage:
             logger.error(f"Error searching work items: {e}")
             return []
             
-    async def get_work_item_children(self, parent_id: str) -> List[Dict[str, Any]]:
-        """Get child work items for a parent.
+    async def keyword_search_work_items(self,
+                                        query: str,
+                                        fields: Optional[List[str]] = None,
+                                        filters: Optional[Dict[str, Any]] = None,
+                                        limit: int = 10,
+                                        columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Search work items through the maintained keyword index.
+        
+        Args:
+            query: Search query
+            fields: Text fields to search (default: all indexed fields)
+            filters: status, item_type, priority or assignee filters
+            limit: Maximum number of results
+            columns: Columns to read (default: all but the embedding vector)
+            
+        Returns:
+            Matching work items ordered by relevance
+        """
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+            
+        try:
+            return await manager.keyword_search_work_items(
+                query, fields=fields, filters=filters, limit=limit, columns=columns
+            )
+        except Exception as e:
+            logger.error(f"Error in keyword search: {e}")
+            return []
+            
+    async def get_work_item_children(self, parent_id: str, recursive: bool = False,
+                                     columns: Optional[List[str]] = None,
+                                     max_depth: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get child work items for a parent via the hierarchy index.
         
         Args:
             parent_id: Parent work item ID
+            recursive: Include all descendants, not just direct children
+            columns: Columns to read (default: all but the embedding vector)
+            max_depth: Depth limit for recursive reads (1 = direct children only)
             
         Returns:
-            List of child work items
+            List of child work items ordered by order_index
         """
-        return await self.list_work_items(filters={"parent_id": parent_id})
+        manager = self.lancedb_manager
+        if not manager:
+            raise RuntimeError("LanceDB manager not available")
+            
+        return await manager.get_work_item_children(parent_id, recursive=recursive,
+                                                    columns=columns, max_depth=max_depth)
         
     async def query_work_items(self, 
                               filters: Dict[str, Any],
                               limit: int = 100,
-                              offset: int = 0) -> Dict[str, Any]:
+                              offset: int = 0,
+                              columns: Optional[List[str]] = None) -> Dict[str, Any]:
         """Query work items with complex filters.
         
         Args:
             filters: Query filters
             limit: Maximum number of items
             offset: Number of items to skip
+            columns: Columns to read (default: all but the embedding vector)
             
         Returns:
             Query results with pagination info
         """
-        items = await self.list_work_items(limit=limit, offset=offset, filters=filters)
+        items = await self.list_work_items(limit=limit, offset=offset, filters=filters, columns=columns)
         
         return {
             "items": items,
-            "total": len(items),  # Note: This is approximate for pagination
+            "total": await self.count_work_items(filters),
             "page": (offset // limit) + 1,
             "per_page": limit
         }
     
-    async def get_work_item_dependencies(self, work_item_id: str) -> List[Dict[str, Any]]:
+    async def get_work_item_dependencies(self, work_item_id: str,
+                                         columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
         """Get dependencies for a work item.
         
         Args:
             work_item_id: ID of the work item
+            columns: Columns to read for the dependency items
             
         Returns:
             List of dependency work items
         """
-        work_item = await self.get_work_item(work_item_id)
+        work_item = await self.get_work_item(work_item_id, columns=['id', 'dependencies'])
         if not work_item:
             return []
         
@@ -465,13 +601,8 @@ class WorkItemStorage:
             except:
                 dependencies = []
         
-        dependency_items = []
-        for dep_id in dependencies:
-            dep_item = await self.get_work_item(dep_id)
-            if dep_item:
-                dependency_items.append(dep_item)
-        
-        return dependency_items
+        # One batched lookup instead of a query per dependency
+        return await self.lancedb_manager.get_work_items_by_ids(list(dependencies), columns=columns)
     
     async def _generate_sequence_number(self, parent_id: Optional[str] = None) -> tuple[str, int]:
         """Generate sequence number and order index for a work item.
@@ -482,21 +613,30 @@ class WorkItemStorage:
         Returns:
             Tuple of (sequence_number, order_index)
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
-            table = await self.lancedb_manager.get_table("WorkItem")
+            table = await manager.get_table("WorkItem")
+            # Indexed lookups that read only the columns needed, without the 10-row default limit
+            row_limit = max(table.count_rows(), 1)
             
             if parent_id is None:
                 # Top-level item - find highest sequence number
-                results = table.search().where("parent_id IS NULL OR parent_id = ''").to_pandas()
+                results = (
+                    table.search()
+                    .where("parent_id IS NULL OR parent_id = ''")
+                    .select(['sequence_number'])
+                    .limit(row_limit)
+                    .to_list()
+                )
                 if len(results) == 0:
                     return "1", 1
                     
                 # Find highest top-level sequence number
                 max_sequence = 0
-                for _, row in results.iterrows():
+                for row in results:
                     seq_num = row.get('sequence_number', '0')
                     if seq_num and '.' not in str(seq_num):
                         try:
@@ -509,22 +649,34 @@ class WorkItemStorage:
                 return str(next_sequence), next_sequence
             else:
                 # Child item - find parent's sequence and highest child number
-                parent_results = table.search().where(f"id = '{parent_id}'").limit(1).to_pandas()
+                parent_results = (
+                    table.search()
+                    .where(f"id = {sql_literal(parent_id)}")
+                    .select(['sequence_number', 'order_index'])
+                    .limit(1)
+                    .to_list()
+                )
                 if len(parent_results) == 0:
                     # Parent not found, treat as top-level
                     return await self._generate_sequence_number(None)
                     
-                parent_sequence = parent_results.iloc[0].get('sequence_number', '1')
+                parent_sequence = parent_results[0].get('sequence_number') or '1'
                 
                 # Find children of this parent
-                children_results = table.search().where(f"parent_id = '{parent_id}'").to_pandas()
+                children_results = (
+                    table.search()
+                    .where(f"parent_id = {sql_literal(parent_id)}")
+                    .select(['sequence_number'])
+                    .limit(row_limit)
+                    .to_list()
+                )
                 
                 # Find highest child sequence number
                 max_child_num = 0
                 parent_prefix = f"{parent_sequence}."
                 
-                for _, row in children_results.iterrows():
-                    seq_num = str(row.get('sequence_number', ''))
+                for row in children_results:
+                    seq_num = str(row.get('sequence_number') or '')
                     if seq_num.startswith(parent_prefix):
                         try:
                             # Extract the child number (e.g., "1.3" -> 3)
@@ -539,7 +691,7 @@ class WorkItemStorage:
                 sequence_number = f"{parent_sequence}.{next_child_num}"
                 
                 # Calculate order index based on parent's order and child position
-                parent_order = parent_results.iloc[0].get('order_index', 0)
+                parent_order = parent_results[0].get('order_index') or 0
                 order_index = parent_order * 1000 + next_child_num
                 
                 return sequence_number, order_index
@@ -561,15 +713,17 @@ class WorkItemStorage:
         Returns:
             Dict with operation results and statistics
         """
-        if not self.lancedb_manager:
+        manager = self.lancedb_manager
+        if not manager:
             raise RuntimeError("LanceDB manager not available")
             
         try:
             logger.info("Starting sequence number regeneration for all work items")
             
-            # Get all work items
-            table = await self.lancedb_manager.get_table("WorkItem")
-            all_items = table.search().to_pandas()
+            # Get all work items (only the columns the renumbering needs)
+            all_items = await manager.scan_work_items(
+                ['id', 'parent_id', 'order_index', 'created_at']
+            )
             
             if len(all_items) == 0:
                 return {
@@ -578,11 +732,7 @@ class WorkItemStorage:
                     "updated_count": 0
                 }
             
-            # Convert to dict for easier manipulation
-            items_dict = {}
-            for _, row in all_items.iterrows():
-                item_data = row.to_dict()
-                items_dict[item_data['id']] = item_data
+            items_dict = {item['id']: item for item in all_items}
             
             # Build hierarchy tree
             root_items = []
@@ -641,23 +791,23 @@ class WorkItemStorage:
             # Start the recursive assignment
             assign_sequence_recursive(root_items)
             
-            # Update all items in the database
-            update_count = 0
+            # Update all items in the database with a single upsert
             errors = []
-            
-            for item in updated_items:
-                try:
-                    # Update the item in database
-                    await self.update_work_item(item['id'], {
+            try:
+                written = await self.upsert_work_items([
+                    {
+                        'id': item['id'],
                         'sequence_number': item['sequence_number'],
-                        'order_index': item['order_index'],
-                        'updated_at': item['updated_at']
-                    })
-                    update_count += 1
-                except Exception as e:
-                    error_msg = f"Failed to update {item['id']}: {str(e)}"
-                    errors.append(error_msg)
-                    logger.error(error_msg)
+                        'order_index': int(item['order_index'])
+                    }
+                    for item in updated_items
+                ])
+                update_count = len(written)
+            except Exception as e:
+                update_count = 0
+                error_msg = f"Failed to update sequence numbers: {str(e)}"
+                errors.append(error_msg)
+                logger.error(error_msg)
             
             result = {
                 "success": len(errors) == 0,
@@ -685,92 +835,25 @@ class WorkItemStorage:
             }
     
     async def set_namespace_context(self, namespace: str) -> None:
-        """Set the current namespace context for storage operations.
+        """Set the namespace for the current request context.
+
+        The namespace is stored in a context variable, so it only affects the
+        calling request/task. Prefer ``namespace_scope`` at request entry points.
 
         Args:
             namespace: Namespace to set as current context
         """
-        logger.info(f"Setting storage namespace context to: {namespace}")
-        self.current_namespace = namespace
-
-        # If the LanceDB manager supports namespace switching, update it
-        if self.lancedb_manager and hasattr(self.lancedb_manager, 'config'):
-            # Create a new LanceDB manager with the new namespace
-            from ..lancedb_manager import DatabaseConfig, LanceDBManager
-
-            # Properly shutdown the old manager if it exists
-            if hasattr(self.lancedb_manager, '_initialized') and self.lancedb_manager._initialized:
-                logger.debug(f"Shutting down old LanceDB manager for namespace switch")
-                # Close existing connections if possible
-                if hasattr(self.lancedb_manager, 'db') and self.lancedb_manager.db is not None:
-                    try:
-                        # LanceDB doesn't have an explicit close method, but we clear the reference
-                        self.lancedb_manager.db = None
-                    except Exception as e:
-                        logger.warning(f"Error closing old database connection: {e}")
-                self.lancedb_manager._initialized = False
-
-            new_config = DatabaseConfig(
-                data_path=self.lancedb_manager.config.data_path,
-                namespace=namespace,
-                embedding_model=self.lancedb_manager.config.embedding_model,
-                device=self.lancedb_manager.config.device,
-                normalize_embeddings=self.lancedb_manager.config.normalize_embeddings,
-                vector_dimension=self.lancedb_manager.config.vector_dimension,
-                batch_size=self.lancedb_manager.config.batch_size,
-                timeout=self.lancedb_manager.config.timeout,
-                enable_fts=self.lancedb_manager.config.enable_fts,
-                max_retries=self.lancedb_manager.config.max_retries,
-                retry_delay=self.lancedb_manager.config.retry_delay
-            )
-            logger.debug(f"Creating new LanceDB manager for namespace: {namespace}")
-            logger.debug(f"Database path will be: {new_config.data_path}/namespaces/{namespace if namespace != 'default' else ''}")
-
-            self.lancedb_manager = LanceDBManager(new_config)
-            await self.lancedb_manager.initialize()
+        logger.debug(f"Setting storage namespace context to: {namespace}")
+        set_current_namespace(namespace)
 
-            logger.info(f"Successfully switched to namespace: {namespace} at path: {self.lancedb_manager.db_path}")
+        # Warm the pooled manager for this namespace
+        if self.manager_pool:
+            await self.manager_pool.acquire(namespace)
     
     async def clear_namespace_context(self) -> None:
-        """Clear the current namespace context."""
-        logger.info("Clearing storage namespace context")
-        self.current_namespace = None
-
-        # Reset to default namespace
-        if self.lancedb_manager and hasattr(self.lancedb_manager, 'config'):
-            from ..lancedb_manager import DatabaseConfig, LanceDBManager
-
-            # Properly shutdown the old manager if it exists
-            if hasattr(self.lancedb_manager, '_initialized') and self.lancedb_manager._initialized:
-                logger.debug(f"Shutting down old LanceDB manager for namespace clear")
-                # Close existing connections if possible
-                if hasattr(self.lancedb_manager, 'db') and self.lancedb_manager.db is not None:
-                    try:
-                        # LanceDB doesn't have an explicit close method, but we clear the reference
-                        self.lancedb_manager.db = None
-                    except Exception as e:
-                        logger.warning(f"Error closing old database connection: {e}")
-                self.lancedb_manager._initialized = False
-
-            new_config = DatabaseConfig(
-                data_path=self.lancedb_manager.config.data_path,
-                namespace=None,  # Default namespace
-                embedding_model=self.lancedb_manager.config.embedding_model,
-                device=self.lancedb_manager.config.device,
-                normalize_embeddings=self.lancedb_manager.config.normalize_embeddings,
-                vector_dimension=self.lancedb_manager.config.vector_dimension,
-                batch_size=self.lancedb_manager.config.batch_size,
-                timeout=self.lancedb_manager.config.timeout,
-                enable_fts=self.lancedb_manager.config.enable_fts,
-                max_retries=self.lancedb_manager.config.max_retries,
-                retry_delay=self.lancedb_manager.config.retry_delay
-            )
-            logger.debug(f"Creating new LanceDB manager for default namespace")
-
-            self.lancedb_manager = LanceDBManager(new_config)
-            await self.lancedb_manager.initialize()
-
-            logger.info(f"Successfully reset to default namespace at path: {self.lancedb_manager.db_path}")
+        """Clear the namespace for the current request context."""
+        logger.debug("Clearing storage namespace context")
+        set_current_namespace(None)
     
     def get_current_namespace(self) -> Optional[str]:
         """Get the current namespace context.
@@ -778,4 +861,4 @@ class WorkItemStorage:
         Returns:
             Current namespace or None if not set
         """
-        return self.current_namespace
\ No newline at end of file
+        return get_current_namespace()
\ No newline at end of file
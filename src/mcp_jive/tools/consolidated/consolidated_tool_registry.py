@@ -7,6 +7,7 @@ with legacy tool calls during the transition period.
 import logging
 from typing import Dict, Any, List, Optional, Type
 from ..base import BaseTool
+from ...namespace.context import get_current_namespace, set_current_namespace
 
 # Import unified tools
 from .unified_work_item_tool import UnifiedWorkItemTool
@@ -26,17 +27,22 @@ logger = logging.getLogger(__name__)
 class ConsolidatedToolRegistry:
     """Registry for consolidated MCP tools with backward compatibility."""
 
-    def __init__(self, storage=None, lancedb_manager=None, enable_legacy_support: bool = True):
+    def __init__(self, storage=None, lancedb_manager=None, enable_legacy_support: bool = True,
+                 manager_pool=None):
         self.storage = storage
         self.lancedb_manager = lancedb_manager
+        # Share the storage layer's namespace manager pool when one exists
+        if manager_pool is None and storage is not None:
+            manager_pool = getattr(storage, 'manager_pool', None)
+        self.manager_pool = manager_pool
         self.enable_legacy_support = enable_legacy_support
         self.tools = {}
         self.legacy_tools = {}
         self.compatibility_wrapper = None
         self.migration_helper = None
-
-        # Namespace context
-        self.current_namespace: Optional[str] = None
+        # Tool schemas are static per tool set; built on first request
+        self._schema_cache: Optional[Dict[str, Dict[str, Any]]] = None
+        self._alias_schema_cache: Optional[Dict[str, Dict[str, Any]]] = None
 
         # Initialize tools
         self._initialize_consolidated_tools()
@@ -57,7 +63,8 @@ class ConsolidatedToolRegistry:
             UnifiedProgressTool(storage=self.storage),
             UnifiedStorageTool(storage=self.storage),
             UnifiedReorderTool(storage=self.storage),
-            UnifiedMemoryTool(storage=self.lancedb_manager)  # Memory tool needs LanceDB manager directly
+            # Memory tool needs LanceDB manager directly; the pool routes it by namespace
+            UnifiedMemoryTool(storage=self.lancedb_manager, manager_pool=self.manager_pool)
         ]
 
         # Register tools
@@ -80,15 +87,55 @@ class ConsolidatedToolRegistry:
         return list(self.tools.keys())
     
     def get_tool_schemas(self) -> Dict[str, Dict[str, Any]]:
-        """Get schemas for all consolidated tools mapped by tool name."""
-        schemas = {}
-        for tool in self.tools.values():
-            try:
-                schema = tool.get_schema()
-                schemas[tool.tool_name] = schema
-            except Exception as e:
-                logger.error(f"Error getting schema for {tool.tool_name}: {str(e)}")
-        return schemas
+        """Get schemas for all consolidated tools mapped by tool name.
+        
+        Schemas are built once and cached until invalidate_schema_cache().
+        """
+        if self._schema_cache is None:
+            schemas = {}
+            for tool in self.tools.values():
+                try:
+                    schema = tool.get_schema()
+                    schemas[tool.tool_name] = schema
+                except Exception as e:
+                    logger.error(f"Error getting schema for {tool.tool_name}: {str(e)}")
+            self._schema_cache = schemas
+        return self._schema_cache
+    
+    def get_alias_schemas(self) -> Dict[str, Dict[str, Any]]:
+        """Get schemas for the legacy tool aliases (empty without legacy support).
+        
+        An alias takes its consolidated tool's parameters minus the ones its
+        migration mapping fills in (e.g. ``action``).
+        """
+        if not self.enable_legacy_support or not self.compatibility_wrapper:
+            return {}
+        if self._alias_schema_cache is None:
+            tool_schemas = self.get_tool_schemas()
+            aliases = {}
+            for legacy_name, mapping in self.compatibility_wrapper.migration_map.items():
+                target = tool_schemas.get(mapping["new_tool"])
+                if target is None:
+                    continue
+                fixed = set(mapping["parameter_mapping"]({}))
+                input_schema = dict(target.get("inputSchema", {}))
+                if "properties" in input_schema:
+                    input_schema["properties"] = {name: prop for name, prop in input_schema["properties"].items()
+                                                  if name not in fixed}
+                if "required" in input_schema:
+                    input_schema["required"] = [name for name in input_schema["required"] if name not in fixed]
+                aliases[legacy_name] = {
+                    "name": legacy_name,
+                    "description": f"DEPRECATED: {mapping['description']}.",
+                    "inputSchema": input_schema
+                }
+            self._alias_schema_cache = aliases
+        return self._alias_schema_cache
+    
+    def invalidate_schema_cache(self) -> None:
+        """Drop cached tool and alias schemas (e.g. after a configuration reload)."""
+        self._schema_cache = None
+        self._alias_schema_cache = None
     
     async def handle_tool_call(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a tool call with automatic legacy support."""
@@ -120,6 +167,14 @@ class ConsolidatedToolRegistry:
                 "error_code": "TOOL_CALL_ERROR"
             }
     
+    async def shutdown(self) -> None:
+        """Shut down every consolidated tool."""
+        for tool_name, tool in self.tools.items():
+            try:
+                await tool.shutdown()
+            except Exception as e:
+                logger.error(f"Error shutting down tool {tool_name}: {str(e)}")
+    
     def get_migration_info(self, tool_name: str) -> Dict[str, Any]:
         """Get migration information for a tool."""
         if not self.compatibility_wrapper:
@@ -219,6 +274,7 @@ class ConsolidatedToolRegistry:
         self.enable_legacy_support = False
         self.compatibility_wrapper = None
         self.migration_helper = None
+        self._alias_schema_cache = None
         logger.info("Legacy tool support disabled")
     
     def enable_legacy_support(self):
@@ -226,6 +282,7 @@ class ConsolidatedToolRegistry:
         if not self.enable_legacy_support:
             self.enable_legacy_support = True
             self._initialize_backward_compatibility()
+            self._alias_schema_cache = None
             logger.info("Legacy tool support enabled")
     
     def get_tool_documentation(self) -> Dict[str, Any]:
@@ -402,27 +459,31 @@ class ConsolidatedToolRegistry:
             ]
         }
 
+    @property
+    def current_namespace(self) -> Optional[str]:
+        """Namespace of the current request context."""
+        return get_current_namespace()
+
     async def set_namespace_context(self, namespace: str) -> None:
-        """Set the current namespace context for tool execution.
+        """Set the namespace for the current request context.
+
+        The namespace lives in a context variable, so concurrent requests in
+        different namespaces do not interfere with each other.
         
         Args:
             namespace: Namespace to set as current context
         """
         logger.debug(f"Setting namespace context to: {namespace}")
-        self.current_namespace = namespace
+        set_current_namespace(namespace)
         
-        # Pass namespace context to storage if it supports it
-        if self.storage and hasattr(self.storage, 'set_namespace_context'):
-            await self.storage.set_namespace_context(namespace)
+        # Warm the pooled manager for this namespace
+        if self.manager_pool:
+            await self.manager_pool.acquire(namespace)
     
     async def clear_namespace_context(self) -> None:
-        """Clear the current namespace context."""
+        """Clear the namespace for the current request context."""
         logger.debug("Clearing namespace context")
-        self.current_namespace = None
-        
-        # Clear namespace context from storage if it supports it
-        if self.storage and hasattr(self.storage, 'clear_namespace_context'):
-            await self.storage.clear_namespace_context()
+        set_current_namespace(None)
     
     def get_current_namespace(self) -> Optional[str]:
         """Get the current namespace context.
@@ -430,20 +491,21 @@ class ConsolidatedToolRegistry:
         Returns:
             Current namespace or None if not set
         """
-        return self.current_namespace
+        return get_current_namespace()
 
 
 # Factory function for creating the registry
 def create_consolidated_registry(storage=None,
                                lancedb_manager=None,
-                               enable_legacy_support: bool = True) -> ConsolidatedToolRegistry:
+                               enable_legacy_support: bool = True,
+                               manager_pool=None) -> ConsolidatedToolRegistry:
     """Create a consolidated tool registry."""
     # Set up dependency injection for ProgressCalculator if storage is available
     if storage and hasattr(storage, 'progress_calculator') and storage.progress_calculator is None:
         from ...services.progress_calculator import ProgressCalculator
         storage.progress_calculator = ProgressCalculator(storage)
 
-    return ConsolidatedToolRegistry(storage, lancedb_manager, enable_legacy_support)
+    return ConsolidatedToolRegistry(storage, lancedb_manager, enable_legacy_support, manager_pool)
 
 
 # Export the registry class and factory function
@@ -15,15 +15,13 @@ from ..base import BaseTool, ToolResult
 from datetime import datetime, timedelta
 import asyncio
 import uuid
-try:
-    import numpy as np
-except ImportError:
-    np = None
 from ...uuid_utils import validate_uuid, validate_work_item_exists
 from ...planning.execution_planner import ExecutionPlanner
 from ...planning.ai_guidance_generator import AIGuidanceGenerator
 from ...planning.models import PlanningContext, PlanningScope, InstructionDetail
 from ...utils.status_validator import StatusValidator
+from ...services.dag_scheduler import DagScheduler
+from ...services.execution_sessions import ExecutionSessionStore
 try:
     from mcp.types import Tool
 except ImportError:
@@ -40,7 +38,9 @@ class UnifiedExecutionTool(BaseTool):
         super().__init__()
         self.storage = storage
         self.tool_name = "jive_execute_work_item"
-        self.active_executions = {}  # Track active executions
+        # Bounded LRU of sessions, written behind to ExecutionLog
+        self.active_executions = ExecutionSessionStore(storage)
+        self._cancel_events: Dict[str, asyncio.Event] = {}  # Signalled by the cancel action
         self.execution_planner = ExecutionPlanner(storage)
         self.ai_guidance_generator = AIGuidanceGenerator()
         self.status_validator = StatusValidator()
@@ -50,6 +50,10 @@ class UnifiedExecutionTool(BaseTool):
         """Tool name identifier."""
         return self.tool_name
     
+    async def shutdown(self) -> None:
+        """Write pending execution sessions before the tool goes away."""
+        await self.active_executions.close()
+    
     @property
     def description(self) -> str:
         """Tool description for AI agents."""
@@ -628,6 +632,9 @@ class UnifiedExecutionTool(BaseTool):
             else:
                 await self._execute_single_task(execution_id, work_item)
             
+            if execution["status"] == "cancelled":
+                return
+            
             # Mark as completed
             execution["status"] = "completed"
             execution["progress_percentage"] = 100
@@ -772,65 +779,60 @@ class UnifiedExecutionTool(BaseTool):
     
     async def _execute_dependency_based(self, execution_id: str, children: List[Dict[str, Any]],
                                        max_parallel: int, fail_fast: bool):
-        """Execute children based on dependency order."""
+        """Execute children based on dependency order.
+        
+        Children run on a DAG scheduler: each starts as soon as its own
+        dependencies finish, and a freed slot is refilled immediately.
+        """
         execution = self.active_executions[execution_id]
         
-        # Build dependency graph
+        # Build dependency graph (ids as strings to avoid numpy comparison issues)
         dependency_graph = await self._build_dependency_graph(children)
+        children_by_id = {str(child.get('id')): child for child in children}
+        dependencies = {
+            child_id: [str(dep_id) for dep_id in dependency_graph.get(child.get('id'), [])]
+            for child_id, child in children_by_id.items()
+        }
         
-        # Execute in dependency order
-        completed = set()
-        running = set()
-        
-        while len(completed) < len(children):
-            # Find ready tasks (dependencies completed)
-            ready_tasks = []
-            for child in children:
-                child_id = str(child.get('id'))  # Convert to string to avoid numpy issues
-                if (child_id not in completed and 
-                    child_id not in running and 
-                    len(ready_tasks) < max_parallel):
-                    
-                    dependencies = dependency_graph.get(child_id, [])
-                    # Ensure dependencies is a Python list to avoid numpy array issues
-                    if hasattr(dependencies, 'tolist'):
-                        dependencies = dependencies.tolist()
-                    # Convert dependency IDs to strings to avoid numpy comparison issues
-                    dependencies = [str(dep_id) for dep_id in dependencies]
-                    if all(dep_id in completed for dep_id in dependencies):
-                        ready_tasks.append(child)
-            
-            if len(ready_tasks) == 0:
-                break  # No more tasks can be started
-            
-            # Start ready tasks
-            tasks = []
-            for child in ready_tasks:
-                running.add(str(child.get('id')))  # Convert to string to avoid numpy issues
-                tasks.append(self._execute_child_task(execution_id, child))
-            
-            # Wait for completion
-            if fail_fast:
-                await asyncio.gather(*tasks)
-                for child in ready_tasks:
-                    child_id = str(child.get('id'))  # Convert to string to avoid numpy issues
-                    completed.add(child_id)
-                    running.remove(child_id)
-                    execution["metrics"]["tasks_completed"] += 1
+        finished = 0
+        
+        def on_done(child_id: str, error: Optional[BaseException]) -> None:
+            nonlocal finished
+            finished += 1
+            if error is None:
+                execution["metrics"]["tasks_completed"] += 1
             else:
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for i, result in enumerate(results):
-                    child = ready_tasks[i]
-                    child_id = str(child.get('id'))  # Convert to string to avoid numpy issues
-                    completed.add(child_id)
-                    running.remove(child_id)
-                    
-                    if isinstance(result, Exception):
-                        execution["metrics"]["tasks_failed"] += 1
-                    else:
-                        execution["metrics"]["tasks_completed"] += 1
-            
-            execution["progress_percentage"] = int(len(completed) / len(children) * 90)
+                execution["metrics"]["tasks_failed"] += 1
+            execution["progress_percentage"] = int(finished / len(children_by_id) * 90)
+        
+        cancel_event = self._get_cancel_event(execution_id)
+        if execution.get("status") == "cancelled":
+            # Cancelled while the dependency graph was being built
+            cancel_event.set()
+        scheduler = DagScheduler(max_parallel)
+        try:
+            result = await scheduler.run(
+                dependencies,
+                lambda child_id: self._execute_child_task(execution_id, children_by_id[child_id]),
+                fail_fast=fail_fast,
+                cancel_event=cancel_event,
+                on_done=on_done
+            )
+        finally:
+            self._cancel_events.pop(execution_id, None)
+        
+        if result.not_started and not result.cancelled:
+            self._safe_log_append(execution, {
+                "timestamp": datetime.now().isoformat(),
+                "level": "warning",
+                "message": f"{len(result.not_started)} tasks could not start because of circular dependencies"
+            })
+    
+    def _get_cancel_event(self, execution_id: str) -> asyncio.Event:
+        """Get the event that the cancel action sets for an execution."""
+        if execution_id not in self._cancel_events:
+            self._cancel_events[execution_id] = asyncio.Event()
+        return self._cancel_events[execution_id]
     
     async def _execute_child_task(self, execution_id: str, child: Dict[str, Any]):
         """Execute a single child task."""
@@ -871,15 +873,15 @@ class UnifiedExecutionTool(BaseTool):
                 "error_code": "MISSING_EXECUTION_ID"
             }
         
-        if execution_id not in self.active_executions:
+        # Finished or pre-restart sessions are loaded from ExecutionLog
+        execution = await self.active_executions.load(execution_id)
+        if execution is None:
             return {
                 "success": False,
                 "error": f"Execution not found: {execution_id}",
                 "error_code": "EXECUTION_NOT_FOUND"
             }
         
-        execution = self.active_executions[execution_id]
-        
         # Handle progress update if provided
         if progress_update:
             await self._update_execution_progress(execution_id, progress_update)
@@ -928,7 +930,8 @@ class UnifiedExecutionTool(BaseTool):
                 "suggestion": "Use the status action to see active executions"
             }
         
-        if execution_id not in self.active_executions:
+        execution = await self.active_executions.load(execution_id)
+        if execution is None:
             # Provide helpful information about available executions
             active_ids = list(self.active_executions.keys())
             return {
@@ -941,7 +944,6 @@ class UnifiedExecutionTool(BaseTool):
                 "total_active": len(active_ids)
             }
         
-        execution = self.active_executions[execution_id]
         current_status = execution.get("status", "unknown")
         
         if current_status in ["completed", "failed", "cancelled"]:
@@ -961,11 +963,15 @@ class UnifiedExecutionTool(BaseTool):
             rollback_changes = cancel_options.get("rollback_changes", False)
             cancel_reason = cancel_options.get("reason", "User requested cancellation")
             
-            # Cancel execution
+            # Cancel execution and stop its running tasks
             execution["status"] = "cancelled"
             execution["cancelled_at"] = datetime.now().isoformat()
             execution["cancel_reason"] = cancel_reason
             execution["force_cancelled"] = force_cancel
+            # Only a running DAG scheduler has an event; other executions just see the status
+            cancel_event = self._cancel_events.get(execution_id)
+            if cancel_event is not None:
+                cancel_event.set()
             
             # Update work item status with validation
             work_item_id = execution.get("work_item_id")
@@ -1167,6 +1173,7 @@ class UnifiedExecutionTool(BaseTool):
             execution["logs"] = list(execution["logs"]) if execution["logs"] else []
         
         execution["logs"].append(log_entry)
+        self.active_executions.trim(execution)
     
     async def _resolve_work_item_id(self, work_item_id: str) -> Optional[str]:
         """Resolve work item ID from UUID, title, or keywords."""
@@ -1834,6 +1841,7 @@ class UnifiedExecutionTool(BaseTool):
         
         # Add to progress updates
         execution["progress_updates"].append(update_record)
+        self.active_executions.trim(execution)
         
         # Update status if provided
         if "status" in progress_update:
@@ -24,6 +24,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Fields rendered for related items (children, parents, dependencies, dependents)
+RELATIONSHIP_COLUMNS = [
+    "id", "title", "item_type", "status", "priority", "parent_id", "dependencies",
+    "description", "tags", "progress", "created_at", "updated_at",
+]
+
+# Fields needed to walk parent links and dependency edges
+STRUCTURE_COLUMNS = ["id", "title", "parent_id", "dependencies"]
+
 
 class HierarchyValidator:
     """Comprehensive hierarchy validation and orphan detection."""
@@ -44,7 +53,7 @@ class HierarchyValidator:
         }
         
         # Get all work items
-        all_items = await self.storage.list_work_items()
+        all_items = await self.storage.list_work_items(columns=STRUCTURE_COLUMNS)
         
         # Check for orphaned items
         orphaned = await self._find_orphaned_items(all_items, root_id)
@@ -139,7 +148,7 @@ class HierarchyValidator:
                 return root_id is None
             
             # Check if parent exists
-            parent_item = await self.storage.get_work_item(parent_id)
+            parent_item = await self.storage.get_work_item(parent_id, columns=STRUCTURE_COLUMNS)
             if not parent_item:
                 return False
             
@@ -192,7 +201,7 @@ class HierarchyValidator:
             path.append(current_id)
             
             # Get current item
-            current_item = await self.storage.get_work_item(current_id)
+            current_item = await self.storage.get_work_item(current_id, columns=STRUCTURE_COLUMNS)
             if not current_item:
                 path.pop()
                 return None
@@ -291,7 +300,7 @@ class HierarchyValidator:
         
         while current_id and current_id not in visited:
             visited.add(current_id)
-            current_item = await self.storage.get_work_item(current_id)
+            current_item = await self.storage.get_work_item(current_id, columns=STRUCTURE_COLUMNS)
             
             if not current_item:
                 break
@@ -703,7 +712,7 @@ class UnifiedHierarchyTool(BaseTool):
                 return work_item_id
         
         # Try exact title match
-        work_items = await self.storage.list_work_items()
+        work_items = await self.storage.list_work_items(columns=["id", "title", "description"])
         for item in work_items:
             item_title = item.get("title", "")
             if item_title.lower() == work_item_id.lower():
@@ -727,7 +736,7 @@ class UnifiedHierarchyTool(BaseTool):
         include_cancelled = params.get("include_cancelled", False)
         include_metadata = params.get("include_metadata", True)
         
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         if not work_item:
             return {
                 "success": False,
@@ -782,58 +791,49 @@ class UnifiedHierarchyTool(BaseTool):
     async def _get_children(self, work_item_id: str, include_completed: bool, 
                            include_cancelled: bool, include_metadata: bool) -> List[Dict]:
         """Get direct children of a work item."""
-        all_items = await self.storage.list_work_items()
-        children = []
-        
-        for item in all_items:
-            # Handle both dict and object formats
-            parent_id = item.get('parent_id')
-            status = item.get('status', 'not_started')
-            
-            if parent_id == work_item_id:
-                if not include_completed and status == "completed":
-                    continue
-                if not include_cancelled and status == "cancelled":
-                    continue
-                
-                item_id = item.get('id')
-                title = item.get('title')
-                item_type = item.get('item_type')
-                priority = item.get('priority', 'medium')
-                
-                child_data = {
-                    "id": item_id,
-                    "title": title,
-                    "type": item_type,
-                    "status": status,
-                    "priority": priority
-                }
-                
-                if include_metadata:
-                    description = item.get('description', '')
-                    tags = item.get('tags', [])
-                    created_at = item.get('created_at')
-                    updated_at = item.get('updated_at')
-                    effort_estimate = item.get('effort_estimate')
-                    progress_percentage = item.get('progress', 0)
-                    
-                    child_data.update({
-                        "description": description,
-                        "tags": tags,
-                        "created_at": created_at.isoformat() if hasattr(created_at, 'isoformat') else created_at,
-                        "updated_at": updated_at.isoformat() if hasattr(updated_at, 'isoformat') else updated_at,
-                        "effort_estimate": effort_estimate,
-                        "progress_percentage": progress_percentage
-                    })
-                
-                children.append(child_data)
+        child_items = await self.storage.get_work_item_children(work_item_id, columns=RELATIONSHIP_COLUMNS)
+        return [self._child_entry(item, include_metadata) for item in child_items
+                if self._is_included(item, include_completed, include_cancelled)]
+    
+    @staticmethod
+    def _is_included(item: Dict, include_completed: bool, include_cancelled: bool) -> bool:
+        """Whether a work item passes the completed/cancelled filters."""
+        status = item.get('status', 'not_started')
+        if not include_completed and status == "completed":
+            return False
+        if not include_cancelled and status == "cancelled":
+            return False
+        return True
+    
+    @staticmethod
+    def _child_entry(item: Dict, include_metadata: bool) -> Dict:
+        """Format a work item row as a child relationship entry."""
+        child_data = {
+            "id": item.get('id'),
+            "title": item.get('title'),
+            "type": item.get('item_type'),
+            "status": item.get('status', 'not_started'),
+            "priority": item.get('priority', 'medium')
+        }
         
-        return children
+        if include_metadata:
+            created_at = item.get('created_at')
+            updated_at = item.get('updated_at')
+            child_data.update({
+                "description": item.get('description', ''),
+                "tags": item.get('tags', []),
+                "created_at": created_at.isoformat() if hasattr(created_at, 'isoformat') else created_at,
+                "updated_at": updated_at.isoformat() if hasattr(updated_at, 'isoformat') else updated_at,
+                "effort_estimate": item.get('effort_estimate'),
+                "progress_percentage": item.get('progress', 0)
+            })
+        
+        return child_data
     
     async def _get_parents(self, work_item_id: str, include_completed: bool,
                           include_cancelled: bool, include_metadata: bool) -> List[Dict]:
         """Get parent chain of a work item."""
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         parents = []
         
         current_item = work_item
@@ -843,7 +843,7 @@ class UnifiedHierarchyTool(BaseTool):
             if not parent_id:
                 break
                 
-            parent = await self.storage.get_work_item(parent_id)
+            parent = await self.storage.get_work_item(parent_id, columns=RELATIONSHIP_COLUMNS)
             if not parent:
                 break
             
@@ -890,7 +890,7 @@ class UnifiedHierarchyTool(BaseTool):
     async def _get_dependencies(self, work_item_id: str, include_completed: bool,
                                include_cancelled: bool, include_metadata: bool) -> List[Dict]:
         """Get dependencies of a work item."""
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         dependencies = []
         
         # Handle both dict and object formats for work_item
@@ -902,7 +902,7 @@ class UnifiedHierarchyTool(BaseTool):
             
         if work_item_deps:
             for dep_id in work_item_deps:
-                dep_item = await self.storage.get_work_item(dep_id)
+                dep_item = await self.storage.get_work_item(dep_id, columns=RELATIONSHIP_COLUMNS)
                 if not dep_item:
                     continue
                 
@@ -946,10 +946,10 @@ class UnifiedHierarchyTool(BaseTool):
     async def _get_dependents(self, work_item_id: str, include_completed: bool,
                              include_cancelled: bool, include_metadata: bool) -> List[Dict]:
         """Get work items that depend on this work item."""
-        all_items = await self.storage.list_work_items()
         dependents = []
         
-        for item in all_items:
+        # Dependencies are stored on the dependent, so every item has to be checked
+        async for item in self.storage.iter_work_items(columns=RELATIONSHIP_COLUMNS):
             # Handle both dict and object formats for item
             item_deps = None
             if isinstance(item, dict):
@@ -998,33 +998,38 @@ class UnifiedHierarchyTool(BaseTool):
     async def _get_full_hierarchy(self, work_item_id: str, max_depth: int,
                                  include_completed: bool, include_cancelled: bool,
                                  include_metadata: bool) -> List[Dict]:
-        """Get full hierarchy tree starting from work item."""
-        hierarchy = []
-        visited = set()
+        """Get full hierarchy tree starting from work item.
+        
+        The subtree ids come from the hierarchy index and their rows are read
+        in one query; the tree is then assembled in memory.
+        """
+        root = await self.storage.get_work_item(work_item_id, columns=RELATIONSHIP_COLUMNS)
+        if not root or not self._is_included(root, include_completed, include_cancelled):
+            return []
+        
+        rows = [root]
+        if max_depth > 0:
+            rows += await self.storage.get_work_item_children(
+                root["id"], recursive=True, columns=RELATIONSHIP_COLUMNS, max_depth=max_depth
+            )
         
-        async def traverse_hierarchy(item_id: str, current_depth: int, parent_path: List[str]):
-            if current_depth > max_depth or item_id in visited:
-                return
-            
-            visited.add(item_id)
-            item = await self.storage.get_work_item(item_id)
-            if not item:
-                return
-            
-            item_status = item.get("status", "not_started")
-            if not include_completed and item_status == "completed":
-                return
-            if not include_cancelled and item_status == "cancelled":
-                return
+        nodes: Dict[str, Dict] = {}
+        for item in rows:
+            parent = nodes.get(item.get("parent_id")) if item is not root else None
+            # Descendants come in pre-order; skip subtrees under filtered items
+            if item is not root and parent is None:
+                continue
+            if not self._is_included(item, include_completed, include_cancelled):
+                continue
             
             item_data = {
                 "id": item.get("id"),
                 "title": item.get("title", ""),
-                "type": item.get("type", ""),
-                "status": item_status,
+                "type": item.get("item_type", ""),
+                "status": item.get("status", "not_started"),
                 "priority": item.get("priority", "medium"),
-                "depth": current_depth,
-                "path": parent_path + [item_id],
+                "depth": parent["depth"] + 1 if parent else 0,
+                "path": (parent["path"] if parent else []) + [item.get("id")],
                 "children": []
             }
             
@@ -1035,22 +1040,11 @@ class UnifiedHierarchyTool(BaseTool):
                     "progress_percentage": item.get("progress", 0)
                 })
             
-            # Get children
-            children = await self._get_children(item_id, include_completed, include_cancelled, False)
-            for child in children:
-                child_hierarchy = await traverse_hierarchy(
-                    child["id"], current_depth + 1, parent_path + [item_id]
-                )
-                if child_hierarchy:
-                    item_data["children"].append(child_hierarchy)
-            
-            return item_data
+            nodes[item_data["id"]] = item_data
+            if parent:
+                parent["children"].append(item_data)
         
-        root_hierarchy = await traverse_hierarchy(work_item_id, 0, [])
-        if root_hierarchy:
-            hierarchy.append(root_hierarchy)
-        
-        return hierarchy
+        return [nodes[root["id"]]]
     
     async def _get_ancestors(self, work_item_id: str, max_depth: int,
                             include_completed: bool, include_cancelled: bool,
@@ -1061,23 +1055,28 @@ class UnifiedHierarchyTool(BaseTool):
     async def _get_descendants(self, work_item_id: str, max_depth: int,
                               include_completed: bool, include_cancelled: bool,
                               include_metadata: bool) -> List[Dict]:
-        """Get all descendants up to max_depth."""
-        descendants = []
-        visited = set()
+        """Get all descendants up to max_depth.
+        
+        Reads the subtree in one query through the hierarchy index.
+        """
+        if max_depth < 1:
+            return []
+        rows = await self.storage.get_work_item_children(
+            work_item_id, recursive=True, columns=RELATIONSHIP_COLUMNS, max_depth=max_depth
+        )
         
-        async def traverse_descendants(item_id: str, current_depth: int):
-            if current_depth >= max_depth or item_id in visited:
-                return
-            
-            visited.add(item_id)
-            children = await self._get_children(item_id, include_completed, include_cancelled, include_metadata)
-            
-            for child in children:
-                child["depth"] = current_depth + 1
-                descendants.append(child)
-                await traverse_descendants(child["id"], current_depth + 1)
+        depths = {work_item_id: 0}
+        descendants = []
+        for item in rows:
+            parent_depth = depths.get(item.get("parent_id"))
+            # Descendants come in pre-order; skip subtrees under filtered items
+            if parent_depth is None or not self._is_included(item, include_completed, include_cancelled):
+                continue
+            depths[item["id"]] = parent_depth + 1
+            child = self._child_entry(item, include_metadata)
+            child["depth"] = parent_depth + 1
+            descendants.append(child)
         
-        await traverse_descendants(work_item_id, 0)
         return descendants
     
     async def _add_dependency(self, work_item_id: str, params: Dict) -> Dict[str, Any]:
@@ -1110,7 +1109,7 @@ class UnifiedHierarchyTool(BaseTool):
             }
         
         # Add dependency
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         if not work_item:
             return {
                 "success": False,
@@ -1181,7 +1180,7 @@ class UnifiedHierarchyTool(BaseTool):
             }
         
         # Remove dependency
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         # Handle both dict and object formats for work_item
         if isinstance(work_item, dict):
             dependencies = work_item.get("dependencies", [])
@@ -1274,7 +1273,7 @@ class UnifiedHierarchyTool(BaseTool):
                 return False
             
             visited.add(current_id)
-            current_item = await self.storage.get_work_item(current_id)
+            current_item = await self.storage.get_work_item(current_id, columns=STRUCTURE_COLUMNS)
             
             # Handle both dict and object formats for current_item
             if isinstance(current_item, dict):
@@ -1315,7 +1314,7 @@ class UnifiedHierarchyTool(BaseTool):
             visited.add(current_id)
             path.append(current_id)
             
-            current_item = await self.storage.get_work_item(current_id)
+            current_item = await self.storage.get_work_item(current_id, columns=STRUCTURE_COLUMNS)
             # Handle both dict and object formats for current_item
             if isinstance(current_item, dict):
                 dependencies = current_item.get("dependencies", [])
@@ -1334,7 +1333,7 @@ class UnifiedHierarchyTool(BaseTool):
     async def _check_missing_dependencies(self, work_item_id: str) -> List[Dict]:
         """Check for missing dependencies."""
         issues = []
-        work_item = await self.storage.get_work_item(work_item_id)
+        work_item = await self.storage.get_work_item(work_item_id, columns=STRUCTURE_COLUMNS)
         
         # Handle both dict and object formats for work_item
         if isinstance(work_item, dict):
@@ -1344,7 +1343,7 @@ class UnifiedHierarchyTool(BaseTool):
         
         if dependencies is not None and len(dependencies) > 0:
             for dep_id in dependencies:
-                dep_item = await self.storage.get_work_item(dep_id)
+                dep_item = await self.storage.get_work_item(dep_id, columns=STRUCTURE_COLUMNS)
                 if not dep_item:
                     issues.append({
                         "type": "missing_dependency",
@@ -1359,7 +1358,7 @@ class UnifiedHierarchyTool(BaseTool):
     async def _check_orphaned_items(self) -> List[Dict]:
         """Check for orphaned work items."""
         issues = []
-        all_items = await self.storage.list_work_items()
+        all_items = await self.storage.list_work_items(columns=STRUCTURE_COLUMNS)
         
         # Find items without parents or dependencies
         for item in all_items:
@@ -35,25 +35,26 @@ class UnifiedMemoryTool(BaseTool):
     """Unified tool for Architecture and Troubleshoot Memory operations."""
 
     def __init__(self, storage=None, arch_storage: ArchitectureMemoryStorage = None,
-                 troubleshoot_storage: TroubleshootMemoryStorage = None):
+                 troubleshoot_storage: TroubleshootMemoryStorage = None, manager_pool=None):
         """Initialize the unified memory tool.
 
         Args:
             storage: LanceDB manager instance (will be used to create memory storage if needed)
             arch_storage: Architecture Memory storage instance (optional, created from storage if not provided)
             troubleshoot_storage: Troubleshoot Memory storage instance (optional, created from storage if not provided)
+            manager_pool: Optional per-namespace manager pool used to route requests by namespace
         """
         super().__init__()
         self.tool_name = "jive_memory"
 
         # Initialize storage instances
         if arch_storage is None and storage is not None:
-            self.arch_storage = ArchitectureMemoryStorage(storage)
+            self.arch_storage = ArchitectureMemoryStorage(storage, manager_pool)
         else:
             self.arch_storage = arch_storage
 
         if troubleshoot_storage is None and storage is not None:
-            self.troubleshoot_storage = TroubleshootMemoryStorage(storage)
+            self.troubleshoot_storage = TroubleshootMemoryStorage(storage, manager_pool)
         else:
             self.troubleshoot_storage = troubleshoot_storage
 
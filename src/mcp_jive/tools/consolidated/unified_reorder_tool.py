@@ -162,16 +162,17 @@ class UnifiedReorderTool(BaseTool):
             if item.get('parent_id') != expected_parent:
                 raise ValueError(f"All work items must have the same parent for reordering")
         
+        parent_item = None
+        if expected_parent:
+            parent_item = await self.storage.get_work_item(expected_parent)
+            if not parent_item:
+                raise ValueError(f"Parent work item not found: {expected_parent}")
+        
         # Calculate new sequence numbers and order indices
         updates = []
         for i, work_item_id in enumerate(work_item_ids):
-            item = work_items[i]
-            
             # Generate new sequence number based on position
-            if expected_parent:
-                parent_item = await self.storage.get_work_item(expected_parent)
-                if not parent_item:
-                    raise ValueError(f"Parent work item not found: {expected_parent}")
+            if parent_item:
                 parent_sequence = parent_item.get('sequence_number', '0')
                 new_sequence = f"{parent_sequence}.{i + 1}"
                 
@@ -262,14 +263,11 @@ class UnifiedReorderTool(BaseTool):
             # Insert at position
             siblings.insert(position, work_item)
         
-        # Update parent_id for the moved item
-        await self.storage.update_work_item(work_item_id, {"parent_id": new_parent_id})
-        
-        # Recalculate sequence numbers for all siblings
+        # Recalculate sequence numbers for all siblings; the moved item's new
+        # parent_id is written in the same batch so the move is one commit
         updates = []
         for i, sibling in enumerate(siblings):
             if new_parent_id:
-                parent_item = await self.storage.get_work_item(new_parent_id)
                 parent_sequence = parent_item.get('sequence_number', '0')
                 new_sequence = f"{parent_sequence}.{i + 1}"
                 parent_order = parent_item.get('order_index', 0)
@@ -278,11 +276,14 @@ class UnifiedReorderTool(BaseTool):
                 new_sequence = str(i + 1)
                 new_order_index = i + 1
                 
-            updates.append({
+            update = {
                 "id": sibling.get('id'),
                 "sequence_number": new_sequence,
                 "order_index": new_order_index
-            })
+            }
+            if sibling.get('id') == work_item_id:
+                update["parent_id"] = new_parent_id
+            updates.append(update)
         
         # Perform batch update
         result = await self.storage.batch_update_order_indices(updates)
@@ -22,6 +22,14 @@ from ...utils.search_query_builder import (
 
 logger = logging.getLogger(__name__)
 
+# Fields returned in search results; embeddings and long free-text fields
+# (notes, execution instructions, metadata) are never read
+SEARCH_RESULT_COLUMNS = [
+    "id", "item_id", "title", "description", "item_type", "status", "priority",
+    "assignee", "tags", "acceptance_criteria", "parent_id", "progress",
+    "order_index", "sequence_number", "created_at", "updated_at",
+]
+
 
 class UnifiedSearchTool(BaseTool):
     """Unified tool for all content search operations."""
@@ -289,7 +297,8 @@ class UnifiedSearchTool(BaseTool):
                 results = await self.storage.search_work_items(
                     query=query,
                     limit=limit,
-                    search_type="vector"
+                    search_type="vector",
+                    columns=SEARCH_RESULT_COLUMNS
                 )
                 
                 # Filter results by content types and apply filters
@@ -327,135 +336,84 @@ class UnifiedSearchTool(BaseTool):
             logger.warning(f"Semantic search failed, falling back to keyword: {e}")
             return await self._keyword_search(query, content_types, filters, limit)
     
+    # Tool content types → keyword index fields
+    KEYWORD_CONTENT_FIELDS = {
+        "work_item": "title",
+        "task": "title",
+        "title": "title",
+        "description": "description",
+        "acceptance_criteria": "acceptance_criteria",
+        "tags": "tags",
+    }
+    
+    # Tool filter names → keyword index attributes
+    KEYWORD_FILTER_ATTRIBUTES = {
+        "type": "item_type",
+        "status": "status",
+        "priority": "priority",
+        "assignee_id": "assignee",
+    }
+    
     async def _keyword_search(self, query: str, content_types: List[str], 
                              filters: Dict, limit: int) -> List[Dict]:
-        """Perform keyword-based search."""
+        """Perform keyword-based search through the storage keyword index."""
         try:
-            # Build optimized search query with filters
-            query_builder = SearchQueryBuilder()
-            query_builder.add_term(query).set_scope(SearchScope.ALL)
-            
-            # Add filters to the builder before building
-            if filters:
-                for key, value in filters.items():
-                    if value:
-                        query_builder.add_filter(key, SearchOperator.EXACT, value)
-            
-            search_query = query_builder.build()
-            
             if not self.storage:
                 logger.warning("No storage available for keyword search")
                 return []
             
-            # Get all work items and filter them
-            all_items = await self.storage.list_work_items(limit=1000)  # Get more items for filtering
-            
-            # Filter by keyword matching with improved sensitivity
-            matching_items = []
-            query_lower = query.lower().strip()
-            query_terms = [term.strip() for term in query_lower.split() if term.strip()]
+            fields = list(dict.fromkeys(
+                self.KEYWORD_CONTENT_FIELDS[content_type]
+                for content_type in content_types
+                if content_type in self.KEYWORD_CONTENT_FIELDS
+            ))
+            index_filters = {
+                self.KEYWORD_FILTER_ATTRIBUTES[key]: value
+                for key, value in (filters or {}).items()
+                if value and key in self.KEYWORD_FILTER_ATTRIBUTES
+            }
             
-            for item in all_items:
-                # Check if item matches query in specified content types
-                matches = False
-                match_score = 0.0
-                matched_content = ""
-                
-                for content_type in content_types:
-                    if content_type in ["work_item", "task", "title"]:
-                        title = item.get("title", "").lower()
-                        # Exact phrase match (highest priority)
-                        if query_lower in title:
-                            matches = True
-                            match_score += 0.8
-                            matched_content = item.get("title", "")
-                        # Partial word matches
-                        elif any(term in title for term in query_terms):
-                            matches = True
-                            match_score += 0.5
-                            matched_content = item.get("title", "")
-                        # Fuzzy matching for single character differences
-                        elif len(query_terms) == 1 and len(query_terms[0]) > 3:
-                            if self._fuzzy_match(query_terms[0], title):
-                                matches = True
-                                match_score += 0.3
-                                matched_content = item.get("title", "")
-                    
-                    elif content_type == "description":
-                        description = item.get("description", "").lower()
-                        if query_lower in description:
-                            matches = True
-                            match_score += 0.6
-                            if not matched_content:
-                                matched_content = item.get("description", "")[:100]
-                        elif any(term in description for term in query_terms):
-                            matches = True
-                            match_score += 0.3
-                            if not matched_content:
-                                matched_content = item.get("description", "")[:100]
-                    
-                    elif content_type == "acceptance_criteria":
-                        criteria = item.get("acceptance_criteria", [])
-                        if isinstance(criteria, list):
-                            for criterion in criteria:
-                                if isinstance(criterion, str):
-                                    criterion_lower = criterion.lower()
-                                    if query_lower in criterion_lower or any(term in criterion_lower for term in query_terms):
-                                        matches = True
-                                        match_score += 0.2
-                                        if not matched_content:
-                                            matched_content = criterion[:100]
-                    
-                    elif content_type == "tags":
-                        tags = item.get("tags", [])
-                        if isinstance(tags, list):
-                            tag_matches = []
-                            for tag in tags:
-                                tag_lower = tag.lower()
-                                if query_lower in tag_lower or any(term in tag_lower for term in query_terms):
-                                    tag_matches.append(tag)
-                            if tag_matches:
-                                matches = True
-                                match_score += 0.2
-                                if not matched_content:
-                                    matched_content = ", ".join(tag_matches)
-                
-                if matches:
-                    item_copy = item.copy()
-                    item_copy["keyword_score"] = min(match_score, 1.0)
-                    item_copy["matched_content"] = matched_content
-                    matching_items.append(item_copy)
-            
-            # If no items matched the search query, return empty list
-            if not matching_items:
+            matches = await self.storage.keyword_search_work_items(
+                query, fields=fields or None, filters=index_filters, limit=limit,
+                columns=SEARCH_RESULT_COLUMNS
+            )
+            if not matches:
                 logger.info(f"No items matched search query: '{query}'")
                 return []
             
-            # Apply filters using query builder (filters already added to search_query)
-            logger.info(f"Applying filters from search_query: {len(search_query.filters)} filters")
-            logger.info(f"Matching items before filtering: {len(matching_items)}")
-            filtered_items = self._apply_query_filters(matching_items, search_query)
-            logger.info(f"Filtered items after filtering: {len(filtered_items)}")
-            
-            # Rank results using the new ranker
-            ranked_search_results = self.result_ranker.rank_results(
-                filtered_items, search_query
-            )
+            # Normalize BM25 scores to 0-1 relative to the best match
+            top_score = matches[0].get("_keyword_score") or 1.0
+            results = []
+            for item in matches:
+                result = dict(item)
+                matched_fields = result.pop("_keyword_fields", {})
+                score = result.pop("_keyword_score", 0.0) / top_score
+                result["keyword_score"] = score
+                result["score"] = score
+                result["matched_content"] = self._keyword_matched_content(result, matched_fields)
+                results.append(result)
             
-            # Convert SearchResult objects to dictionaries
-            ranked_results = []
-            for search_result in ranked_search_results:
-                result = search_result.item.copy()
-                result["keyword_score"] = search_result.score
-                result["score"] = search_result.score
-                ranked_results.append(result)
-            
-            return ranked_results[:limit]
+            return results
             
         except Exception as e:
             logger.error(f"Error in keyword search: {e}")
             return []
     
+    def _keyword_matched_content(self, item: Dict, matched_fields: Dict[str, List[str]]) -> str:
+        """Pick the snippet of the best matching field."""
+        for field, terms in matched_fields.items():
+            if field == "title":
+                return item.get("title", "")
+            if field == "description":
+                return (item.get("description") or "")[:100]
+            values = [str(value) for value in (item.get(field) or [])]
+            hits = [value for value in values if any(term in value.lower() for term in terms)]
+            if field == "tags":
+                return ", ".join(hits or values)
+            if hits or values:
+                return (hits or values)[0][:100]
+        return item.get("title", "")
+    
     async def _hybrid_search(self, query: str, content_types: List[str],
                              filters: Dict, limit: int, min_score: float = 0.1) -> List[Dict]:
         """Perform hybrid search combining semantic and keyword approaches."""
@@ -555,20 +513,6 @@ class UnifiedSearchTool(BaseTool):
             semantic_results, keyword_results, semantic_weight, keyword_weight
         )
     
-    def _fuzzy_match(self, query_term: str, text: str, max_distance: int = 1) -> bool:
-        """Simple fuzzy matching for single character differences."""
-        if not query_term or not text:
-            return False
-        
-        # Check if query_term appears with single character substitution
-        for i in range(len(text) - len(query_term) + 1):
-            substring = text[i:i + len(query_term)]
-            if len(substring) == len(query_term):
-                differences = sum(1 for a, b in zip(query_term, substring) if a != b)
-                if differences <= max_distance:
-                    return True
-        return False
-    
     def _calculate_keyword_score(self, work_item: Dict, query: str) -> float:
         """Calculate keyword relevance score for a work item."""
         query_terms = set(query.lower().split())
@@ -759,7 +703,7 @@ class UnifiedSearchTool(BaseTool):
                 return []
             
             # Get all work items directly from storage
-            all_items = await self.storage.get_all_work_items()
+            all_items = await self.storage.get_all_work_items(columns=SEARCH_RESULT_COLUMNS)
             
             if not all_items:
                 return []
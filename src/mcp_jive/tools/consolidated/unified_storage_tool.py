@@ -8,21 +8,17 @@ Consolidates storage and synchronization operations:
 - jive_restore_data
 """
 
+import asyncio
 import logging
 from typing import Dict, Any, List, Optional, Union
 from ..base import BaseTool, ToolResult
 from datetime import datetime, timedelta
 import json
 import os
-import shutil
 import uuid
-import hashlib
-try:
-    import numpy as np
-except ImportError:
-    np = None
 from ...uuid_utils import validate_uuid, validate_work_item_exists
-from ...models.workflow import WorkItem
+from ...lancedb_snapshots import LanceSnapshotStore
+from ...storage.backup_stream import BackupIntegrityError, iter_backup_batches, verify_backup, write_backup
 try:
     from mcp.types import Tool
 except ImportError:
@@ -32,6 +28,7 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+
 class UnifiedStorageTool(BaseTool):
     """Unified tool for storage and synchronization operations."""
     
@@ -328,6 +325,12 @@ class UnifiedStorageTool(BaseTool):
                                 "type": "string",
                                 "description": "Name for the backup"
                             },
+                            "mode": {
+                                "type": "string",
+                                "enum": ["export", "snapshot"],
+                                "default": "export",
+                                "description": "export: portable NDJSON file; snapshot: incremental copy of the namespace's Lance table versions (keeps vectors and indexes)"
+                            },
                             "include_files": {
                                 "type": "boolean",
                                 "default": True,
@@ -354,7 +357,12 @@ class UnifiedStorageTool(BaseTool):
                         "properties": {
                             "backup_id": {
                                 "type": "string",
-                                "description": "ID of backup to restore"
+                                "description": "ID of backup or snapshot to restore"
+                            },
+                            "mode": {
+                                "type": "string",
+                                "enum": ["export", "snapshot"],
+                                "description": "snapshot: restore the namespace to a snapshot (by backup_id, or the latest at restore_point)"
                             },
                             "restore_point": {
                                 "type": "string",
@@ -671,8 +679,15 @@ class UnifiedStorageTool(BaseTool):
         return status_result
     
     async def _backup_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a backup of data."""
+        """Create a backup of data.
+        
+        Work items are streamed from the table into a gzip-compressed NDJSON
+        file (see storage.backup_stream); compression, writes and the
+        checksum run in a worker thread in the same pass.
+        """
         backup_config = params.get("backup_config", {})
+        if backup_config.get("mode") == "snapshot":
+            return await self._snapshot_namespace(backup_config)
         
         # Create backup directory if it doesn't exist
         os.makedirs(self.backup_location, exist_ok=True)
@@ -681,103 +696,38 @@ class UnifiedStorageTool(BaseTool):
         backup_name = backup_config.get("backup_name", f"backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
         backup_id = str(uuid.uuid4())
         backup_path = os.path.join(self.backup_location, f"{backup_name}_{backup_id}")
+        compress = backup_config.get("compress_backup", True)
+        backup_file_path = f"{backup_path}.ndjson.gz" if compress else f"{backup_path}.ndjson"
+        created_at = datetime.now().isoformat()
         
         try:
-            # Get all work items
-            work_items = await self.storage.list_work_items()
-            
-            # Create backup data structure
-            backup_data = {
-                "backup_id": backup_id,
-                "backup_name": backup_name,
-                "created_at": datetime.now().isoformat(),
-                "version": "1.0",
-                "work_items": [],
-                "metadata": {
-                    "total_items": len(work_items),
+            result = await write_backup(
+                self.storage.iter_work_items(),
+                backup_file_path,
+                header={
+                    "backup_id": backup_id,
+                    "backup_name": backup_name,
+                    "created_at": created_at,
                     "backup_config": backup_config
-                }
-            }
-            
-            # Add work items to backup
-            for item in work_items:
-                # Helper function to safely convert datetime to ISO format
-                def safe_isoformat(dt_value):
-                    if dt_value is None:
-                        return None
-                    if isinstance(dt_value, str):
-                        return dt_value  # Already a string
-                    if hasattr(dt_value, 'isoformat'):
-                        return dt_value.isoformat()  # datetime object
-                    return str(dt_value)  # Fallback to string conversion
-                
-                # Helper function to safely get attribute value (handles mock objects and numpy arrays)
-                def safe_getattr(obj, attr):
-                    try:
-                        value = getattr(obj, attr, None)
-                        # Handle numpy arrays and other non-serializable objects
-                        if hasattr(value, '__array__'):
-                            return value.tolist() if hasattr(value, 'tolist') else str(value)
-                        # Handle MagicMock objects
-                        if hasattr(value, '_mock_name'):
-                            return str(value)
-                        # Handle datetime objects
-                        if hasattr(value, 'isoformat'):
-                            return value.isoformat()
-                        return value
-                    except Exception:
-                        return None
-                item_data = {
-                    "id": item.get('id'),
-                    "title": item.get('title'),
-                    "description": item.get('description'),
-                    "type": item.get('type'),
-                    "status": item.get('status'),
-                    "priority": item.get('priority'),
-                    "parent_id": item.get('parent_id'),
-                    "tags": item.get('tags', []),
-                    "created_at": safe_isoformat(item.get('created_at')),
-                    "updated_at": safe_isoformat(item.get('updated_at'))
-                }
-                
-                # Add additional attributes if they exist
-                for attr in ["acceptance_criteria", "effort_estimate", "progress_percentage", 
-                           "dependencies", "blockers", "progress_history"]:
-                    if hasattr(item, attr):
-                        item_data[attr] = safe_getattr(item, attr)
-                
-                backup_data["work_items"].append(item_data)
-            
-            # Write backup file
-            backup_file_path = f"{backup_path}.json"
-            with open(backup_file_path, 'w', encoding='utf-8') as f:
-                json.dump(backup_data, f, indent=2, ensure_ascii=False, default=self._json_serializer)
-            
-            # Compress if requested
-            if backup_config.get("compress_backup", True):
-                import gzip
-                compressed_path = f"{backup_file_path}.gz"
-                with open(backup_file_path, 'rb') as f_in:
-                    with gzip.open(compressed_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-                os.remove(backup_file_path)  # Remove uncompressed file
-                backup_file_path = compressed_path
-            
-            # Calculate checksum
-            checksum = await self._calculate_file_checksum(backup_file_path)
+                },
+                compress=compress,
+                compression_level=backup_config.get("compression_level", 6)
+            )
             
             return {
                 "success": True,
                 "backup_id": backup_id,
                 "backup_name": backup_name,
                 "backup_path": backup_file_path,
-                "items_backed_up": len(work_items),
-                "backup_size": os.path.getsize(backup_file_path),
-                "checksum": checksum,
-                "created_at": backup_data["created_at"]
+                "items_backed_up": result["total_items"],
+                "backup_size": result["size"],
+                "checksum": result["checksum"],
+                "created_at": created_at
             }
         
         except Exception as e:
+            if os.path.exists(backup_file_path):
+                os.remove(backup_file_path)
             return {
                 "success": False,
                 "error": f"Backup failed: {str(e)}",
@@ -785,10 +735,17 @@ class UnifiedStorageTool(BaseTool):
             }
     
     async def _restore_data(self, params: Dict[str, Any]) -> Dict[str, Any]:
-        """Restore data from backup."""
+        """Restore data from backup.
+        
+        The backup is read in batches, each written with one bulk upsert, so
+        memory stays bounded by the batch size.
+        """
         restore_config = params.get("restore_config", {})
         backup_id = restore_config.get("backup_id")
         
+        if restore_config.get("mode") == "snapshot":
+            return await self._restore_snapshot(restore_config)
+        
         if not backup_id:
             return {
                 "success": False,
@@ -796,6 +753,10 @@ class UnifiedStorageTool(BaseTool):
                 "error_code": "MISSING_BACKUP_ID"
             }
         
+        # Snapshot ids restore through the snapshot store
+        if self._snapshot_store().find_snapshot(self.storage.lancedb_manager.get_namespace(), backup_id):
+            return await self._restore_snapshot(restore_config)
+        
         # Find backup file
         backup_files = [f for f in os.listdir(self.backup_location) if backup_id in f]
         
@@ -809,18 +770,9 @@ class UnifiedStorageTool(BaseTool):
         backup_file_path = os.path.join(self.backup_location, backup_files[0])
         
         try:
-            # Read backup file
-            if backup_file_path.endswith('.gz'):
-                import gzip
-                with gzip.open(backup_file_path, 'rt', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            else:
-                with open(backup_file_path, 'r', encoding='utf-8') as f:
-                    backup_data = json.load(f)
-            
             # Verify integrity if requested
             if restore_config.get("verify_integrity", True):
-                integrity_check = await self._verify_backup_integrity(backup_data)
+                integrity_check = await self._verify_backup_integrity(backup_file_path)
                 if not integrity_check["valid"]:
                     return {
                         "success": False,
@@ -829,48 +781,26 @@ class UnifiedStorageTool(BaseTool):
                     }
             
             # Restore work items
-            selective_restore = restore_config.get("selective_restore", [])
+            selective_restore = set(restore_config.get("selective_restore", []))
             restored_count = 0
+            total_items = 0
             
-            for item_data in backup_data["work_items"]:
+            header: Dict[str, Any] = {}
+            async for batch in iter_backup_batches(backup_file_path, header=header):
+                total_items += len(batch)
                 # Skip if selective restore and item not in list
-                if selective_restore and item_data["id"] not in selective_restore:
-                    continue
-                
-                # Create or update work item
-                existing_item = await self.storage.get_work_item(item_data["id"])
-                
-                if existing_item:
-                    # Update existing item
-                    await self.storage.update_work_item(item_data["id"], item_data)
-                else:
-                    # Create new work item
-                    work_item = WorkItem(
-                        id=item_data["id"],
-                        title=item_data["title"],
-                        description=item_data.get("description"),
-                        type=item_data["type"],
-                        status=item_data["status"],
-                        priority=item_data["priority"],
-                        parent_id=item_data.get("parent_id"),
-                        tags=item_data.get("tags", [])
-                    )
-                    
-                    # Set additional attributes
-                    for attr, value in item_data.items():
-                        if attr not in ["id", "title", "description", "type", "status", "priority", "parent_id", "tags"]:
-                            setattr(work_item, attr, value)
-                    
-                    await self.storage.create_work_item(work_item)
-                
-                restored_count += 1
+                if selective_restore:
+                    batch = [item for item in batch if item.get("id") in selective_restore]
+                if batch:
+                    # Existing items are updated in place, missing ones created
+                    restored_count += len(await self.storage.upsert_work_items(batch))
             
             return {
                 "success": True,
                 "backup_id": backup_id,
                 "items_restored": restored_count,
-                "total_items_in_backup": len(backup_data["work_items"]),
-                "backup_created_at": backup_data["created_at"],
+                "total_items_in_backup": total_items,
+                "backup_created_at": header.get("created_at"),
                 "restored_at": datetime.now().isoformat()
             }
         
@@ -881,6 +811,72 @@ class UnifiedStorageTool(BaseTool):
                 "error_code": "RESTORE_ERROR"
             }
     
+    def _snapshot_store(self) -> LanceSnapshotStore:
+        return LanceSnapshotStore(os.path.join(self.backup_location, "snapshots"))
+    
+    async def _snapshot_namespace(self, backup_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Snapshot the active namespace's tables at their current versions."""
+        try:
+            manager = self.storage.lancedb_manager
+            if not manager._initialized:
+                await manager.initialize()
+            snapshot = await asyncio.to_thread(
+                self._snapshot_store().create_snapshot, manager, backup_config.get("backup_name")
+            )
+            return {
+                "success": True,
+                "backup_id": snapshot["snapshot_id"],
+                "backup_name": snapshot["name"],
+                "mode": "snapshot",
+                "namespace": snapshot["namespace"],
+                "table_versions": {name: table["version"] for name, table in snapshot["tables"].items()},
+                "files_added": snapshot["files_added"],
+                "bytes_added": snapshot["bytes_added"],
+                "created_at": snapshot["created_at"]
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Snapshot failed: {str(e)}",
+                "error_code": "BACKUP_ERROR"
+            }
+    
+    async def _restore_snapshot(self, restore_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Restore the active namespace to a snapshot, by id or point in time."""
+        try:
+            manager = self.storage.lancedb_manager
+            if not manager._initialized:
+                await manager.initialize()
+            store = self._snapshot_store()
+            snapshot = store.find_snapshot(manager.get_namespace(),
+                                           restore_config.get("backup_id"),
+                                           restore_config.get("restore_point"))
+            if snapshot is None:
+                return {
+                    "success": False,
+                    "error": "No matching snapshot found",
+                    "error_code": "BACKUP_NOT_FOUND"
+                }
+            result = await asyncio.to_thread(store.restore_snapshot, manager, snapshot)
+            # Rows changed underneath the in-memory indexes, rollups and graphs
+            manager.invalidate_tables(list(result["tables"]))
+            return {
+                "success": True,
+                "backup_id": snapshot["snapshot_id"],
+                "mode": "snapshot",
+                "namespace": snapshot["namespace"],
+                "table_versions": {name: table["version"] for name, table in result["tables"].items()},
+                "files_restored": sum(table["files_restored"] for table in result["tables"].values()),
+                "backup_created_at": snapshot["created_at"],
+                "restored_at": datetime.now().isoformat()
+            }
+        except Exception as e:
+            return {
+                "success": False,
+                "error": f"Restore failed: {str(e)}",
+                "error_code": "RESTORE_ERROR"
+            }
+    
     async def _validate_sync(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Validate synchronization readiness."""
         sync_direction = params.get("sync_direction")
@@ -1146,14 +1142,6 @@ class UnifiedStorageTool(BaseTool):
             }
         })
     
-    async def _calculate_file_checksum(self, file_path: str) -> str:
-        """Calculate MD5 checksum of a file."""
-        hash_md5 = hashlib.md5()
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    
     # Additional helper methods for validation, formatting, etc.
     async def _validate_file_access(self, file_path: str, sync_direction: str) -> Dict[str, Any]:
         """Validate file access permissions."""
@@ -1237,10 +1225,13 @@ class UnifiedStorageTool(BaseTool):
         # Implementation for conflict detection
         return []
     
-    async def _verify_backup_integrity(self, backup_data: Dict) -> Dict[str, Any]:
-        """Verify backup integrity."""
-        # Implementation for backup integrity verification
-        return {"valid": True}
+    async def _verify_backup_integrity(self, backup_file_path: str) -> Dict[str, Any]:
+        """Verify backup integrity by reading the file end to end."""
+        try:
+            result = await verify_backup(backup_file_path)
+        except BackupIntegrityError as e:
+            return {"valid": False, "error": str(e)}
+        return {"valid": True, "total_items": result["total_items"]}
     
     async def _parse_markdown_content(self, content: str) -> Dict[str, Any]:
         """Parse markdown content for work items."""
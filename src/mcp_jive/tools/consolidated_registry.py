@@ -6,7 +6,10 @@ while maintaining backward compatibility with legacy tools during transition.
 
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Callable
+import hashlib
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Dict, Any, List, Optional, Callable, AsyncIterator, Tuple
 from datetime import datetime
 import json
 
@@ -37,11 +40,59 @@ from .consolidated import (
 )
 from ..config import ServerConfig
 from ..lancedb_manager import LanceDBManager
+from ..lancedb_pool import LanceDBManagerPool
 from ..storage import WorkItemStorage
+from ..namespace.context import get_current_namespace, set_current_namespace, namespace_scope
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True)
+class ToolCatalog:
+    """Tool definitions compiled once per configuration.
+    
+    Holds the MCP Tool objects for tools/list handlers, the schema dicts
+    they were built from, and the ``{"tools": [...]}`` listing serialized
+    once with an ETag, so HTTP and JSON-RPC responses can send it as is.
+    """
+    tools: Tuple[Any, ...]
+    schemas: Dict[str, Dict[str, Any]]
+    aliases: Tuple[str, ...]
+    payload: bytes
+    etag: str
+    
+    def jsonrpc_response(self, request_id: Any) -> bytes:
+        """Serialized JSON-RPC tools/list response for a request id."""
+        return b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (json.dumps(request_id).encode("utf-8"), self.payload)
+
+
+def build_tool_catalog(schemas: Dict[str, Dict[str, Any]],
+                       aliases: Optional[Dict[str, Dict[str, Any]]] = None) -> ToolCatalog:
+    """Compile tool schemas into a ToolCatalog.
+    
+    Args:
+        schemas: Tool name → schema dict (name, description, inputSchema)
+        aliases: Legacy alias name → schema dict, listed after the tools
+        
+    Returns:
+        The compiled catalog
+    """
+    definitions: Dict[str, Dict[str, Any]] = {}
+    for tool_name, schema in {**schemas, **(aliases or {})}.items():
+        definitions[tool_name] = {
+            "name": tool_name,
+            "description": schema.get("description", f"Consolidated tool: {tool_name}"),
+            "inputSchema": schema.get("inputSchema", {})
+        }
+    tools = tuple(Tool(name=d["name"], description=d["description"], inputSchema=d["inputSchema"])
+                  for d in definitions.values())
+    payload = json.dumps({"tools": list(definitions.values())}, separators=(",", ":"),
+                         default=str).encode("utf-8")
+    etag = '"%s"' % hashlib.sha256(payload).hexdigest()[:32]
+    return ToolCatalog(tools=tools, schemas=definitions, aliases=tuple(aliases or ()),
+                       payload=payload, etag=etag)
+
+
 class MCPConsolidatedToolRegistry:
     """MCP Tool Registry using consolidated tools.
     
@@ -51,18 +102,21 @@ class MCPConsolidatedToolRegistry:
     
     def __init__(self, 
                  config: Optional[ServerConfig] = None,
-                 lancedb_manager: Optional[LanceDBManager] = None):
+                 lancedb_manager: Optional[LanceDBManager] = None,
+                 manager_pool: Optional[LanceDBManagerPool] = None):
         """Initialize the consolidated tool registry.
         
         Args:
             config: Server configuration
             lancedb_manager: Database manager instance
+            manager_pool: Shared per-namespace database manager pool
         """
         self.config = config or ServerConfig()
         self.lancedb_manager = lancedb_manager
         
         # Initialize storage with LanceDB backend
-        self.storage = WorkItemStorage(lancedb_manager=lancedb_manager)
+        self.storage = WorkItemStorage(lancedb_manager=lancedb_manager, manager_pool=manager_pool)
+        self.manager_pool = self.storage.manager_pool
         
         # Initialize consolidated registry
         self.consolidated_registry: Optional[ConsolidatedToolRegistry] = None
@@ -70,6 +124,8 @@ class MCPConsolidatedToolRegistry:
         # Tool tracking
         self.tools: Dict[str, Tool] = {}
         self.tool_instances: Dict[str, Any] = {}
+        # Compiled tool definitions, rebuilt only on update_config()
+        self.catalog: Optional[ToolCatalog] = None
         self.is_initialized = False
         
         # Performance metrics
@@ -78,9 +134,6 @@ class MCPConsolidatedToolRegistry:
         self.legacy_call_count = 0
         self.start_time = datetime.now()
         
-        # Namespace context
-        self.current_namespace: Optional[str] = None
-        
     async def initialize(self) -> None:
         """Initialize the registry and all tools."""
         if self.is_initialized:
@@ -97,7 +150,8 @@ class MCPConsolidatedToolRegistry:
             self.consolidated_registry = create_consolidated_registry(
                 storage=self.storage,
                 lancedb_manager=self.lancedb_manager,
-                enable_legacy_support=False
+                enable_legacy_support=False,
+                manager_pool=self.manager_pool
             )
             
             # Register only the 7 consolidated tools
@@ -116,24 +170,32 @@ class MCPConsolidatedToolRegistry:
         
         # Get tool schemas from consolidated registry
         tool_schemas = self.consolidated_registry.get_tool_schemas()
+        schemas = {name: tool_schemas[name] for name in CONSOLIDATED_TOOLS if name in tool_schemas}
+        self.catalog = build_tool_catalog(schemas, self.consolidated_registry.get_alias_schemas())
         
-        for tool_name in CONSOLIDATED_TOOLS:
-            if tool_name in tool_schemas:
-                schema = tool_schemas[tool_name]
-                self.tools[tool_name] = self._create_mcp_tool_schema(tool_name, schema)
-                self.tool_instances[tool_name] = self.consolidated_registry
+        self.tools = {tool.name: tool for tool in self.catalog.tools}
+        self.tool_instances = {name: self.consolidated_registry for name in self.tools}
                 
         logger.info(f"Registered {len(CONSOLIDATED_TOOLS)} consolidated tools")
     
-
+    async def get_tool_catalog(self) -> ToolCatalog:
+        """Get the compiled tool definitions (initializing the registry if needed)."""
+        if not self.is_initialized:
+            await self.initialize()
+        return self.catalog
     
-    def _create_mcp_tool_schema(self, tool_name: str, schema: Dict[str, Any]) -> Tool:
-        """Create MCP Tool schema from consolidated tool schema."""
-        return Tool(
-            name=tool_name,
-            description=schema.get("description", f"Consolidated tool: {tool_name}"),
-            inputSchema=schema.get("inputSchema", {})
-        )
+    async def update_config(self, config: Any) -> None:
+        """Apply a reloaded configuration and recompile the tool definitions.
+        
+        Args:
+            config: Reloaded server configuration
+        """
+        self.config = config
+        if self.consolidated_registry is None:
+            return
+        self.consolidated_registry.invalidate_schema_cache()
+        await self._register_consolidated_tools()
+        logger.info(f"Tool definitions recompiled (ETag {self.catalog.etag})")
     
 
     
@@ -142,26 +204,22 @@ class MCPConsolidatedToolRegistry:
         if not self.is_initialized:
             # Return empty dict if not initialized yet
             return {}
-            
-        schemas = {}
-        for tool_name, tool in self.tools.items():
-            # Convert MCP Tool back to schema dict
-            schemas[tool_name] = {
-                "name": tool.name,
-                "description": tool.description,
-                "inputSchema": tool.inputSchema
-            }
-        return schemas
+        return self.catalog.schemas
     
     async def list_tools(self) -> List[Tool]:
         """List all available tools."""
-        if not self.is_initialized:
-            await self.initialize()
-            
-        return list(self.tools.values())
+        catalog = await self.get_tool_catalog()
+        return list(catalog.tools)
     
-    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> List[TextContent]:
-        """Call a tool by name with arguments."""
+    async def call_tool(self, name: str, arguments: Dict[str, Any],
+                        namespace: Optional[str] = None) -> List[TextContent]:
+        """Call a tool by name with arguments.
+        
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            namespace: Optional resolved namespace to run the call in
+        """
         if not self.is_initialized:
             await self.initialize()
             
@@ -177,7 +235,8 @@ class MCPConsolidatedToolRegistry:
                 raise ValueError(f"Tool '{name}' not found")
             
             # Execute through consolidated registry
-            result = await self.consolidated_registry.handle_tool_call(name, arguments)
+            async with self.namespace_scope(namespace):
+                result = await self.consolidated_registry.handle_tool_call(name, arguments)
             
             # Format result for MCP
             return [TextContent(
@@ -199,8 +258,15 @@ class MCPConsolidatedToolRegistry:
                 }, indent=2)
             )]
     
-    async def handle_tool_call(self, name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Handle a tool call and return the result directly (for HTTP API)."""
+    async def handle_tool_call(self, name: str, arguments: Dict[str, Any],
+                               namespace: Optional[str] = None) -> Dict[str, Any]:
+        """Handle a tool call and return the result directly (for HTTP API).
+        
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            namespace: Optional resolved namespace to run the call in
+        """
         if not self.is_initialized:
             await self.initialize()
             
@@ -216,7 +282,8 @@ class MCPConsolidatedToolRegistry:
                 raise ValueError(f"Tool '{name}' not found")
             
             # Execute through consolidated registry
-            result = await self.consolidated_registry.handle_tool_call(name, arguments)
+            async with self.namespace_scope(namespace):
+                result = await self.consolidated_registry.handle_tool_call(name, arguments)
             return result
             
         except Exception as e:
@@ -239,11 +306,11 @@ class MCPConsolidatedToolRegistry:
         if name not in self.tools:
             return None
             
-        tool_schema = self.tools[name]
+        tool_schema = self.catalog.schemas[name]
         info = {
             "name": name,
-            "description": tool_schema.description,
-            "schema": tool_schema.inputSchema,
+            "description": tool_schema["description"],
+            "schema": tool_schema["inputSchema"],
             "is_consolidated": name in CONSOLIDATED_TOOLS
         }
                 
@@ -317,27 +384,52 @@ class MCPConsolidatedToolRegistry:
     
 
     
+    @property
+    def current_namespace(self) -> Optional[str]:
+        """Namespace of the current request context."""
+        return get_current_namespace()
+    
+    @asynccontextmanager
+    async def namespace_scope(self, namespace: Optional[str]) -> AsyncIterator[Optional[str]]:
+        """Run the enclosed block in a namespace, scoped to the current request.
+        
+        The namespace is carried in a context variable, so concurrent requests
+        for different namespaces can execute at the same time.
+        
+        Args:
+            namespace: Resolved namespace, or None to keep the current context
+        """
+        if not namespace:
+            yield get_current_namespace()
+            return
+        
+        # Lease the pooled manager so it is not evicted while tools use it
+        if self.manager_pool:
+            async with self.manager_pool.lease(namespace):
+                with namespace_scope(namespace):
+                    yield namespace
+            return
+        with namespace_scope(namespace):
+            yield namespace
+    
     async def set_namespace_context(self, namespace: str) -> None:
-        """Set the current namespace context for tool execution.
+        """Set the namespace for the current request context.
+        
+        Prefer ``namespace_scope`` or the ``namespace`` argument of
+        ``call_tool``/``handle_tool_call``, which restore the previous value.
         
         Args:
             namespace: Namespace to set as current context
         """
         logger.debug(f"Setting namespace context to: {namespace}")
-        self.current_namespace = namespace
-        
-        # If the consolidated registry supports namespace context, set it there too
-        if self.consolidated_registry and hasattr(self.consolidated_registry, 'set_namespace_context'):
-            await self.consolidated_registry.set_namespace_context(namespace)
+        if self.manager_pool:
+            await self.manager_pool.acquire(namespace)
+        set_current_namespace(namespace)
     
     async def clear_namespace_context(self) -> None:
-        """Clear the current namespace context."""
+        """Clear the namespace for the current request context."""
         logger.debug("Clearing namespace context")
-        self.current_namespace = None
-        
-        # If the consolidated registry supports namespace context, clear it there too
-        if self.consolidated_registry and hasattr(self.consolidated_registry, 'clear_namespace_context'):
-            await self.consolidated_registry.clear_namespace_context()
+        set_current_namespace(None)
     
     def get_current_namespace(self) -> Optional[str]:
         """Get the current namespace context.
@@ -345,7 +437,7 @@ class MCPConsolidatedToolRegistry:
         Returns:
             Current namespace or None if not set
         """
-        return self.current_namespace
+        return get_current_namespace()
 
     async def cleanup(self) -> None:
         """Cleanup registry resources."""
@@ -353,8 +445,8 @@ class MCPConsolidatedToolRegistry:
         
         try:
             if self.consolidated_registry:
-                # Consolidated registry cleanup if needed
-                pass
+                # Tools flush write-behind state through storage, so they go first
+                await self.consolidated_registry.shutdown()
                 
             if self.storage:
                 await self.storage.cleanup()
@@ -373,18 +465,21 @@ class MCPConsolidatedToolRegistry:
 # Factory function for easy creation
 def create_mcp_consolidated_registry(
     config: Optional[ServerConfig] = None,
-    lancedb_manager: Optional[LanceDBManager] = None
+    lancedb_manager: Optional[LanceDBManager] = None,
+    manager_pool: Optional[LanceDBManagerPool] = None
 ) -> MCPConsolidatedToolRegistry:
     """Create a new MCP consolidated tool registry.
     
     Args:
         config: Server configuration
         lancedb_manager: Database manager
+        manager_pool: Shared per-namespace database manager pool
         
     Returns:
         Configured registry instance
     """
     return MCPConsolidatedToolRegistry(
         config=config,
-        lancedb_manager=lancedb_manager
+        lancedb_manager=lancedb_manager,
+        manager_pool=manager_pool
     )
\ No newline at end of file
@@ -535,7 +535,7 @@ class SearchDiscoveryTools:
             # Get all work items (tasks are stored as work items)
             all_items = await self.lancedb_manager.list_work_items(
                 filters={},
-                limit=1000,  # Get all items for hierarchy building
+                limit=None,  # Get all items for hierarchy building
                 offset=0,
                 sort_by="created_at",
                 sort_order="asc"
@@ -1,26 +1,236 @@
-"""WebSocket connection manager for real-time event broadcasting."""
+"""WebSocket connection manager for real-time event broadcasting.
+
+Every connection gets a bounded outbound queue drained by its own sender
+task, so broadcasting only serializes the event once and appends it to each
+queue; a slow or half-dead client delays nobody but itself. When a queue is
+full the oldest pending message is dropped, and events that supersede
+earlier ones (the latest progress or update of a work item) replace their
+pending predecessor instead of queueing behind it. Change feed batches cannot
+be dropped without leaving a gap in ``seq``, so dropping one discards every
+queued batch and queues a single ``resync`` marker in their place.
+"""
 
 import json
 import logging
 import asyncio
+import time
+from collections import deque
 from datetime import datetime
-from typing import Dict, Set, Any, Optional
-from fastapi import WebSocket
-from weakref import WeakSet
+from typing import TYPE_CHECKING, Deque, Dict, Set, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    # Only used for annotations; importing FastAPI costs a quarter second
+    from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
 
+# Messages pending per connection before the oldest is dropped
+DEFAULT_MAX_QUEUE_SIZE = 256
+# A send still in flight after this long marks the connection as dead
+DEFAULT_SEND_TIMEOUT_SECONDS = 10.0
+# Event type of change feed batches and of the marker that replaces lost ones
+CHANGE_BATCH_EVENT = "work_item_changes"
+RESYNC_EVENT = "resync"
+
+
+def coalesce_key(event_type: str, data: Dict[str, Any]) -> Optional[Tuple[str, ...]]:
+    """Key under which a pending event is superseded by a newer one.
+
+    Args:
+        event_type: Type of event
+        data: Event data
+
+    Returns:
+        Key shared by events that only the latest of matters, or None if the
+        event must be delivered in full
+    """
+    if event_type == RESYNC_EVENT:
+        return (event_type,)
+    if event_type == "progress_update":
+        work_item_id = data.get("work_item_id") or data.get("id")
+        return (event_type, str(work_item_id)) if work_item_id else None
+    if event_type == "work_item_update" and data.get("action") == "update":
+        work_item = data.get("work_item") or {}
+        work_item_id = work_item.get("id") if isinstance(work_item, dict) else None
+        return (event_type, "update", str(work_item_id)) if work_item_id else None
+    return None
+
+
+def change_batch_seq(event_type: str, data: Dict[str, Any]) -> Optional[int]:
+    """Feed position of a change feed batch, or None for any other event."""
+    if event_type != CHANGE_BATCH_EVENT:
+        return None
+    seq = data.get("seq")
+    return seq if isinstance(seq, int) else None
+
+
+def serialize_event(event_type: str, data: Dict[str, Any]) -> str:
+    """Serialize an event into the message sent to clients."""
+    return json.dumps({
+        "type": event_type,
+        "data": data,
+        "timestamp": datetime.now().isoformat()
+    })
+
+
+class _QueuedMessage:
+    """A serialized message waiting in a connection's queue."""
+    __slots__ = ("key", "text", "enqueued_at", "seq")
+
+    def __init__(self, key: Optional[Tuple[str, ...]], text: str, enqueued_at: float,
+                 seq: Optional[int] = None):
+        self.key = key
+        self.text = text
+        self.enqueued_at = enqueued_at
+        # Feed position if this is a change feed batch
+        self.seq = seq
+
+
+class _ConnectionChannel:
+    """Outbound queue, sender task and delivery metrics of one connection."""
+
+    def __init__(self, websocket: "WebSocket", max_queue_size: int):
+        self.websocket = websocket
+        self.max_queue_size = max_queue_size
+        self.queue: Deque[_QueuedMessage] = deque()
+        self.pending: Dict[Tuple[str, ...], _QueuedMessage] = {}
+        self.wakeup = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        # perf_counter() when the send in flight started, None when idle
+        self.sending_since: Optional[float] = None
+
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.resyncs = 0
+        self.max_depth = 0
+        self.last_send_ms = 0.0
+        self.max_send_ms = 0.0
+        self.total_send_ms = 0.0
+        self.last_queue_wait_ms = 0.0
+        self.max_queue_wait_ms = 0.0
+
+    def enqueue(self, key: Optional[Tuple[str, ...]], text: str, now: float,
+                seq: Optional[int] = None) -> None:
+        if key is not None:
+            pending = self.pending.get(key)
+            if pending is not None:
+                # Keep its place in line but deliver the newest state
+                pending.text = text
+                self.coalesced += 1
+                return
+
+        if len(self.queue) >= self.max_queue_size:
+            self._drop_oldest(now)
+
+        message = _QueuedMessage(key, text, now, seq)
+        self.queue.append(message)
+        if key is not None:
+            self.pending[key] = message
+        if len(self.queue) > self.max_depth:
+            self.max_depth = len(self.queue)
+        self.wakeup.set()
+
+    def _drop_oldest(self, now: float) -> None:
+        # The resync marker is never dropped; it is what reports the loss
+        marker = self.pending.get((RESYNC_EVENT,))
+        oldest = next((message for message in self.queue if message is not marker), None)
+        if oldest is None:
+            return
+        self.queue.remove(oldest)
+        if oldest.key is not None and self.pending.get(oldest.key) is oldest:
+            del self.pending[oldest.key]
+        self.dropped += 1
+        if oldest.seq is not None:
+            self._replace_batches_with_resync(oldest.seq, now)
+            if len(self.queue) >= self.max_queue_size:
+                # No batches are left, so this drops a plain event at most
+                self._drop_oldest(now)
+
+    def _replace_batches_with_resync(self, dropped_seq: int, now: float) -> None:
+        # The client has to reload anyway, so the batches still queued are
+        # stale too; it resumes from the newest of them after the marker
+        last_seq = dropped_seq
+        kept: Deque[_QueuedMessage] = deque()
+        for message in self.queue:
+            if message.seq is None:
+                kept.append(message)
+            else:
+                last_seq = max(last_seq, message.seq)
+                self.dropped += 1
+        self.queue = kept
+
+        text = serialize_event(RESYNC_EVENT, {"seq": last_seq})
+        marker = self.pending.get((RESYNC_EVENT,))
+        if marker is not None:
+            marker.text = text
+            self.coalesced += 1
+        else:
+            marker = _QueuedMessage((RESYNC_EVENT,), text, now)
+            self.queue.append(marker)
+            self.pending[marker.key] = marker
+            self.resyncs += 1
+
+    def next_message(self) -> Optional[_QueuedMessage]:
+        if not self.queue:
+            self.wakeup.clear()
+            return None
+        message = self.queue.popleft()
+        if message.key is not None and self.pending.get(message.key) is message:
+            del self.pending[message.key]
+        return message
+
+    def record_send(self, queued_at: float, started: float, finished: float) -> None:
+        send_ms = (finished - started) * 1000
+        wait_ms = (started - queued_at) * 1000
+        self.sent += 1
+        self.last_send_ms = send_ms
+        self.total_send_ms += send_ms
+        self.max_send_ms = max(self.max_send_ms, send_ms)
+        self.last_queue_wait_ms = wait_ms
+        self.max_queue_wait_ms = max(self.max_queue_wait_ms, wait_ms)
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "queue_depth": len(self.queue),
+            "max_queue_depth": self.max_depth,
+            "sent": self.sent,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+            "resyncs": self.resyncs,
+            "send_latency_ms": {
+                "last": round(self.last_send_ms, 3),
+                "avg": round(self.total_send_ms / self.sent, 3) if self.sent else 0.0,
+                "max": round(self.max_send_ms, 3)
+            },
+            "queue_wait_ms": {
+                "last": round(self.last_queue_wait_ms, 3),
+                "max": round(self.max_queue_wait_ms, 3)
+            }
+        }
+
+
 class WebSocketConnectionManager:
     """Manages WebSocket connections and handles broadcasting events to all connected clients."""
     
-    def __init__(self):
+    def __init__(self, max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+                 send_timeout: float = DEFAULT_SEND_TIMEOUT_SECONDS):
+        """Initialize the connection manager.
+
+        Args:
+            max_queue_size: Messages pending per connection before the oldest is dropped
+            send_timeout: Seconds a send may stay in flight before the connection is dropped
+        """
         # Use a regular set to track active connections
         # We'll handle cleanup manually in disconnect method
-        self.active_connections: Set[WebSocket] = set()
-        self.connection_metadata: Dict[WebSocket, Dict[str, Any]] = {}
+        self.active_connections: Set["WebSocket"] = set()
+        self.connection_metadata: Dict["WebSocket", Dict[str, Any]] = {}
+        self.max_queue_size = max_queue_size
+        self.send_timeout = send_timeout
+        self._channels: Dict["WebSocket", _ConnectionChannel] = {}
         self._lock = asyncio.Lock()
     
-    async def connect(self, websocket: WebSocket, client_info: Optional[Dict[str, Any]] = None) -> None:
+    async def connect(self, websocket: "WebSocket", client_info: Optional[Dict[str, Any]] = None) -> None:
         """Register a new WebSocket connection.
         
         Args:
@@ -34,23 +244,55 @@ class WebSocketConnectionManager:
                 "client_info": client_info or {},
                 "last_ping": datetime.now().isoformat()
             }
+            channel = _ConnectionChannel(websocket, self.max_queue_size)
+            channel.task = asyncio.create_task(self._sender(channel))
+            self._channels[websocket] = channel
             
         logger.info(f"WebSocket client connected. Total connections: {len(self.active_connections)}")
     
-    async def disconnect(self, websocket: WebSocket) -> None:
+    async def disconnect(self, websocket: "WebSocket") -> None:
         """Unregister a WebSocket connection.
         
         Args:
             websocket: The WebSocket connection to remove
         """
         async with self._lock:
-            self.active_connections.discard(websocket)
-            self.connection_metadata.pop(websocket, None)
+            self._remove(websocket)
             
         logger.info(f"WebSocket client disconnected. Total connections: {len(self.active_connections)}")
-    
-    async def broadcast_event(self, event_type: str, data: Dict[str, Any], exclude: Optional[WebSocket] = None) -> int:
+
+    def _remove(self, websocket: "WebSocket") -> None:
+        self.active_connections.discard(websocket)
+        self.connection_metadata.pop(websocket, None)
+        channel = self._channels.pop(websocket, None)
+        if channel is not None and channel.task is not None and channel.task is not asyncio.current_task():
+            channel.task.cancel()
+
+    async def _sender(self, channel: _ConnectionChannel) -> None:
+        """Drain one connection's queue until it is closed or a send fails."""
+        while True:
+            message = channel.next_message()
+            if message is None:
+                await channel.wakeup.wait()
+                continue
+
+            started = channel.sending_since = time.perf_counter()
+            try:
+                await channel.websocket.send_text(message.text)
+            except Exception as e:
+                logger.warning(f"Failed to send to WebSocket client, dropping connection: {e!r}")
+                async with self._lock:
+                    if self._channels.get(channel.websocket) is channel:
+                        self._remove(channel.websocket)
+                return
+            channel.sending_since = None
+            channel.record_send(message.enqueued_at, started, time.perf_counter())
+
+    async def broadcast_event(self, event_type: str, data: Dict[str, Any], exclude: Optional["WebSocket"] = None) -> int:
         """Broadcast an event to all connected WebSocket clients.
+
+        The event is serialized once and queued for every connection; the
+        call returns without waiting for any client to receive it.
         
         Args:
             event_type: Type of event (e.g., 'work_item_update', 'progress_update')
@@ -58,49 +300,52 @@ class WebSocketConnectionManager:
             exclude: Optional WebSocket connection to exclude from broadcast
             
         Returns:
-            Number of clients that received the event
+            Number of clients the event was queued for
+        """
+        return self.queue_broadcast(event_type, data, exclude)
+
+    def queue_broadcast(self, event_type: str, data: Dict[str, Any], exclude: Optional["WebSocket"] = None) -> int:
+        """Synchronous form of broadcast_event for callbacks outside coroutines.
+
+        Args:
+            event_type: Type of event
+            data: Event data to broadcast
+            exclude: Optional WebSocket connection to exclude from broadcast
+
+        Returns:
+            Number of clients the event was queued for
         """
-        if not self.active_connections:
+        if not self._channels:
             logger.debug(f"No active WebSocket connections to broadcast {event_type} event")
             return 0
         
-        message = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        message_str = json.dumps(message)
-        successful_sends = 0
-        failed_connections = set()
-        
-        # Create a copy of connections to avoid modification during iteration
-        connections_to_broadcast = self.active_connections.copy()
-        if exclude:
-            connections_to_broadcast.discard(exclude)
-        
-        for connection in connections_to_broadcast:
-            try:
-                await connection.send_text(message_str)
-                successful_sends += 1
-                logger.debug(f"Sent {event_type} event to WebSocket client")
-            except Exception as e:
-                logger.warning(f"Failed to send {event_type} event to WebSocket client: {e}")
-                failed_connections.add(connection)
-        
-        # Clean up failed connections
-        if failed_connections:
-            async with self._lock:
-                for failed_connection in failed_connections:
-                    self.active_connections.discard(failed_connection)
-                    self.connection_metadata.pop(failed_connection, None)
-            
-            logger.info(f"Cleaned up {len(failed_connections)} failed WebSocket connections")
+        message_str = serialize_event(event_type, data)
+        key = coalesce_key(event_type, data)
+        seq = change_batch_seq(event_type, data)
+        now = time.perf_counter()
+        stuck_before = now - self.send_timeout
+        queued = 0
+        stuck = []
+        for websocket, channel in self._channels.items():
+            if websocket is exclude:
+                continue
+            if channel.sending_since is not None and channel.sending_since < stuck_before:
+                stuck.append(websocket)
+                continue
+            channel.enqueue(key, message_str, now, seq)
+            queued += 1
+
+        if stuck:
+            # Checked here rather than with a timeout around every send, which
+            # would cost a task per message
+            for websocket in stuck:
+                self._remove(websocket)
+            logger.info(f"Dropped {len(stuck)} WebSocket connections stuck sending for over {self.send_timeout:.0f}s")
         
-        logger.info(f"Broadcasted {event_type} event to {successful_sends} clients")
-        return successful_sends
+        logger.debug(f"Queued {event_type} event for {queued} clients")
+        return queued
     
-    async def send_to_connection(self, websocket: WebSocket, event_type: str, data: Dict[str, Any]) -> bool:
+    async def send_to_connection(self, websocket: "WebSocket", event_type: str, data: Dict[str, Any]) -> bool:
         """Send an event to a specific WebSocket connection.
         
         Args:
@@ -109,32 +354,23 @@ class WebSocketConnectionManager:
             data: Event data
             
         Returns:
-            True if sent successfully, False otherwise
+            True if the event was queued, False if the connection is inactive
         """
-        if websocket not in self.active_connections:
+        channel = self._channels.get(websocket)
+        if channel is None:
             logger.warning("Attempted to send to inactive WebSocket connection")
             return False
         
-        message = {
-            "type": event_type,
-            "data": data,
-            "timestamp": datetime.now().isoformat()
-        }
-        
-        try:
-            await websocket.send_text(json.dumps(message))
-            logger.debug(f"Sent {event_type} event to specific WebSocket client")
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to send {event_type} event to specific client: {e}")
-            await self.disconnect(websocket)
-            return False
+        channel.enqueue(coalesce_key(event_type, data), serialize_event(event_type, data),
+                        time.perf_counter(), change_batch_seq(event_type, data))
+        logger.debug(f"Queued {event_type} event for specific WebSocket client")
+        return True
     
     async def ping_all_connections(self) -> int:
         """Send ping to all active connections to check health.
         
         Returns:
-            Number of connections that responded successfully
+            Number of connections the ping was queued for
         """
         return await self.broadcast_event("ping", {"message": "heartbeat"})
     
@@ -150,17 +386,26 @@ class WebSocketConnectionManager:
         """Get information about all active connections.
         
         Returns:
-            Dictionary with connection statistics and metadata
+            Dictionary with connection statistics, metadata and per-connection
+            queue depth and send latency
         """
+        connections = []
+        for ws in self.active_connections:
+            channel = self._channels.get(ws)
+            connections.append({
+                "client": str(ws.client) if hasattr(ws, 'client') else "unknown",
+                "metadata": self.connection_metadata.get(ws, {}),
+                "outbound": channel.get_stats() if channel else None
+            })
+        channels = list(self._channels.values())
         return {
             "total_connections": len(self.active_connections),
-            "connections": [
-                {
-                    "client": str(ws.client) if hasattr(ws, 'client') else "unknown",
-                    "metadata": self.connection_metadata.get(ws, {})
-                }
-                for ws in self.active_connections
-            ]
+            "max_queue_size": self.max_queue_size,
+            "queued_messages": sum(len(c.queue) for c in channels),
+            "max_queue_depth": max((len(c.queue) for c in channels), default=0),
+            "dropped_messages": sum(c.dropped for c in channels),
+            "coalesced_messages": sum(c.coalesced for c in channels),
+            "connections": connections
         }
     
     async def cleanup_stale_connections(self) -> int:
@@ -181,12 +426,11 @@ class WebSocketConnectionManager:
         if stale_connections:
             async with self._lock:
                 for stale_connection in stale_connections:
-                    self.active_connections.discard(stale_connection)
-                    self.connection_metadata.pop(stale_connection, None)
+                    self._remove(stale_connection)
             
             logger.info(f"Cleaned up {len(stale_connections)} stale WebSocket connections")
         
         return len(stale_connections)
 
 # Global instance to be used across the application
-websocket_manager = WebSocketConnectionManager()
\ No newline at end of file
+websocket_manager = WebSocketConnectionManager()
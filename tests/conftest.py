@@ -48,6 +48,42 @@ def temp_dir():
     shutil.rmtree(temp_path, ignore_errors=True)
 
 
+@pytest_asyncio.fixture
+async def lancedb_manager(temp_dir):
+    """Initialized LanceDBManager with its database in a temporary directory."""
+    from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+    
+    manager = LanceDBManager(DatabaseConfig(data_path=str(temp_dir / "db")))
+    await manager.initialize()
+    yield manager
+    await manager.shutdown()
+
+
+@pytest.fixture
+def work_item_row():
+    """Factory for complete WorkItem table rows, for seeding tables directly.
+    
+    Call it with the fields to set; ``id`` is required, ``item_id`` and
+    ``title`` default to the id and the vector to zeros.
+    """
+    from mcp_jive.lancedb_manager import WorkItemModel
+    
+    def make_row(**overrides) -> Dict[str, Any]:
+        fields = {
+            "item_id": overrides["id"],
+            "title": overrides["id"],
+            "description": "Task",
+            "vector": [0.0] * 384,
+            "item_type": "task",
+            "status": "not_started",
+            "priority": "medium",
+        }
+        fields.update(overrides)
+        return WorkItemModel(**fields).model_dump()
+    
+    return make_row
+
+
 @pytest.fixture
 def mock_env():
     """Provide a clean environment for testing."""
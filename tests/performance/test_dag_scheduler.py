@@ -0,0 +1,70 @@
+"""Makespan benchmark: DAG scheduler versus barrier waves.
+
+Runs synthetic 1k-node DAGs whose tasks just sleep, comparing the DAG
+scheduler against the previous wave loop that started up to max_parallel
+ready tasks and waited for all of them before looking for more. Run with:
+
+    pytest tests/performance/test_dag_scheduler.py -m performance -s
+"""
+
+import asyncio
+import random
+import time
+
+import pytest
+
+from mcp_jive.services.dag_scheduler import DagScheduler
+
+NODE_COUNT = 1000
+MAX_PARALLEL = 8
+
+
+def _synthetic_dag(seed: int):
+    """Random DAG: each node depends on up to 3 earlier nodes; ~5% of tasks are slow."""
+    rng = random.Random(seed)
+    graph, durations = {}, {}
+    for i in range(NODE_COUNT):
+        node = f"n{i}"
+        candidates = range(max(0, i - 50), i)
+        graph[node] = [f"n{j}" for j in rng.sample(candidates, min(len(candidates), rng.randint(0, 3)))]
+        durations[node] = 0.02 if rng.random() < 0.05 else 0.001
+    return graph, durations
+
+
+async def _run_waves(graph, run, max_parallel):
+    """The previous dependency-based loop (barrier waves, O(n) rescans)."""
+    completed, running = set(), set()
+    while len(completed) < len(graph):
+        ready = []
+        for node, deps in graph.items():
+            if node not in completed and node not in running and len(ready) < max_parallel:
+                if all(dep in completed for dep in deps):
+                    ready.append(node)
+        if not ready:
+            break
+        running.update(ready)
+        await asyncio.gather(*(run(node) for node in ready), return_exceptions=True)
+        completed.update(ready)
+        running.difference_update(ready)
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+@pytest.mark.parametrize("seed", [1, 2, 3])
+async def test_dag_scheduler_makespan(seed):
+    """The DAG scheduler finishes 1k-node graphs faster than barrier waves."""
+    graph, durations = _synthetic_dag(seed)
+
+    async def run(node):
+        await asyncio.sleep(durations[node])
+
+    start = time.perf_counter()
+    await _run_waves(graph, run, MAX_PARALLEL)
+    waves = time.perf_counter() - start
+
+    result = await DagScheduler(MAX_PARALLEL).run(graph, run)
+
+    print(f"\nseed={seed}: waves {waves * 1000:.0f} ms, dag {result.makespan * 1000:.0f} ms "
+          f"({waves / result.makespan:.1f}x)")
+    assert len(result.completed) == NODE_COUNT
+    assert result.makespan < waves
@@ -0,0 +1,46 @@
+"""Embedding throughput benchmark for different batch sizes.
+
+Loads the real sentence-transformers model, so it is marked ``slow``. Run with:
+
+    pytest tests/performance/test_embedding_throughput.py -m performance -s
+"""
+
+import time
+
+import pytest
+
+from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+
+TEXT_COUNT = 256
+SAMPLE_TEXTS = [
+    f"Implement feature {i}: authentication flow, token refresh and audit logging"
+    for i in range(TEXT_COUNT)
+]
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+@pytest.mark.parametrize("batch_size", [1, 16, 64])
+async def test_embedding_throughput(batch_size, temp_dir):
+    """Measure texts/second through the batching embedder."""
+    # Without the model, embeddings fall back to zero vectors and the numbers are meaningless
+    pytest.importorskip("sentence_transformers")
+    manager = LanceDBManager(DatabaseConfig(data_path=str(temp_dir), batch_size=batch_size))
+    await manager.initialize()
+    # Load the model outside the timed section
+    await manager.warm_up_embedding_model()
+
+    start = time.perf_counter()
+    vectors = await manager.generate_embeddings(SAMPLE_TEXTS)
+    elapsed = time.perf_counter() - start
+    await manager.cleanup()
+
+    stats = manager.embedder.get_stats()
+    print(f"\nbatch_size={batch_size}: {TEXT_COUNT / elapsed:.1f} texts/s "
+          f"({elapsed * 1000:.0f} ms, {stats['batches']} batches)")
+
+    assert stats['batches'] > 0
+    assert len(vectors) == TEXT_COUNT
+    assert all(len(vector) == manager.config.vector_dimension for vector in vectors)
+    assert all(any(value != 0 for value in vector) for vector in vectors)
@@ -0,0 +1,111 @@
+"""Hybrid search latency/recall benchmark on a synthetic 50k-item namespace.
+
+Compares the fused (reciprocal rank fusion) hybrid search against the
+previous implementation, which ran two ``limit // 2`` queries, concatenated
+the frames and cut vector matches at distance 0.8. Vectors are synthetic
+topic clusters; the query embedding is seeded into the embedding cache, so
+the model is never loaded. Run with:
+
+    pytest tests/performance/test_hybrid_search.py -m performance -s
+"""
+
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from mcp_jive.lancedb_manager import LanceDBManager
+
+ITEM_COUNT = 50_000
+DIMENSION = 384
+LIMIT = 20
+RUNS = 20
+STATUSES = ["not_started", "in_progress", "completed", "blocked"]
+TOPICS = [
+    "authentication", "billing", "caching", "deployment", "encryption", "federation",
+    "gateway", "hashing", "indexing", "journaling", "kubernetes", "logging",
+    "messaging", "notifications", "onboarding", "pagination", "queueing", "reporting",
+    "scheduling", "telemetry", "upload", "validation", "webhooks", "exports",
+]
+
+
+def _legacy_hybrid(table, query: str, query_vector, limit: int):
+    """The pre-fusion hybrid search (filters were ignored in this mode)."""
+    vector_results = table.search(query_vector).limit(limit // 2).to_pandas()
+    vector_results = vector_results[vector_results['_distance'] <= 0.8]
+    keyword_results = table.search(query, query_type="fts").limit(limit // 2).to_pandas()
+    if not vector_results.empty and not keyword_results.empty:
+        combined = pd.concat([vector_results, keyword_results]).drop_duplicates(subset=['id'])
+    else:
+        combined = vector_results if not vector_results.empty else keyword_results
+    return combined.head(limit).to_dict('records')
+
+
+async def _populate(manager: LanceDBManager, work_item_row, rng: np.random.Generator):
+    """Write ITEM_COUNT work items in topic clusters straight into the table."""
+    centroids = rng.normal(size=(len(TOPICS), DIMENSION)).astype(np.float32)
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True)
+
+    table = await manager.get_table("WorkItem")
+    chunk = 5_000
+    for start in range(0, ITEM_COUNT, chunk):
+        rows = []
+        for i in range(start, min(start + chunk, ITEM_COUNT)):
+            topic = i % len(TOPICS)
+            vector = centroids[topic] + rng.normal(scale=0.04, size=DIMENSION)
+            vector /= np.linalg.norm(vector)
+            rows.append(work_item_row(
+                id=f"item-{i}",
+                title=f"{TOPICS[topic].capitalize()} component {i}",
+                description=f"Improve the {TOPICS[topic]} service and its integration tests",
+                vector=vector.tolist(),
+                status=STATUSES[i % len(STATUSES)],
+                order_index=i,
+            ))
+        table.add(rows)
+    await manager._ensure_fts_index("WorkItem")
+    return centroids
+
+
+@pytest.mark.performance
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_hybrid_search_latency_and_recall(lancedb_manager, work_item_row):
+    """Fused hybrid search fills the limit with filter-matching, on-topic items."""
+    manager = lancedb_manager
+    rng = np.random.default_rng(42)
+    centroids = await _populate(manager, work_item_row, rng)
+    table = await manager.get_table("WorkItem")
+
+    topic = 7
+    query = TOPICS[topic]
+    query_vector = centroids[topic].tolist()
+    manager.embedding_cache.put(query, query_vector)
+    filters = {"status": "in_progress"}
+
+    def relevant(row):
+        return query in row['title'].lower() and row['status'] == filters['status']
+
+    legacy_times, fused_times = [], []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        legacy = _legacy_hybrid(table, query, query_vector, LIMIT)
+        legacy_times.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        fused = await manager.search_work_items(query, search_type="hybrid", limit=LIMIT, filters=filters)
+        fused_times.append(time.perf_counter() - start)
+
+    legacy_recall = sum(relevant(row) for row in legacy) / LIMIT
+    fused_recall = sum(relevant(row) for row in fused) / LIMIT
+    print(f"\nlegacy: p50 {statistics.median(legacy_times) * 1000:.1f} ms, "
+          f"{len(legacy)} results, recall@{LIMIT} {legacy_recall:.2f}")
+    print(f"fused:  p50 {statistics.median(fused_times) * 1000:.1f} ms, "
+          f"{len(fused)} results, recall@{LIMIT} {fused_recall:.2f}")
+
+    assert len(fused) == LIMIT
+    assert fused_recall >= legacy_recall
+    assert all(row['_relevance_score'] > 0 for row in fused)
+    assert fused == sorted(fused, key=lambda row: row['_relevance_score'], reverse=True)
@@ -0,0 +1,109 @@
+"""Startup benchmark: import time and time to the first tools/list.
+
+Importing the server must not load LanceDB, pyarrow, numpy, pandas,
+networkx, FastAPI or the embedding stack (sentence-transformers/torch), and
+the tool list must be available before the database has been connected. Both are measured in fresh
+interpreters. Run with:
+
+    pytest tests/performance/test_startup_time.py -m performance -s
+
+For a per-module breakdown:
+
+    PYTHONPATH=src python -X importtime -c "import mcp_jive.server"
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).resolve().parents[2] / "src"
+
+# Modules that only the database, embedding or HTTP paths need
+HEAVY_MODULES = ("lancedb", "pyarrow", "numpy", "pandas", "networkx", "fastapi", "sentence_transformers", "torch")
+
+# Upper bounds with ample headroom; eager imports took over 4s on their own
+IMPORT_BUDGET_SECONDS = 3.0
+FIRST_TOOLS_LIST_BUDGET_SECONDS = 4.0
+
+# Measures process start → server started → first tools/list, with the
+# background warm-up disabled so that its imports cannot be confused with
+# imports the tool list needed.
+FIRST_TOOLS_LIST_SCRIPT = """
+import asyncio, json, os, sys, time
+started = time.perf_counter()
+import mcp_jive.server as server_module
+from mcp_jive.config import Config
+imported = time.perf_counter()
+
+async def no_warm_up(manager):
+    return None
+
+server_module.warm_up_database = no_warm_up
+
+async def main():
+    server = server_module.MCPServer(config=Config())
+    await server.start()
+    tools = await server.tool_registry.list_tools()
+    listed = time.perf_counter()
+    print(json.dumps({
+        "import_seconds": imported - started,
+        "first_tools_list_seconds": listed - started,
+        "tool_count": len(tools),
+        "loaded": [name for name in %r if name in sys.modules],
+    }), flush=True)
+    os._exit(0)
+
+asyncio.run(main())
+""" % (HEAVY_MODULES,)
+
+
+def _run_python(args, tmp_path):
+    env = dict(os.environ, PYTHONPATH=str(SRC_DIR), LANCEDB_DATA_PATH=str(tmp_path / "lancedb"))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                          env=env, cwd=tmp_path, timeout=120)
+
+
+def _parse_importtime(stderr: str):
+    """Map module name → cumulative import time in seconds from -X importtime output."""
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, total, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        if total.isdigit():
+            cumulative[name] = int(total) / 1_000_000
+    return cumulative
+
+
+@pytest.mark.performance
+def test_server_import_skips_heavy_modules(tmp_path):
+    """Importing the server loads none of the heavy dependencies."""
+    result = _run_python(["-X", "importtime", "-c", "import mcp_jive.server"], tmp_path)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative = _parse_importtime(result.stderr)
+    loaded = [name for name in HEAVY_MODULES if name in cumulative]
+    slowest = sorted(((t, name) for name, t in cumulative.items() if "." not in name), reverse=True)[:5]
+
+    print(f"\nimport mcp_jive.server: {cumulative['mcp_jive.server']:.2f}s; "
+          f"slowest top-level imports: {', '.join(f'{name} {t:.2f}s' for t, name in slowest)}")
+    assert loaded == []
+    assert cumulative["mcp_jive.server"] < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.performance
+def test_first_tools_list_before_database(tmp_path):
+    """Tools are listed before LanceDB or the embedding model are loaded."""
+    result = _run_python(["-c", FIRST_TOOLS_LIST_SCRIPT], tmp_path)
+    assert result.returncode == 0, result.stderr[-2000:]
+    report = json.loads(result.stdout.strip().splitlines()[-1])
+
+    print(f"\nimport {report['import_seconds']:.2f}s, "
+          f"first tools/list {report['first_tools_list_seconds']:.2f}s ({report['tool_count']} tools)")
+    assert report["tool_count"] > 0
+    assert report["loaded"] == []
+    assert report["first_tools_list_seconds"] < FIRST_TOOLS_LIST_BUDGET_SECONDS
@@ -0,0 +1,62 @@
+"""Directory sync benchmark: re-syncing an unchanged tree after a restart.
+
+A 5,000-file tree is synced once, then a fresh SyncEngine (as after a
+server restart) re-syncs it. The persisted sync state lets the second pass
+skip every file from its stat alone. Run with:
+
+    pytest tests/performance/test_sync_directory.py -m performance -s
+"""
+
+import json
+import time
+
+import pytest
+
+from mcp_jive.config import ServerConfig
+from mcp_jive.services.sync_engine import ConflictResolution, SyncEngine
+
+FILE_COUNT = 5000
+RESYNC_BUDGET_SECONDS = 1.0
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_unchanged_resync_after_restart(lancedb_manager, work_item_row, tmp_path):
+    """Re-syncing 5k unchanged files with a fresh engine reads none of them."""
+    manager = lancedb_manager
+    table = await manager.get_table("WorkItem")
+    # Stored rows carry vectors and file titles match, so syncing needs no embedding model
+    table.add([
+        work_item_row(id=f"item-{i}", title=f"Task {i}", description="Synced task",
+                      vector=[0.1] * 384, status="todo")
+        for i in range(FILE_COUNT)
+    ])
+
+    for i in range(FILE_COUNT):
+        directory = tmp_path / "tasks" / f"group-{i % 50}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"item-{i}.json").write_text(json.dumps({
+            "id": f"item-{i}", "title": f"Task {i}", "description": "Synced task", "type": "task",
+            "status": "in_progress" if i % 10 == 0 else "todo", "priority": "medium",
+            "created_at": "2026-01-01T00:00:00+00:00", "updated_at": "2026-01-01T00:00:00+00:00"
+        }))
+
+    engine = SyncEngine(ServerConfig(), manager)
+    await engine.initialize()
+    started = time.perf_counter()
+    first = await engine.sync_directory(str(tmp_path / "tasks"), ConflictResolution.FILE_WINS)
+    first_seconds = time.perf_counter() - started
+    assert first.metadata["synced"] == FILE_COUNT
+    assert first.metadata["written"] == FILE_COUNT // 10
+
+    restarted = SyncEngine(ServerConfig(), manager)
+    started = time.perf_counter()
+    await restarted.initialize()
+    second = await restarted.sync_directory(str(tmp_path / "tasks"))
+    resync_seconds = time.perf_counter() - started
+
+    print(f"\nfirst sync of {FILE_COUNT} files {first_seconds:.2f}s, "
+          f"unchanged re-sync after restart {resync_seconds * 1000:.0f}ms")
+    assert second.metadata["unchanged"] == FILE_COUNT
+    assert second.metadata["synced"] == 0
+    assert resync_seconds < RESYNC_BUDGET_SECONDS
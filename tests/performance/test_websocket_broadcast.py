@@ -0,0 +1,60 @@
+"""Benchmark: broadcast latency to many WebSocket clients.
+
+Broadcasting only serializes the event and appends it to per-connection
+queues, so the caller's latency must not depend on how fast clients read.
+Half of the simulated clients never complete a send. Run with:
+
+    pytest tests/performance/test_websocket_broadcast.py -m performance -s
+"""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from mcp_jive.websocket_manager import WebSocketConnectionManager
+
+CLIENTS = 500
+EVENTS = 200
+# Generous bound for the median broadcast on a shared CI machine
+MEDIAN_BUDGET_MS = 5.0
+
+
+class StalledWebSocket:
+    async def send_text(self, text: str) -> None:
+        await asyncio.Event().wait()
+
+
+class InstantWebSocket:
+    async def send_text(self, text: str) -> None:
+        return None
+
+
+@pytest.mark.performance
+@pytest.mark.asyncio
+async def test_broadcast_to_many_clients():
+    """Broadcasting to 500 clients, half of them stalled, returns immediately."""
+    manager = WebSocketConnectionManager(max_queue_size=64)
+    clients = [StalledWebSocket() if i % 2 else InstantWebSocket() for i in range(CLIENTS)]
+    for ws in clients:
+        await manager.connect(ws)
+
+    timings = []
+    for i in range(EVENTS):
+        data = {"work_item_id": f"item-{i % 20}", "progress": i}
+        started = time.perf_counter()
+        assert await manager.broadcast_event("progress_update", data) == CLIENTS
+        timings.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(0)
+
+    median = statistics.median(timings)
+    info = manager.get_connection_info()
+    print(f"\nbroadcast to {CLIENTS} clients: median {median * 1000:.0f}µs, "
+          f"p99 {sorted(timings)[int(EVENTS * 0.99)] * 1000:.0f}µs, "
+          f"max queue depth {info['max_queue_depth']}, coalesced {info['coalesced_messages']}")
+    assert median < MEDIAN_BUDGET_MS
+    assert info["max_queue_depth"] <= 64
+
+    for ws in clients:
+        await manager.disconnect(ws)
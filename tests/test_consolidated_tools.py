@@ -130,6 +130,11 @@ async def mock_storage():
         "total": 1
     })
     
+    storage.keyword_search_work_items = AsyncMock(return_value=[
+        {"id": "test-123", "title": "Test Item 1", "_keyword_score": 2.5,
+         "_keyword_fields": {"title": ["test"]}}
+    ])
+    
     storage.get_work_item_children = AsyncMock(return_value=[])
     
     storage.query_work_items = AsyncMock(return_value={
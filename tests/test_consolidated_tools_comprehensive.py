@@ -123,7 +123,7 @@ def mock_database():
         work_items_storage[work_item_id] = work_item
         return work_item
     
-    async def mock_get_work_item(work_item_id):
+    async def mock_get_work_item(work_item_id, columns=None):
         return work_items_storage.get(work_item_id)
     
     async def mock_update_work_item(work_item_id, updates):
@@ -138,7 +138,7 @@ def mock_database():
             return True
         return False
     
-    async def mock_list_work_items(limit=None, offset=0):
+    async def mock_list_work_items(limit=None, offset=0, columns=None):
         items = list(work_items_storage.values())
         if limit:
             return items[offset:offset+limit]
@@ -188,13 +188,13 @@ def mock_database():
 
 
 @pytest.fixture
-def consolidated_tools(mock_database):
+def consolidated_tools(mock_database, tmp_path):
     """Provide consolidated tools with mocked dependencies."""
     # Create a mock storage with required methods and in-memory storage
     mock_storage = MagicMock()
     storage_data = {}  # In-memory storage for work items
     
-    async def mock_get_work_item(work_item_id):
+    async def mock_get_work_item(work_item_id, columns=None):
         # Return actual dictionary instead of MagicMock
         if work_item_id in storage_data:
             item_data = storage_data[work_item_id]
@@ -243,7 +243,18 @@ def consolidated_tools(mock_database):
             "total": total
         }
     
+    async def mock_upsert_work_items(rows):
+        for row in rows:
+            storage_data.setdefault(row['id'], {}).update(row)
+        return [row['id'] for row in rows]
+    
+    async def mock_scan_work_items(columns):
+        return [{column: item_data.get(column) for column in columns}
+                for item_data in storage_data.values()]
+    
     mock_storage.list_work_items = mock_list_work_items
+    mock_storage.upsert_work_items = mock_upsert_work_items
+    mock_storage.lancedb_manager.scan_work_items = mock_scan_work_items
     mock_storage.get_work_item = mock_get_work_item
     mock_storage.create_work_item = mock_create_work_item
     mock_storage.update_work_item = mock_update_work_item
@@ -266,6 +277,8 @@ def consolidated_tools(mock_database):
         'progress': UnifiedProgressTool(storage=mock_storage),
         'storage': UnifiedStorageTool(storage=mock_storage)
     }
+    # Keep backup artifacts out of the working tree.
+    tools['storage'].backup_location = str(tmp_path / "backups")
     return tools
 
 
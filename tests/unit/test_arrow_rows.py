@@ -0,0 +1,62 @@
+"""Unit tests for Arrow row decoding and column projection."""
+
+import pyarrow as pa
+import pytest
+
+from mcp_jive.arrow_rows import decode_table, read_rows, resolve_columns
+
+
+class _Query:
+    """Minimal query builder recording the projection pushed down to it."""
+
+    def __init__(self, table: pa.Table):
+        self.table = table
+        self.selected = None
+
+    def select(self, columns):
+        self.selected = list(columns)
+        return self
+
+    def to_arrow(self):
+        return self.table.select(self.selected) if self.selected else self.table
+
+
+def _table() -> pa.Table:
+    return pa.table({
+        "id": ["a", "b"],
+        "title": ["First", "Second"],
+        "tags": [["x"], None],
+        "vector": pa.FixedSizeListArray.from_arrays(pa.array([0.1, 0.2, 0.3, 0.4]), 2),
+    })
+
+
+class TestColumnProjection:
+    """Test cases for column projection on reads."""
+
+    @pytest.mark.unit
+    def test_resolve_columns(self):
+        """Default projection drops the vector; explicit ones keep id and skip unknown columns."""
+        schema = _table().schema
+
+        assert resolve_columns(schema) == ["id", "title", "tags"]
+        assert resolve_columns(schema, ["title", "missing"]) == ["id", "title"]
+        assert resolve_columns(schema, ["vector"]) == ["id", "vector"]
+
+    @pytest.mark.unit
+    def test_read_rows_pushes_projection_down(self):
+        """Only requested columns are read; the vector is returned only when asked for."""
+        query = _Query(_table())
+        rows = read_rows(query, ["id", "title"])
+
+        assert query.selected == ["id", "title"]
+        assert rows == [{"id": "a", "title": "First"}, {"id": "b", "title": "Second"}]
+
+        rows = read_rows(_Query(_table()), ["id", "vector"])
+        assert rows[0]["vector"] == pytest.approx([0.1, 0.2])
+
+    @pytest.mark.unit
+    def test_decode_table_fills_null_lists(self):
+        """Null list columns decode to empty lists and the vector is excluded by default."""
+        rows = decode_table(_table())
+
+        assert rows[1] == {"id": "b", "title": "Second", "tags": []}
@@ -0,0 +1,82 @@
+"""Unit tests for streaming backup files."""
+
+import gzip
+import hashlib
+import json
+from datetime import datetime
+
+import pytest
+
+from mcp_jive.storage.backup_stream import (
+    BackupIntegrityError, iter_backup_batches, verify_backup, write_backup
+)
+
+
+async def _rows(count):
+    for i in range(count):
+        yield {"id": f"item-{i}", "title": f"Item {i}", "created_at": datetime(2024, 1, 1, 12, 0, i % 60)}
+
+
+async def _read_all(path, batch_size=4):
+    header = {}
+    batches = [batch async for batch in iter_backup_batches(path, batch_size, header=header)]
+    return header, batches
+
+
+class TestBackupStream:
+    """Test cases for writing and reading NDJSON backups."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_round_trip_in_batches(self, temp_dir):
+        """Rows come back in batches with the header, and the checksum matches the file."""
+        path = str(temp_dir / "backup.ndjson.gz")
+        result = await write_backup(_rows(10), path, {"backup_id": "b1"}, chunk_bytes=64)
+
+        assert result["total_items"] == 10
+        with open(path, "rb") as f:
+            content = f.read()
+        assert result["checksum"] == hashlib.md5(content).hexdigest()
+        assert result["size"] == len(content)
+
+        header, batches = await _read_all(path)
+        assert header["backup_id"] == "b1"
+        assert [len(batch) for batch in batches] == [4, 4, 2]
+        assert batches[0][1] == {"id": "item-1", "title": "Item 1", "created_at": "2024-01-01T12:00:01"}
+        assert (await verify_backup(path))["total_items"] == 10
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_truncated_backup_is_rejected(self, temp_dir):
+        """A file cut short or missing its trailer fails verification."""
+        path = str(temp_dir / "backup.ndjson")
+        await write_backup(_rows(5), path, {}, compress=False)
+        with open(path) as f:
+            lines = f.readlines()
+        with open(path, "w") as f:
+            f.writelines(lines[:-1])
+
+        with pytest.raises(BackupIntegrityError):
+            await verify_backup(path)
+
+        gz_path = str(temp_dir / "backup.ndjson.gz")
+        await write_backup(_rows(50), gz_path, {})
+        with open(gz_path, "rb") as f:
+            data = f.read()
+        with open(gz_path, "wb") as f:
+            f.write(data[: len(data) // 2])
+        with pytest.raises(BackupIntegrityError):
+            await verify_backup(gz_path)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_reads_single_document_backups(self, temp_dir):
+        """Backups in the earlier single-JSON-document format can still be restored."""
+        path = str(temp_dir / "old.json.gz")
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"backup_id": "old", "created_at": "2024-01-01",
+                       "work_items": [{"id": "a"}, {"id": "b"}, {"id": "c"}]}, f, indent=2)
+
+        header, batches = await _read_all(path, batch_size=2)
+        assert header == {"backup_id": "old", "created_at": "2024-01-01"}
+        assert [[item["id"] for item in batch] for batch in batches] == [["a", "b"], ["c"]]
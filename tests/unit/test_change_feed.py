@@ -0,0 +1,98 @@
+"""Unit tests for the batched work item change feed."""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from mcp_jive.change_feed import ChangeFeed
+from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+from mcp_jive.lancedb_pool import LanceDBManagerPool
+
+
+class TestChangeFeed:
+    """Test cases for merging, batching and resuming."""
+
+    @pytest.mark.unit
+    def test_writes_merge_per_work_item(self):
+        """Writes in one window become one change per item, latest fields winning."""
+        feed = ChangeFeed()
+        feed.record("default", "task", "upsert", {"id": "task", "status": "done", "vector": [0.1]})
+        feed.record("default", "story", "upsert", {"id": "story", "progress": 50.0})
+        feed.record("default", "story", "upsert", {"id": "story", "progress": 100.0,
+                                                   "updated_at": datetime(2024, 1, 2)})
+        feed.record("default", "gone", "upsert", {"id": "gone", "title": "x"})
+        feed.record("default", "gone", "delete")
+
+        batch = feed.flush()
+        assert batch["seq"] == 1
+        assert batch["changes"] == [
+            {"namespace": "default", "id": "task", "op": "upsert", "fields": {"status": "done"}},
+            {"namespace": "default", "id": "story", "op": "upsert",
+             "fields": {"progress": 100.0, "updated_at": "2024-01-02T00:00:00"}},
+            {"namespace": "default", "id": "gone", "op": "delete"},
+        ]
+        assert feed.flush() is None
+        assert feed.get_stats()["merged_writes"] == 2
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_window_publishes_one_batch(self):
+        """Writes made within the window reach listeners as a single batch."""
+        feed = ChangeFeed(window_seconds=0.01)
+        published = []
+        feed.add_listener(published.append)
+
+        for progress in (10.0, 20.0, 30.0):
+            feed.record("default", "epic", "upsert", {"id": "epic", "progress": progress})
+        assert published == []
+
+        await asyncio.sleep(0.05)
+        assert len(published) == 1
+        assert published[0]["changes"][0]["fields"] == {"progress": 30.0}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_resume_from_sequence_number(self):
+        """Reconnecting clients get the batches they missed, or a resync once they are gone."""
+        feed = ChangeFeed(history_size=2)
+        for item_id in ("a", "b", "c"):
+            feed.record("default", item_id, "upsert", {"id": item_id})
+            feed.flush()
+
+        assert [batch["seq"] for batch in feed.since(1)] == [2, 3]
+        assert feed.since(3) == []
+        assert feed.since(0) is None
+        assert feed.since(7) is None
+
+        subscription = feed.subscribe(since=2)
+        assert (await subscription.get(timeout=0.1))["seq"] == 3
+        assert await subscription.get(timeout=0.01) is None
+        feed.record("default", "d", "upsert", {"id": "d"})
+        feed.flush()
+        assert (await subscription.get(timeout=0.1))["seq"] == 4
+        subscription.close()
+
+        stale = feed.subscribe(since=0)
+        assert await stale.get(timeout=0.1) == {"resync": True, "seq": 4}
+        stale.close()
+        assert feed.get_stats()["subscribers"] == 0
+
+    @pytest.mark.unit
+    def test_pool_observes_every_namespace(self, temp_dir):
+        """Managers opened before and after subscribing publish their writes."""
+        feed = ChangeFeed()
+        pool = LanceDBManagerPool(LanceDBManager(DatabaseConfig(data_path=str(temp_dir))))
+        pool.get("early")
+        pool.add_work_item_observer(feed.observer)
+        pool.get("late")
+
+        for namespace in ("default", "early", "late"):
+            pool.get(namespace)._notify_work_items_written([{"id": "x", "title": namespace}])
+        pool.get("late")._notify_work_item_removed("y")
+
+        changes = feed.flush()["changes"]
+        assert [(c["namespace"], c["id"], c["op"]) for c in changes] == [
+            ("default", "x", "upsert"), ("early", "x", "upsert"),
+            ("late", "x", "upsert"), ("late", "y", "delete"),
+        ]
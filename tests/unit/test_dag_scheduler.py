@@ -0,0 +1,115 @@
+"""Unit tests for the DAG execution scheduler."""
+
+import asyncio
+
+import pytest
+
+from mcp_jive.services.dag_scheduler import DagScheduler
+from mcp_jive.tools.consolidated.unified_execution_tool import UnifiedExecutionTool
+
+
+class TestDagScheduler:
+    """Test cases for DagScheduler."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_runs_in_dependency_order(self):
+        """Every task starts only after its dependencies finished."""
+        finished = []
+
+        async def run(node):
+            await asyncio.sleep(0)
+            finished.append(node)
+
+        graph = {"a": [], "b": ["a"], "c": ["a"], "d": ["b", "c"]}
+        result = await DagScheduler(max_parallel=2).run(graph, run)
+
+        assert sorted(result.completed) == ["a", "b", "c", "d"]
+        assert finished[0] == "a" and finished[-1] == "d"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_slots_refill_without_waiting_for_slow_task(self):
+        """A slow task does not hold back other ready tasks."""
+        async def run(node):
+            await asyncio.sleep(0.2 if node == "slow" else 0.01)
+
+        graph = {"slow": [], "a": [], "b": ["a"], "c": ["b"]}
+        result = await DagScheduler(max_parallel=2).run(graph, run)
+
+        assert result.completed.index("c") < result.completed.index("slow")
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_fail_fast_cancels_running_tasks(self):
+        """With fail_fast the first failure cancels the rest and is raised."""
+        cancelled = []
+
+        async def run(node):
+            if node == "bad":
+                raise RuntimeError("boom")
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.append(node)
+                raise
+
+        with pytest.raises(RuntimeError):
+            await DagScheduler(max_parallel=2).run({"bad": [], "slow": []}, run, fail_fast=True)
+        assert cancelled == ["slow"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failure_releases_dependents_without_fail_fast(self):
+        """Without fail_fast dependents of a failed task still run."""
+        async def run(node):
+            if node == "a":
+                raise RuntimeError("boom")
+
+        result = await DagScheduler().run({"a": [], "b": ["a"]}, run)
+
+        assert list(result.failed) == ["a"]
+        assert result.completed == ["b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_event_stops_run(self):
+        """Setting the cancel event interrupts running tasks immediately."""
+        cancel = asyncio.Event()
+
+        async def run(node):
+            if node == "a":
+                cancel.set()
+            await asyncio.sleep(1)
+
+        result = await DagScheduler(max_parallel=1).run({"a": [], "b": ["a"]}, run, cancel_event=cancel)
+
+        assert result.cancelled
+        assert result.interrupted == ["a"]
+        assert result.not_started == ["b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cycles_are_reported(self):
+        """Tasks in a dependency cycle never start and are reported."""
+        async def run(node):
+            return None
+
+        result = await DagScheduler().run({"a": ["b"], "b": ["a"], "c": []}, run)
+
+        assert result.completed == ["c"]
+        assert sorted(result.not_started) == ["a", "b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_cancel_leaves_no_cancel_event_behind(self):
+        """Cancelling an execution without a running scheduler keeps no event around."""
+        tool = UnifiedExecutionTool()
+        tool.active_executions["e1"] = {"status": "running", "logs": []}
+
+        response = await tool._cancel_execution({"execution_id": "e1"})
+
+        assert response["success"] is True
+        assert tool.active_executions["e1"]["status"] == "cancelled"
+        assert tool._cancel_events == {}
+        await tool.active_executions.close()
@@ -0,0 +1,32 @@
+"""Unit tests for DependencyEngine persistence."""
+
+import pytest
+
+from mcp_jive.models.workflow import DependencyType
+from mcp_jive.services.dependency_engine import DependencyEngine
+
+
+class TestDependencyEngine:
+    """Test cases for DependencyEngine."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_remove_dependency_quotes_id(self, lancedb_manager):
+        """An id containing a quote matches nothing instead of widening the delete."""
+        manager = lancedb_manager
+        engine = DependencyEngine(None, manager)
+        await engine.initialize()
+
+        first = await engine.add_dependency("a", "b", DependencyType.BLOCKS)
+        await engine.add_dependency("b", "c", DependencyType.BLOCKS)
+
+        assert await engine.remove_dependency("x' OR '1'='1") is False
+        assert await engine.remove_dependency("it's") is False
+        rows = await manager.search_data(engine.dependency_collection, limit=10)
+        assert len(rows) == 2
+
+        assert await engine.remove_dependency(first.id) is True
+        assert await engine.remove_dependency(first.id) is False
+        rows = await manager.search_data(engine.dependency_collection, limit=10)
+        assert [row["source_id"] for row in rows] == ["b"]
+        assert first.id not in (await engine._get_graph()).dependencies
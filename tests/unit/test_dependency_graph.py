@@ -0,0 +1,80 @@
+"""Unit tests for the incrementally ordered dependency graph."""
+
+import random
+
+import pytest
+
+from mcp_jive.services.dependency_graph import DependencyCycleError, DependencyGraphIndex
+
+
+def _dep(dep_id, source, target, dependency_type="blocks"):
+    return {"id": dep_id, "source_id": source, "target_id": target, "dependency_type": dependency_type}
+
+
+def _respects(order, graph):
+    position = {node: index for index, node in enumerate(order)}
+    return all(position[before] < position[after]
+               for before, after in graph.ordering_edges(order)
+               if before in position and after in position)
+
+
+class TestDependencyGraphIndex:
+    """Test cases for DependencyGraphIndex."""
+
+    @pytest.mark.unit
+    def test_edge_directions(self):
+        """blocks orders source first, depends_on orders target first, relates_to adds nothing."""
+        graph = DependencyGraphIndex()
+        graph.build([
+            _dep("d1", "a", "b", "blocks"),
+            _dep("d2", "c", "b", "depends_on"),
+            _dep("d3", "a", "c", "relates_to"),
+        ])
+
+        assert graph.execution_order(["c", "b", "a"]) == ["a", "b", "c"]
+        assert [row["id"] for row in graph.blocking("b")] == ["d1"]
+        assert {row["id"] for row in graph.dependencies_of("a")} == {"d1", "d3"}
+
+    @pytest.mark.unit
+    def test_add_rejects_cycles(self):
+        """An edge closing a cycle is rejected and leaves the graph unchanged."""
+        graph = DependencyGraphIndex()
+        graph.build([_dep("d1", "a", "b"), _dep("d2", "b", "c")])
+
+        with pytest.raises(DependencyCycleError) as error:
+            graph.add(_dep("d3", "c", "a"))
+
+        assert error.value.cycle == ["c", "a", "b"]
+        assert "d3" not in graph.dependencies
+        assert graph.execution_order(["c", "b", "a"]) == ["a", "b", "c"]
+
+    @pytest.mark.unit
+    def test_incremental_order_matches_inserts(self):
+        """Random inserts keep a valid topological order without rebuilding."""
+        rng = random.Random(7)
+        graph = DependencyGraphIndex()
+        graph.build([])
+        nodes = [f"n{i}" for i in range(40)]
+        for index in range(300):
+            source, target = rng.sample(nodes, 2)
+            try:
+                graph.add(_dep(f"d{index}", source, target))
+            except DependencyCycleError:
+                pass
+
+        order = graph.execution_order(nodes)
+        assert graph.is_acyclic
+        assert _respects(order, graph)
+
+    @pytest.mark.unit
+    def test_cycles_from_storage_clear_on_remove(self):
+        """A cyclic graph loaded from storage becomes ordered once the cycle is removed."""
+        graph = DependencyGraphIndex()
+        graph.build([_dep("d1", "a", "b"), _dep("d2", "b", "a")])
+
+        assert not graph.is_acyclic
+        assert graph.execution_order(["a", "b"]) is None
+
+        graph.remove("d2")
+        assert graph.is_acyclic
+        assert graph.execution_order(["b", "a"]) == ["a", "b"]
@@ -0,0 +1,87 @@
+"""Unit tests for the batching embedder."""
+
+import asyncio
+import threading
+
+import pytest
+
+from mcp_jive.embedding_batcher import BatchingEmbedder
+
+
+class RecordingEncoder:
+    """Deterministic encoder that records the batches it receives."""
+
+    def __init__(self):
+        self.batches = []
+        self.threads = set()
+
+    def __call__(self, texts):
+        self.batches.append(list(texts))
+        self.threads.add(threading.get_ident())
+        return [[float(len(text))] for text in texts]
+
+
+class TestBatchingEmbedder:
+    """Test cases for BatchingEmbedder."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_coalesced(self):
+        """Concurrent single requests share one model call."""
+        encoder = RecordingEncoder()
+        embedder = BatchingEmbedder(encoder, batch_size=16)
+
+        results = await asyncio.gather(*(embedder.embed("x" * n) for n in range(1, 9)))
+        await embedder.close()
+
+        assert results == [[float(n)] for n in range(1, 9)]
+        assert len(encoder.batches) == 1
+        assert threading.get_ident() not in encoder.threads
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_batches_respect_batch_size(self):
+        """Large requests are split into batches of at most batch_size."""
+        encoder = RecordingEncoder()
+        embedder = BatchingEmbedder(encoder, batch_size=4)
+
+        results = await embedder.embed_many(["a"] * 10)
+        await embedder.close()
+
+        assert len(results) == 10
+        assert [len(batch) for batch in encoder.batches] == [4, 4, 2]
+        assert embedder.get_stats()["largest_batch"] == 4
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_encode_errors_propagate_to_callers(self):
+        """A failing batch fails every request in it."""
+        def failing(texts):
+            raise RuntimeError("model unavailable")
+
+        embedder = BatchingEmbedder(failing)
+
+        with pytest.raises(RuntimeError):
+            await embedder.embed("text")
+        await embedder.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_close_fails_unfinished_requests(self):
+        """Requests queued or being encoded when the batcher closes raise instead of hanging."""
+        started, release = threading.Event(), threading.Event()
+
+        def blocking_encode(texts):
+            started.set()
+            release.wait(5)
+            return [[0.0] for _ in texts]
+
+        embedder = BatchingEmbedder(blocking_encode, batch_size=1, max_wait=0)
+        futures = [embedder.submit(text) for text in ("a", "b", "c")]
+        await asyncio.to_thread(started.wait, 5)
+        await embedder.close()
+        release.set()
+
+        for future in futures:
+            with pytest.raises(RuntimeError, match="closed"):
+                await asyncio.wait_for(future, 1)
@@ -0,0 +1,85 @@
+"""Unit tests for the content-hash embedding cache."""
+
+import pytest
+
+from mcp_jive.lancedb_manager import EmbeddingCache
+
+DIMENSION = 4
+# float32 vector plus sha256 key
+ENTRY_BYTES = DIMENSION * 4 + EmbeddingCache.KEY_SIZE
+
+
+class TestEmbeddingCache:
+    """Test cases for EmbeddingCache."""
+
+    @pytest.mark.unit
+    def test_normalized_text_shares_entry(self):
+        """Whitespace differences map onto the same cache entry."""
+        cache = EmbeddingCache("model", DIMENSION, max_bytes=ENTRY_BYTES * 10)
+        cache.put("fix  login\nbug", [1.0, 2.0, 3.0, 4.0])
+
+        assert cache.get(" fix login bug ") == [1.0, 2.0, 3.0, 4.0]
+        assert cache.get("fix logout bug") is None
+        stats = cache.get_stats()
+        assert stats["memory_hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.unit
+    def test_model_name_is_part_of_key(self):
+        """Vectors from a different model are never returned."""
+        cache = EmbeddingCache("model-a", DIMENSION, max_bytes=ENTRY_BYTES * 10)
+        other = EmbeddingCache("model-b", DIMENSION, max_bytes=ENTRY_BYTES * 10)
+
+        assert cache.key("text") != other.key("text")
+
+    @pytest.mark.unit
+    def test_memory_tier_is_bounded_by_bytes(self):
+        """The least recently used vector is evicted past max_bytes."""
+        cache = EmbeddingCache("model", DIMENSION, max_bytes=ENTRY_BYTES * 2)
+        cache.put("a", [1.0] * DIMENSION)
+        cache.put("b", [2.0] * DIMENSION)
+        cache.get("a")  # "b" is now least recently used
+        cache.put("c", [3.0] * DIMENSION)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == [1.0] * DIMENSION
+        assert cache.get_stats()["memory_bytes"] <= ENTRY_BYTES * 2
+
+    @pytest.mark.unit
+    def test_disk_tier_persists_across_instances(self, temp_dir):
+        """Vectors flushed to the disk tier are served after a restart."""
+        path = str(temp_dir / "embedding_cache")
+        cache = EmbeddingCache("model", DIMENSION, max_bytes=0,
+                               disk_path=path, disk_max_bytes=ENTRY_BYTES * 8)
+        cache.put("persisted", [0.5] * DIMENSION)
+        cache.close()
+
+        reopened = EmbeddingCache("model", DIMENSION, max_bytes=ENTRY_BYTES * 8,
+                                  disk_path=path, disk_max_bytes=ENTRY_BYTES * 8)
+        assert reopened.get("persisted") == [0.5] * DIMENSION
+        assert reopened.get_stats()["disk_hits"] == 1
+
+    @pytest.mark.unit
+    def test_disk_tier_survives_unclean_shutdown(self, temp_dir):
+        """Vectors written to the memmaps are reused even if flush() never ran."""
+        path = temp_dir / "embedding_cache"
+        cache = EmbeddingCache("model", DIMENSION, max_bytes=0,
+                               disk_path=str(path), disk_max_bytes=ENTRY_BYTES * 8)
+        cache.put("first", [0.25] * DIMENSION)
+        cache.put("second", [0.75] * DIMENSION)
+        # Dirty pages reach the files, but meta.json keeps its creation-time ring position
+        cache._disk_vectors.flush()
+        cache._disk_keys.flush()
+        assert (path / "meta.json").exists()
+
+        reopened = EmbeddingCache("model", DIMENSION, max_bytes=0,
+                                  disk_path=str(path), disk_max_bytes=ENTRY_BYTES * 8)
+        assert reopened.get("first") == [0.25] * DIMENSION
+        reopened.put("third", [1.0] * DIMENSION)
+        assert reopened.get("second") == [0.75] * DIMENSION
+
+        (path / "meta.json").unlink()
+        again = EmbeddingCache("model", DIMENSION, max_bytes=0,
+                               disk_path=str(path), disk_max_bytes=ENTRY_BYTES * 8)
+        assert again.get("third") == [1.0] * DIMENSION
+        assert again.get_stats()["disk_entries"] == 3
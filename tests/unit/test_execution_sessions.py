@@ -0,0 +1,118 @@
+"""Unit tests for the bounded execution session store."""
+
+import pytest
+
+from mcp_jive.services.execution_sessions import ExecutionSessionStore
+from mcp_jive.tools.consolidated.unified_execution_tool import UnifiedExecutionTool
+
+
+class _RecordingManager:
+    """Collects rows written to ExecutionLog."""
+
+    def __init__(self):
+        self.rows = {}
+        self.writes = 0
+
+    async def upsert_data(self, table_name, rows, key="id"):
+        assert table_name == "ExecutionLog"
+        self.writes += 1
+        for row in rows:
+            self.rows[row[key]] = row
+        return len(rows)
+
+
+class _Storage:
+    def __init__(self):
+        self.lancedb_manager = _RecordingManager()
+
+
+class TestExecutionSessionStore:
+    """Test cases for ExecutionSessionStore."""
+
+    @pytest.mark.unit
+    def test_trim_keeps_newest_entries(self):
+        """Log lists are capped to their newest entries."""
+        store = ExecutionSessionStore(max_log_entries=3)
+        session = {"logs": list(range(10)), "progress_updates": [1, 2]}
+        store.trim(session)
+
+        assert session["logs"] == [7, 8, 9]
+        assert session["progress_updates"] == [1, 2]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_flush_writes_only_changed_sessions(self):
+        """Clean sessions are not rewritten on the next flush."""
+        storage = _Storage()
+        store = ExecutionSessionStore(storage, flush_interval=3600)
+        store["a"] = {"status": "running", "work_item_id": "w1"}
+        store["b"] = {"status": "running", "work_item_id": "w2"}
+
+        assert await store.flush() == 2
+        store["a"]["status"] = "completed"
+        assert await store.flush() == 1
+        assert storage.lancedb_manager.rows["a"]["status"] == "completed"
+        await store.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_only_finished_sessions_are_evicted(self):
+        """Capacity evicts least recently used finished sessions, never running ones."""
+        store = ExecutionSessionStore(_Storage(), max_sessions=1, flush_interval=3600)
+        store["running"] = {"status": "in_progress"}
+        store["old"] = {"status": "completed"}
+        store["new"] = {"status": "completed"}
+
+        await store.flush()
+
+        assert "running" in store and "new" in store
+        assert "old" not in store
+        assert store.evictions == 1
+        await store.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_expired_sessions_reload_from_log(self):
+        """Sessions past their TTL leave memory but stay in ExecutionLog."""
+        storage = _Storage()
+        store = ExecutionSessionStore(storage, ttl_seconds=0, flush_interval=3600)
+        store["done"] = {"status": "failed", "logs": []}
+
+        await store.flush()
+
+        assert "done" not in store
+        assert "done" in storage.lancedb_manager.rows
+        await store.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_unwritable_finished_sessions_are_dropped(self):
+        """A finished session whose writes keep failing is evicted after max_flush_failures."""
+        storage = _Storage()
+
+        async def fail(table_name, rows, key="id"):
+            raise RuntimeError("disk full")
+
+        storage.lancedb_manager.upsert_data = fail
+        store = ExecutionSessionStore(storage, max_sessions=1, ttl_seconds=0,
+                                      flush_interval=3600, max_flush_failures=2)
+        store["a"] = {"status": "completed"}
+
+        assert await store.flush() == 0
+        assert "a" in store
+        assert await store.flush() == 0
+        assert "a" not in store
+        assert store.get_stats()["dropped_unwritten"] == 1
+        await store.close()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_tool_shutdown_writes_pending_sessions(self):
+        """Shutting down the execution tool flushes sessions not yet written behind."""
+        storage = _Storage()
+        tool = UnifiedExecutionTool(storage)
+        tool.active_executions.flush_interval = 3600
+        tool.active_executions["a"] = {"status": "completed", "work_item_id": "w1"}
+
+        await tool.shutdown()
+        assert storage.lancedb_manager.rows["a"]["status"] == "completed"
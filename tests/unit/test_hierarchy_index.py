@@ -0,0 +1,58 @@
+"""Unit tests for the work item hierarchy index."""
+
+import pytest
+
+from mcp_jive.hierarchy_index import WorkItemHierarchyIndex
+
+
+@pytest.fixture
+def index():
+    """Index over a small epic → feature → task tree."""
+    hierarchy = WorkItemHierarchyIndex()
+    hierarchy.build([
+        {"id": "epic", "parent_id": None, "order_index": 1},
+        {"id": "feature-b", "parent_id": "epic", "order_index": 2},
+        {"id": "feature-a", "parent_id": "epic", "order_index": 1},
+        {"id": "task-1", "parent_id": "feature-a", "order_index": 1},
+        {"id": "task-2", "parent_id": "feature-a", "order_index": 2},
+        {"id": "other-root", "parent_id": "", "order_index": 2},
+    ])
+    return hierarchy
+
+
+class TestWorkItemHierarchyIndex:
+    """Test cases for WorkItemHierarchyIndex."""
+
+    @pytest.mark.unit
+    def test_children_are_ordered(self, index):
+        """Children come back sorted by order_index; empty parents are roots."""
+        assert index.children("epic") == ["feature-a", "feature-b"]
+        assert index.roots() == ["epic", "other-root"]
+
+    @pytest.mark.unit
+    def test_descendants_and_ancestors(self, index):
+        """Subtrees are walked depth-first and ancestors nearest first."""
+        assert index.descendants("epic") == ["feature-a", "task-1", "task-2", "feature-b"]
+        assert index.descendants("epic", max_depth=1) == ["feature-a", "feature-b"]
+        assert index.ancestors("task-2") == ["feature-a", "epic"]
+
+    @pytest.mark.unit
+    def test_partial_upsert_moves_item(self, index):
+        """A partial row moves or reorders an item without losing other fields."""
+        index.upsert({"id": "task-2", "parent_id": "feature-b"})
+        index.upsert({"id": "feature-b", "order_index": 0})
+
+        assert index.children("feature-a") == ["task-1"]
+        assert index.children("feature-b") == ["task-2"]
+        assert index.children("epic") == ["feature-b", "feature-a"]
+
+    @pytest.mark.unit
+    def test_remove_and_invalidate(self, index):
+        """Removed items disappear; an invalidated index ignores writes."""
+        index.remove("task-1")
+        assert index.children("feature-a") == ["task-2"]
+
+        index.invalidate()
+        index.upsert({"id": "new", "parent_id": None})
+        assert not index.built
+        assert len(index) == 0
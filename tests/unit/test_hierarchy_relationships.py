@@ -0,0 +1,82 @@
+"""Unit tests for hierarchy relationship reads in UnifiedHierarchyTool."""
+
+import pytest
+import pytest_asyncio
+
+from mcp_jive.storage import WorkItemStorage
+from mcp_jive.tools.consolidated.unified_hierarchy_tool import UnifiedHierarchyTool
+
+
+@pytest_asyncio.fixture
+async def storage(lancedb_manager, work_item_row):
+    """Storage over epic → (feature-a → (task-1 completed → sub, task-2), feature-b)."""
+    table = await lancedb_manager.get_table("WorkItem")
+    table.add([
+        work_item_row(id="epic"),
+        work_item_row(id="feature-a", parent_id="epic", order_index=1),
+        work_item_row(id="feature-b", parent_id="epic", order_index=2),
+        work_item_row(id="task-1", parent_id="feature-a", status="completed", order_index=1),
+        work_item_row(id="task-2", parent_id="feature-a", order_index=2),
+        work_item_row(id="sub", parent_id="task-1"),
+    ])
+    return WorkItemStorage(lancedb_manager)
+
+
+def _count_calls(monkeypatch, storage, name):
+    calls = []
+    method = getattr(storage, name)
+
+    async def counted(*args, **kwargs):
+        calls.append(args)
+        return await method(*args, **kwargs)
+
+    monkeypatch.setattr(storage, name, counted)
+    return calls
+
+
+class TestHierarchyRelationships:
+    """Test cases for descendant, hierarchy and dependent reads."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_descendants_read_subtree_once(self, storage, monkeypatch):
+        """Descendants come from one subtree read, with filtered subtrees pruned."""
+        tool = UnifiedHierarchyTool(storage)
+        subtree_reads = _count_calls(monkeypatch, storage, "get_work_item_children")
+
+        descendants = await tool._get_descendants("epic", 5, True, False, False)
+        assert [(d["id"], d["depth"]) for d in descendants] == [
+            ("feature-a", 1), ("task-1", 2), ("sub", 3), ("task-2", 2), ("feature-b", 1)
+        ]
+        assert len(subtree_reads) == 1
+
+        descendants = await tool._get_descendants("epic", 2, False, False, False)
+        assert [d["id"] for d in descendants] == ["feature-a", "task-2", "feature-b"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_full_hierarchy_is_built_in_memory(self, storage, monkeypatch):
+        """The tree is assembled from one root read and one subtree read."""
+        tool = UnifiedHierarchyTool(storage)
+        item_reads = _count_calls(monkeypatch, storage, "get_work_item")
+        subtree_reads = _count_calls(monkeypatch, storage, "get_work_item_children")
+
+        hierarchy = await tool._get_full_hierarchy("epic", 2, False, False, False)
+        assert (len(item_reads), len(subtree_reads)) == (1, 1)
+
+        epic, = hierarchy
+        assert [child["id"] for child in epic["children"]] == ["feature-a", "feature-b"]
+        task_2, = epic["children"][0]["children"]
+        assert (task_2["id"], task_2["depth"], task_2["path"]) == ("task-2", 2, ["epic", "feature-a", "task-2"])
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_dependents_scan_every_item(self, storage, work_item_row):
+        """Dependents past the first page of items are found."""
+        table = await storage.lancedb_manager.get_table("WorkItem")
+        table.add([work_item_row(id=f"filler-{i:03d}") for i in range(120)]
+                  + [work_item_row(id="late", order_index=9, dependencies=["epic"])])
+        tool = UnifiedHierarchyTool(storage)
+
+        dependents = await tool._get_dependents("epic", True, False, False)
+        assert [d["id"] for d in dependents] == ["late"]
@@ -0,0 +1,63 @@
+"""Unit tests for the in-memory work item keyword index."""
+
+import pytest
+
+from mcp_jive.keyword_index import WorkItemKeywordIndex
+
+
+def _index():
+    index = WorkItemKeywordIndex()
+    index.build([
+        {"id": "a", "title": "Authentication service", "description": "Token refresh flow",
+         "acceptance_criteria": ["Users can log in"], "tags": ["security"],
+         "status": "in_progress", "item_type": "task", "priority": "high", "assignee": None},
+        {"id": "b", "title": "Billing export", "description": "Export invoices for authentication audits",
+         "acceptance_criteria": [], "tags": ["finance"],
+         "status": "not_started", "item_type": "task", "priority": "low", "assignee": None},
+        {"id": "c", "title": "Dashboard", "description": "Charts",
+         "acceptance_criteria": ["Shows billing totals"], "tags": ["ui"],
+         "status": "completed", "item_type": "story", "priority": "medium", "assignee": None},
+    ])
+    return index
+
+
+class TestWorkItemKeywordIndex:
+    """Test cases for WorkItemKeywordIndex."""
+
+    @pytest.mark.unit
+    def test_title_boost_outranks_description(self):
+        """A title match scores above the same term in a description."""
+        hits = _index().search("authentication")
+
+        assert [hit["id"] for hit in hits] == ["a", "b"]
+        assert list(hits[0]["fields"]) == ["title"]
+
+    @pytest.mark.unit
+    def test_prefix_and_typo_tolerance(self):
+        """Prefixes and one-edit typos still match."""
+        index = _index()
+
+        assert [hit["id"] for hit in index.search("auth")] == ["a", "b"]
+        assert [hit["id"] for hit in index.search("dashbaord")] == ["c"]
+
+    @pytest.mark.unit
+    def test_fields_and_filters(self):
+        """Searches can be restricted to fields and filtered by attributes."""
+        index = _index()
+
+        assert [hit["id"] for hit in index.search("billing", fields=["acceptance_criteria"])] == ["c"]
+        assert [hit["id"] for hit in index.search("authentication", filters={"status": ["not_started"]})] == ["b"]
+
+    @pytest.mark.unit
+    def test_incremental_updates(self):
+        """Partial upserts re-index changed fields and removals drop postings."""
+        index = _index()
+
+        index.upsert({"id": "b", "title": "Payroll export"})
+        assert [hit["id"] for hit in index.search("billing")] == ["c"]
+        assert [hit["id"] for hit in index.search("payroll")] == ["b"]
+
+        index.upsert({"id": "d", "title": "Payroll reports", "status": "not_started"})
+        index.remove("b")
+        assert [hit["id"] for hit in index.search("payroll")] == ["d"]
+        assert index.get_stats()["items"] == 3
@@ -0,0 +1,87 @@
+"""Unit tests for background LanceDB table maintenance."""
+
+import pytest
+
+from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+from mcp_jive.lancedb_maintenance import LanceDBMaintenanceScheduler, MaintenanceConfig
+from mcp_jive.lancedb_pool import LanceDBManagerPool
+
+
+def _stats(**overrides):
+    stats = {
+        'version': 10, 'total_bytes': 1000, 'num_rows': 100, 'num_fragments': 1,
+        'num_small_fragments': 1, 'deleted_rows': 0, 'deleted_ratio': 0.0,
+        'unindexed_rows': 0
+    }
+    stats.update(overrides)
+    return stats
+
+
+class TestLanceDBMaintenanceScheduler:
+    """Test cases for LanceDBMaintenanceScheduler."""
+
+    @pytest.mark.unit
+    def test_plan_thresholds(self, temp_dir):
+        """Healthy tables are skipped; fragmentation, deletes and unindexed rows trigger work."""
+        scheduler = LanceDBMaintenanceScheduler(
+            LanceDBManagerPool(LanceDBManager(DatabaseConfig(data_path=str(temp_dir)))),
+            MaintenanceConfig(min_small_fragments=8, max_deleted_ratio=0.1)
+        )
+
+        assert scheduler.plan("default", "WorkItem", _stats()) is None
+
+        task = scheduler.plan("default", "WorkItem", _stats(num_small_fragments=8))
+        assert task.compact and task.cleanup and not task.refresh_indexes
+        assert task.estimated_bytes == 1000
+
+        task = scheduler.plan("default", "WorkItem", _stats(deleted_rows=20, deleted_ratio=0.2))
+        assert task.compact and task.cleanup
+
+        task = scheduler.plan("default", "WorkItem", _stats(unindexed_rows=10))
+        assert not task.compact and task.refresh_indexes
+        assert task.estimated_bytes == 100
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_run_once_compacts_and_respects_budget(self, lancedb_manager, work_item_row):
+        """A pass compacts fragmented tables and defers work beyond the I/O budget."""
+        manager = lancedb_manager
+        table = await manager.get_table("WorkItem")
+        for i in range(10):
+            table.add([work_item_row(id=f"item-{i}")])
+        assert manager.get_table_maintenance_stats("WorkItem")['num_small_fragments'] == 10
+
+        scheduler = LanceDBMaintenanceScheduler(LanceDBManagerPool(manager),
+                                                MaintenanceConfig(io_budget_bytes=1))
+        report = await scheduler.run_once()
+
+        assert report["default"]["WorkItem"]["status"] == "maintained"
+        stats = manager.get_table_maintenance_stats("WorkItem")
+        assert stats['num_rows'] == 10
+        assert stats['num_fragments'] == 1
+        assert scheduler.get_stats()['totals']['compactions'] == 1
+
+        # Nothing is left to do on the next pass
+        assert await scheduler.run_once() == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_maintain_table_keeps_fts_index_current(self, lancedb_manager, work_item_row):
+        """Compaction keeps the native full-text index, and rows added later become searchable."""
+        manager = lancedb_manager
+        table = await manager.get_table("WorkItem")
+        for i in range(4):
+            table.add([work_item_row(id=f"item-{i}", title=f"Billing task {i}")])
+        await manager._ensure_fts_index("WorkItem")
+        table.add([work_item_row(id="item-4", title="Billing task 4")])
+
+        result = manager.maintain_table("WorkItem", compact=True, cleanup_older_than=0,
+                                        refresh_indexes=True)
+
+        assert result['compaction']['fragments_removed'] > 0
+        assert result['cleanup']['old_versions'] > 0
+        stats = manager.get_table_maintenance_stats("WorkItem")
+        assert stats['num_fragments'] < 5
+        assert stats['unindexed_rows'] == 0
+        results = await manager.search_work_items("billing", search_type="keyword", limit=10)
+        assert {row['id'] for row in results} == {f"item-{i}" for i in range(5)}
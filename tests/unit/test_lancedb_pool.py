@@ -0,0 +1,136 @@
+"""Unit tests for the per-namespace LanceDB manager pool."""
+
+import pytest
+
+from mcp_jive.lancedb_manager import LanceDBManager, DatabaseConfig
+from mcp_jive.lancedb_pool import LanceDBManagerPool
+from mcp_jive.namespace.context import namespace_scope
+from mcp_jive.storage import WorkItemStorage
+
+
+@pytest.fixture
+def default_manager(temp_dir):
+    """Default-namespace manager rooted in a temporary directory."""
+    return LanceDBManager(DatabaseConfig(data_path=str(temp_dir)))
+
+
+class TestLanceDBManagerPool:
+    """Test cases for LanceDBManagerPool."""
+
+    @pytest.mark.unit
+    def test_default_namespace_returns_pinned_manager(self, default_manager):
+        """None and 'default' resolve to the pinned default manager."""
+        pool = LanceDBManagerPool(default_manager)
+
+        assert pool.get(None) is default_manager
+        assert pool.get("default") is default_manager
+        assert pool.get_stats()["open_count"] == 0
+
+    @pytest.mark.unit
+    def test_reuses_manager_per_namespace(self, default_manager, temp_dir):
+        """Repeated lookups for a namespace reuse the same warm manager."""
+        pool = LanceDBManagerPool(default_manager)
+
+        first = pool.get("project-a")
+        second = pool.get("project-a")
+
+        assert first is second
+        assert first.get_namespace() == "project-a"
+        assert first.get_database_path() == str(temp_dir / "namespaces" / "project-a")
+        # The default manager's config must not be mutated by namespace managers
+        assert default_manager.config.namespace is None
+        stats = pool.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    @pytest.mark.unit
+    def test_lru_eviction_respects_max_open(self, default_manager):
+        """The least recently used namespace is evicted past max_open."""
+        pool = LanceDBManagerPool(default_manager, max_open=2)
+
+        pool.get("a")
+        pool.get("b")
+        pool.get("a")  # "b" is now least recently used
+        pool.get("c")
+
+        stats = pool.get_stats()
+        assert stats["open_namespaces"] == ["a", "c"]
+        assert stats["evictions"] == 1
+
+    @pytest.mark.unit
+    def test_idle_eviction(self, default_manager, monkeypatch):
+        """Managers idle longer than idle_timeout are evicted."""
+        clock = [1000.0]
+        monkeypatch.setattr("mcp_jive.lancedb_pool.time.monotonic", lambda: clock[0])
+        pool = LanceDBManagerPool(default_manager, idle_timeout=60.0)
+
+        pool.get("a")
+        clock[0] += 61.0
+
+        assert pool.evict_idle() == 1
+        assert pool.get_stats()["open_count"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_evict_namespace(self, default_manager):
+        """Explicit eviction removes and cleans up the namespace manager."""
+        pool = LanceDBManagerPool(default_manager)
+        pool.get("a")
+
+        assert await pool.evict("a") is True
+        assert await pool.evict("a") is False
+        pool._drop("a", "explicit")
+        assert pool.get_stats()["evictions"] == 1
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lru_evicted_manager_is_cleaned_up(self, default_manager):
+        """Managers dropped past max_open are cleaned up, not just forgotten."""
+        pool = LanceDBManagerPool(default_manager, max_open=1)
+        first = await pool.acquire("a")
+        assert first._initialized
+
+        second = await pool.acquire("b")
+        assert pool.get_stats()["open_namespaces"] == ["b"]
+        assert not first._initialized and first.db is None
+        assert second._initialized
+
+        pool.get("c")  # Retires "b"; cleanup is scheduled on the running loop
+        await pool._cleanup_task
+        assert not second._initialized
+        await pool.close_all()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_storage_operation_counts_one_hit(self, default_manager):
+        """A storage call resolves its namespace manager once, not per attribute access."""
+        pool = LanceDBManagerPool(default_manager)
+        storage = WorkItemStorage(default_manager, manager_pool=pool)
+        with namespace_scope("a"):
+            pool.get("a")
+            assert await storage.count_work_items() == 0
+            assert await storage.search_work_items("anything", search_type="keyword") == []
+
+        assert (pool.get_stats()["misses"], pool.get_stats()["hits"]) == (1, 2)
+        await pool.close_all()
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_leased_manager_survives_eviction(self, default_manager, monkeypatch):
+        """A manager leased by an in-flight request is neither LRU- nor idle-evicted."""
+        clock = [1000.0]
+        monkeypatch.setattr("mcp_jive.lancedb_pool.time.monotonic", lambda: clock[0])
+        pool = LanceDBManagerPool(default_manager, max_open=1, idle_timeout=60.0)
+
+        async with pool.lease("a") as leased:
+            clock[0] += 61.0
+            assert pool.evict_idle() == 0
+            pool.get("b")  # Over capacity, but "a" is still in use
+            assert pool.get_stats()["open_namespaces"] == ["a", "b"]
+            assert pool.get("a") is leased
+            assert leased._initialized
+
+        # Released: "b" is now least recently used and gives way
+        assert pool.get_stats()["open_namespaces"] == ["a"]
+        assert pool.get_stats()["leased_count"] == 0
+        await pool.close_all()
@@ -0,0 +1,85 @@
+"""Unit tests for Lance-native snapshot backups."""
+
+import pytest
+
+from mcp_jive.lancedb_snapshots import LanceSnapshotStore
+from mcp_jive.models.workflow import DependencyType
+from mcp_jive.services.dependency_engine import DependencyEngine
+
+
+class TestLanceSnapshotStore:
+    """Test cases for LanceSnapshotStore."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_incremental_snapshot_survives_version_cleanup(self, lancedb_manager, work_item_row, temp_dir):
+        """Snapshots link only new files and restore rows and vectors after cleanup."""
+        manager = lancedb_manager
+        store = LanceSnapshotStore(str(temp_dir / "snapshots"))
+
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="a", vector=[1.0] * 384), work_item_row(id="b", vector=[2.0] * 384)])
+        first = store.create_snapshot(manager, "first")
+
+        table.delete("id = 'a'")
+        table.add([work_item_row(id="c", vector=[3.0] * 384)])
+        second = store.create_snapshot(manager)
+        assert 0 < second["files_added"] < first["files_added"]
+        assert second["tables"]["WorkItem"]["version"] > first["tables"]["WorkItem"]["version"]
+
+        # Compaction plus cleanup removes every file of the first snapshot's version
+        manager.maintain_table("WorkItem", compact=True, cleanup_older_than=0)
+
+        snapshot = store.find_snapshot("default", restore_point=first["created_at"])
+        assert snapshot["snapshot_id"] == first["snapshot_id"]
+        result = store.restore_snapshot(manager, snapshot)
+        assert result["tables"]["WorkItem"]["files_restored"] > 0
+
+        rows = (await manager.get_table("WorkItem")).search().limit(10).to_list()
+        assert {row["id"]: row["vector"][0] for row in rows} == {"a": 1.0, "b": 2.0}
+        assert [s["name"] for s in store.list_snapshots("default")] == ["first", None]
+        assert store.find_snapshot("default", first["snapshot_id"].upper())["name"] == "first"
+        assert store.find_snapshot("default", f"../../default/snapshots/{first['snapshot_id']}") is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_recreated_table_gets_its_own_lineage(self, lancedb_manager, temp_dir):
+        """A dropped and recreated table's manifests are stored, and each snapshot restores its own rows."""
+        manager = lancedb_manager
+        store = LanceSnapshotStore(str(temp_dir / "snapshots"))
+
+        manager.db.create_table("Scratch", [{"id": "old"}])
+        first = store.create_snapshot(manager)
+        manager.db.drop_table("Scratch")
+        manager.db.create_table("Scratch", [{"id": "new"}])
+        second = store.create_snapshot(manager)
+
+        assert second["tables"]["Scratch"]["store"] != first["tables"]["Scratch"]["store"]
+        assert second["tables"]["Scratch"]["version"] == first["tables"]["Scratch"]["version"]
+
+        result = store.restore_snapshot(manager, first, tables=["Scratch"])
+        assert result["tables"]["Scratch"]["replaced"]
+        assert manager.db.open_table("Scratch").to_arrow()["id"].to_pylist() == ["old"]
+
+        store.restore_snapshot(manager, second, tables=["Scratch"])
+        assert manager.db.open_table("Scratch").to_arrow()["id"].to_pylist() == ["new"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_restore_reloads_dependency_graph(self, lancedb_manager, temp_dir):
+        """invalidate_tables after a restore makes the dependency engine reread its table."""
+        manager = lancedb_manager
+        store = LanceSnapshotStore(str(temp_dir / "snapshots"))
+        engine = DependencyEngine(None, manager)
+        await engine.initialize()
+
+        await engine.add_dependency("a", "b", DependencyType.BLOCKS)
+        snapshot = store.create_snapshot(manager)
+        await engine.add_dependency("b", "c", DependencyType.BLOCKS)
+        assert len((await engine._get_graph()).dependencies) == 2
+
+        result = store.restore_snapshot(manager, snapshot)
+        manager.invalidate_tables(list(result["tables"]))
+
+        graph = await engine._get_graph()
+        assert [(dep["source_id"], dep["target_id"]) for dep in graph.dependencies.values()] == [("a", "b")]
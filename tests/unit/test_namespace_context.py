@@ -0,0 +1,35 @@
+"""Unit tests for the request-scoped namespace context."""
+
+import asyncio
+
+import pytest
+
+from mcp_jive.namespace.context import get_current_namespace, namespace_scope
+
+
+class TestNamespaceContext:
+    """Test cases for namespace_scope and get_current_namespace."""
+
+    @pytest.mark.unit
+    def test_scope_restores_previous_namespace(self):
+        """Leaving a scope restores the outer namespace."""
+        assert get_current_namespace() is None
+        with namespace_scope("outer"):
+            with namespace_scope("inner"):
+                assert get_current_namespace() == "inner"
+            assert get_current_namespace() == "outer"
+        assert get_current_namespace() is None
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_tasks_are_isolated(self):
+        """Concurrent tasks each see only their own namespace."""
+        async def run(namespace):
+            with namespace_scope(namespace):
+                await asyncio.sleep(0.01)
+                return get_current_namespace()
+
+        results = await asyncio.gather(run("project-a"), run("project-b"), run(None))
+
+        assert results == ["project-a", "project-b", None]
+        assert get_current_namespace() is None
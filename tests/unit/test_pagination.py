@@ -0,0 +1,112 @@
+"""Unit tests for keyset pagination cursors."""
+
+from datetime import datetime
+
+import pytest
+
+from mcp_jive.lancedb_manager import LanceDBManager
+from mcp_jive.pagination import decode_cursor, encode_cursor, keyset_filter, like_contains, sql_literal
+
+
+class TestKeysetPagination:
+    """Test cases for cursor encoding and keyset filters."""
+
+    @pytest.mark.unit
+    def test_keyset_filter_directions(self):
+        """Rows after the cursor follow the sort direction, with nulls last."""
+        assert keyset_filter("order_index", True, 3, "b") == (
+            "(order_index > 3 OR (order_index = 3 AND id > 'b') OR order_index IS NULL)"
+        )
+        assert keyset_filter("order_index", False, 3, "b") == (
+            "(order_index < 3 OR (order_index = 3 AND id < 'b') OR order_index IS NULL)"
+        )
+        assert keyset_filter("parent_id", True, None, "b") == "(parent_id IS NULL AND id > 'b')"
+        assert keyset_filter("id", True, "b", "b") == "id > 'b'"
+
+    @pytest.mark.unit
+    def test_sql_literals(self):
+        """Strings are escaped and timestamps become typed literals."""
+        assert sql_literal("it's") == "'it''s'"
+        assert sql_literal(True) == "true"
+        assert sql_literal(datetime(2024, 1, 2, 3, 4, 5)) == "timestamp '2024-01-02 03:04:05'"
+        assert like_contains("title", "100%_it's\\") == "title LIKE '%100\\%\\_it''s\\\\%' ESCAPE '\\'"
+
+    @pytest.mark.unit
+    def test_cursor_round_trip(self):
+        """A cursor decodes to the keyset of the row it was issued for."""
+        where = "status = 'done'"
+        created = datetime(2024, 5, 1, 12, 30)
+        cursor = encode_cursor("created_at", True, where, {"id": "x1", "created_at": created})
+
+        assert decode_cursor(cursor, "created_at", True, where) == keyset_filter("created_at", True, created, "x1")
+
+    @pytest.mark.unit
+    def test_cursor_rejects_other_listings(self):
+        """Cursors are bound to their filter and sort order."""
+        cursor = encode_cursor("order_index", True, None, {"id": "x1", "order_index": 2})
+
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "order_index", False, None)
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, "order_index", True, "status = 'done'")
+        with pytest.raises(ValueError):
+            decode_cursor("not a cursor", "order_index", True, None)
+
+
+class TestOrderedPages:
+    """Test cases for pages ordered inside LanceDB."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_page_reads_limit_plus_one_rows(self, lancedb_manager, work_item_row, monkeypatch):
+        """A page reads limit + 1 rows, ties broken by id and nulls last."""
+        manager = lancedb_manager
+        table = await manager.get_table("WorkItem")
+        table.add([
+            work_item_row(id="e"), work_item_row(id="d", parent_id="p2"), work_item_row(id="c", parent_id="p1"),
+            work_item_row(id="b", parent_id="p2"), work_item_row(id="a"), work_item_row(id="f", parent_id="p1"),
+        ])
+
+        scanned = []
+        ordered_scan = LanceDBManager._ordered_scan
+
+        def recording_scan(*args, **kwargs):
+            data = ordered_scan(*args, **kwargs)
+            scanned.append(data.column("id").to_pylist())
+            return data
+
+        monkeypatch.setattr(LanceDBManager, "_ordered_scan", staticmethod(recording_scan))
+
+        first = await manager.list_work_items_page(limit=3, sort_by="parent_id", columns=["id"])
+        assert [item["id"] for item in first["items"]] == ["c", "f", "b"]
+        assert scanned == [["c", "f", "b", "d"]]
+
+        second = await manager.list_work_items_page(limit=3, cursor=first["next_cursor"],
+                                                    sort_by="parent_id", columns=["id"])
+        assert [item["id"] for item in second["items"]] == ["d", "a", "e"]
+        assert second["next_cursor"] is None
+        assert scanned[-1] == ["d", "a", "e"]
+
+        descending = await manager.list_work_items(limit=4, sort_by="parent_id", sort_order="desc",
+                                                   columns=["id"])
+        assert [item["id"] for item in descending] == ["d", "b", "f", "c"]
+
+
+class TestLikeFallback:
+    """Test cases for LIKE matching when full-text search is disabled."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_keyword_fallback_matches_wildcards_literally(self, lancedb_manager, work_item_row):
+        """Without FTS, % and _ in a keyword query only match themselves."""
+        manager = lancedb_manager
+        manager.config.enable_fts = False
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id=item_id, title=title) for item_id, title in (
+            ("a", "Reach 100%"), ("b", "Reach 1000"), ("c", "snake_case names"), ("d", "snakeXcase names")
+        )])
+
+        found = await manager.search_work_items("100%", search_type="keyword", columns=["id"])
+        assert [item["id"] for item in found] == ["a"]
+        found = await manager.search_work_items("snake_case", search_type="keyword", columns=["id"])
+        assert [item["id"] for item in found] == ["c"]
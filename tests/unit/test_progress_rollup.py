@@ -0,0 +1,121 @@
+"""Unit tests for the incremental progress rollup engine."""
+
+import pytest
+
+from mcp_jive.services.progress_rollup import ProgressRollup
+
+
+def _tree():
+    """epic → feature → two tasks, plus a second feature with one task."""
+    rollup = ProgressRollup()
+    rollup.build([
+        {"id": "epic", "parent_id": None, "status": "not_started", "progress": 0.0},
+        {"id": "f1", "parent_id": "epic", "status": "not_started", "progress": 0.0},
+        {"id": "f2", "parent_id": "epic", "status": "not_started", "progress": 0.0},
+        {"id": "t1", "parent_id": "f1", "status": "not_started", "progress": 0.0},
+        {"id": "t2", "parent_id": "f1", "status": "not_started", "progress": 0.0},
+        {"id": "t3", "parent_id": "f2", "status": "not_started", "progress": 0.0},
+    ])
+    return rollup
+
+
+class TestProgressRollup:
+    """Test cases for ProgressRollup."""
+
+    @pytest.mark.unit
+    def test_leaf_change_walks_to_root(self):
+        """A leaf status change updates every ancestor in one set of updates."""
+        rollup = _tree()
+
+        rollup.upsert({"id": "t1", "status": "completed"})
+        updates = rollup.flush()
+
+        assert set(updates) == {"f1", "epic"}
+        assert updates["f1"]["progress"] == 50.0
+        assert updates["f1"]["status"] == "in_progress"
+        assert updates["epic"]["progress"] == 25.0
+        assert updates["epic"]["status"] == "in_progress"
+        assert rollup.flush() == {}
+
+    @pytest.mark.unit
+    def test_all_children_completed_completes_parent(self):
+        """A parent completes once all its children are completed."""
+        rollup = _tree()
+        for item_id in ("t1", "t2"):
+            rollup.upsert({"id": item_id, "status": "done"})
+        updates = rollup.flush()
+
+        assert updates["f1"]["status"] == "completed"
+        assert updates["f1"]["progress"] == 100.0
+        assert "completed_at" in updates["f1"]
+        assert rollup.effective_progress("epic") == 50.0
+
+    @pytest.mark.unit
+    def test_unchanged_contribution_stops_walk(self):
+        """Changes that do not alter a node's contribution stop propagating."""
+        rollup = _tree()
+        rollup.upsert({"id": "t3", "status": "in_progress"})
+        rollup.flush()
+
+        rollup.upsert({"id": "t3", "progress": 75.0})
+        assert rollup.flush() == {}
+
+    @pytest.mark.unit
+    def test_move_and_remove_update_aggregates(self):
+        """Moving or removing a child re-derives the old parent."""
+        rollup = _tree()
+        rollup.upsert({"id": "t1", "status": "completed"})
+        rollup.flush()
+
+        rollup.upsert({"id": "t1", "parent_id": "f2"})
+        updates = rollup.flush()
+        assert rollup.effective_progress("f1") == 0.0
+        assert rollup.effective_progress("f2") == 50.0
+        assert updates["f1"]["progress"] == 0.0
+
+        rollup.remove("t1")
+        rollup.flush()
+        assert rollup.effective_progress("f2") == 0.0
+        assert rollup.effective_progress("epic") == 0.0
+
+    @pytest.mark.unit
+    def test_recalculate_is_single_post_order_pass(self):
+        """Recalculation fixes stale stored values bottom-up."""
+        rollup = ProgressRollup()
+        rollup.build([
+            {"id": "epic", "parent_id": None, "status": "not_started", "progress": 0.0},
+            {"id": "f1", "parent_id": "epic", "status": "not_started", "progress": 0.0},
+            {"id": "t1", "parent_id": "f1", "status": "completed", "progress": 0.0},
+        ])
+
+        updates = rollup.recalculate()
+
+        assert updates["t1"]["progress"] == 100.0
+        assert updates["f1"]["status"] == "completed"
+        assert updates["epic"]["status"] == "completed"
+        assert updates["epic"]["progress"] == 100.0
+        assert rollup.recalculate() == {}
+
+    @pytest.mark.unit
+    def test_completed_parent_is_not_reopened(self):
+        """A parent already marked completed keeps its status."""
+        rollup = _tree()
+        rollup.upsert({"id": "f2", "status": "completed"})
+        rollup.flush()
+
+        updates = rollup.recalculate("f2")
+
+        assert "status" not in updates.get("f2", {})
+
+    @pytest.mark.unit
+    def test_parent_cycles_terminate(self):
+        """Cyclic parent links do not loop forever."""
+        rollup = ProgressRollup()
+        rollup.build([
+            {"id": "a", "parent_id": "b", "status": "in_progress", "progress": 0.0},
+            {"id": "b", "parent_id": "a", "status": "not_started", "progress": 0.0},
+        ])
+
+        rollup.upsert({"id": "a", "status": "completed"})
+        rollup.flush()
+        rollup.recalculate()
@@ -0,0 +1,56 @@
+"""Unit tests for scalar index creation on lookup columns."""
+
+import pyarrow as pa
+import pytest
+from lancedb.table import LanceTable
+
+LOOKUP_COLUMNS = {"id", "item_id", "parent_id", "status", "item_type"}
+
+
+def _indexed_columns(table):
+    return {column for index in table.list_indices() for column in index.columns}
+
+
+async def _write_first_item(manager):
+    manager.embedding_cache.put("First Task", [1.0] * 384)
+    await manager.upsert_work_items([{"id": "a", "title": "First", "description": "Task",
+                                      "type": "task", "status": "todo", "priority": "medium"}])
+
+
+class TestScalarIndexes:
+    """Test cases for LanceDBManager._ensure_scalar_indexes."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lookup_columns_indexed_after_first_write(self, lancedb_manager):
+        """After the first write, WorkItem has an index on every lookup column."""
+        manager = lancedb_manager
+        await _write_first_item(manager)
+
+        assert LOOKUP_COLUMNS <= _indexed_columns(manager.db.open_table("WorkItem"))
+        assert "WorkItem" in manager._scalar_index_checked
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_empty_table_retried_on_next_write(self, lancedb_manager, monkeypatch):
+        """A table that could not be indexed while empty is indexed by the next write."""
+        manager = lancedb_manager
+        # Older LanceDB releases refuse to index a table without rows
+        create_index = LanceTable.create_index
+
+        def reject_empty(table, column, **kwargs):
+            if table.count_rows() == 0:
+                raise RuntimeError("cannot index an empty table")
+            return create_index(table, column, **kwargs)
+
+        monkeypatch.setattr(LanceTable, "create_index", reject_empty)
+        manager.db.create_table("Scratch", schema=pa.schema([("id", pa.string()), ("key", pa.string())]))
+        manager.register_scalar_indexes("Scratch", {"key": "BTREE"})
+
+        assert _indexed_columns(manager.db.open_table("Scratch")) == set()
+        assert "Scratch" not in manager._scalar_index_checked
+
+        await manager.add_data("Scratch", {"id": "a", "key": "k"})
+
+        assert _indexed_columns(manager.db.open_table("Scratch")) == {"key"}
+        assert "Scratch" in manager._scalar_index_checked
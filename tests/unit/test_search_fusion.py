@@ -0,0 +1,41 @@
+"""Unit tests for reciprocal rank fusion."""
+
+import pytest
+
+from mcp_jive.search_fusion import reciprocal_rank_fusion
+
+
+class TestReciprocalRankFusion:
+    """Test cases for reciprocal_rank_fusion."""
+
+    @pytest.mark.unit
+    def test_items_in_both_lists_rank_first(self):
+        """An item found by both retrievers outranks single-list items."""
+        vector = [{"id": "a", "_distance": 0.1}, {"id": "b", "_distance": 0.2}]
+        keyword = [{"id": "c", "_score": 9.0}, {"id": "b", "_score": 4.0}]
+
+        fused = reciprocal_rank_fusion({"vector": vector, "keyword": keyword}, k=60)
+
+        assert [row["id"] for row in fused] == ["b", "a", "c"]
+        assert fused[0]["_relevance_score"] == pytest.approx(1 / 62 + 1 / 62)
+        # Both component scores and ranks are kept
+        assert fused[0]["_distance"] == 0.2
+        assert fused[0]["_score"] == 4.0
+        assert (fused[0]["_vector_rank"], fused[0]["_keyword_rank"]) == (2, 2)
+        assert fused[2]["_vector_rank"] is None
+
+    @pytest.mark.unit
+    def test_weights_and_limit(self):
+        """Component weights shift the ranking and limit truncates it."""
+        vector = [{"id": "a"}]
+        keyword = [{"id": "b"}]
+
+        fused = reciprocal_rank_fusion({"vector": vector, "keyword": keyword},
+                                       weights={"keyword": 2.0}, limit=1)
+
+        assert [row["id"] for row in fused] == ["b"]
+
+    @pytest.mark.unit
+    def test_empty_lists(self):
+        """Fusing nothing returns nothing."""
+        assert reciprocal_rank_fusion({"vector": [], "keyword": []}) == []
@@ -0,0 +1,112 @@
+"""Unit tests for the persistent sync state and bulk directory sync."""
+
+import asyncio
+import json
+import os
+
+import pytest
+
+from mcp_jive.config import ServerConfig
+from mcp_jive.services.sync_engine import ConflictResolution, SyncEngine, SyncStatus
+from mcp_jive.services.sync_state import SyncStateIndex
+
+
+def _write_item(path, status):
+    path.write_text(json.dumps({
+        "id": "a", "title": "First", "description": "Task", "type": "task",
+        "status": status, "priority": "medium",
+        "created_at": "2026-01-01T00:00:00+00:00", "updated_at": "2026-01-01T00:00:00+00:00"
+    }))
+
+
+class TestSyncState:
+    """Test cases for SyncStateIndex and SyncEngine.sync_directory."""
+
+    @pytest.mark.unit
+    def test_index_round_trip(self, temp_dir):
+        """Entries survive a save and reload and are found by path or work item id."""
+        index = SyncStateIndex(str(temp_dir / "state" / "sync_state.json"))
+        index.record("/tasks/a.json", "a", "sum-a", 10, 100)
+        index.record("/tasks/b.json", "b", "sum-b")
+        index.touch("/tasks/a.json", 20, 120)
+        index.record("/tasks/c.json", "c", "sum-c", 5, 50)
+        index.remove("/tasks/c.json")
+        changes = index.changes
+        index.write(index.snapshot())
+        assert index.dirty
+        index.mark_saved(changes)
+        assert not index.dirty
+
+        loaded = SyncStateIndex(index.path)
+        loaded.load()
+        assert len(loaded) == 2
+        assert loaded.lookup("a").matches_stat(20, 120)
+        assert loaded.lookup("/tasks/b.json").mtime_ns is None
+        assert loaded.lookup("c") is None
+        assert sorted(loaded.under("/tasks")) == ["/tasks/a.json", "/tasks/b.json"]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_sync_directory_skips_unchanged_files_after_restart(self, lancedb_manager, work_item_row, temp_dir):
+        """Changed fields are upserted once; a restarted engine skips the file by stat or hash."""
+        manager = lancedb_manager
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="a", title="First", status="todo", vector=[1.0] * 384)])
+
+        tasks = temp_dir / "tasks"
+        (tasks / "nested").mkdir(parents=True)
+        _write_item(tasks / "nested" / "a.json", "in_progress")
+        (tasks / "notes.txt").write_text("not a work item")
+
+        engine = SyncEngine(ServerConfig(), manager)
+        await engine.initialize()
+        result = await engine.sync_directory(str(tasks), ConflictResolution.FILE_WINS)
+        assert result.status == SyncStatus.SUCCESS
+        assert (result.metadata["scanned"], result.metadata["synced"], result.metadata["written"]) == (1, 1, 1)
+        stored = await manager.get_work_item("a", columns=["status", "vector"])
+        assert stored["status"] == "in_progress"
+        assert stored["vector"][0] == 1.0
+
+        restarted = SyncEngine(ServerConfig(), manager)
+        await restarted.initialize()
+        assert (await restarted.get_sync_status("a"))["status"] == "synced"
+        result = await restarted.sync_directory(str(tasks))
+        assert (result.metadata["unchanged"], result.metadata["synced"]) == (1, 0)
+
+        os.utime(tasks / "nested" / "a.json", ns=(0, 0))
+        result = await restarted.sync_directory(str(tasks))
+        assert (result.metadata["touched"], result.metadata["synced"]) == (1, 0)
+
+        (tasks / "nested" / "a.json").unlink()
+        result = await restarted.sync_directory(str(tasks))
+        assert result.metadata["removed"] == [str(tasks / "nested" / "a.json")]
+        assert (await restarted.get_sync_status("a"))["status"] == "database_only"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_save_is_retried(self, lancedb_manager, temp_dir, monkeypatch):
+        """A save that fails leaves the index dirty; concurrent saves write it once."""
+        engine = SyncEngine(ServerConfig(), lancedb_manager)
+        await engine.initialize()
+        engine.sync_state.record("/tasks/a.json", "a", "sum-a", 10, 100)
+
+        write = SyncStateIndex.write
+        writes = []
+
+        def failing_write(index, data):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(SyncStateIndex, "write", failing_write)
+        with pytest.raises(OSError):
+            await engine._save_sync_state()
+        assert engine.sync_state.dirty
+
+        monkeypatch.setattr(SyncStateIndex, "write", lambda index, data: writes.append(1) or write(index, data))
+        await asyncio.gather(engine._save_sync_state(), engine._save_sync_state())
+        assert writes == [1]
+        assert not engine.sync_state.dirty
+        assert [p.name for p in (temp_dir / "db").rglob("*.tmp")] == []
+
+        loaded = SyncStateIndex(engine.sync_state.path)
+        loaded.load()
+        assert loaded.lookup("a").checksum == "sum-a"
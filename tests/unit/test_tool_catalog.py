@@ -0,0 +1,66 @@
+"""Unit tests for the compiled tool catalog served by tools/list."""
+
+import json
+
+import pytest
+
+from mcp_jive.tools.consolidated import CONSOLIDATED_TOOLS
+from mcp_jive.tools.consolidated.consolidated_tool_registry import ConsolidatedToolRegistry
+from mcp_jive.tools.consolidated_registry import MCPConsolidatedToolRegistry, build_tool_catalog
+
+
+class TestToolCatalog:
+    """Test cases for tool definition caching."""
+
+    @pytest.mark.unit
+    def test_serialized_listing_and_etag(self):
+        """The payload is the serialized listing and the ETag follows its content."""
+        schema = {"description": "Do it", "inputSchema": {"type": "object", "properties": {}}}
+        catalog = build_tool_catalog({"jive_do": schema})
+
+        assert json.loads(catalog.payload) == {"tools": [{"name": "jive_do", **schema}]}
+        assert catalog.etag == build_tool_catalog({"jive_do": dict(schema)}).etag
+        assert catalog.etag != build_tool_catalog({"jive_do": {**schema, "description": "Other"}}).etag
+
+        response = json.loads(catalog.jsonrpc_response(7))
+        assert response == {"jsonrpc": "2.0", "id": 7, "result": json.loads(catalog.payload)}
+
+    @pytest.mark.unit
+    def test_alias_schemas_drop_mapped_parameters(self):
+        """Legacy aliases list their target's parameters minus the ones the mapping fills in."""
+        registry = ConsolidatedToolRegistry(enable_legacy_support=True)
+        aliases = registry.get_alias_schemas()
+
+        create_task = aliases["jive_create_task"]
+        assert create_task["description"].startswith("DEPRECATED")
+        assert "action" not in create_task["inputSchema"]["properties"]
+        assert "title" in create_task["inputSchema"]["properties"]
+        assert registry.get_alias_schemas() is aliases
+        assert ConsolidatedToolRegistry(enable_legacy_support=False).get_alias_schemas() == {}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_schemas_built_once_until_config_update(self, monkeypatch):
+        """tools/list reuses compiled definitions; update_config rebuilds them."""
+        registry = MCPConsolidatedToolRegistry()
+        await registry.initialize()
+        catalog = await registry.get_tool_catalog()
+
+        calls = []
+        tool = registry.consolidated_registry.get_tool("jive_get_work_item")
+        original = tool.get_schema
+        monkeypatch.setattr(tool, "get_schema", lambda: calls.append(1) or original())
+
+        first = await registry.list_tools()
+        second = await registry.list_tools()
+        # Compare names through the catalog: another test may swap mcp.types.Tool for a mock
+        assert list(catalog.schemas) == CONSOLIDATED_TOOLS
+        assert len(first) == len(CONSOLIDATED_TOOLS)
+        assert all(a is b for a, b in zip(first, second))
+        assert await registry.get_tool_catalog() is catalog
+        assert calls == []
+
+        await registry.update_config(registry.config)
+        assert calls == [1]
+        assert registry.catalog is not catalog
+        assert registry.catalog.etag == catalog.etag
@@ -0,0 +1,118 @@
+"""Unit tests for per-connection WebSocket outbound queues."""
+
+import asyncio
+import json
+
+import pytest
+
+from mcp_jive.websocket_manager import WebSocketConnectionManager
+
+
+class FakeWebSocket:
+    """Records sent messages; sends block until released when gated."""
+
+    def __init__(self, gated: bool = False, fail: bool = False):
+        self.sent = []
+        self.fail = fail
+        self.gate = asyncio.Event()
+        if not gated:
+            self.gate.set()
+
+    async def send_text(self, text: str) -> None:
+        await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("gone")
+        self.sent.append(json.loads(text))
+
+
+async def _drain():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestWebSocketFanout:
+    """Test cases for non-blocking broadcasts."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        """A stalled client keeps its backlog while the others receive events."""
+        manager = WebSocketConnectionManager(max_queue_size=3)
+        slow, fast = FakeWebSocket(gated=True), FakeWebSocket()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for i in range(5):
+            assert await manager.broadcast_event("log", {"i": i}) == 2
+            await _drain()
+
+        assert [m["data"]["i"] for m in fast.sent] == [0, 1, 2, 3, 4]
+        info = manager.get_connection_info()
+        assert info["dropped_messages"] == 1
+        assert info["max_queue_depth"] == 3
+
+        slow.gate.set()
+        await _drain()
+        # The first send was already in flight; the oldest queued one was dropped
+        assert [m["data"]["i"] for m in slow.sent] == [0, 2, 3, 4]
+        await manager.disconnect(slow)
+        await manager.disconnect(fast)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_progress_updates_coalesce_per_work_item(self):
+        """Only the latest pending progress of a work item is delivered."""
+        manager = WebSocketConnectionManager()
+        ws = FakeWebSocket(gated=True)
+        await manager.connect(ws)
+
+        await manager.broadcast_event("log", {"i": 0})
+        await _drain()
+        for percent in (10, 20, 30):
+            await manager.broadcast_event("progress_update", {"work_item_id": "a", "progress": percent})
+        await manager.broadcast_event("progress_update", {"work_item_id": "b", "progress": 50})
+
+        ws.gate.set()
+        await _drain()
+        assert [m["data"].get("progress") for m in ws.sent] == [None, 30, 50]
+        stats = manager.get_connection_info()["connections"][0]["outbound"]
+        assert stats["coalesced"] == 2
+        assert stats["sent"] == 3
+        await manager.disconnect(ws)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_failed_send_drops_connection(self):
+        """A connection whose send fails is unregistered by its sender task."""
+        manager = WebSocketConnectionManager()
+        ws = FakeWebSocket(fail=True)
+        await manager.connect(ws)
+
+        await manager.broadcast_event("log", {})
+        await _drain()
+        assert manager.get_connection_count() == 0
+        assert await manager.broadcast_event("log", {}) == 0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_dropped_change_batch_queues_one_resync(self):
+        """Losing a change feed batch replaces the queued batches with a resync marker."""
+        manager = WebSocketConnectionManager(max_queue_size=3)
+        ws = FakeWebSocket(gated=True)
+        await manager.connect(ws)
+
+        await manager.broadcast_event("log", {"i": 0})
+        await _drain()
+        for seq in range(1, 4):
+            await manager.broadcast_event("work_item_changes", {"seq": seq, "changes": []})
+        await manager.broadcast_event("log", {"i": 1})
+        for seq in range(4, 7):
+            await manager.broadcast_event("work_item_changes", {"seq": seq, "changes": []})
+
+        ws.gate.set()
+        await _drain()
+        received = [(m["type"], m["data"].get("seq")) for m in ws.sent]
+        assert received == [("log", None), ("resync", 5), ("work_item_changes", 6)]
+        stats = manager.get_connection_info()["connections"][0]["outbound"]
+        assert stats["resyncs"] == 1
+        await manager.disconnect(ws)
@@ -0,0 +1,157 @@
+"""Unit tests for in-place work item updates."""
+
+import pytest
+import pytest_asyncio
+
+from mcp_jive.services.progress_calculator import ProgressCalculator
+from mcp_jive.storage import WorkItemStorage
+
+
+@pytest_asyncio.fixture
+async def manager(lancedb_manager, work_item_row):
+    """Shared manager with three stored work items."""
+    table = await lancedb_manager.get_table("WorkItem")
+    table.add([
+        work_item_row(id="a", title="First", status="todo", vector=[1.0] * 384, tags=["x"]),
+        work_item_row(id="b", title="Second", status="todo", vector=[2.0] * 384),
+        work_item_row(id="c", title="Third", status="todo", vector=[3.0] * 384),
+    ])
+    return lancedb_manager
+
+
+async def _rows(manager):
+    table = await manager.get_table("WorkItem")
+    return {row["id"]: row for row in table.search().limit(10).to_list()}
+
+
+class TestWorkItemUpdates:
+    """Test cases for LanceDBManager.update_work_item(s)."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_only_given_columns_change_and_vector_is_kept(self, manager):
+        """Updating non-text fields leaves every other column and the vector as stored."""
+        before = await _rows(manager)
+        assert await manager.update_work_item("a", {"status": "in_progress", "assignee": "O'Brien"})
+
+        after = (await _rows(manager))["a"]
+        assert after["status"] == "in_progress"
+        assert after["assignee"] == "O'Brien"
+        assert after["updated_at"] > before["a"]["updated_at"]
+        for column in ("title", "description", "priority", "tags", "created_at", "item_type"):
+            assert after[column] == before["a"][column]
+        assert list(after["vector"]) == list(before["a"]["vector"])
+        assert await manager.update_work_item("missing", {"status": "done"}) is False
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_title_change_is_re_embedded(self, manager):
+        """A new title gets the embedding of the new text (served from the cache here)."""
+        manager.embedding_cache.put("Renamed by O'Brien Task", [0.5] * 384)
+
+        assert await manager.update_work_item("a", {"title": "Renamed by O'Brien"})
+
+        row = (await _rows(manager))["a"]
+        assert row["title"] == "Renamed by O'Brien"
+        assert row["vector"][0] == pytest.approx(0.5)
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_bulk_update_with_mixed_values(self, manager):
+        """Items sharing values share one table update; the others get their own."""
+        version = manager.db.open_table("WorkItem").version
+        updated = await manager.update_work_items([
+            {"id": "a", "status": "done"},
+            {"id": "b", "status": "done"},
+            {"id": "c", "status": "blocked", "notes": "It's waiting"},
+            {"id": "missing", "status": "done"},
+        ])
+
+        assert updated == 3
+        assert manager.db.open_table("WorkItem").version == version + 2
+        rows = await _rows(manager)
+        assert {item_id: row["status"] for item_id, row in rows.items()} == {
+            "a": "done", "b": "done", "c": "blocked"
+        }
+        assert rows["c"]["notes"] == "It's waiting"
+        assert rows["a"]["notes"] is None
+        assert [rows[item_id]["vector"][0] for item_id in "abc"] == [1.0, 2.0, 3.0]
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_lookup_matches_the_exact_id_only(self, manager, work_item_row):
+        """Quotes in an id are literal; a lookup never falls back to another row."""
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="o'brien", title="Quoted")])
+        crafted = "x' OR '1'='1"
+
+        assert await manager.get_work_item(crafted) is None
+        assert await manager.delete_work_item(crafted) is False
+        assert set(await _rows(manager)) == {"a", "b", "c", "o'brien"}
+        assert (await manager.get_work_item("o'brien", columns=["title"])) == {"id": "o'brien", "title": "Quoted"}
+        assert await manager.delete_work_item("o'brien")
+        assert set(await _rows(manager)) == {"a", "b", "c"}
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_bulk_update_quotes_ids(self, manager, work_item_row):
+        """Ids with quotes are matched literally and never widen the update."""
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="o'brien", title="Quoted")])
+
+        updated = await manager.update_work_items([
+            {"id": "o'brien", "status": "done"},
+            {"id": "x') OR ('1'='1", "status": "done"},
+        ])
+
+        assert updated == 1
+        rows = await _rows(manager)
+        assert {item_id: row["status"] for item_id, row in rows.items()} == {
+            "a": "todo", "b": "todo", "c": "todo", "o'brien": "done"
+        }
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_child_sequence_number_quotes_parent_id(self, manager, work_item_row):
+        """A parent id containing a quote is matched literally when numbering children."""
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="o'brien", sequence_number="2"),
+                   work_item_row(id="kid", parent_id="o'brien", sequence_number="2.3")])
+        storage = WorkItemStorage(manager)
+
+        sequence_number, _ = await storage._generate_sequence_number("o'brien")
+        assert sequence_number == "2.4"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_storage_lookup_matches_manager(self, manager, work_item_row):
+        """WorkItemStorage resolves quoted ids and item_ids the same way as the manager."""
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="o'brien", item_id="JIVE-1", title="Quoted")])
+        storage = WorkItemStorage(manager)
+
+        assert await storage.get_work_item("x' OR '1'='1") is None
+        assert (await storage.get_work_item("o'brien", columns=["title"])) == {"id": "o'brien", "title": "Quoted"}
+        assert (await storage.get_work_item("JIVE-1", columns=["title"]))["id"] == "o'brien"
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_storage_update_propagates_without_rewriting_item(self, manager, work_item_row):
+        """Progress and status updates are stored as given and only ancestors are rolled up."""
+        table = await manager.get_table("WorkItem")
+        table.add([work_item_row(id="epic"),
+                   work_item_row(id="t1", parent_id="epic", status="blocked"),
+                   work_item_row(id="t2", parent_id="epic")])
+        storage = WorkItemStorage(manager)
+        storage.progress_calculator = ProgressCalculator(storage)
+
+        returned = await storage.update_work_item("t1", {"progress": 30})
+        rows = await _rows(manager)
+        assert (rows["t1"]["status"], rows["t1"]["progress"]) == ("blocked", 30.0)
+        assert (returned["status"], returned["progress"]) == ("blocked", 30)
+
+        returned = await storage.update_work_item("t2", {"status": "completed"})
+        rows = await _rows(manager)
+        assert (rows["t2"]["status"], rows["t2"]["progress"]) == ("completed", 0.0)
+        assert "completed_at" not in returned
+        assert (rows["epic"]["status"], rows["epic"]["progress"]) == ("in_progress", 62.5)
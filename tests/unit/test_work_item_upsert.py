@@ -0,0 +1,65 @@
+"""Unit tests for merge_insert-backed work item upserts."""
+
+import pytest
+import pytest_asyncio
+
+@pytest_asyncio.fixture
+async def manager(lancedb_manager, work_item_row):
+    """Shared manager with one stored work item."""
+    table = await lancedb_manager.get_table("WorkItem")
+    table.add([work_item_row(id="a", title="First", status="todo", vector=[1.0] * 384, tags=["x"])])
+    return lancedb_manager
+
+
+class TestWorkItemUpsert:
+    """Test cases for LanceDBManager.upsert_work_items."""
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_mixed_batch_is_one_commit(self, manager):
+        """Partial rows update, complete rows insert, incomplete unknown rows are skipped."""
+        # New rows are embedded; seed the cache so no model is needed
+        manager.embedding_cache.put("Second Task", [2.0] * 384)
+        version = manager.db.open_table("WorkItem").version
+
+        written = await manager.upsert_work_items([
+            {"id": "a", "status": "done"},
+            {"id": "b", "title": "Second", "description": "Task", "type": "task",
+             "status": "todo", "priority": "high"},
+            {"id": "unknown", "status": "done"},
+        ])
+
+        assert sorted(written) == ["a", "b"]
+        assert manager.db.open_table("WorkItem").version == version + 1
+
+        table = await manager.get_table("WorkItem")
+        rows = {row["id"]: row for row in table.search().limit(10).to_list()}
+        assert set(rows) == {"a", "b"}
+        assert rows["a"]["status"] == "done"
+        assert (rows["a"]["title"], rows["a"]["tags"], rows["a"]["priority"]) == ("First", ["x"], "medium")
+        assert rows["a"]["vector"][0] == 1.0
+        assert (rows["b"]["item_type"], rows["b"]["priority"]) == ("task", "high")
+        assert rows["b"]["vector"][0] == 2.0
+
+    @pytest.mark.unit
+    @pytest.mark.asyncio
+    async def test_concurrent_update_during_embedding_is_kept(self, manager):
+        """A write landing while embeddings are computed is not overwritten by the upsert."""
+        generate_embeddings = manager.generate_embeddings
+
+        async def embed_while_updating(texts):
+            await manager.update_work_item("a", {"priority": "high", "tags": ["y"]})
+            return [[3.0] * 384 for _ in texts]
+
+        manager.generate_embeddings = embed_while_updating
+        try:
+            written = await manager.upsert_work_items([{"id": "a", "title": "Renamed", "status": "done"}])
+        finally:
+            manager.generate_embeddings = generate_embeddings
+
+        assert written == ["a"]
+        table = await manager.get_table("WorkItem")
+        row = table.search().where("id = 'a'").limit(1).to_list()[0]
+        assert (row["title"], row["status"], row["description"]) == ("Renamed", "done", "Task")
+        assert (row["priority"], row["tags"]) == ("high", ["y"])
+        assert row["vector"][0] == 3.0